@@ -5,16 +5,32 @@ Main application file for the question-answering API
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from transformers import pipeline, AutoTokenizer, AutoModelForQuestionAnswering
 import uvicorn
+import asyncio
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
-import requests as http_requests
 from unified_intelligence import unified_intelligence
-from config import ExternalAPIConfig
+from config import ExternalAPIConfig, RuntimeConfig
+from llm_client import llm_client, OPENAI_CHAT_URL, GROQ_CHAT_URL, HUGGINGFACE_INFERENCE_URL
+from provider_fanout import provider_fanout
+from circuit_breaker import provider_health
+from response_cache import llm_response_cache, prompt_fingerprint
+from semantic_cache import semantic_cache
+from keyword_matcher import keyword_matcher
+from course_codes import extract_course_codes
+from bm25_index import bm25_index
+from dense_index import dense_index
+from hybrid_retriever import hybrid_retriever
+from material_store import material_store
+from knowledge_store import knowledge_store
+from lecturer_index import format_lecturer_matches, lecturer_index
+from streaming import SSE_HEADERS, chunk_markdown, sse_event
+from qa_batcher import QABatcher
+from qa_model import DEFAULT_QA_CONTEXT, qa_models
+from qa_process_pool import worker_count
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -36,9 +52,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global variables for model and pipeline
-qa_pipeline = None
-model_loaded = False
+
+GENERAL_SYSTEM_PROMPT = "You are a helpful assistant. Provide clear, informative answers to user questions."
 
 # Pydantic models for request/response
 class QuestionRequest(BaseModel):
@@ -54,33 +69,52 @@ class HealthResponse(BaseModel):
     status: str
     model_loaded: bool
     model_name: str
+    model_version: int = 0
+    model_load_seconds: Optional[float] = None
+    model_reloading: bool = False
+
+def external_provider_calls(question: str) -> Dict:
+    """Configured external APIs for a question, in order of preference"""
+    provider_calls = {}
+    if ExternalAPIConfig.is_gemini_configured():
+        provider_calls["gemini"] = lambda: try_gemini_api(question)
+    if ExternalAPIConfig.is_openai_configured():
+        provider_calls["openai"] = lambda: try_openai_api(question)
+    provider_calls["huggingface"] = lambda: try_huggingface_api(question)
+    if ExternalAPIConfig.is_groq_configured():
+        provider_calls["groq"] = lambda: try_groq_api(question)
+    return provider_calls
+
+def healthiest_external_provider(question: str) -> Optional[str]:
+    """The provider get_external_llm_response would try first (None when every circuit is open)"""
+    ordered = provider_health.order_by_health(list(external_provider_calls(question)))
+    return ordered[0] if ordered else None
 
-def get_external_llm_response(question: str) -> Optional[str]:
+async def get_external_llm_response(question: str) -> Optional[str]:
     """Get response from external LLMs (Google, OpenAI, etc.)"""
     try:
-        # Try multiple external APIs in order of preference
+        provider_calls = external_provider_calls(question)
         
-        # 1. Try Google's Gemini API (if available)
-        gemini_response = try_gemini_api(question)
-        if gemini_response:
-            return gemini_response
+        # Skip open circuits and try the healthiest providers first
+        candidates = [
+            (name, provider_calls[name])
+            for name in provider_health.order_by_health(list(provider_calls))
+        ]
         
-        # 2. Try OpenAI API (if available)
-        openai_response = try_openai_api(question)
-        if openai_response:
-            return openai_response
+        mode = ExternalAPIConfig.LLM_FANOUT_MODE
+        deadline = ExternalAPIConfig.LLM_REQUEST_DEADLINE
+        if mode == "sequential":
+            winner = await provider_fanout.sequential(candidates, deadline)
+        else:
+            stagger = 0.0 if mode == "parallel" else ExternalAPIConfig.LLM_HEDGE_DELAY
+            winner = await provider_fanout.race(candidates, stagger, deadline)
         
-        # 3. Try Hugging Face Inference API
-        huggingface_response = try_huggingface_api(question)
-        if huggingface_response:
-            return huggingface_response
+        if winner:
+            provider, answer = winner
+            logger.info(f"External answer served by {provider}")
+            return answer
         
-        # 4. Try Groq API (FREE)
-        groq_response = try_groq_api(question)
-        if groq_response:
-            return groq_response
-        
-        # 5. Fallback to web search + basic processing
+        # Fallback to web search + basic processing
         web_response = try_web_search(question)
         if web_response:
             return web_response
@@ -91,7 +125,7 @@ def get_external_llm_response(question: str) -> Optional[str]:
         logger.error(f"Error getting external LLM response: {str(e)}")
         return None
 
-def try_gemini_api(question: str) -> Optional[str]:
+async def try_gemini_api(question: str) -> Optional[str]:
     """Try Google's Gemini API"""
     try:
         if not ExternalAPIConfig.is_gemini_configured():
@@ -105,7 +139,7 @@ def try_gemini_api(question: str) -> Optional[str]:
         logger.error(f"Gemini API error: {str(e)}")
         return None
 
-def try_openai_api(question: str) -> Optional[str]:
+async def try_openai_api(question: str) -> Optional[str]:
     """Try OpenAI API"""
     try:
         if not ExternalAPIConfig.is_openai_configured():
@@ -116,14 +150,11 @@ def try_openai_api(question: str) -> Optional[str]:
         if not api_key or api_key == "your_openai_key_here":
             return None
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": ExternalAPIConfig.OPENAI_MODEL,
-            "messages": [
+        answer = await llm_client.chat_completion(
+            "openai",
+            OPENAI_CHAT_URL,
+            api_key,
+            messages=[
                 {
                     "role": "system",
                     "content": "You are a helpful assistant. Provide clear, informative answers to user questions."
@@ -133,34 +164,21 @@ def try_openai_api(question: str) -> Optional[str]:
                     "content": question
                 }
             ],
-            "max_tokens": 500,
-            "temperature": 0.7
-        }
-        
-        response = http_requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            timeout=30
+            model=ExternalAPIConfig.OPENAI_MODEL,
+            max_tokens=500,
+            temperature=0.7
         )
-        
-        if response.status_code == 200:
-            result = response.json()
-            if 'choices' in result and len(result['choices']) > 0:
-                return result['choices'][0]['message']['content'].strip()
-        
-        logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
-        return None
+        return answer.strip() if answer else None
         
     except Exception as e:
         logger.error(f"OpenAI API error: {str(e)}")
         return None
 
-def try_huggingface_api(question: str) -> Optional[str]:
+async def try_huggingface_api(question: str) -> Optional[str]:
     """Try Hugging Face Inference API (Free)"""
     try:
         # Use Hugging Face's free inference API (no key required for some models)
-        api_url = f"https://api-inference.huggingface.co/models/{ExternalAPIConfig.HUGGINGFACE_MODEL}"
+        api_url = HUGGINGFACE_INFERENCE_URL.format(model=ExternalAPIConfig.HUGGINGFACE_MODEL)
         
         # Try without authentication first (free tier)
         headers = {"Content-Type": "application/json"}
@@ -174,7 +192,7 @@ def try_huggingface_api(question: str) -> Optional[str]:
             }
         }
         
-        response = http_requests.post(api_url, headers=headers, json=payload, timeout=15)
+        response = await llm_client.post_json("huggingface", api_url, payload, headers=headers)
         
         if response.status_code == 200:
             result = response.json()
@@ -196,8 +214,8 @@ def try_huggingface_api(question: str) -> Optional[str]:
         
         for model in alternative_models:
             try:
-                alt_url = f"https://api-inference.huggingface.co/models/{model}"
-                response = http_requests.post(alt_url, headers=headers, json=payload, timeout=10)
+                alt_url = HUGGINGFACE_INFERENCE_URL.format(model=model)
+                response = await llm_client.post_json("huggingface", alt_url, payload, headers=headers, timeout=10)
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -205,7 +223,7 @@ def try_huggingface_api(question: str) -> Optional[str]:
                         generated_text = result[0].get('generated_text', '')
                         if generated_text:
                             return generated_text[:300]
-            except:
+            except Exception:
                 continue
         
         return None
@@ -214,7 +232,7 @@ def try_huggingface_api(question: str) -> Optional[str]:
         logger.error(f"Hugging Face API error: {str(e)}")
         return None
 
-def try_groq_api(question: str) -> Optional[str]:
+async def try_groq_api(question: str) -> Optional[str]:
     """Try Groq API (FREE)"""
     try:
         if not ExternalAPIConfig.is_groq_configured():
@@ -224,41 +242,38 @@ def try_groq_api(question: str) -> Optional[str]:
         if not api_key or api_key == "your_groq_key_here":
             return None
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "messages": [
+        system_prompt = GENERAL_SYSTEM_PROMPT
+        cache_key = prompt_fingerprint(question, system_prompt, ExternalAPIConfig.GROQ_MODEL, 0.7)
+        if ExternalAPIConfig.LLM_CACHE_ENABLED:
+            cached = await llm_response_cache.aget(cache_key)
+            if cached is not None:
+                return cached
+        
+        answer = await llm_client.chat_completion(
+            "groq",
+            GROQ_CHAT_URL,
+            api_key,
+            messages=[
                 {
                     "role": "system",
-                    "content": "You are a helpful assistant. Provide clear, informative answers to user questions."
+                    "content": system_prompt
                 },
                 {
                     "role": "user",
                     "content": question
                 }
             ],
-            "model": ExternalAPIConfig.GROQ_MODEL,
-            "max_tokens": 500,
-            "temperature": 0.7
-        }
-        
-        response = http_requests.post(
-            "https://api.groq.com/openai/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            timeout=30
+            model=ExternalAPIConfig.GROQ_MODEL,
+            max_tokens=500,
+            temperature=0.7
         )
+        if not answer:
+            return None
         
-        if response.status_code == 200:
-            result = response.json()
-            if 'choices' in result and len(result['choices']) > 0:
-                return result['choices'][0]['message']['content'].strip()
-        
-        logger.error(f"Groq API error: {response.status_code} - {response.text}")
-        return None
+        answer = answer.strip()
+        if ExternalAPIConfig.LLM_CACHE_ENABLED:
+            await llm_response_cache.aset(cache_key, answer)
+        return answer
         
     except Exception as e:
         logger.error(f"Groq API error: {str(e)}")
@@ -332,41 +347,65 @@ def get_fut_basic_info(question: str) -> str:
         return f"{fut_info['general']} It was established in {fut_info['established']} and is located in {fut_info['location']}. Visit {fut_info['website']} for more information."
 
 def load_model():
-    """Load the QA model and create pipeline"""
-    global qa_pipeline, model_loaded
-    
+    """Load (or reload) the QA model and swap it in; blocking, used by scripts and benchmarks"""
+    return qa_models.load()
+
+async def ensure_model_loaded():
+    """Wait for the QA model, starting the load if nothing has; 503 if it can't be loaded"""
     try:
-        # Try to load ultimate model first, then fallback to final model
-        model_path = "../data/models/fut_qa_model_ultimate"
-        if not os.path.exists(model_path):
-            model_path = "../data/models/fut_qa_model_final"
-        if os.path.exists(model_path):
-            logger.info(f"Loading fine-tuned model from: {model_path}")
-            tokenizer = AutoTokenizer.from_pretrained(model_path)
-            model = AutoModelForQuestionAnswering.from_pretrained(model_path)
-            qa_pipeline = pipeline("question-answering", model=model, tokenizer=tokenizer)
-            model_loaded = True
-            logger.info("Fine-tuned model loaded successfully")
-        else:
-            # Fallback to pre-trained model
-            logger.info("Fine-tuned model not found, using pre-trained model")
-            model_name = "distilbert/distilbert-base-cased-distilled-squad"
-            qa_pipeline = pipeline("question-answering", model=model_name)
-            model_loaded = True
-            logger.info("Pre-trained model loaded successfully")
-            
+        return await qa_models.ensure_loaded()
     except Exception as e:
-        logger.error(f"Error loading model: {str(e)}")
-        model_loaded = False
-        raise e
+        raise HTTPException(status_code=503, detail=f"Model not loaded: {str(e)}")
+
+def run_qa_batch(questions: List[str], contexts: List[str]) -> List[Dict]:
+    """One padded forward pass over a batch of (question, context) pairs"""
+    # Read the snapshot once: a reload mid-batch doesn't affect this batch
+    qa_pipeline = qa_models.current.pipeline
+    results = qa_pipeline(question=questions, context=contexts, batch_size=len(questions))
+    # The pipeline unwraps single-item batches
+    return [results] if isinstance(results, dict) else results
+
+qa_batcher = QABatcher(
+    run_qa_batch,
+    max_batch_size=RuntimeConfig.QA_BATCH_MAX_SIZE,
+    max_wait_ms=RuntimeConfig.QA_BATCH_MAX_WAIT_MS,
+    # One batch in flight per worker process
+    workers=worker_count() if RuntimeConfig.QA_EXECUTION == 'process' else 1
+)
+
+async def run_qa_model(question: str, context: str) -> Dict:
+    """Answer with the extractive QA model, batched with concurrent requests when enabled"""
+    model = await ensure_model_loaded()
+    if RuntimeConfig.QA_BATCHING_ENABLED:
+        return await qa_batcher.submit(question, context)
+    # Off the event loop: other requests keep being served during the forward pass
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lambda: model.pipeline(question=question, context=context))
 
 @app.on_event("startup")
 async def startup_event():
-    """Load model on startup"""
-    try:
-        load_model()
-    except Exception as e:
-        logger.error(f"Failed to load model on startup: {str(e)}")
+    """Start loading the QA model (and the dense retriever's encoder) in the background; keyword and knowledge-base answers are served meanwhile"""
+    # Refuse to start rather than serve an empty course catalogue
+    knowledge_store.load()
+    if RuntimeConfig.QA_MODEL_PRELOAD:
+        qa_models.start_load()
+    if RuntimeConfig.PRERENDER_RESPONSES:
+        count = unified_intelligence.prerender_responses()
+        logger.info(f"Pre-rendered {count} static answers (knowledge {knowledge_store.version})")
+    if RuntimeConfig.MATERIALS_TOP_K > 0:
+        # Opens the chunk store now so a missing or mismatched store is logged at startup, not on the first question
+        await asyncio.get_running_loop().run_in_executor(None, lambda: material_store.available)
+    if RuntimeConfig.MATERIALS_RETRIEVER in ('dense', 'hybrid'):
+        # Loads the sentence encoder off the event loop, before the first question needs it
+        asyncio.get_running_loop().run_in_executor(None, lambda: dense_index.available)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled connections to external providers, stop the QA batch workers and processes and flush the LLM cache"""
+    await llm_client.aclose()
+    qa_batcher.close()
+    qa_models.close()
+    llm_response_cache.close()
 
 @app.get("/", response_model=dict)
 async def root():
@@ -374,60 +413,94 @@ async def root():
     return {
         "message": "FUT QA Assistant API",
         "status": "running",
-        "model_loaded": model_loaded
+        "model_loaded": qa_models.loaded
     }
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint"""
+    """Liveness: the process is up and serving (see /ready for the QA model)"""
+    model_status = qa_models.get_status()
     return HealthResponse(
-        status="healthy" if model_loaded else "unhealthy",
-        model_loaded=model_loaded,
-        model_name="Johnson's Training Model"
+        status="healthy",
+        model_loaded=model_status['loaded'],
+        model_name="Johnson's Training Model",
+        model_version=model_status['version'],
+        model_load_seconds=model_status['load_seconds'],
+        model_reloading=model_status['loading'] and model_status['loaded']
     )
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 503 until the QA model has loaded (or if loading failed)"""
+    model_status = qa_models.get_status()
+    if model_status['loaded']:
+        state = "ready"
+    elif model_status['last_error'] and not model_status['loading']:
+        state = "failed"
+    elif qa_models.started:
+        state = "loading"
+    else:
+        # QA_MODEL_PRELOAD=false: the model loads on the first question that needs it
+        state = "on_demand"
+    ready = state in ("ready", "on_demand")
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "model_state": state,
+            "model_loaded": model_status['loaded'],
+            "model_version": model_status['version'],
+            "load_seconds": model_status['load_seconds'],
+            "error": model_status['last_error']
+        }
+    )
+
+# Questions answered from the department facts (lecturers, careers) rather than course materials
+LECTURER_KEYWORDS = ['lecturer', 'lecturers', 'teacher', 'teachers', 'instructor', 'instructors', 'professor', 'professors', 'dr.', 'dr', 'who teaches', 'who is teaching']
+FUT_CS_KEYWORDS = ['fut', 'futminna', 'computer science', 'cs department', 'department', 'university', 'minna']
+CAREER_KEYWORDS = ['career', 'careers', 'job', 'jobs', 'work', 'employment', 'industry', 'industries', 'path', 'paths']
+
+def is_department_question(question_lower: str) -> bool:
+    """Lecturer, FUT CS department or career question (naming a lecturer counts)"""
+    if any(keyword in question_lower for keyword in LECTURER_KEYWORDS + FUT_CS_KEYWORDS + CAREER_KEYWORDS):
+        return True
+    return bool(lecturer_index.mentioned(question_lower))
+
+def is_cs_domain_question(question_lower: str) -> bool:
+    """Whether a question belongs to the CS department dataset rather than general FUT info"""
+    # Domain keywords and course name variations live in keyword_matcher
+    if keyword_matcher.match(question_lower).any('cs_domain', 'cs_course_name'):
+        return True
+    return bool(extract_course_codes(question_lower)) or bool(lecturer_index.mentioned(question_lower))
+
 @app.post("/ask", response_model=QuestionResponse)
 async def ask_question(request: QuestionRequest):
     """Main question-answering endpoint with external API integration"""
-    if not model_loaded:
-        raise HTTPException(status_code=503, detail="Model not loaded")
+    # Paraphrases of recently answered questions are served from the semantic cache
+    use_semantic_cache = RuntimeConfig.SEMANTIC_CACHE_ENABLED and not request.context
+    if use_semantic_cache:
+        cached = semantic_cache.lookup(request.question)
+        if cached:
+            return QuestionResponse(**cached)
+    
+    response = await answer_question(request)
+    
+    if use_semantic_cache and response.confidence >= RuntimeConfig.SEMANTIC_CACHE_MIN_CONFIDENCE:
+        semantic_cache.store(request.question, response.model_dump())
     
+    return response
+
+async def answer_question(request: QuestionRequest) -> QuestionResponse:
+    """Route a question through unified intelligence, Groq, external APIs and the QA model"""
     try:
         # First, check if this is a general FUT question that should use external API
         question_lower = request.question.lower()
         
-        # Check for general FUT questions (not domain-specific CS questions)
-        general_fut_keywords = ['fut', 'university', 'minna', 'federal', 'technology', 'campus', 'admission', 'facilities']
-        cs_domain_keywords = ['course', 'lecturer', 'programming', 'computer', 'software', 'hardware', 'materials', 'study', 'cos', 'cst', 'mat', 'phy', 'cpt']
-        
-        is_general_fut = any(word in question_lower for word in general_fut_keywords)
-        is_cs_domain = any(word in question_lower for word in cs_domain_keywords)
-        
-        # Enhanced CS domain detection - more comprehensive course codes
-        cs_course_codes = [
-            'cos101', 'cos102', 'cos103', 'cos104', 'cos105', 'cos106', 'cos107', 'cos108', 'cos109', 'cos110',
-            'cst111', 'cst112', 'cst113', 'cst114', 'cst115', 'cst116', 'cst117', 'cst118', 'cst119', 'cst120',
-            'mat121', 'mat122', 'mat123', 'mat124', 'mat125', 'mat126', 'mat127', 'mat128', 'mat129', 'mat130',
-            'phy101', 'phy102', 'phy103', 'phy104', 'phy105', 'phy106', 'phy107', 'phy108', 'phy109', 'phy110',
-            'cpt111', 'cpt112', 'cpt113', 'cpt114', 'cpt115', 'cpt116', 'cpt117', 'cpt118', 'cpt119', 'cpt120',
-            'cpt192', 'cpt193', 'cpt194', 'cpt195', 'cpt196', 'cpt197', 'cpt198', 'cpt199', 'cpt200'
-        ]
-        has_cs_course = any(code in question_lower for code in cs_course_codes)
-        
-        # Also check for course name variations
-        course_name_variations = [
-            'computer science', 'computer studies', 'programming', 'software engineering',
-            'data structures', 'algorithms', 'database', 'networking', 'cybersecurity',
-            'artificial intelligence', 'machine learning', 'web development'
-        ]
-        has_cs_course_name = any(variation in question_lower for variation in course_name_variations)
-        
-        if has_cs_course or has_cs_course_name:
-            is_cs_domain = True
+        is_cs_domain = is_cs_domain_question(question_lower)
         
         # PRIORITY 1: Always use Unified Intelligence for CS domain questions
         # This ensures your specific dataset (COS101, COS102, etc.) is used first
-        if is_cs_domain or has_cs_course or has_cs_course_name:
+        if is_cs_domain:
             # Use Unified Intelligence System for domain-specific CS questions
             unified_response = unified_intelligence.get_unified_response(request.question, request.context or "")
             
@@ -452,12 +525,9 @@ async def ask_question(request: QuestionRequest):
                 )
         
         # PRIORITY 2: Use Groq with PDF data for CS questions, external APIs for general questions
-        if is_cs_domain or has_cs_course or has_cs_course_name:
+        if is_cs_domain:
             # For CS questions, try Groq with PDF data first
-            groq_pdf_response = call_groq_with_context(
-                request.question, 
-                f"You are a specialized assistant for Federal University of Technology, Minna Computer Science Department.\n\n{get_comprehensive_fut_cs_context()}\n\nProvide detailed, accurate information based on the FUT Computer Science context above. Be specific about lecturers, courses, career paths, and academic information."
-            )
+            groq_pdf_response = await call_groq_with_context(request.question, await get_cs_system_prompt(request.question))
             if groq_pdf_response:
                 return QuestionResponse(
                     answer=groq_pdf_response,
@@ -466,7 +536,7 @@ async def ask_question(request: QuestionRequest):
                 )
         else:
             # For general questions, use external APIs
-            external_response = get_external_llm_response(request.question)
+            external_response = await get_external_llm_response(request.question)
             if external_response and "I understand you're asking about" not in external_response:
                 return QuestionResponse(
                     answer=external_response,
@@ -484,18 +554,8 @@ async def ask_question(request: QuestionRequest):
                 model_used="Johnson's Training Model"
             )
         
-        # Prepare the input for QA model
-        if request.context:
-            # Use provided context
-            result = qa_pipeline(question=request.question, context=request.context)
-        else:
-            # Use default FUT context for academic questions
-            default_context = """
-            Federal University of Technology (FUT) is a Nigerian university focused on technology and engineering education. 
-            The university offers various programs in engineering, technology, and applied sciences. 
-            Students can access academic resources, course materials, and institutional information through various channels.
-            """
-            result = qa_pipeline(question=request.question, context=default_context)
+        # QA model over the provided context, or the default FUT context for academic questions
+        result = await run_qa_model(request.question, await get_qa_context(request))
         
         # Use Johnson's Training Model name
         return QuestionResponse(
@@ -504,20 +564,157 @@ async def ask_question(request: QuestionRequest):
             model_used="Johnson's Training Model"
         )
         
+    except HTTPException:
+        # e.g. 503 when the QA model fallback is needed but the model couldn't load
+        raise
     except Exception as e:
         logger.error(f"Error processing question: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
 
+@app.post("/ask/stream")
+async def ask_question_stream(request: QuestionRequest):
+    """Streaming variant of /ask using Server-Sent Events"""
+    return StreamingResponse(stream_answer(request), media_type="text/event-stream", headers=SSE_HEADERS)
+
+async def stream_answer(request: QuestionRequest):
+    """Yield a `start` event, `delta` chunks as the answer is produced, then `done` (or `error`)"""
+    model_used = "Johnson's Training Model"
+    # Flush something immediately so slow networks see the first byte right away
+    yield sse_event({"model_used": model_used}, event="start")
+    
+    try:
+        use_semantic_cache = RuntimeConfig.SEMANTIC_CACHE_ENABLED and not request.context
+        if use_semantic_cache:
+            cached = semantic_cache.lookup(request.question)
+            if cached:
+                for chunk in chunk_markdown(cached['answer']):
+                    yield sse_event({"delta": chunk})
+                yield sse_event({"confidence": cached['confidence'], "model_used": cached['model_used']}, event="done")
+                return
+        
+        is_cs_domain = is_cs_domain_question(request.question.lower())
+        answer = None
+        confidence = 0.0
+        streamed = False
+        
+        # Same priority order as /ask
+        if is_cs_domain:
+            unified_response = unified_intelligence.get_unified_response(request.question, request.context or "")
+            if unified_response and unified_response.get('answer'):
+                answer = unified_response['answer']
+                confidence = unified_response['confidence']
+        
+        # CS questions stream from Groq as /ask calls it. Other questions go through the same
+        # health-ordered hedged fan-out as /ask; only when Groq leads that order is it streamed
+        # directly (token by token instead of raced against the others), falling back to the fan-out
+        stream_prompt = None
+        if answer is None:
+            if is_cs_domain:
+                stream_prompt = (await get_cs_system_prompt(request.question), 0.3, 0.95)
+            elif healthiest_external_provider(request.question) == "groq":
+                stream_prompt = (GENERAL_SYSTEM_PROMPT, 0.7, 0.85)
+        
+        if stream_prompt is not None:
+            system_prompt, temperature, groq_confidence = stream_prompt
+            parts = []
+            async for delta in stream_groq_with_context(request.question, system_prompt, temperature):
+                parts.append(delta)
+                yield sse_event({"delta": delta})
+            if parts:
+                answer = "".join(parts)
+                confidence = groq_confidence
+                streamed = True
+        
+        if answer is None and not is_cs_domain:
+            external_response = await get_external_llm_response(request.question)
+            if external_response and "I understand you're asking about" not in external_response:
+                answer = external_response
+                confidence = 0.85
+        
+        if answer is None:
+            unified_response = unified_intelligence.get_unified_response(request.question, request.context or "")
+            if unified_response and unified_response.get('answer'):
+                answer = unified_response['answer']
+                confidence = unified_response['confidence']
+        
+        if answer is None:
+            result = await run_qa_model(request.question, await get_qa_context(request))
+            answer = result["answer"]
+            confidence = result["score"]
+        
+        if not streamed:
+            for chunk in chunk_markdown(answer):
+                yield sse_event({"delta": chunk})
+        
+        yield sse_event({"confidence": confidence, "model_used": model_used}, event="done")
+        
+        if use_semantic_cache and confidence >= RuntimeConfig.SEMANTIC_CACHE_MIN_CONFIDENCE:
+            semantic_cache.store(request.question, {
+                "answer": answer.strip() if streamed else answer,
+                "confidence": confidence,
+                "model_used": model_used
+            })
+        
+    except Exception as e:
+        logger.error(f"Error streaming answer: {str(e)}")
+        yield sse_event({"detail": f"Error processing question: {str(e)}"}, event="error")
+
 @app.post("/reload-model")
-async def reload_model():
-    """Reload the model (useful after training)"""
+async def reload_model(wait: bool = True):
+    """Reload the model (useful after training) without interrupting traffic
+
+    The new model is built and warmed up on a worker thread and swapped in
+    atomically; requests keep using the current model until then. With
+    wait=false the reload runs in the background and this returns at once.
+    """
     try:
-        load_model()
-        return {"message": "Model reloaded successfully", "model_loaded": model_loaded}
+        reload = qa_models.start_load()
+        if not wait:
+            return {
+                "message": "Model reload started",
+                "model_loaded": qa_models.loaded,
+                "model_version": qa_models.get_status()['version'],
+                "reloading": True
+            }
+        model = await asyncio.shield(reload)
+        return {
+            "message": "Model reloaded successfully",
+            "model_loaded": True,
+            "model_version": model.version,
+            "load_seconds": round(model.load_seconds, 2),
+            "warm_up_seconds": round(model.warm_up_seconds, 2)
+        }
     except Exception as e:
         logger.error(f"Error reloading model: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error reloading model: {str(e)}")
 
+@app.post("/reload-knowledge")
+async def reload_knowledge():
+    """Re-read data/knowledge/*.json and lecturer_database.json without a restart
+
+    The lecturer index, pre-rendered answers and department context are keyed
+    by the knowledge version and rebuilt on next use; semantic cache answers
+    given from the old data are dropped. If the files can't be read the
+    current knowledge stays in use.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        changed = await loop.run_in_executor(None, knowledge_store.reload)
+        rendered = 0
+        if changed:
+            semantic_cache.clear()
+            if RuntimeConfig.PRERENDER_RESPONSES:
+                rendered = await loop.run_in_executor(None, unified_intelligence.prerender_responses)
+        return {
+            "message": "Knowledge reloaded" if changed else "Knowledge unchanged",
+            "changed": changed,
+            "knowledge_version": knowledge_store.version,
+            "prerendered_answers": rendered
+        }
+    except Exception as e:
+        logger.error(f"Error reloading knowledge: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error reloading knowledge: {str(e)}")
+
 @app.get("/conversation-summary")
 async def get_conversation_summary():
     """Get conversation summary from unified intelligence"""
@@ -560,17 +757,95 @@ async def get_external_api_status():
             "gemini_configured": ExternalAPIConfig.is_gemini_configured(),
             "huggingface_configured": ExternalAPIConfig.is_huggingface_configured(),
             "groq_configured": ExternalAPIConfig.is_groq_configured(),
+            "connection_pools": llm_client.get_status(),
+            "circuit_breakers": provider_health.get_status(),
+            "request_coalescing": llm_client.single_flight.get_stats(),
+            "fanout": {
+                "mode": ExternalAPIConfig.LLM_FANOUT_MODE,
+                "hedge_delay": ExternalAPIConfig.LLM_HEDGE_DELAY,
+                "deadline": ExternalAPIConfig.LLM_REQUEST_DEADLINE,
+                **provider_fanout.get_stats()
+            },
             "message": f"External APIs configured: {', '.join(available_apis) if available_apis else 'None'}"
         }
     except Exception as e:
         logger.error(f"Error getting external API status: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error getting external API status: {str(e)}")
 
+@app.get("/cache-status")
+async def get_cache_status():
+    """Get hit/miss counters for the LLM answer and semantic caches"""
+    try:
+        return {
+            "status": "success",
+            # Counts the disk rows, so off the event loop
+            "llm_response_cache": await asyncio.get_running_loop().run_in_executor(None, llm_response_cache.get_status),
+            "semantic_cache": semantic_cache.get_status()
+        }
+    except Exception as e:
+        logger.error(f"Error getting cache status: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting cache status: {str(e)}")
+
+@app.get("/qa-status")
+async def get_qa_status():
+    """Get micro-batching counters for the local QA model"""
+    try:
+        return {
+            "status": "success",
+            "model_loaded": qa_models.loaded,
+            "model": qa_models.get_status(),
+            "batching_enabled": RuntimeConfig.QA_BATCHING_ENABLED,
+            "batching": qa_batcher.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting QA status: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting QA status: {str(e)}")
+
+@app.get("/retrieve")
+async def retrieve_materials(question: str, k: Optional[int] = None, course: Optional[str] = None):
+    """Material chunks the hybrid retriever returns for a question, with per-stage timings
+
+    course narrows the search (comma-separated codes); by default the course
+    codes mentioned in the question are used.
+    """
+    try:
+        k = k or RuntimeConfig.MATERIALS_TOP_K or 4
+        courses = [code.strip() for code in course.split(',') if code.strip()] if course \
+            else extract_course_codes(question)
+        chunks, timings = await asyncio.get_running_loop().run_in_executor(
+            None, hybrid_retriever.retrieve_with_timings, question, k, courses or None)
+        return {
+            "question": question,
+            "courses": courses,
+            "dense_used": hybrid_retriever.dense.available,
+            "chunks": chunks,
+            "timings_ms": timings
+        }
+    except Exception as e:
+        logger.error(f"Error retrieving materials: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving materials: {str(e)}")
+
+@app.get("/retrieval-status")
+async def get_retrieval_status():
+    """Material store, index and hybrid retrieval settings and average stage timings"""
+    try:
+        return {
+            "status": "success",
+            "retriever": RuntimeConfig.MATERIALS_RETRIEVER,
+            "store": material_store.get_stats(),
+            "bm25": bm25_index.get_stats(),
+            "dense": dense_index.get_stats(),
+            "hybrid": hybrid_retriever.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting retrieval status: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting retrieval status: {str(e)}")
+
 @app.post("/ask-groq")
 async def ask_groq_direct(request: QuestionRequest):
     """Direct Groq API endpoint for enhanced responses"""
     try:
-        groq_response = try_groq_api(request.question)
+        groq_response = await try_groq_api(request.question)
         if groq_response:
             return QuestionResponse(
                 answer=groq_response,
@@ -589,33 +864,12 @@ async def ask_groq_pdf_trained(request: QuestionRequest):
     try:
         question_lower = request.question.lower()
         
-        # Enhanced course detection
-        course_codes = ["COS101", "COS102", "COS103", "COS104", "COS105", "COS106", "COS107", "COS108", "COS109", "COS110",
-                       "CST111", "CST112", "CST113", "CST114", "CST115", "CST116", "CST117", "CST118", "CST119", "CST120",
-                       "MAT121", "MAT122", "MAT123", "MAT124", "MAT125", "MAT126", "MAT127", "MAT128", "MAT129", "MAT130",
-                       "PHY101", "PHY102", "PHY103", "PHY104", "PHY105", "PHY106", "PHY107", "PHY108", "PHY109", "PHY110",
-                       "CPT111", "CPT112", "CPT113", "CPT114", "CPT115", "CPT116", "CPT117", "CPT118", "CPT119", "CPT120",
-                       "CPT192", "CPT193", "CPT194", "CPT195", "CPT196", "CPT197", "CPT198", "CPT199", "CPT200",
-                       "GST112", "STA111"]
-        
-        # Check for specific course questions
-        course_context = None
-        for course in course_codes:
-            if course.lower() in question_lower:
-                course_context = course
-                break
-        
-        # Check for lecturer-related questions
-        lecturer_keywords = ['lecturer', 'lecturers', 'teacher', 'teachers', 'instructor', 'instructors', 'professor', 'professors', 'dr.', 'dr', 'who teaches', 'who is teaching']
-        is_lecturer_question = any(keyword in question_lower for keyword in lecturer_keywords)
-        
-        # Check for general CS questions about FUT
-        fut_cs_keywords = ['fut', 'futminna', 'computer science', 'cs department', 'department', 'university', 'minna']
-        is_fut_cs_question = any(keyword in question_lower for keyword in fut_cs_keywords)
-        
-        # Check for career/academic questions
-        career_keywords = ['career', 'careers', 'job', 'jobs', 'work', 'employment', 'industry', 'industries', 'path', 'paths']
-        is_career_question = any(keyword in question_lower for keyword in career_keywords)
+        # Check for specific course questions (COS102, "cos 102", FTM-CPT112, ...)
+        mentioned_codes = extract_course_codes(question_lower)
+        course_context = mentioned_codes[0] if mentioned_codes else None
+        
+        # Check for lecturer, FUT CS department and career questions
+        is_department = is_department_question(question_lower)
         
         # Check for skills questions
         skills_keywords = ['skills', 'skill', 'learn', 'learning', 'study', 'studying', 'essential', 'important', 'required']
@@ -623,8 +877,11 @@ async def ask_groq_pdf_trained(request: QuestionRequest):
         
         # Determine the best context to provide
         if course_context:
-            # Specific course question
+            # Specific course question: course summary plus the material passages that match the question
             pdf_content = get_course_pdf_content(course_context)
+            material_context = await aretrieve_material_context(request.question, mentioned_codes)
+            if material_context:
+                pdf_content += f"\n\nExcerpts from the {course_context} course materials:\n\n{material_context}"
             system_prompt = f"""
             You are a specialized assistant for Federal University of Technology, Minna Computer Science courses.
             
@@ -636,9 +893,9 @@ async def ask_groq_pdf_trained(request: QuestionRequest):
             Include information about lecturers, materials, and practical sessions when available.
             If asked about lecturers, provide the exact names from the course content.
             """
-        elif is_lecturer_question or is_fut_cs_question or is_career_question or is_skills_question:
+        elif is_department or is_skills_question:
             # General FUT CS question - use comprehensive context
-            fut_context = get_comprehensive_fut_cs_context()
+            fut_context = get_department_context(request.question)
             system_prompt = f"""
             You are a specialized assistant for Federal University of Technology, Minna Computer Science Department.
             
@@ -651,10 +908,13 @@ async def ask_groq_pdf_trained(request: QuestionRequest):
             If asked about skills, provide the essential skills list from the context.
             """
         else:
-            # General CS question
+            # General CS question, grounded in the course materials when any passage matches
             system_prompt = "You are a computer science expert. Provide detailed, educational explanations suitable for university students."
+            material_context = await aretrieve_material_context(request.question)
+            if material_context:
+                system_prompt += f"\n\nRelevant excerpts from FUT course materials:\n\n{material_context}"
         
-        groq_response = call_groq_with_context(request.question, system_prompt)
+        groq_response = await call_groq_with_context(request.question, system_prompt)
         
         if groq_response:
             return QuestionResponse(
@@ -818,307 +1078,210 @@ async def download_course_materials(course_code: str):
 
 def get_course_pdf_content(course_code):
     """Get PDF content for a specific course"""
+    summary = knowledge_store.course_summary(course_code)
+    return summary or f"{course_code} - Course content not available"
+
+def format_material_context(chunks: List[Dict]) -> str:
+    """Retrieved chunks as prompt excerpts labelled with course, file and page/slide
+
+    Overlapping chunks of the same page are merged so shared text is sent once.
+    """
+    merged: List[Dict] = []
+    for chunk in sorted(chunks, key=lambda c: (c['source'], c['page'] or 0, c['start'])):
+        previous = merged[-1] if merged else None
+        if previous and (previous['source'], previous['page']) == (chunk['source'], chunk['page']) \
+                and chunk['start'] <= previous['end']:
+            if chunk['end'] > previous['end']:
+                previous['text'] += chunk['text'][previous['end'] - chunk['start']:]
+                previous['end'] = chunk['end']
+            continue
+        merged.append(dict(chunk))
     
-    # Enhanced content based on your actual PDF data
-    course_content = {
-        "COS101": """
-        COS101 - Introduction to Computer Science
-        
-        Course Overview:
-        This course introduces students to the fundamental concepts of computer science including:
-        - History of computing and computer evolution
-        - Computer hardware components (CPU, RAM, Storage, Input/Output devices)
-        - Software systems and operating systems
-        - Programming basics and syntax
-        - Problem-solving techniques and algorithms
-        - Introduction to data structures and programming logic
-        
-        Learning Objectives:
-        1. Understand the evolution of computers from abacus to modern systems
-        2. Learn basic computer hardware components and their functions
-        3. Introduction to programming concepts and syntax
-        4. Develop logical thinking and problem-solving skills
-        5. Understand the role of algorithms in computing
-        
-        Assessment Structure:
-        - Continuous Assessment: 30% (Assignments, Quizzes, Lab work)
-        - Mid-term Examination: 20% (Theory and Practical)
-        - Final Examination: 50% (Comprehensive)
-        
-        Lecturers: Umar Alkali, O. Ojerinde O, Abisoye O. A, Lawal Olamilekan Lawal, Bashir Suleiman
-        
-        Course Materials:
-        - Introduction to Computer Science textbook
-        - Programming exercises and assignments
-        - Lab manuals and practical guides
-        - Past examination questions
-        """,
-        "COS102": """
-        COS102 - Introduction to Problem Solving
-        
-        Course Overview:
-        This course focuses on problem-solving techniques and programming fundamentals:
-        - Algorithm design and analysis
-        - Flowchart creation and documentation
-        - Programming logic and control structures
-        - Debugging techniques and error handling
-        - Code optimization and best practices
-        
-        Programming Languages Covered:
-        - Python programming basics
-        - Control structures (if-else, loops)
-        - Functions and modular programming
-        - Data types and variable manipulation
-        - Input/output operations
-        
-        Practical Sessions:
-        - Weekly programming laboratories
-        - Group programming projects
-        - Code review and peer assessment
-        - Debugging and testing exercises
-        
-        Lecturers: Sadiu Ahmed Abubakar, Shuaibu M Badeggi, Ibrahim Shehi Shehu, Abubakar Suleiman T, Lasotte Yakubu
-        
-        Assessment:
-        - Lab Assignments: 40%
-        - Programming Projects: 30%
-        - Final Examination: 30%
-        """,
-        "PHY101": """
-        PHY101 - General Physics I
-        
-        Course Content:
-        - Mechanics and motion
-        - Forces and energy
-        - Waves and oscillations
-        - Thermodynamics basics
-        - Laboratory experiments
-        
-        Lecturers: Aku Ibrahim
-        
-        Assessment:
-        - Laboratory Work: 30%
-        - Continuous Assessment: 20%
-        - Final Examination: 50%
-        """,
-        "PHY102": """
-        PHY102 - General Physics II
-        
-        Course Content:
-        - Advanced mechanics and motion
-        - Electromagnetism
-        - Optics and wave phenomena
-        - Modern physics concepts
-        - Laboratory experiments
-        
-        Lecturers: Dr. Julia Elchie
-        
-        Assessment:
-        - Laboratory Work: 30%
-        - Continuous Assessment: 20%
-        - Final Examination: 50%
-        """,
-        "CST111": """
-        CST111 - Communication in English
-        
-        Course Content:
-        - English language skills
-        - Technical writing
-        - Presentation skills
-        - Communication in academic settings
-        
-        Lecturers: Okeli Chike, Amina Gogo Tafida, Halima Shehu
-        
-        Assessment:
-        - Written Assignments: 40%
-        - Oral Presentations: 30%
-        - Final Examination: 30%
-        """,
-        "CPT111": """
-        FTM-CPT111 - Probability for Computer Science
-        
-        Course Content:
-        - Probability theory and applications
-        - Statistical methods for computer science
-        - Data analysis techniques
-        - Mathematical foundations for CS
-        
-        Lecturers: Saliu Adam Muhammad, Saidu Ahmed Abubakar
-        
-        Assessment:
-        - Assignments: 30%
-        - Mid-term Test: 20%
-        - Final Examination: 50%
-        """,
-        "CPT112": """
-        FTM-CPT112 - Front End Web Development
-        
-        Course Content:
-        - HTML, CSS, JavaScript fundamentals
-        - Responsive web design
-        - Front-end frameworks
-        - User interface design
-        - Web development best practices
-        
-        Lecturers: Benjamin Alenoghen, Lawal Olamilekan Lawal, Lasotte Yakubu, Benjamin Alenoghena
-        
-        Assessment:
-        - Web Development Projects: 40%
-        - Practical Assignments: 30%
-        - Final Examination: 30%
-        """,
-        "CPT192": """
-        FTM-CPT192 - Introduction to Computer Hardware
-        
-        Course Content:
-        - Computer hardware components
-        - System architecture
-        - Hardware troubleshooting
-        - Assembly and maintenance
-        - Hardware-software interaction
-        
-        Lecturers: Benjamin Alenoghen
-        
-        Assessment:
-        - Hardware Labs: 40%
-        - Practical Projects: 30%
-        - Final Examination: 30%
-        """
-    }
-    
-    return course_content.get(course_code, f"{course_code} - Course content not available")
+    excerpts = []
+    for chunk in merged:
+        location = os.path.basename(chunk['source'])
+        if chunk['page']:
+            location += f", {'slide' if chunk['kind'] == 'pptx' else 'page'} {chunk['page']}"
+        excerpts.append(f"[{chunk['course'] or 'Course material'} - {location}]\n{chunk['text']}")
+    return "\n\n".join(excerpts)
+
+def get_material_retriever():
+    """The MATERIALS_RETRIEVER index; BM25 when the dense index hasn't been built"""
+    if RuntimeConfig.MATERIALS_RETRIEVER == 'hybrid':
+        return hybrid_retriever
+    if RuntimeConfig.MATERIALS_RETRIEVER == 'dense' and dense_index.available:
+        return dense_index
+    return bm25_index
+
+def retrieve_material_context(question: str, course_codes: Optional[List[str]] = None) -> Optional[str]:
+    """The MATERIALS_TOP_K best-matching material chunks (only those courses' if given) as prompt text"""
+    if RuntimeConfig.MATERIALS_TOP_K <= 0:
+        return None
+    try:
+        chunks = get_material_retriever().retrieve(question, RuntimeConfig.MATERIALS_TOP_K, course_codes)
+    except Exception as e:
+        logger.error(f"Material retrieval error: {str(e)}")
+        return None
+    return format_material_context(chunks) if chunks else None
+
+async def aretrieve_material_context(question: str, course_codes: Optional[List[str]] = None) -> Optional[str]:
+    """retrieve_material_context on a worker thread: BM25 scoring, the dense matmul and a first-use encoder load stay off the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(None, retrieve_material_context, question, course_codes)
+
+async def get_qa_context(request: QuestionRequest) -> str:
+    """Passage for the extractive QA fallback: the caller's context, else matching material chunks, else the FUT default"""
+    if request.context:
+        return request.context
+    if RuntimeConfig.MATERIALS_TOP_K > 0:
+        try:
+            retriever = get_material_retriever()
+            chunks = await asyncio.get_running_loop().run_in_executor(
+                None, retriever.retrieve, request.question, RuntimeConfig.MATERIALS_TOP_K,
+                extract_course_codes(request.question))
+            if chunks:
+                return "\n\n".join(chunk['text'] for chunk in chunks)
+        except Exception as e:
+            logger.error(f"Material retrieval error: {str(e)}")
+    return DEFAULT_QA_CONTEXT
+
+async def get_cs_system_prompt(question: str) -> str:
+    """System prompt for CS department questions answered by Groq
+
+    Course-material passages matching the question when there are any; the
+    full department context for lecturer/career questions or when nothing matches.
+    """
+    question_lower = question.lower()
+    if not is_department_question(question_lower):
+        material_context = await aretrieve_material_context(question, extract_course_codes(question_lower))
+        if material_context:
+            return f"You are a specialized assistant for Federal University of Technology, Minna Computer Science Department.\n\nRelevant excerpts from FUT course materials:\n\n{material_context}\n\nAnswer from the excerpts above and mention the course material you used. If they don't cover the question, answer from general computer science knowledge."
+    return f"You are a specialized assistant for Federal University of Technology, Minna Computer Science Department.\n\n{get_department_context(question)}\n\nProvide detailed, accurate information based on the FUT Computer Science context above. Be specific about lecturers, courses, career paths, and academic information."
+
+def get_department_context(question: str) -> str:
+    """Department context plus the courses of any lecturer named in the question"""
+    context = get_comprehensive_fut_cs_context()
+    lecturers = lecturer_index.mentioned(question)
+    if lecturers:
+        context += f"\n\nLECTURERS NAMED IN THE QUESTION (closest spellings on record):\n{format_lecturer_matches(lecturers)}"
+    return context
+
+# Rendered department context, keyed by knowledge store version
+fut_cs_context_cache: Dict[str, str] = {}
 
 def get_comprehensive_fut_cs_context():
     """Get comprehensive FUT Computer Science context for Groq"""
+    version = knowledge_store.version
+    context = fut_cs_context_cache.get(version)
+    if context is None:
+        context = render_fut_cs_context()
+        fut_cs_context_cache.clear()
+        fut_cs_context_cache[version] = context
+    return context
+
+def render_fut_cs_context() -> str:
+    """Lecturers, courses and department guide from the knowledge store as plain text"""
+    lines = ["FEDERAL UNIVERSITY OF TECHNOLOGY, MINNA - COMPUTER SCIENCE DEPARTMENT", "", "CURRENT LECTURERS AND COURSES:"]
+    for level, courses in knowledge_store.catalogue().items():
+        for code, name in courses.items():
+            lecturers = knowledge_store.course_lecturers(code)
+            if lecturers:
+                names = ", ".join(f"{lecturer['name']} ({lecturer['role']})" for lecturer in lecturers)
+                lines.append(f"- {code} - {name} ({level.replace('_', ' ')}): {names}")
     
-    return """
-    FEDERAL UNIVERSITY OF TECHNOLOGY, MINNA - COMPUTER SCIENCE DEPARTMENT
-    
-    CURRENT LECTURERS AND COURSES:
-    
-    PHYSICS COURSES:
-    - PHY 101 - General Physics I: Aku Ibrahim
-    - PHY 102 - General Physics II: Dr. Julia Elchie
-    
-    COMPUTER SCIENCE CORE COURSES:
-    - COS 101 - Introduction to Computer Science:
-      Lecturers: Umar Alkali, O. Ojerinde O, Abisoye O. A, Lawal Olamilekan Lawal, Bashir Suleiman
-      
-    - COS 102 - Introduction to Problem Solving:
-      Lecturers: Sadiu Ahmed Abubakar, Shuaibu M Badeggi, Ibrahim Shehi Shehu, Abubakar Suleiman T, Lasotte Yakubu
-    
-    COMMUNICATION COURSES:
-    - CST 111 - Communication in English:
-      Lecturers: Okeli Chike, Amina Gogo Tafida, Halima Shehu
-    
-    GENERAL STUDIES:
-    - GST 112 - Nigerian Peoples and Culture: Isah Usman
-    
-    COMPUTER SCIENCE SPECIALIZED COURSES:
-    - FTM-CPT111 - Probability for Computer Science:
-      Lecturers: Saliu Adam Muhammad, Saidu Ahmed Abubakar
-      
-    - FTM-CPT112 - Front End Web Development:
-      Lecturers: Benjamin Alenoghen, Lawal Olamilekan Lawal, Lasotte Yakubu, Benjamin Alenoghena
-      
-    - FTM-CPT192 - Introduction to Computer Hardware:
-      Lecturers: Benjamin Alenoghen
-    
-    STATISTICS:
-    - STA111 - Descriptive Statistics: Olayiwola Adelutu
-    
-    PHYSICS PRACTICAL:
-    - PHY 101 - General Practical Physics I: Moses AS
-    
-    CAREER PATHS IN COMPUTER SCIENCE:
-    1. Software Development
-    2. Web Development
-    3. Mobile App Development
-    4. Data Science and Analytics
-    5. Cybersecurity
-    6. Artificial Intelligence and Machine Learning
-    7. Database Administration
-    8. Network Administration
-    9. System Administration
-    10. IT Consulting
-    
-    ESSENTIAL SKILLS FOR COMPUTER SCIENCE STUDENTS:
-    - Programming Languages (Python, Java, C++, JavaScript)
-    - Problem-solving and logical thinking
-    - Data structures and algorithms
-    - Database management
-    - Web development
-    - Software engineering principles
-    - Mathematics and statistics
-    - Communication skills
-    - Project management
-    - Continuous learning
-    
-    INDUSTRIES WHERE COMPUTER SCIENCE GRADUATES CAN WORK:
-    - Technology companies (Google, Microsoft, Apple, etc.)
-    - Financial services and banking
-    - Healthcare and medical technology
-    - E-commerce and retail
-    - Gaming and entertainment
-    - Government and public sector
-    - Education and research
-    - Consulting firms
-    - Startups and entrepreneurship
-    - Telecommunications
-    
-    COMPUTER SCIENCE CONTRIBUTION TO SOCIETY (Next 15 years):
-    - Artificial Intelligence and automation
-    - Smart cities and IoT
-    - Healthcare technology and telemedicine
-    - Environmental monitoring and sustainability
-    - Education technology and e-learning
-    - Financial technology and digital banking
-    - Cybersecurity and data protection
-    - Space technology and exploration
-    - Biotechnology and bioinformatics
-    - Renewable energy optimization
-    """
+    guide = knowledge_store.department_guide
+    sections = [
+        ("CAREER PATHS IN COMPUTER SCIENCE:", guide['career_paths'], True),
+        ("ESSENTIAL SKILLS FOR COMPUTER SCIENCE STUDENTS:", guide['essential_skills'], False),
+        ("INDUSTRIES WHERE COMPUTER SCIENCE GRADUATES CAN WORK:", guide['industries'], False),
+        ("COMPUTER SCIENCE CONTRIBUTION TO SOCIETY (Next 15 years):", guide['future_contributions'], False)
+    ]
+    for title, items, numbered in sections:
+        lines += ["", title]
+        lines += [f"{number}. {item}" if numbered else f"- {item}" for number, item in enumerate(items, 1)]
+    return "\n".join(lines)
 
-def call_groq_with_context(question, system_prompt):
+async def call_groq_with_context(question, system_prompt):
     """Call Groq API with specific context"""
     
     try:
         if not ExternalAPIConfig.is_groq_configured():
             return None
         
-        headers = {
-            "Authorization": f"Bearer {ExternalAPIConfig.GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
+        cache_key = prompt_fingerprint(question, system_prompt, ExternalAPIConfig.GROQ_MODEL, 0.3)
+        if ExternalAPIConfig.LLM_CACHE_ENABLED:
+            cached = await llm_response_cache.aget(cache_key)
+            if cached is not None:
+                return cached
         
-        payload = {
-            "messages": [
+        # Fail fast while Groq's circuit is open
+        if not provider_health.is_available("groq"):
+            logger.info("Skipping Groq context call: circuit open")
+            return None
+        
+        answer = await llm_client.chat_completion(
+            "groq",
+            GROQ_CHAT_URL,
+            ExternalAPIConfig.GROQ_API_KEY,
+            messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": question}
             ],
-            "model": ExternalAPIConfig.GROQ_MODEL,
-            "max_tokens": 500,
-            "temperature": 0.3
-        }
-        
-        response = http_requests.post(
-            "https://api.groq.com/openai/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            timeout=30
+            model=ExternalAPIConfig.GROQ_MODEL,
+            max_tokens=500,
+            temperature=0.3
         )
-        
-        if response.status_code == 200:
-            result = response.json()
-            if 'choices' in result and len(result['choices']) > 0:
-                return result['choices'][0]['message']['content']
-        
-        return None
+        if answer and ExternalAPIConfig.LLM_CACHE_ENABLED:
+            await llm_response_cache.aset(cache_key, answer)
+        return answer
         
     except Exception as e:
         logger.error(f"Groq context API error: {e}")
         return None
 
+async def stream_groq_with_context(question: str, system_prompt: str, temperature: float):
+    """Stream a Groq answer chunk by chunk (cached answers are replayed in chunks)"""
+    if not ExternalAPIConfig.is_groq_configured():
+        return
+    
+    cache_key = prompt_fingerprint(question, system_prompt, ExternalAPIConfig.GROQ_MODEL, temperature)
+    if ExternalAPIConfig.LLM_CACHE_ENABLED:
+        cached = await llm_response_cache.aget(cache_key)
+        if cached is not None:
+            for chunk in chunk_markdown(cached):
+                yield chunk
+            return
+    
+    if not provider_health.is_available("groq"):
+        logger.info("Skipping Groq stream: circuit open")
+        return
+    
+    parts = []
+    try:
+        async for delta in llm_client.stream_chat_completion(
+            "groq",
+            GROQ_CHAT_URL,
+            ExternalAPIConfig.GROQ_API_KEY,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": question}
+            ],
+            model=ExternalAPIConfig.GROQ_MODEL,
+            max_tokens=500,
+            temperature=temperature
+        ):
+            parts.append(delta)
+            yield delta
+    except Exception as e:
+        logger.error(f"Groq stream error: {e}")
+        # Nothing sent yet: let the caller fall back to another source
+        if not parts:
+            return
+        raise
+    
+    answer = "".join(parts).strip()
+    if answer and ExternalAPIConfig.LLM_CACHE_ENABLED:
+        await llm_response_cache.aset(cache_key, answer)
+
 @app.get("/materials/{course_code}")
 async def get_course_materials(course_code: str):
     """Get available course materials for a specific course"""
@@ -0,0 +1,182 @@
+"""
+BM25 inverted index over the course-material chunks
+Postings are stored term-sorted in flat .npy arrays (chunk ids and term
+frequencies, sliced by a term-offsets array) and memory-mapped at load, so
+opening the index reads only the vocabulary; a query touches only the
+postings of its own terms
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import RuntimeConfig
+from material_store import ChunkStore, material_store
+from text_tokens import tokenize
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INDEX_DIR = 'bm25'
+META_FILE = 'meta.json'
+ARRAY_FILES = ('term_offsets', 'postings_chunks', 'postings_tf', 'chunk_lengths')
+
+
+def build_bm25_index(store: ChunkStore, directory: str, k1: float = 1.5, b: float = 0.75) -> Dict:
+    """Index every chunk of the store into directory; returns the meta written"""
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    lengths: List[int] = []
+    for chunk in store:
+        tokens = tokenize(chunk['text'])
+        lengths.append(len(tokens))
+        for term, tf in Counter(tokens).items():
+            postings.setdefault(term, []).append((chunk['id'], tf))
+
+    terms = sorted(postings)
+    offsets = np.zeros(len(terms) + 1, dtype=np.uint64)
+    offsets[1:] = np.cumsum([len(postings[term]) for term in terms])
+    flat = [entry for term in terms for entry in postings[term]]
+    arrays = {
+        'term_offsets': offsets,
+        'postings_chunks': np.array([chunk_id for chunk_id, _ in flat], dtype=np.uint32),
+        'postings_tf': np.minimum([tf for _, tf in flat], np.iinfo(np.uint16).max).astype(np.uint16),
+        'chunk_lengths': np.array(lengths, dtype=np.uint32)
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), array)
+    meta = {
+        'version': INDEX_VERSION,
+        'k1': k1,
+        'b': b,
+        'chunk_count': len(lengths),
+        'avg_length': float(np.mean(lengths)) if lengths else 0.0,
+        # Ties the index to the exact store it was built from
+        'store_bytes': store.get_stats()['bytes'],
+        'terms': terms
+    }
+    # meta.json last: a reader never pairs new arrays with an old vocabulary
+    with open(os.path.join(directory, META_FILE + '.tmp'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(os.path.join(directory, META_FILE + '.tmp'), os.path.join(directory, META_FILE))
+    return meta
+
+
+class BM25Index:
+    """Okapi BM25 over the chunk store, loaded lazily from build_bm25_index's files"""
+
+    def __init__(self, store: ChunkStore, directory: str):
+        self.store = store
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._loaded: Optional[bool] = None
+        self.term_ids: Dict[str, int] = {}
+
+    def _load(self) -> bool:
+        if self._loaded is not None:
+            return self._loaded
+        with self._lock:
+            if self._loaded is not None:
+                return self._loaded
+            self._loaded = False
+            meta_path = os.path.join(self.directory, META_FILE)
+            try:
+                if not os.path.exists(meta_path) or not self.store.available:
+                    logger.info(f"No BM25 index in {self.directory} (run ingest_materials.py)")
+                    return False
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if meta.get('version') != INDEX_VERSION or meta['chunk_count'] != len(self.store) \
+                        or meta['store_bytes'] != self.store.get_stats()['bytes']:
+                    logger.warning("BM25 index is out of date with the material store; re-run ingest_materials.py")
+                    return False
+                for name in ARRAY_FILES:
+                    setattr(self, name, np.load(os.path.join(self.directory, f"{name}.npy"), mmap_mode='r'))
+                self.term_ids = {term: i for i, term in enumerate(meta['terms'])}
+                self.k1 = meta['k1']
+                self.chunk_count = meta['chunk_count']
+                # Per-chunk length normalisation, computed once: k1 * (1 - b + b * len / avg_len)
+                avg_length = meta['avg_length'] or 1.0
+                self.length_norm = (self.k1 * (1 - meta['b'] + meta['b'] * np.asarray(self.chunk_lengths) / avg_length)
+                                    ).astype(np.float32)
+                self._loaded = True
+                logger.info(f"Loaded BM25 index: {len(self.term_ids)} terms over {self.chunk_count} chunks")
+            except Exception as e:
+                logger.error(f"Error loading BM25 index: {str(e)}")
+            return self._loaded
+
+    @property
+    def available(self) -> bool:
+        return self._load()
+
+    def search(self, query: str, k: int = 4, courses: Optional[Sequence[str]] = None,
+               mask: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """Top-k (chunk_id, score) for the query, optionally only chunks of the given courses
+
+        mask (a boolean array over chunk ids, e.g. store.course_mask(courses))
+        can be passed instead of courses when the caller already has it.
+        """
+        if not self._load():
+            return []
+        term_ids = {self.term_ids[term] for term in tokenize(query) if term in self.term_ids}
+        if not term_ids:
+            return []
+        if mask is None and courses:
+            mask = self.store.course_mask(courses)
+        if mask is not None and not mask.any():
+            return []
+
+        scores = np.zeros(self.chunk_count, dtype=np.float32)
+        for term_id in term_ids:
+            start, end = int(self.term_offsets[term_id]), int(self.term_offsets[term_id + 1])
+            chunk_ids = self.postings_chunks[start:end]
+            tf = self.postings_tf[start:end]
+            df = end - start
+            idf = math.log(1 + (self.chunk_count - df + 0.5) / (df + 0.5))
+            if mask is not None:
+                # Postings of other courses are dropped before any scoring work
+                keep = mask[chunk_ids]
+                chunk_ids, tf = chunk_ids[keep], tf[keep]
+            tf = tf.astype(np.float32)
+            # Each chunk appears once per postings list, so fancy-index += is safe
+            scores[chunk_ids] += idf * tf * (self.k1 + 1) / (tf + self.length_norm[chunk_ids])
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(chunk_id), float(scores[chunk_id])) for chunk_id in ranked]
+
+    def retrieve(self, query: str, k: int = 4, courses: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Top-k chunks (with their 'score') for the query"""
+        results = self.search(query, k, courses)
+        chunks = self.store.get_many(chunk_id for chunk_id, _ in results)
+        for chunk, (_, score) in zip(chunks, results):
+            chunk['score'] = round(score, 3)
+        return chunks
+
+    def reset(self):
+        """Forget the loaded index (after re-ingestion); the next query loads it again"""
+        with self._lock:
+            self._loaded = None
+
+    def get_stats(self) -> Dict:
+        available = self._load()
+        return {
+            'available': available,
+            'path': self.directory,
+            'terms': len(self.term_ids) if available else 0,
+            'chunks': self.chunk_count if available else 0,
+            'postings': len(self.postings_chunks) if available else 0
+        }
+
+
+# Global instance
+bm25_index = BM25Index(material_store, os.path.join(RuntimeConfig.MATERIALS_PATH, INDEX_DIR))
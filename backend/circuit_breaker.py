@@ -0,0 +1,174 @@
+"""
+Per-provider circuit breakers and health scoring for external LLM backends
+Stops paying the full timeout on providers that are down or rate-limiting
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from config import ExternalAPIConfig
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Bad key, no access, unknown or retired model: retrying won't help until the config changes
+MISCONFIGURED_STATUSES = frozenset({401, 403, 404, 410})
+
+
+def is_failure_status(status_code: int) -> bool:
+    """Whether an HTTP status counts against the provider's health (misconfiguration, rate limiting, server errors)"""
+    return status_code in MISCONFIGURED_STATUSES or status_code == 429 or status_code >= 500
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is attempted against an open circuit"""
+
+    def __init__(self, provider: str):
+        super().__init__(f"Circuit open for {provider}")
+        self.provider = provider
+
+
+class CircuitBreaker:
+    """Closed -> open after N consecutive failures, half-open probe after a cool-down"""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float, ewma_alpha: float,
+                 prior_latency: float = 1.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.ewma_alpha = ewma_alpha
+        self.prior_latency = prior_latency
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_in_flight = False
+        self.ewma_latency: Optional[float] = None
+        self.ewma_success = 1.0
+        self.total_successes = 0
+        self.total_failures = 0
+        self.times_opened = 0
+
+    def _cooldown_over(self) -> bool:
+        return self.opened_at is not None and time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def is_available(self) -> bool:
+        """Whether a call could be attempted right now (does not reserve the probe)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            return self._cooldown_over()
+        return not self.probe_in_flight
+
+    def allow_request(self) -> bool:
+        """Reserve permission for one call, moving open -> half-open when the cool-down ends"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if not self._cooldown_over():
+                return False
+            self.state = HALF_OPEN
+            logger.info(f"Circuit for {self.name} is half-open, sending a probe")
+        if self.probe_in_flight:
+            return False
+        self.probe_in_flight = True
+        return True
+
+    def release_probe(self):
+        """Give back a half-open probe that ended without an outcome (cancelled, or an unexpected error)"""
+        self.probe_in_flight = False
+
+    def _update_ewma(self, latency: Optional[float], success: bool):
+        alpha = self.ewma_alpha
+        self.ewma_success = alpha * (1.0 if success else 0.0) + (1 - alpha) * self.ewma_success
+        if latency is not None:
+            if self.ewma_latency is None:
+                self.ewma_latency = latency
+            else:
+                self.ewma_latency = alpha * latency + (1 - alpha) * self.ewma_latency
+
+    def record_success(self, latency: Optional[float] = None):
+        self._update_ewma(latency, True)
+        self.total_successes += 1
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+        if self.state != CLOSED:
+            logger.info(f"Circuit for {self.name} closed again")
+        self.state = CLOSED
+        self.opened_at = None
+
+    def record_failure(self, latency: Optional[float] = None):
+        self._update_ewma(latency, False)
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+                logger.warning(f"Circuit for {self.name} opened after {self.consecutive_failures} failures")
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def health_score(self) -> float:
+        """Higher is healthier: recent success rate discounted by EWMA latency
+
+        A provider with no latency samples yet is scored with prior_latency, so
+        it ranks behind providers proven faster and ahead of slower ones.
+        """
+        if self.state == OPEN and not self._cooldown_over():
+            return 0.0
+        latency = self.ewma_latency if self.ewma_latency is not None else self.prior_latency
+        return self.ewma_success / (1.0 + latency)
+
+    def to_dict(self) -> Dict:
+        retry_in = None
+        if self.state == OPEN and self.opened_at is not None:
+            retry_in = max(0.0, round(self.reset_timeout - (time.monotonic() - self.opened_at), 1))
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'ewma_latency': round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            'ewma_success': round(self.ewma_success, 3),
+            'health_score': round(self.health_score(), 3),
+            'successes': self.total_successes,
+            'failures': self.total_failures,
+            'times_opened': self.times_opened,
+            'retry_in': retry_in
+        }
+
+
+class ProviderHealthRegistry:
+    """One circuit breaker per provider"""
+
+    def __init__(self):
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, provider: str) -> CircuitBreaker:
+        if provider not in self.breakers:
+            self.breakers[provider] = CircuitBreaker(
+                provider,
+                failure_threshold=ExternalAPIConfig.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=ExternalAPIConfig.CIRCUIT_RESET_TIMEOUT,
+                ewma_alpha=ExternalAPIConfig.CIRCUIT_EWMA_ALPHA,
+                prior_latency=ExternalAPIConfig.CIRCUIT_PRIOR_LATENCY
+            )
+        return self.breakers[provider]
+
+    def is_available(self, provider: str) -> bool:
+        return self.get(provider).is_available()
+
+    def order_by_health(self, providers: List[str]) -> List[str]:
+        """Drop providers with open circuits and sort the rest by health (ties keep preference order)"""
+        available = [p for p in providers if self.is_available(p)]
+        return sorted(available, key=lambda p: -self.get(p).health_score())
+
+    def get_status(self) -> Dict:
+        return {provider: breaker.to_dict() for provider, breaker in self.breakers.items()}
+
+
+# Global instance
+provider_health = ProviderHealthRegistry()
@@ -3,7 +3,15 @@ Configuration for external API integrations
 """
 
 import os
-from typing import Optional
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def backend_path(path: str) -> str:
+    """Absolute form of a path given relative to backend/, so data is found from any working directory"""
+    return os.path.normpath(os.path.join(BACKEND_DIR, path))
+
 
 class ExternalAPIConfig:
     """Configuration for external API services"""
@@ -15,6 +23,56 @@ class ExternalAPIConfig:
     SEARCH_API_KEY: Optional[str] = os.getenv('SEARCH_API_KEY')
     GROQ_API_KEY: Optional[str] = os.getenv('GROQ_API_KEY')
     
+    # Model names used by each provider
+    OPENAI_MODEL: str = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+    GROQ_MODEL: str = os.getenv('GROQ_MODEL', 'llama-3.1-8b-instant')
+    HUGGINGFACE_MODEL: str = os.getenv('HUGGINGFACE_MODEL', 'microsoft/DialoGPT-medium')
+    
+    # Shared HTTP client settings (seconds)
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv('LLM_CONNECT_TIMEOUT', '5'))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv('LLM_KEEPALIVE_EXPIRY', '30'))
+    
+    # Per-provider read timeouts (seconds)
+    PROVIDER_TIMEOUTS: Dict[str, float] = {
+        'openai': float(os.getenv('OPENAI_TIMEOUT', '30')),
+        'groq': float(os.getenv('GROQ_TIMEOUT', '30')),
+        'huggingface': float(os.getenv('HUGGINGFACE_TIMEOUT', '15')),
+        'gemini': float(os.getenv('GEMINI_TIMEOUT', '30')),
+    }
+    
+    # Per-provider connection pool sizes
+    PROVIDER_MAX_CONNECTIONS: Dict[str, int] = {
+        'openai': int(os.getenv('OPENAI_MAX_CONNECTIONS', '10')),
+        'groq': int(os.getenv('GROQ_MAX_CONNECTIONS', '20')),
+        'huggingface': int(os.getenv('HUGGINGFACE_MAX_CONNECTIONS', '10')),
+        'gemini': int(os.getenv('GEMINI_MAX_CONNECTIONS', '10')),
+    }
+    PROVIDER_MAX_KEEPALIVE: Dict[str, int] = {
+        'openai': int(os.getenv('OPENAI_MAX_KEEPALIVE', '5')),
+        'groq': int(os.getenv('GROQ_MAX_KEEPALIVE', '10')),
+        'huggingface': int(os.getenv('HUGGINGFACE_MAX_KEEPALIVE', '5')),
+        'gemini': int(os.getenv('GEMINI_MAX_KEEPALIVE', '5')),
+    }
+    
+    # Provider fan-out: 'sequential', 'parallel' or 'hedged'
+    LLM_FANOUT_MODE: str = os.getenv('LLM_FANOUT_MODE', 'hedged')
+    LLM_HEDGE_DELAY: float = float(os.getenv('LLM_HEDGE_DELAY', '2.0'))
+    LLM_REQUEST_DEADLINE: float = float(os.getenv('LLM_REQUEST_DEADLINE', '20'))
+    
+    # Circuit breaker per provider
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '3'))
+    CIRCUIT_RESET_TIMEOUT: float = float(os.getenv('CIRCUIT_RESET_TIMEOUT', '30'))
+    CIRCUIT_EWMA_ALPHA: float = float(os.getenv('CIRCUIT_EWMA_ALPHA', '0.3'))
+    # Latency (seconds) assumed for a provider with no samples yet when ranking by health
+    CIRCUIT_PRIOR_LATENCY: float = float(os.getenv('CIRCUIT_PRIOR_LATENCY', '1.0'))
+    
+    # LLM answer cache (memory LRU backed by SQLite; path relative to backend/)
+    LLM_CACHE_ENABLED: bool = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_PATH: str = backend_path(os.getenv('LLM_CACHE_PATH', '../data/cache/llm_cache.sqlite3'))
+    LLM_CACHE_TTL: float = float(os.getenv('LLM_CACHE_TTL', '86400'))
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '1000'))
+    LLM_CACHE_MAX_DISK_ENTRIES: int = int(os.getenv('LLM_CACHE_MAX_DISK_ENTRIES', '20000'))
+    
     @classmethod
     def has_openai_key(cls) -> bool:
         """Check if OpenAI API key is configured"""
@@ -33,4 +91,94 @@ class ExternalAPIConfig:
     @classmethod
     def has_groq_key(cls) -> bool:
         """Check if Groq API key is configured"""
-        return cls.GROQ_API_KEY is not None and cls.GROQ_API_KEY != "your_groq_key_here"
\ No newline at end of file
+        return cls.GROQ_API_KEY is not None and cls.GROQ_API_KEY != "your_groq_key_here"
+    
+    # Aliases used by the API layer
+    is_openai_configured = has_openai_key
+    is_gemini_configured = has_gemini_key
+    is_huggingface_configured = has_huggingface_key
+    is_groq_configured = has_groq_key
+    
+    @classmethod
+    def get_available_apis(cls) -> List[str]:
+        """List the external APIs that have keys configured"""
+        available = []
+        if cls.has_openai_key():
+            available.append('OpenAI')
+        if cls.has_gemini_key():
+            available.append('Gemini')
+        if cls.has_huggingface_key():
+            available.append('Hugging Face')
+        if cls.has_groq_key():
+            available.append('Groq')
+        return available
+    
+    @classmethod
+    def get_timeout(cls, provider: str) -> float:
+        """Read timeout for a provider"""
+        return cls.PROVIDER_TIMEOUTS.get(provider, 30.0)
+    
+    @classmethod
+    def get_pool_limits(cls, provider: str) -> Dict[str, int]:
+        """Connection pool limits for a provider"""
+        return {
+            'max_connections': cls.PROVIDER_MAX_CONNECTIONS.get(provider, 10),
+            'max_keepalive_connections': cls.PROVIDER_MAX_KEEPALIVE.get(provider, 5)
+        }
+
+
+class RuntimeConfig:
+    """Configuration for local serving: caches, routing and inference"""
+    
+    # Semantic near-duplicate cache in front of /ask
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv('SEMANTIC_CACHE_ENABLED', 'true').lower() == 'true'
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.85'))
+    SEMANTIC_CACHE_CAPACITY: int = int(os.getenv('SEMANTIC_CACHE_CAPACITY', '1000'))
+    SEMANTIC_CACHE_EVICTION: str = os.getenv('SEMANTIC_CACHE_EVICTION', 'lru')  # 'lru' or 'fifo'
+    SEMANTIC_CACHE_MIN_CONFIDENCE: float = float(os.getenv('SEMANTIC_CACHE_MIN_CONFIDENCE', '0.8'))
+    
+    # Question routing engine: 'keyword' (substring tables) or 'classifier' (trained n-gram model, path relative to backend/)
+    INTENT_ROUTER: str = os.getenv('INTENT_ROUTER', 'keyword')
+    INTENT_CLASSIFIER_PATH: str = backend_path(os.getenv('INTENT_CLASSIFIER_PATH', '../data/models/intent_classifier.npz'))
+    # Below this probability the keyword router decides instead
+    INTENT_CLASSIFIER_MIN_CONFIDENCE: float = float(os.getenv('INTENT_CLASSIFIER_MIN_CONFIDENCE', '0.6'))
+    
+    # Micro-batching of extractive QA model calls
+    QA_BATCHING_ENABLED: bool = os.getenv('QA_BATCHING_ENABLED', 'true').lower() == 'true'
+    QA_BATCH_MAX_SIZE: int = int(os.getenv('QA_BATCH_MAX_SIZE', '8'))
+    QA_BATCH_MAX_WAIT_MS: float = float(os.getenv('QA_BATCH_MAX_WAIT_MS', '5'))
+    
+    # Extractive QA model runtime: 'pytorch' (transformers pipeline) or 'onnx' (int8 ONNX Runtime,
+    # exported to QA_ONNX_MODEL_PATH, relative to backend/)
+    QA_BACKEND: str = os.getenv('QA_BACKEND', 'pytorch')
+    QA_ONNX_MODEL_PATH: str = backend_path(os.getenv('QA_ONNX_MODEL_PATH', '../data/models/fut_qa_model_onnx'))
+    QA_ONNX_THREADS: int = int(os.getenv('QA_ONNX_THREADS', '0'))  # 0 = onnxruntime default
+    
+    # Load the QA model in the background at startup; false = load on the first question that needs it
+    QA_MODEL_PRELOAD: bool = os.getenv('QA_MODEL_PRELOAD', 'true').lower() == 'true'
+    
+    # Where QA inference runs: 'thread' (this process) or 'process' (a pool of worker processes,
+    # each with its own model, so forward passes don't contend for this process's GIL)
+    QA_EXECUTION: str = os.getenv('QA_EXECUTION', 'thread')
+    QA_PROCESS_WORKERS: int = int(os.getenv('QA_PROCESS_WORKERS', '0'))  # 0 = one per CPU core
+    
+    # Course, lecturer and university knowledge shared by every assistant (knowledge_store.py);
+    # relative paths are resolved against backend/, not the working directory
+    KNOWLEDGE_PATH: str = backend_path(os.getenv('KNOWLEDGE_PATH', '../data/knowledge'))
+    LECTURER_DATABASE_PATH: str = backend_path(os.getenv('LECTURER_DATABASE_PATH', '../lecturer_database.json'))
+    # Render the static course, PDF and past-question answers at startup instead of on first use
+    PRERENDER_RESPONSES: bool = os.getenv('PRERENDER_RESPONSES', 'true').lower() == 'true'
+    
+    # Chunked course materials written by ingest_materials.py (relative to backend/)
+    MATERIALS_PATH: str = backend_path(os.getenv('MATERIALS_PATH', '../data/materials'))
+    # Material chunks put into Groq system prompts; 0 = send the fixed contexts instead
+    MATERIALS_TOP_K: int = int(os.getenv('MATERIALS_TOP_K', '4'))
+    # Ranking for those chunks: 'bm25' (keywords), 'dense' (sentence embeddings, ingest_materials.py --dense)
+    # or 'hybrid' (both fused by reciprocal rank; BM25 alone until the dense index is built)
+    MATERIALS_RETRIEVER: str = os.getenv('MATERIALS_RETRIEVER', 'hybrid')
+    # Dense matches below this cosine similarity are not used
+    MATERIALS_DENSE_MIN_SCORE: float = float(os.getenv('MATERIALS_DENSE_MIN_SCORE', '0.3'))
+    # Hybrid fusion: score = sum(weight / (RRF_K + rank)) over the two rankings
+    MATERIALS_RRF_K: int = int(os.getenv('MATERIALS_RRF_K', '60'))
+    MATERIALS_LEXICAL_WEIGHT: float = float(os.getenv('MATERIALS_LEXICAL_WEIGHT', '1.0'))
+    MATERIALS_DENSE_WEIGHT: float = float(os.getenv('MATERIALS_DENSE_WEIGHT', '1.0'))
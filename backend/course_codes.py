@@ -0,0 +1,93 @@
+"""
+Course-code extraction and lookup shared by every router
+One compiled regex recognises COS102, "cos 102", "cos-102" and FTM-CPT112;
+CourseIndex maps canonical codes to (level, info) for O(1) lookups
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Department prefixes used by FUT CS courses
+COURSE_PREFIXES = ('cos', 'cst', 'cpt', 'mat', 'phy', 'gst', 'sta')
+
+COURSE_CODE_PATTERN = re.compile(
+    r'(?<![a-z0-9])(?:(ftm)[\s\-]*)?(' + '|'.join(COURSE_PREFIXES) + r')[\s\-]*(\d{3})(?!\d)',
+    re.IGNORECASE
+)
+
+
+def canonical_code(match: re.Match) -> str:
+    """Canonical form of a regex match: COS102, FTM-CPT112"""
+    code = f"{match.group(2).upper()}{match.group(3)}"
+    return f"FTM-{code}" if match.group(1) else code
+
+
+def extract_course_codes(text: str) -> List[str]:
+    """Canonical course codes mentioned in the text, in order, without duplicates"""
+    codes = []
+    for match in COURSE_CODE_PATTERN.finditer(text):
+        code = canonical_code(match)
+        if code not in codes:
+            codes.append(code)
+    return codes
+
+
+def course_variants(codes: Iterable[str]) -> Set[str]:
+    """Codes plus their FTM- / plain spellings (questions say CPT122, files say FUTM-CPT 122 and vice versa)"""
+    variants = set()
+    for code in codes:
+        code = code.upper()
+        plain = code[4:] if code.startswith('FTM-') else code
+        variants.update({plain, f"FTM-{plain}"})
+    return variants
+
+
+class CourseIndex:
+    """Canonical course code -> (level, info) built from a {level: {code: info}} table"""
+
+    def __init__(self, courses_by_level: Dict[str, Dict[str, Dict]]):
+        self.by_code: Dict[str, Tuple[str, Dict]] = {}
+        for level, courses in courses_by_level.items():
+            for code, info in courses.items():
+                self.by_code[code.upper()] = (level, info)
+
+        # "cpt112" should find FTM-CPT112 and vice versa when only one form is catalogued
+        self.aliases: Dict[str, str] = {}
+        for code in self.by_code:
+            alias = code[4:] if code.startswith('FTM-') else f"FTM-{code}"
+            if alias not in self.by_code:
+                self.aliases[alias] = code
+
+    def resolve(self, code: str) -> Optional[str]:
+        """Catalogued spelling of a canonical code, or None if unknown"""
+        code = code.upper()
+        if code in self.by_code:
+            return code
+        return self.aliases.get(code)
+
+    def lookup(self, code: str) -> Optional[Tuple[str, Dict]]:
+        resolved = self.resolve(code)
+        return self.by_code[resolved] if resolved else None
+
+    def entries(self, codes: Iterable[str]) -> List[Tuple[str, str, Dict]]:
+        """(code, level, info) for each catalogued code, in the given order"""
+        found = []
+        for code in codes:
+            resolved = self.resolve(code)
+            if resolved and all(resolved != existing for existing, _, _ in found):
+                level, info = self.by_code[resolved]
+                found.append((resolved, level, info))
+        return found
+
+    def find(self, text: str) -> List[Tuple[str, str, Dict]]:
+        """(code, level, info) for every catalogued course mentioned in the text"""
+        return self.entries(extract_course_codes(text))
+
+    def codes(self) -> Iterable[str]:
+        return self.by_code.keys()
+
+    def __contains__(self, code: str) -> bool:
+        return self.resolve(code) is not None
+
+    def __len__(self) -> int:
+        return len(self.by_code)
@@ -0,0 +1,245 @@
+"""
+Dense vector index over the course-material chunks
+Chunks are embedded offline (ingest_materials.py --dense) with a small
+sentence encoder and stored as a float16 matrix of unit vectors opened with
+np.memmap, so every uvicorn worker shares the same page-cache pages. A query
+is one matrix-vector product and an argpartition top-k
+"""
+
+import json
+import logging
+import os
+import threading
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bm25_index import tokenize
+from config import RuntimeConfig
+from material_store import ChunkStore, material_store
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INDEX_DIR = 'dense'
+META_FILE = 'meta.json'
+VECTORS_FILE = 'vectors.f16'
+DEFAULT_ENCODER = 'sentence-transformers/all-MiniLM-L6-v2'
+# Rows upcast to float32 at a time, bounding the temporary memory of a query
+SCORE_BLOCK_ROWS = 8192
+
+
+class HashedEncoder:
+    """Dependency-free encoder: signed feature hashing of words and character n-grams
+
+    Catches spelling variants and shared word stems, not real paraphrases; a
+    fallback for hosts without sentence-transformers.
+    """
+
+    name = 'hashed'
+
+    def __init__(self, dims: int = 512):
+        self.dims = dims
+
+    def _features(self, text: str) -> List[str]:
+        features = []
+        for token in tokenize(text):
+            features.append(token)
+            padded = f" {token} "
+            features.extend(padded[i:i + 4] for i in range(len(padded) - 3))
+        return features
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dims), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = zlib.crc32(feature.encode('utf-8'))
+                vectors[row, digest % self.dims] += 1.0 if digest & 0x80000000 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class SentenceEncoder:
+    """sentence-transformers model (e.g. all-MiniLM-L6-v2, 384 dims); imported on first use"""
+
+    def __init__(self, name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.name = name
+        self.model = SentenceTransformer(name, device='cpu')
+        self.dims = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        return self.model.encode(list(texts), batch_size=32, normalize_embeddings=True,
+                                 convert_to_numpy=True).astype(np.float32)
+
+
+def load_encoder(name: str):
+    if name == HashedEncoder.name:
+        return HashedEncoder()
+    return SentenceEncoder(name)
+
+
+def read_index_meta(directory: str) -> Optional[Dict]:
+    """meta.json of the dense index in directory, or None if there is none"""
+    meta_path = os.path.join(directory, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_dense_index(store: ChunkStore, directory: str, encoder_name: str = DEFAULT_ENCODER,
+                      batch_size: int = 64, previous: Optional[Sequence[int]] = None) -> Dict:
+    """Embed every chunk of the store into directory; returns the meta written
+
+    previous[i] is the id chunk i had in the store the existing index was
+    built from (-1 for new text); with the same encoder those vectors are
+    copied instead of encoded again.
+    """
+    chunks = list(store)
+    os.makedirs(directory, exist_ok=True)
+    vectors_path = os.path.join(directory, VECTORS_FILE)
+
+    old_meta = read_index_meta(directory) if previous is not None else None
+    old_vectors = None
+    if old_meta and old_meta.get('version') == INDEX_VERSION and old_meta['encoder'] == encoder_name:
+        old_vectors = np.memmap(vectors_path, dtype=np.float16, mode='r',
+                                shape=(max(1, old_meta['chunk_count']), old_meta['dims']))
+    reused = {row: previous[row] for row in range(len(chunks))
+              if old_vectors is not None and 0 <= previous[row] < old_meta['chunk_count']}
+    to_encode = [row for row in range(len(chunks)) if row not in reused]
+
+    # The model is only loaded when something is left to encode
+    encoder = load_encoder(encoder_name) if to_encode or old_vectors is None else None
+    dims = encoder.dims if encoder is not None else old_meta['dims']
+
+    # Raw float16 rows; the shape lives in meta.json
+    matrix = np.memmap(vectors_path + '.tmp', dtype=np.float16, mode='w+', shape=(max(1, len(chunks)), dims))
+    if reused:
+        rows = np.fromiter(reused.keys(), dtype=np.int64, count=len(reused))
+        matrix[rows] = old_vectors[np.fromiter(reused.values(), dtype=np.int64, count=len(reused))]
+    for start in range(0, len(to_encode), batch_size):
+        rows = to_encode[start:start + batch_size]
+        matrix[rows] = encoder.encode([chunks[row]['text'] for row in rows]).astype(np.float16)
+    matrix.flush()
+    del matrix, old_vectors
+    os.replace(vectors_path + '.tmp', vectors_path)
+
+    meta = {
+        'version': INDEX_VERSION,
+        'encoder': encoder.name if encoder is not None else old_meta['encoder'],
+        'dims': dims,
+        'chunk_count': len(chunks),
+        'store_bytes': store.get_stats()['bytes'],
+        'reused': len(reused)
+    }
+    with open(os.path.join(directory, META_FILE + '.tmp'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(os.path.join(directory, META_FILE + '.tmp'), os.path.join(directory, META_FILE))
+    return meta
+
+
+class DenseIndex:
+    """Cosine top-k over the memory-mapped chunk vectors, loaded lazily with the encoder they were built with"""
+
+    def __init__(self, store: ChunkStore, directory: str, min_score: float = 0.0):
+        self.store = store
+        self.directory = directory
+        self.min_score = min_score
+        self._lock = threading.Lock()
+        self._loaded: Optional[bool] = None
+        self.encoder = None
+
+    def _load(self) -> bool:
+        if self._loaded is not None:
+            return self._loaded
+        with self._lock:
+            if self._loaded is not None:
+                return self._loaded
+            self._loaded = False
+            meta_path = os.path.join(self.directory, META_FILE)
+            try:
+                if not os.path.exists(meta_path) or not self.store.available:
+                    logger.info(f"No dense index in {self.directory} (run ingest_materials.py --dense)")
+                    return False
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if meta.get('version') != INDEX_VERSION or meta['chunk_count'] != len(self.store) \
+                        or meta['store_bytes'] != self.store.get_stats()['bytes']:
+                    logger.warning("Dense index is out of date with the material store; re-run ingest_materials.py --dense")
+                    return False
+                self.vectors = np.memmap(os.path.join(self.directory, VECTORS_FILE), dtype=np.float16, mode='r',
+                                         shape=(meta['chunk_count'], meta['dims']))
+                self.encoder = load_encoder(meta['encoder'])
+                self._loaded = True
+                logger.info(f"Loaded dense index: {meta['chunk_count']} x {meta['dims']} ({meta['encoder']})")
+            except Exception as e:
+                logger.error(f"Error loading dense index: {str(e)}")
+            return self._loaded
+
+    @property
+    def available(self) -> bool:
+        return self._load()
+
+    def search(self, query: str, k: int = 4, courses: Optional[Sequence[str]] = None,
+               mask: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """Top-k (chunk_id, cosine) for the query, optionally only chunks of the given courses
+
+        mask (a boolean array over chunk ids, e.g. store.course_mask(courses))
+        can be passed instead of courses when the caller already has it.
+        """
+        if not self._load() or len(self.vectors) == 0:
+            return []
+        if mask is None and courses:
+            mask = self.store.course_mask(courses)
+        # Only the rows of the wanted courses are read and scored
+        row_ids = np.flatnonzero(mask) if mask is not None else None
+        if row_ids is not None and len(row_ids) == 0:
+            return []
+        query_vector = self.encoder.encode([query])[0].astype(np.float32)
+
+        row_count = len(self.vectors) if row_ids is None else len(row_ids)
+        scores = np.empty(row_count, dtype=np.float32)
+        for start in range(0, row_count, SCORE_BLOCK_ROWS):
+            if row_ids is None:
+                block = self.vectors[start:start + SCORE_BLOCK_ROWS]
+            else:
+                block = self.vectors[row_ids[start:start + SCORE_BLOCK_ROWS]]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query_vector
+
+        candidates = np.flatnonzero(scores > self.min_score)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+        chunk_ids = ranked if row_ids is None else row_ids[ranked]
+        return [(int(chunk_id), float(score)) for chunk_id, score in zip(chunk_ids, scores[ranked])]
+
+    def retrieve(self, query: str, k: int = 4, courses: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Top-k chunks (with their 'score') for the query"""
+        results = self.search(query, k, courses)
+        chunks = self.store.get_many(chunk_id for chunk_id, _ in results)
+        for chunk, (_, score) in zip(chunks, results):
+            chunk['score'] = round(score, 3)
+        return chunks
+
+    def reset(self):
+        """Forget the loaded index (after re-ingestion); the next query loads it again"""
+        with self._lock:
+            self._loaded = None
+
+    def get_stats(self) -> Dict:
+        available = self._load()
+        return {
+            'available': available,
+            'path': self.directory,
+            'encoder': self.encoder.name if available else None,
+            'chunks': len(self.vectors) if available else 0,
+            'dims': self.vectors.shape[1] if available else 0
+        }
+
+
+# Global instance
+dense_index = DenseIndex(material_store, os.path.join(RuntimeConfig.MATERIALS_PATH, INDEX_DIR),
+                         min_score=RuntimeConfig.MATERIALS_DENSE_MIN_SCORE)
@@ -9,200 +9,16 @@ import re
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import requests
+from keyword_matcher import keyword_matcher
+from knowledge_store import knowledge_store
 
 class DynamicIntelligence:
     def __init__(self):
-        self.knowledge_base = self._load_comprehensive_knowledge()
-        self.course_database = self._load_course_database()
+        self.knowledge = knowledge_store
         self.external_sources = self._load_external_sources()
         self.conversation_context = []
         self.learning_data = []
     
-    def _load_comprehensive_knowledge(self) -> Dict:
-        """Load comprehensive knowledge base"""
-        return {
-            'fut_general': {
-                'established': '1983',
-                'location': 'Minna, Niger State, Nigeria',
-                'motto': 'Technology for Development',
-                'type': 'Federal University',
-                'accreditation': 'National Universities Commission (NUC)',
-                'website': 'https://fut.edu.ng',
-                'email': 'info@fut.edu.ng',
-                'phone': '+234-66-222-000'
-            },
-            'sict_school': {
-                'name': 'School of Information and Communication Technology',
-                'departments': ['Computer Science', 'Cyber Security', 'Information Technology', 'Telecommunications Engineering'],
-                'programs': ['B.Sc Computer Science', 'B.Sc Cyber Security', 'B.Sc Information Technology', 'B.Eng Telecommunications'],
-                'facilities': ['Computer Laboratories', 'Network Laboratory', 'Software Development Lab', 'Hardware Maintenance Lab', 'Research Laboratory']
-            },
-            'admission_requirements': {
-                'utme': 'Minimum of 180 in UTME',
-                'olevel': 'Five credits including Mathematics and English',
-                'subjects': 'Mathematics, English, Physics, Chemistry, and any other science subject',
-                'direct_entry': 'A-level, OND, HND, or equivalent qualifications',
-                'cut_off_mark': '180 and above'
-            }
-        }
-    
-    def _load_course_database(self) -> Dict:
-        """Load comprehensive course database"""
-        return {
-            '100_level': {
-                'COS101': {
-                    'name': 'Introduction to Computer Science',
-                    'description': 'Fundamental concepts of computer science, history, and applications',
-                    'credits': 3,
-                    'prerequisites': 'None',
-                    'materials': [
-                        'Introduction to Computer Science textbook',
-                        'Programming basics guide',
-                        'Computer fundamentals notes',
-                        'Online CS resources'
-                    ],
-                    'success_tips': [
-                        'Understand basic concepts thoroughly',
-                        'Practice programming fundamentals',
-                        'Read recommended textbooks',
-                        'Join study groups',
-                        'Ask questions during lectures'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly lab sessions'
-                },
-                'COS102': {
-                    'name': 'Introduction to Programming',
-                    'description': 'Basic programming concepts using Python',
-                    'credits': 3,
-                    'prerequisites': 'COS101',
-                    'materials': [
-                        'Python programming textbook',
-                        'Code editor (VS Code/PyCharm)',
-                        'Online Python tutorials',
-                        'Programming practice problems'
-                    ],
-                    'success_tips': [
-                        'Practice coding daily',
-                        'Understand variables and data types',
-                        'Work on programming projects',
-                        'Use online coding platforms',
-                        'Debug your code regularly'
-                    ],
-                    'assessment': 'Continuous Assessment (40%) + Examination (60%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly programming labs'
-                },
-                'CPT121': {
-                    'name': 'Introduction to Computer Hardware',
-                    'description': 'Computer hardware components and maintenance',
-                    'credits': 3,
-                    'prerequisites': 'None',
-                    'materials': [
-                        'Computer hardware textbook',
-                        'Hardware lab manual',
-                        'Component identification guide',
-                        'Hardware tools'
-                    ],
-                    'success_tips': [
-                        'Hands-on practice with hardware',
-                        'Understand component functions',
-                        'Study maintenance procedures',
-                        'Practice troubleshooting',
-                        'Join hardware study groups'
-                    ],
-                    'assessment': 'Continuous Assessment (35%) + Examination (65%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly hardware labs'
-                },
-                'CPT122': {
-                    'name': 'Computer Hardware Systems and Maintenance',
-                    'description': 'Advanced hardware systems and troubleshooting',
-                    'credits': 3,
-                    'prerequisites': 'CPT121',
-                    'materials': [
-                        'Hardware systems textbook',
-                        'Troubleshooting guide',
-                        'Maintenance tools',
-                        'System diagnostic software'
-                    ],
-                    'success_tips': [
-                        'Practice troubleshooting',
-                        'Understand system architecture',
-                        'Learn diagnostic procedures',
-                        'Work with different hardware',
-                        'Document maintenance procedures'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly maintenance labs'
-                },
-                'MAT101': {
-                    'name': 'Mathematics for Computer Science',
-                    'description': 'Mathematical foundations for CS',
-                    'credits': 3,
-                    'prerequisites': 'O\'Level Mathematics',
-                    'materials': [
-                        'Discrete mathematics textbook',
-                        'Calculus textbook',
-                        'Mathematical problem sets',
-                        'Scientific calculator'
-                    ],
-                    'success_tips': [
-                        'Practice mathematical problems',
-                        'Understand discrete math concepts',
-                        'Apply math to programming',
-                        'Use mathematical software',
-                        'Join math study groups'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly problem-solving sessions'
-                }
-            },
-            '200_level': {
-                'COS201': {
-                    'name': 'Data Structures and Algorithms',
-                    'description': 'Fundamental data structures and algorithm design',
-                    'credits': 3,
-                    'prerequisites': 'COS102',
-                    'materials': [
-                        'Data structures textbook',
-                        'Algorithm design guide',
-                        'Programming practice problems',
-                        'Algorithm visualization tools'
-                    ],
-                    'success_tips': [
-                        'Master basic data structures',
-                        'Practice algorithm implementation',
-                        'Understand time complexity',
-                        'Solve coding problems',
-                        'Use algorithm visualization tools'
-                    ]
-                },
-                'COS202': {
-                    'name': 'Object-Oriented Programming',
-                    'description': 'OOP concepts using Java or C++',
-                    'credits': 3,
-                    'prerequisites': 'COS102',
-                    'materials': [
-                        'OOP textbook',
-                        'Java/C++ programming guide',
-                        'Design patterns book',
-                        'IDE (IntelliJ/Eclipse)'
-                    ],
-                    'success_tips': [
-                        'Understand OOP principles',
-                        'Practice inheritance and polymorphism',
-                        'Design object-oriented solutions',
-                        'Learn design patterns',
-                        'Build OOP projects'
-                    ]
-                }
-            }
-        }
-    
     def _load_external_sources(self) -> Dict:
         """Load external knowledge sources"""
         return {
@@ -236,17 +52,10 @@ class DynamicIntelligence:
     
     def analyze_question_intent(self, question: str) -> Dict:
         """Analyze question intent and determine response type"""
-        question_lower = question.lower()
+        matches = keyword_matcher.match(question.lower())
         
         # Check for unrelated questions
-        unrelated_keywords = [
-            'cooking', 'recipe', 'food', 'restaurant', 'travel', 'hotel', 'weather',
-            'sports', 'football', 'basketball', 'music', 'movie', 'entertainment',
-            'fashion', 'shopping', 'beauty', 'health', 'medical', 'politics',
-            'religion', 'dating', 'relationship', 'personal', 'private'
-        ]
-        
-        if any(keyword in question_lower for keyword in unrelated_keywords):
+        if 'unrelated' in matches:
             return {
                 'type': 'unrelated',
                 'confidence': 0.9,
@@ -254,24 +63,17 @@ class DynamicIntelligence:
             }
         
         # Check for course-specific questions
-        course_codes = ['COS101', 'COS102', 'CPT121', 'CPT122', 'MAT101', 'COS201', 'COS202']
-        for code in course_codes:
-            if code.lower() in question_lower:
-                return {
-                    'type': 'course_specific',
-                    'course_code': code,
-                    'confidence': 0.95,
-                    'response_type': 'course_detail'
-                }
+        mentioned = self.knowledge.course_index.find(question)
+        if mentioned:
+            return {
+                'type': 'course_specific',
+                'course_code': mentioned[0][0],
+                'confidence': 0.95,
+                'response_type': 'course_detail'
+            }
         
         # Check for general CS questions
-        cs_keywords = [
-            'computer science', 'cs', 'programming', 'coding', 'software',
-            'hardware', 'algorithm', 'data structure', 'database', 'network',
-            'cybersecurity', 'information technology', 'it'
-        ]
-        
-        if any(keyword in question_lower for keyword in cs_keywords):
+        if 'dynamic_cs' in matches:
             return {
                 'type': 'cs_general',
                 'confidence': 0.85,
@@ -279,12 +81,7 @@ class DynamicIntelligence:
             }
         
         # Check for FUT-specific questions
-        fut_keywords = [
-            'fut', 'federal university', 'minna', 'admission', 'requirements',
-            'campus', 'facilities', 'programs', 'courses', 'university'
-        ]
-        
-        if any(keyword in question_lower for keyword in fut_keywords):
+        if 'dynamic_fut' in matches:
             return {
                 'type': 'fut_general',
                 'confidence': 0.8,
@@ -292,12 +89,7 @@ class DynamicIntelligence:
             }
         
         # Check for materials/resources questions
-        material_keywords = [
-            'materials', 'books', 'software', 'tools', 'resources', 'what do i need',
-            'equipment', 'supplies', 'textbooks', 'laptop', 'computer'
-        ]
-        
-        if any(keyword in question_lower for keyword in material_keywords):
+        if 'dynamic_materials' in matches:
             return {
                 'type': 'materials',
                 'confidence': 0.85,
@@ -305,12 +97,7 @@ class DynamicIntelligence:
             }
         
         # Check for success/advice questions
-        success_keywords = [
-            'success', 'pass', 'excel', 'tips', 'advice', 'how to', 'help',
-            'guidance', 'strategy', 'study', 'learn', 'improve'
-        ]
-        
-        if any(keyword in question_lower for keyword in success_keywords):
+        if 'dynamic_success' in matches:
             return {
                 'type': 'success_advice',
                 'confidence': 0.8,
@@ -368,18 +155,11 @@ I can't help with topics like cooking, travel, entertainment, or other non-acade
     
     def _get_course_specific_response(self, question: str, course_code: str) -> str:
         """Get detailed course-specific response"""
-        course_info = None
-        
-        # Search in 100 level
-        if course_code in self.course_database['100_level']:
-            course_info = self.course_database['100_level'][course_code]
-            level = '100 Level'
-        # Search in 200 level
-        elif course_code in self.course_database['200_level']:
-            course_info = self.course_database['200_level'][course_code]
-            level = '200 Level'
-        
-        if course_info:
+        entry = self.knowledge.course_index.lookup(course_code)
+        
+        if entry:
+            level_key, course_info = entry
+            level = level_key.replace('_', ' ').title()
             response = f"📚 **{course_code} - {course_info['name']}**\n"
             response += f"**Level:** {level}\n"
             response += f"**Credits:** {course_info['credits']}\n"
@@ -395,9 +175,13 @@ I can't help with topics like cooking, travel, entertainment, or other non-acade
             for tip in course_info['success_tips']:
                 response += f"• {tip}\n"
             
-            response += f"\n**📊 Assessment:** {course_info['assessment']}\n"
-            response += f"**👨‍🏫 Office Hours:** {course_info['lecturer_office_hours']}\n"
-            response += f"**🔬 Practical Sessions:** {course_info['practical_sessions']}\n"
+            # 200 level entries don't list assessment or session details
+            if 'assessment' in course_info:
+                response += f"\n**📊 Assessment:** {course_info['assessment']}\n"
+            if 'lecturer_office_hours' in course_info:
+                response += f"**👨‍🏫 Office Hours:** {course_info['lecturer_office_hours']}\n"
+            if 'practical_sessions' in course_info:
+                response += f"**🔬 Practical Sessions:** {course_info['practical_sessions']}\n"
             
             return response
         
@@ -446,7 +230,7 @@ I can't help with topics like cooking, travel, entertainment, or other non-acade
         """Get FUT general information"""
         response = "🏛️ **Federal University of Technology, Minna**\n\n"
         
-        fut_info = self.knowledge_base['fut_general']
+        fut_info = self.knowledge.university['fut_general']
         response += f"**Established:** {fut_info['established']}\n"
         response += f"**Location:** {fut_info['location']}\n"
         response += f"**Motto:** {fut_info['motto']}\n"
@@ -459,7 +243,7 @@ I can't help with topics like cooking, travel, entertainment, or other non-acade
         response += f"• Phone: {fut_info['phone']}\n\n"
         
         response += "**🎓 ADMISSION REQUIREMENTS:**\n"
-        admission = self.knowledge_base['admission_requirements']
+        admission = self.knowledge.university['admission_requirements']
         response += f"• UTME Score: {admission['utme']}\n"
         response += f"• O'Level: {admission['olevel']}\n"
         response += f"• Subjects: {admission['subjects']}\n"
@@ -467,7 +251,7 @@ I can't help with topics like cooking, travel, entertainment, or other non-acade
         response += f"• Cut-off Mark: {admission['cut_off_mark']}\n\n"
         
         response += "**🏫 SCHOOL OF ICT (SICT):**\n"
-        sict = self.knowledge_base['sict_school']
+        sict = self.knowledge.university['sict_school']
         response += f"• Name: {sict['name']}\n"
         response += "• Departments:\n"
         for dept in sict['departments']:
@@ -5,9 +5,11 @@ Fetches real-time information from FUT's official website
 
 import requests
 import json
+import os
 import re
 from typing import Dict, List, Optional
 from datetime import datetime
+from knowledge_store import knowledge_store
 
 class FUTAPIIntegration:
     def __init__(self):
@@ -42,84 +44,31 @@ class FUTAPIIntegration:
     
     def fetch_fut_information(self) -> Dict:
         """Fetch comprehensive FUT information"""
+        # Rebuilt (and re-cached) only when the knowledge store changes
+        if self.cached_data.get('knowledge_version') == knowledge_store.version:
+            return self.cached_data
+        
+        university = knowledge_store.university
+        fut_general = university['fut_general']
         fut_info = {
-            'university_name': 'Federal University of Technology, Minna',
-            'established': '1983',
-            'location': 'Minna, Niger State, Nigeria',
-            'motto': 'Technology for Development',
-            'type': 'Federal University',
-            'accreditation': 'National Universities Commission (NUC)',
-            'faculties': [
-                'School of Information and Communication Technology (SICT)',
-                'School of Engineering and Engineering Technology',
-                'School of Environmental Technology',
-                'School of Agriculture and Agricultural Technology',
-                'School of Life Sciences',
-                'School of Physical Sciences',
-                'School of Management Technology'
-            ],
-            'sict_programs': [
-                'Computer Science',
-                'Cyber Security',
-                'Information Technology',
-                'Telecommunications Engineering',
-                'Software Engineering'
-            ],
-            'course_codes': {
-                '100_level': {
-                    'COS101': 'Introduction to Computer Science',
-                    'COS102': 'Introduction to Programming',
-                    'CPT121': 'Introduction to Computer Hardware',
-                    'CPT122': 'Computer Hardware Systems and Maintenance',
-                    'MAT101': 'Mathematics for Computer Science',
-                    'PHY101': 'Physics for Computer Science'
-                },
-                '200_level': {
-                    'COS201': 'Data Structures and Algorithms',
-                    'COS202': 'Object-Oriented Programming',
-                    'CPT221': 'Computer Organization',
-                    'CPT222': 'Digital Logic Design',
-                    'COS203': 'Database Systems',
-                    'COS204': 'Software Engineering'
-                },
-                '300_level': {
-                    'COS301': 'Operating Systems',
-                    'COS302': 'Computer Networks',
-                    'COS303': 'Artificial Intelligence',
-                    'COS304': 'Machine Learning',
-                    'CPT321': 'Microprocessors',
-                    'CPT322': 'Computer Architecture'
-                },
-                '400_level': {
-                    'COS401': 'Final Year Project',
-                    'COS402': 'Advanced Database Systems',
-                    'COS403': 'Cybersecurity',
-                    'COS404': 'Mobile Application Development',
-                    'CPT421': 'Embedded Systems',
-                    'CPT422': 'Network Security'
-                }
-            },
-            'admission_requirements': {
-                'utme': 'Minimum of 180 in UTME',
-                'olevel': 'Five credits including Mathematics and English',
-                'subjects': 'Mathematics, English, Physics, Chemistry, and any other science subject',
-                'direct_entry': 'A-level, OND, HND, or equivalent qualifications'
-            },
-            'campus_facilities': [
-                'Computer Laboratories',
-                'Library and Information Center',
-                'Student Hostels',
-                'Sports Complex',
-                'Health Center',
-                'Banking Facilities',
-                'Internet Services'
-            ],
+            'university_name': fut_general['name'],
+            'established': fut_general['established'],
+            'location': fut_general['location'],
+            'motto': fut_general['motto'],
+            'type': fut_general['type'],
+            'accreditation': fut_general['accreditation'],
+            'faculties': list(university['faculties']),
+            'sict_programs': list(university['sict_school']['programs_offered']),
+            'course_codes': {level: dict(codes) for level, codes in knowledge_store.catalogue().items()},
+            'admission_requirements': dict(university['admission_requirements']),
+            'campus_facilities': list(university['campus_facilities']),
             'contact_information': {
-                'website': 'https://fut.edu.ng',
-                'email': 'info@fut.edu.ng',
-                'phone': '+234-66-222-000',
-                'address': 'Federal University of Technology, Minna, Niger State, Nigeria'
-            }
+                'website': fut_general['website'],
+                'email': fut_general['email'],
+                'phone': fut_general['phone'],
+                'address': fut_general['address']
+            },
+            'knowledge_version': knowledge_store.version
         }
         
         # Cache the information
@@ -153,19 +102,8 @@ class FUTAPIIntegration:
             'school_name': 'School of Information and Communication Technology (SICT)',
             'programs': fut_info.get('sict_programs', []),
             'course_codes': self.get_course_codes(),
-            'facilities': [
-                'Computer Laboratories',
-                'Network Laboratory',
-                'Software Development Lab',
-                'Hardware Maintenance Lab',
-                'Research Laboratory'
-            ],
-            'departments': [
-                'Computer Science',
-                'Cyber Security',
-                'Information Technology',
-                'Telecommunications Engineering'
-            ]
+            'facilities': list(knowledge_store.university['sict_school']['facilities']),
+            'departments': list(knowledge_store.university['sict_school']['departments'])
         }
     
     def search_information(self, query: str) -> Dict:
@@ -0,0 +1,121 @@
+"""
+Hybrid retrieval over the course-material chunks
+Runs the BM25 and dense indexes over the same candidate set and fuses their
+rankings with reciprocal rank fusion (score = sum of weight / (k + rank)), so
+neither index's raw score scale matters. Course codes found in the question
+become a bitmap filter from the chunk store that both indexes apply before
+scoring, so "COS102 loops" never touches CPT122 slides
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bm25_index import BM25Index, bm25_index
+from config import RuntimeConfig
+from dense_index import DenseIndex, dense_index
+from material_store import ChunkStore, material_store
+
+STAGES = ('filter', 'lexical', 'dense', 'fusion', 'fetch')
+# Each index ranks this many candidates per requested chunk before fusion
+CANDIDATES_PER_RESULT = 5
+MIN_CANDIDATES = 20
+
+
+class HybridRetriever:
+    """BM25 + dense retrieval fused by reciprocal rank, with per-stage timings"""
+
+    def __init__(self, store: ChunkStore, lexical: BM25Index, dense: DenseIndex, rrf_k: int = 60,
+                 lexical_weight: float = 1.0, dense_weight: float = 1.0):
+        self.store = store
+        self.lexical = lexical
+        self.dense = dense
+        self.rrf_k = rrf_k
+        self.lexical_weight = lexical_weight
+        self.dense_weight = dense_weight
+        self._lock = threading.Lock()
+        self._queries = 0
+        self._stage_ms = {stage: 0.0 for stage in STAGES}
+
+    @property
+    def available(self) -> bool:
+        return self.lexical.available or self.dense.available
+
+    def fuse(self, rankings: Sequence[Tuple[float, List[Tuple[int, float]]]], k: int) -> List[Tuple[int, float]]:
+        """Top-k (chunk_id, fused score) from (weight, ranking) pairs; ties keep the first ranking's order"""
+        fused: Dict[int, float] = {}
+        for weight, ranking in rankings:
+            for rank, (chunk_id, _) in enumerate(ranking, 1):
+                fused[chunk_id] = fused.get(chunk_id, 0.0) + weight / (self.rrf_k + rank)
+        return sorted(fused.items(), key=lambda item: -item[1])[:k]
+
+    def retrieve_with_timings(self, query: str, k: int = 4,
+                              courses: Optional[Sequence[str]] = None) -> Tuple[List[Dict], Dict[str, float]]:
+        """Top-k chunks (with fused 'score' and each index's rank) and the milliseconds spent per stage"""
+        timings = {}
+        started = time.perf_counter()
+
+        def lap(stage: str):
+            nonlocal started
+            now = time.perf_counter()
+            timings[stage] = round((now - started) * 1000, 3)
+            started = now
+
+        mask = self.store.course_mask(courses) if courses else None
+        lap('filter')
+        if mask is not None and not mask.any():
+            # None of the named courses has materials: nothing to rank
+            for stage in STAGES[1:]:
+                timings[stage] = 0.0
+            self._record(timings)
+            return [], timings
+
+        depth = max(k * CANDIDATES_PER_RESULT, MIN_CANDIDATES)
+        lexical = self.lexical.search(query, depth, mask=mask) if self.lexical_weight > 0 else []
+        lap('lexical')
+        dense = self.dense.search(query, depth, mask=mask) if self.dense_weight > 0 and self.dense.available else []
+        lap('dense')
+        fused = self.fuse([(self.lexical_weight, lexical), (self.dense_weight, dense)], k)
+        lap('fusion')
+
+        lexical_ranks = {chunk_id: rank for rank, (chunk_id, _) in enumerate(lexical, 1)}
+        dense_ranks = {chunk_id: rank for rank, (chunk_id, _) in enumerate(dense, 1)}
+        chunks = self.store.get_many(chunk_id for chunk_id, _ in fused)
+        for chunk, (chunk_id, score) in zip(chunks, fused):
+            chunk['score'] = round(score, 5)
+            chunk['lexical_rank'] = lexical_ranks.get(chunk_id)
+            chunk['dense_rank'] = dense_ranks.get(chunk_id)
+        lap('fetch')
+        self._record(timings)
+        return chunks, timings
+
+    def retrieve(self, query: str, k: int = 4, courses: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Top-k chunks for the query (same interface as the single indexes)"""
+        return self.retrieve_with_timings(query, k, courses)[0]
+
+    def _record(self, timings: Dict[str, float]):
+        with self._lock:
+            self._queries += 1
+            for stage in STAGES:
+                self._stage_ms[stage] += timings.get(stage, 0.0)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            queries = self._queries
+            average = {stage: round(total / queries, 3) if queries else 0.0 for stage, total in self._stage_ms.items()}
+        return {
+            'available': self.available,
+            'dense_available': self.dense.available,
+            'top_k': RuntimeConfig.MATERIALS_TOP_K,
+            'rrf_k': self.rrf_k,
+            'weights': {'lexical': self.lexical_weight, 'dense': self.dense_weight},
+            'queries': queries,
+            'avg_stage_ms': average
+        }
+
+
+# Global instance
+hybrid_retriever = HybridRetriever(material_store, bm25_index, dense_index,
+                                   rrf_k=RuntimeConfig.MATERIALS_RRF_K,
+                                   lexical_weight=RuntimeConfig.MATERIALS_LEXICAL_WEIGHT,
+                                   dense_weight=RuntimeConfig.MATERIALS_DENSE_WEIGHT)
@@ -9,76 +9,28 @@ import re
 from typing import Dict, List, Optional
 from datetime import datetime
 import requests
+from knowledge_store import knowledge_store
 
 class IntelligentCSAssistant:
     def __init__(self):
+        self.knowledge = knowledge_store
         self.cs_knowledge_base = self._load_cs_knowledge()
         self.course_materials = self._load_course_materials()
         self.success_tips = self._load_success_tips()
         self.external_sources = self._load_external_sources()
     
     def _load_cs_knowledge(self) -> Dict:
-        """Load comprehensive CS knowledge base"""
+        """Load study guidance (courses come from the shared knowledge store)"""
         return {
-            '100_level': {
-                'courses': {
-                    'COS101': {
-                        'name': 'Introduction to Computer Science',
-                        'description': 'Fundamental concepts of computer science, history, and applications',
-                        'materials': ['Introduction to Computer Science textbook', 'Programming basics guide', 'Computer fundamentals notes'],
-                        'success_tips': ['Understand basic concepts', 'Practice programming fundamentals', 'Read recommended textbooks']
-                    },
-                    'COS102': {
-                        'name': 'Introduction to Programming',
-                        'description': 'Basic programming concepts using Python',
-                        'materials': ['Python programming textbook', 'Code editor (VS Code/PyCharm)', 'Online Python tutorials'],
-                        'success_tips': ['Practice coding daily', 'Understand variables and data types', 'Work on programming projects']
-                    },
-                    'CPT121': {
-                        'name': 'Introduction to Computer Hardware',
-                        'description': 'Computer hardware components and maintenance',
-                        'materials': ['Computer hardware textbook', 'Hardware lab manual', 'Component identification guide'],
-                        'success_tips': ['Hands-on practice with hardware', 'Understand component functions', 'Study maintenance procedures']
-                    },
-                    'CPT122': {
-                        'name': 'Computer Hardware Systems and Maintenance',
-                        'description': 'Advanced hardware systems and troubleshooting',
-                        'materials': ['Hardware systems textbook', 'Troubleshooting guide', 'Maintenance tools'],
-                        'success_tips': ['Practice troubleshooting', 'Understand system architecture', 'Learn diagnostic procedures']
-                    },
-                    'MAT101': {
-                        'name': 'Mathematics for Computer Science',
-                        'description': 'Mathematical foundations for CS',
-                        'materials': ['Discrete mathematics textbook', 'Calculus textbook', 'Mathematical problem sets'],
-                        'success_tips': ['Practice mathematical problems', 'Understand discrete math concepts', 'Apply math to programming']
-                    }
-                },
-                'success_requirements': [
-                    'Attend all lectures and practical sessions',
-                    'Complete all assignments on time',
-                    'Participate in group projects',
-                    'Use recommended textbooks and materials',
-                    'Practice programming regularly',
-                    'Join study groups',
-                    'Seek help from lecturers when needed'
-                ]
-            },
-            '200_level': {
-                'courses': {
-                    'COS201': {
-                        'name': 'Data Structures and Algorithms',
-                        'description': 'Fundamental data structures and algorithm design',
-                        'materials': ['Data structures textbook', 'Algorithm design guide', 'Programming practice problems'],
-                        'success_tips': ['Master basic data structures', 'Practice algorithm implementation', 'Understand time complexity']
-                    },
-                    'COS202': {
-                        'name': 'Object-Oriented Programming',
-                        'description': 'OOP concepts using Java or C++',
-                        'materials': ['OOP textbook', 'Java/C++ programming guide', 'Design patterns book'],
-                        'success_tips': ['Understand OOP principles', 'Practice inheritance and polymorphism', 'Design object-oriented solutions']
-                    }
-                }
-            },
+            'success_requirements': [
+                'Attend all lectures and practical sessions',
+                'Complete all assignments on time',
+                'Participate in group projects',
+                'Use recommended textbooks and materials',
+                'Practice programming regularly',
+                'Join study groups',
+                'Seek help from lecturers when needed'
+            ],
             'general_tips': [
                 'Join CS student groups and forums',
                 'Participate in coding competitions',
@@ -201,7 +153,7 @@ class IntelligentCSAssistant:
             return self._get_success_tips_response(question)
         
         # Specific course queries
-        elif any(phrase in question_lower for phrase in ['cos101', 'cos102', 'cpt121', 'cpt122', 'mat101']):
+        elif self.knowledge.course_index.find(question_lower):
             return self._get_specific_course_response(question)
         
         # General CS queries
@@ -221,13 +173,13 @@ class IntelligentCSAssistant:
         
         # 100 Level courses
         response += "**100 LEVEL COURSES:**\n"
-        for code, details in self.cs_knowledge_base['100_level']['courses'].items():
-            response += f"• {code}: {details['name']}\n"
+        for code, name in self.knowledge.catalogue()['100_level'].items():
+            response += f"• {code}: {name}\n"
         
         # 200 Level courses
         response += "\n**200 LEVEL COURSES:**\n"
-        for code, details in self.cs_knowledge_base['200_level']['courses'].items():
-            response += f"• {code}: {details['name']}\n"
+        for code, name in self.knowledge.catalogue()['200_level'].items():
+            response += f"• {code}: {name}\n"
         
         response += "\n💡 **Need more details about any specific course? Just ask!**"
         return response
@@ -281,17 +233,11 @@ class IntelligentCSAssistant:
     
     def _get_specific_course_response(self, question: str) -> str:
         """Get specific course information"""
-        question_lower = question.lower()
-        
-        # Find the course code in the question
-        course_code = None
-        for code in ['COS101', 'COS102', 'CPT121', 'CPT122', 'MAT101']:
-            if code.lower() in question_lower:
-                course_code = code
-                break
+        # Find the first catalogued course code in the question
+        mentioned = self.knowledge.course_index.find(question)
         
-        if course_code:
-            course_info = self.cs_knowledge_base['100_level']['courses'].get(course_code, {})
+        if mentioned:
+            course_code, _, course_info = mentioned[0]
             if course_info:
                 response = f"📚 **{course_code} - {course_info['name']}**\n\n"
                 response += f"**Description:** {course_info['description']}\n\n"
@@ -313,11 +259,11 @@ class IntelligentCSAssistant:
         response = "🎓 **100 Level CS Success Guide**\n\n"
         
         response += "**📚 CORE COURSES:**\n"
-        for code, details in self.cs_knowledge_base['100_level']['courses'].items():
-            response += f"• {code}: {details['name']}\n"
+        for code, name in self.knowledge.catalogue()['100_level'].items():
+            response += f"• {code}: {name}\n"
         
         response += "\n**✅ SUCCESS REQUIREMENTS:**\n"
-        for requirement in self.cs_knowledge_base['100_level']['success_requirements']:
+        for requirement in self.cs_knowledge_base['success_requirements']:
             response += f"• {requirement}\n"
         
         response += "\n**💡 GENERAL TIPS:**\n"
@@ -0,0 +1,177 @@
+"""
+Vectorized intent classifier for question routing
+Hashed word and character n-gram features with a linear softmax model in
+NumPy; a batch of questions is scored with one gather-and-sum over the
+weight matrix
+"""
+
+import logging
+import math
+import os
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import RuntimeConfig
+
+logger = logging.getLogger(__name__)
+
+MODEL_FORMAT_VERSION = 1
+
+# Strategies whose analysis 'type' differs from the strategy name
+STRATEGY_TYPES = {
+    'general_guidance': 'general'
+}
+
+
+def strategy_type(strategy: str) -> str:
+    """analysis['type'] the keyword router reports for a strategy"""
+    return STRATEGY_TYPES.get(strategy, strategy)
+
+
+class IntentClassifier:
+    """Linear model over hashed n-grams, mapping questions to response strategies"""
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray, labels: Sequence[str], dims: int):
+        self.weights = weights.astype(np.float32)
+        self.bias = bias.astype(np.float32)
+        self.labels = list(labels)
+        self.dims = dims
+        # Vocabulary is small, so hashing is paid once per distinct token / bigram
+        self._token_features = lru_cache(maxsize=8192)(self._hash_token)
+        self._bigram_feature = lru_cache(maxsize=8192)(self._hash_bigram)
+
+    def _hash(self, feature: str) -> int:
+        return zlib.crc32(feature.encode('utf-8')) % self.dims
+
+    def _hash_token(self, token: str) -> Tuple[int, ...]:
+        """Whole word plus its character 4-grams (with boundary spaces)"""
+        padded = f" {token} "
+        return (self._hash('w:' + token),) + tuple(
+            self._hash('c:' + padded[i:i + 4]) for i in range(len(padded) - 3)
+        )
+
+    def _hash_bigram(self, first: str, second: str) -> int:
+        return self._hash(f"b:{first} {second}")
+
+    def feature_indices(self, question: str) -> List[int]:
+        """Hashed feature ids of a question; repeated features repeat"""
+        tokens = re.findall(r'[a-z0-9]+', question.lower())
+        indices = []
+        for token in tokens:
+            indices.extend(self._token_features(token))
+        indices.extend(self._bigram_feature(first, second) for first, second in zip(tokens, tokens[1:]))
+        return indices
+
+    def vectorize(self, questions: Sequence[str]) -> np.ndarray:
+        """(len(questions), dims) matrix of feature counts scaled by 1/sqrt(feature total)"""
+        matrix = np.zeros((len(questions), self.dims), dtype=np.float32)
+        for row, question in enumerate(questions):
+            indices = self.feature_indices(question)
+            if indices:
+                matrix[row] = np.bincount(indices, minlength=self.dims) / np.sqrt(len(indices))
+        return matrix
+
+    def predict_proba(self, questions: Sequence[str]) -> np.ndarray:
+        """Class probabilities for a batch, without materializing the dense feature matrix
+
+        Equivalent to vectorize(questions) @ weights + bias: the weight rows of every
+        feature in the batch are gathered at once and summed per question.
+        """
+        per_question = [self.feature_indices(question) for question in questions]
+        lengths = np.array([len(indices) for indices in per_question])
+        logits = np.tile(self.bias, (len(questions), 1))
+        present = lengths > 0
+        if present.any():
+            flat = np.fromiter((i for indices in per_question for i in indices), dtype=np.intp, count=int(lengths.sum()))
+            starts = np.concatenate(([0], np.cumsum(lengths[present])[:-1]))
+            sums = np.add.reduceat(self.weights[flat], starts, axis=0)
+            logits[present] += sums / np.sqrt(lengths[present])[:, None]
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits
+
+    def classify_batch(self, questions: Sequence[str]) -> List[Tuple[str, float]]:
+        """(strategy, probability) for each question"""
+        if not questions:
+            return []
+        probabilities = self.predict_proba(questions)
+        best = probabilities.argmax(axis=1)
+        return [(self.labels[index], float(probabilities[row, index])) for row, index in enumerate(best)]
+
+    def classify(self, question: str) -> Tuple[str, float]:
+        """Single-question path of classify_batch with fewer NumPy calls"""
+        indices = self.feature_indices(question)
+        logits = self.bias
+        if indices:
+            logits = self.weights[indices].sum(axis=0) * (1.0 / math.sqrt(len(indices))) + self.bias
+        best = int(logits.argmax())
+        return self.labels[best], float(1.0 / np.exp(logits - logits[best]).sum())
+
+    @classmethod
+    def fit(cls, questions: Sequence[str], strategies: Sequence[str], dims: int = 4096,
+            epochs: int = 500, learning_rate: float = 5.0, l2: float = 1e-4) -> 'IntentClassifier':
+        """Multinomial logistic regression trained with full-batch gradient descent"""
+        labels = sorted(set(strategies))
+        model = cls(np.zeros((dims, len(labels))), np.zeros(len(labels)), labels, dims)
+        features = model.vectorize(questions)
+        targets = np.zeros((len(questions), len(labels)), dtype=np.float32)
+        targets[np.arange(len(questions)), [labels.index(s) for s in strategies]] = 1.0
+
+        for _ in range(epochs):
+            logits = features @ model.weights + model.bias
+            logits -= logits.max(axis=1, keepdims=True)
+            probabilities = np.exp(logits)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            error = (probabilities - targets) / len(questions)
+            model.weights -= learning_rate * (features.T @ error + l2 * model.weights)
+            model.bias -= learning_rate * error.sum(axis=0)
+        return model
+
+    def save(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights.astype(np.float16),
+            bias=self.bias,
+            labels=np.array(self.labels),
+            dims=np.array(self.dims),
+            version=np.array(MODEL_FORMAT_VERSION)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Optional['IntentClassifier']:
+        """Load a model saved by save(); None if missing or unreadable"""
+        try:
+            if not os.path.exists(path):
+                logger.warning(f"Intent classifier model not found at {path}")
+                return None
+            with np.load(path) as data:
+                if int(data['version']) != MODEL_FORMAT_VERSION:
+                    logger.error(f"Unsupported intent classifier format in {path}")
+                    return None
+                return cls(data['weights'], data['bias'], [str(label) for label in data['labels']],
+                           int(data['dims']))
+        except Exception as e:
+            logger.error(f"Could not load intent classifier from {path}: {e}")
+            return None
+
+    def get_status(self) -> Dict:
+        return {
+            'labels': self.labels,
+            'dims': self.dims,
+            'weights_bytes': int(self.weights.nbytes)
+        }
+
+
+# Global instance (None unless the classifier router is enabled and the model loads)
+intent_classifier = (
+    IntentClassifier.load(RuntimeConfig.INTENT_CLASSIFIER_PATH)
+    if RuntimeConfig.INTENT_ROUTER == 'classifier' else None
+)
@@ -0,0 +1,242 @@
+"""
+Compiled multi-pattern keyword matcher for question routing
+One Aho-Corasick automaton over every routing keyword table; a single pass
+over the question reports each matched category with its match positions
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+Match = Tuple[int, int, str]  # (start, end, pattern)
+
+
+class KeywordMatches:
+    """Result of one scan: matched categories and where each pattern occurred"""
+
+    __slots__ = ('text', 'hits')
+
+    def __init__(self, text: str, hits: Dict[str, List[Match]]):
+        self.text = text
+        self.hits = hits
+
+    def __contains__(self, category: str) -> bool:
+        return category in self.hits
+
+    def any(self, *categories: str) -> bool:
+        return any(category in self.hits for category in categories)
+
+    def positions(self, category: str) -> List[Match]:
+        return self.hits.get(category, [])
+
+    @property
+    def categories(self) -> FrozenSet[str]:
+        return frozenset(self.hits)
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton compiled to a dense transition table"""
+
+    def __init__(self, tables: Dict[str, Iterable[str]]):
+        self.tables = {category: tuple(patterns) for category, patterns in tables.items()}
+
+        pattern_categories: Dict[str, List[str]] = {}
+        for category, patterns in self.tables.items():
+            for pattern in patterns:
+                pattern_categories.setdefault(pattern, [])
+                if category not in pattern_categories[pattern]:
+                    pattern_categories[pattern].append(category)
+        self.patterns = list(pattern_categories)
+        self.pattern_categories = [tuple(pattern_categories[p]) for p in self.patterns]
+
+        self._build()
+        self.match = lru_cache(maxsize=512)(self._match)
+
+    def _build(self):
+        # Trie
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].append(index)
+
+        # Failure links (BFS), folding each state's failure outputs into its own and
+        # resolving every transition so scanning never has to follow failure links
+        alphabet = {char for pattern in self.patterns for char in pattern}
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = {char: goto[0].get(char, 0) for char in alphabet}
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            for char in alphabet:
+                child = goto[state].get(char)
+                if child is None:
+                    delta[state][char] = delta[fail[state]][char]
+                else:
+                    fail[child] = delta[fail[state]][char]
+                    delta[state][char] = child
+                    queue.append(child)
+
+        # Drop transitions back to the root; a missing key means "go to root"
+        self._delta = [{char: target for char, target in row.items() if target} for row in delta]
+        self._outputs = [tuple(output) for output in outputs]
+        self.state_count = len(goto)
+
+    def _match(self, text: str) -> KeywordMatches:
+        """Scan lowercased text once and return every matched category"""
+        delta = self._delta
+        outputs = self._outputs
+        found = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found.append((end, outputs[state]))
+
+        hits: Dict[str, List[Match]] = {}
+        for end, pattern_ids in found:
+            for index in pattern_ids:
+                pattern = self.patterns[index]
+                match = (end - len(pattern), end, pattern)
+                for category in self.pattern_categories[index]:
+                    hits.setdefault(category, []).append(match)
+        return KeywordMatches(text, hits)
+
+
+# Course phrases recognised by the unified router (order matters: first match wins for listing)
+UNIFIED_COURSE_PATTERNS = {
+    'COS101': ['cos101', 'cos 101', 'introduction to computer science', 'computer science intro', 'cs intro', 'computer science basics'],
+    'COS102': ['cos102', 'cos 102', 'introduction to programming', 'python', 'programming intro', 'problem solving', 'programming basics'],
+    'PHY101': ['phy101', 'phy 101', 'physics 1', 'general physics', 'physics first', 'physics basics'],
+    'PHY102': ['phy102', 'phy 102', 'physics 2', 'advanced physics', 'physics second'],
+    'CST111': ['cst111', 'cst 111', 'communication', 'english', 'communication skills', 'english skills'],
+    'GST112': ['gst112', 'gst 112', 'nigerian culture', 'culture', 'nigerian people', 'cultural studies'],
+    'STA111': ['sta111', 'sta 111', 'statistics', 'descriptive statistics', 'stats', 'statistical methods'],
+    'CPT121': ['cpt121', 'cpt 121', 'computer hardware', 'hardware intro', 'hardware basics', 'computer components'],
+    'CPT122': ['cpt122', 'cpt 122', 'hardware systems', 'hardware maintenance', 'advanced hardware', 'computer maintenance'],
+    'FTM-CPT111': ['ftm-cpt111', 'ftm cpt111', 'probability', 'math for cs', 'probability theory', 'mathematical probability'],
+    'FTM-CPT112': ['ftm-cpt112', 'ftm cpt112', 'web development', 'frontend', 'html css javascript', 'web programming'],
+    'FTM-CPT192': ['ftm-cpt192', 'ftm cpt192', 'computer hardware systems', 'hardware systems', 'computer systems'],
+    'MAT101': ['mat101', 'mat 101', 'mathematics for cs', 'math for computer science', 'discrete mathematics'],
+    'MAT121': ['mat121', 'mat 121', 'differential calculus', 'integral calculus', 'calculus', 'mathematics 121']
+}
+
+KEYWORD_TABLES = {
+    # Shared boundary check (unified and dynamic routers)
+    'unrelated': [
+        'cooking', 'recipe', 'food', 'restaurant', 'travel', 'hotel', 'weather',
+        'sports', 'football', 'basketball', 'music', 'movie', 'entertainment',
+        'fashion', 'shopping', 'beauty', 'health', 'medical', 'politics',
+        'religion', 'dating', 'relationship', 'personal', 'private'
+    ],
+
+    # UnifiedIntelligence.analyze_question_intelligence
+    'lecturer': [
+        'who teaches', 'who is the lecturer', 'lecturer for', 'teacher for', 'instructor for',
+        'who handles', 'who takes', 'lecturer', 'teacher', 'instructor', 'teaches', 'who are',
+        'who are the lecturer', 'who are the lecturers', 'lecturers for', 'teachers for',
+        'instructors for', 'who is', 'who are the', 'lecturers', 'teachers', 'instructors',
+        'who dey teach', 'who dey', 'dey teach', 'teaching', 'teach us', 'teach me',
+        'who is teaching', 'who teaching', 'teaching us', 'teaches us', 'teaches me'
+    ],
+    'course_list': [
+        'list my courses', 'my courses', 'courses', 'list courses', 'show courses',
+        'available courses', 'all courses', 'courses available', 'courses do i need',
+        'courses should i take', 'list', 'show me courses', 'what courses',
+        'courses by', 'my course', 'course list', 'show my courses'
+    ],
+    'materials': [
+        'materials', 'material', 'download', 'downloads', 'books', 'resources',
+        'study materials', 'course materials', 'materials for', 'materials do i need',
+        'what do i need', 'study guide', 'textbooks', 'learning materials',
+        'books do i need', 'materials do i need', 'i need materials', 'need materials',
+        'course material', 'this course material', 'materials for this course'
+    ],
+    'career': ['career', 'job opportunities', 'what can i do', 'future career', 'work after graduation', 'employment', 'career paths', 'job prospects', 'work in tech', 'tech jobs', 'after graduation', 'jobs available', 'jobs can i get', 'degree', 'work with'],
+    'study_materials': ['study materials', 'books', 'resources', 'what do i need', 'materials for', 'study guide', 'textbooks', 'learning materials', 'books do i need', 'materials do i need'],
+    'success_tips': ['how to study', 'study tips', 'how to pass', 'study strategy', 'academic success', 'excel in', 'study methods', 'learning tips', 'study better', 'struggling with', 'succeed in studies'],
+    'fut_info': ['fut', 'university', 'campus', 'facilities', 'admission', 'about fut', 'university info', 'campus life'],
+    'greeting': ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings', 'new here', 'new student'],
+    'thanks': ['thank you', 'thanks', 'appreciate', 'grateful', 'thank you so much'],
+    'pdf_content': ['pdf', 'download', 'access materials', 'course content', 'lecture notes', 'study materials', 'course files'],
+    'past_questions': ['past questions', 'previous exams', 'sample questions', 'practice questions', 'exam examples', 'old questions', 'previous papers'],
+    'help': ['help', 'what can you do', 'what do you know', 'capabilities', 'assist', 'support', 'guide me', 'can you help'],
+    'pidgin_routing': ['wetin', 'how far', 'abi', 'dey', 'na', 'sabi', 'how you dey'],
+    'casual_routing': ['yo', 'sup', 'what\'s up', 'cool', 'awesome', 'nice one'],
+    'cs_subject': ['computer science', 'cs', 'programming', 'physics', 'statistics', 'hardware', 'web development'],
+    'subject_programming': ['programming', 'python'],
+    'subject_physics': ['physics'],
+    'subject_statistics': ['statistics', 'stats'],
+    'subject_hardware': ['hardware'],
+
+    # UnifiedIntelligence._identify_intent / _needs_context
+    'intent_informational': ['what', 'tell me', 'explain', 'describe'],
+    'intent_guidance': ['how', 'can i', 'should i', 'what should'],
+    'intent_explanatory': ['why', 'because', 'reason'],
+    'intent_specific': ['when', 'where', 'which'],
+    'context_indicator': ['this', 'that', 'it', 'them', 'here', 'there'],
+
+    # UnifiedIntelligence._detect_language_style
+    'style_pidgin': ['wetin', 'how far', 'abi', 'dey', 'na', 'sabi', 'wahala'],
+    'style_casual': ['yo', 'sup', 'hey', 'what\'s up', 'cool', 'awesome'],
+    'style_formal': ['could you please', 'may i know', 'kindly provide'],
+
+    # UnifiedIntelligence._infer_user_type
+    'user_new': ['100l', '100 level', 'first year', 'freshman'],
+    'user_advanced': ['400l', '400 level', 'final year', 'graduating'],
+    'user_struggling': ['struggling', 'difficult', 'hard', 'confused'],
+    'user_career': ['career', 'job', 'industry', 'work'],
+
+    # UnifiedIntelligence._is_follow_up_question
+    'follow_up': [
+        'what about', 'how about', 'and', 'also', 'additionally', 'furthermore',
+        'can you tell me more', 'more details', 'explain more', 'elaborate',
+        'what else', 'anything else', 'other', 'different', 'alternative',
+        'who are', 'who is', 'what are', 'what is', 'tell me about',
+        'that course', 'this course', 'the course', 'it', 'them', 'they',
+        'download', 'materials', 'lecturer', 'teacher', 'instructor',
+        'more info', 'more information', 'details', 'explain'
+    ],
+
+    # DynamicIntelligence.analyze_question_intent
+    'dynamic_cs': [
+        'computer science', 'cs', 'programming', 'coding', 'software',
+        'hardware', 'algorithm', 'data structure', 'database', 'network',
+        'cybersecurity', 'information technology', 'it'
+    ],
+    'dynamic_fut': [
+        'fut', 'federal university', 'minna', 'admission', 'requirements',
+        'campus', 'facilities', 'programs', 'courses', 'university'
+    ],
+    'dynamic_materials': [
+        'materials', 'books', 'software', 'tools', 'resources', 'what do i need',
+        'equipment', 'supplies', 'textbooks', 'laptop', 'computer'
+    ],
+    'dynamic_success': [
+        'success', 'pass', 'excel', 'tips', 'advice', 'how to', 'help',
+        'guidance', 'strategy', 'study', 'learn', 'improve'
+    ],
+
+    # app.is_cs_domain_question (course codes themselves come from course_codes.py)
+    'cs_domain': ['course', 'lecturer', 'programming', 'computer', 'software', 'hardware', 'materials', 'study', 'cos', 'cst', 'mat', 'phy', 'cpt'],
+    'cs_course_name': [
+        'computer science', 'computer studies', 'programming', 'software engineering',
+        'data structures', 'algorithms', 'database', 'networking', 'cybersecurity',
+        'artificial intelligence', 'machine learning', 'web development'
+    ]
+}
+
+for _code, _patterns in UNIFIED_COURSE_PATTERNS.items():
+    KEYWORD_TABLES[f'course:{_code}'] = _patterns
+
+
+# Global instance
+keyword_matcher = KeywordMatcher(KEYWORD_TABLES)
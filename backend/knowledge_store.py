@@ -0,0 +1,300 @@
+"""
+Read-only FUT knowledge store shared by every assistant module
+Course details, the course-code catalogue, lecturers, course PDFs, past
+questions, course summaries and university facts are loaded once from
+data/knowledge/*.json and lecturer_database.json, frozen, and indexed by
+course code, level, lecturer name and topic
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from config import RuntimeConfig
+from course_codes import CourseIndex, course_variants
+from text_tokens import tokenize
+
+logger = logging.getLogger(__name__)
+
+KNOWLEDGE_FILES = ('courses.json', 'course_catalogue.json', 'course_pdfs.json', 'past_questions.json',
+                   'course_summaries.json', 'university.json', 'department_guide.json')
+EMPTY = MappingProxyType({})
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, punctuation-free, single-spaced form of a person's name"""
+    return ' '.join(re.sub(r'[^\w\s]', ' ', name.lower()).split())
+
+
+class KnowledgeStore:
+    """FUT knowledge loaded lazily from JSON files; every accessor returns read-only data"""
+
+    def __init__(self, directory: str, lecturer_file: str):
+        self.directory = directory
+        self.lecturer_file = lecturer_file
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._version = ''
+        self._data: Mapping[str, Any] = EMPTY
+        self._courses_by_level: Mapping[str, Mapping[str, Any]] = EMPTY
+        self._course_index = CourseIndex({})
+        self._course_lecturers: Mapping[str, Tuple] = EMPTY
+        self._by_level: Mapping[str, Tuple[str, ...]] = EMPTY
+        self._by_lecturer: Mapping[str, Tuple[Tuple[str, str], ...]] = EMPTY
+        self._by_topic: Mapping[str, Tuple[str, ...]] = EMPTY
+
+    def _load(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                self._build()
+            except Exception as e:
+                # Every course, lecturer and department answer depends on this data: fail loudly
+                logger.error(f"Error loading knowledge store: {str(e)}")
+                raise RuntimeError(f"Knowledge store could not be loaded from {self.directory} "
+                                   f"and {self.lecturer_file}: {str(e)}") from e
+            self._loaded = True
+            logger.info(f"Loaded knowledge store {self._version}: {len(self._course_index)} courses, "
+                        f"{len(self._by_lecturer)} lecturers, {len(self._by_topic)} topic terms")
+
+    def load(self):
+        """Load the knowledge files now; raises RuntimeError when they can't be read"""
+        self._load()
+
+    def reload(self) -> bool:
+        """Re-read the knowledge files without a restart; True when their content changed
+
+        Readers keep the current data until the new files are read and
+        indexed (the version is swapped last), and anything keyed by the
+        version rebuilds on next use. If the files can't be read, RuntimeError
+        is raised and the current data stays.
+        """
+        with self._lock:
+            previous = self._version
+            try:
+                self._build()
+            except Exception as e:
+                logger.error(f"Error reloading knowledge store: {str(e)}")
+                raise RuntimeError(f"Knowledge store could not be reloaded from {self.directory} "
+                                   f"and {self.lecturer_file}: {str(e)}") from e
+            self._loaded = True
+        changed = self._version != previous
+        if changed:
+            logger.info(f"Reloaded knowledge store {previous or '-'} -> {self._version}")
+        return changed
+
+    def _build(self):
+        digest = hashlib.sha256()
+        data: Dict[str, Any] = {}
+        for name in KNOWLEDGE_FILES:
+            with open(os.path.join(self.directory, name), 'rb') as f:
+                raw = f.read()
+            digest.update(raw)
+            data[name[:-len('.json')]] = json.loads(raw)
+        with open(self.lecturer_file, 'rb') as f:
+            raw = f.read()
+        digest.update(raw)
+        lecturers = json.loads(raw)
+
+        # Lecturer names live only in the lecturer database; course entries get them merged in
+        courses_by_level = {}
+        for level, courses in data['courses'].items():
+            courses_by_level[level] = {}
+            for code, info in courses.items():
+                info = dict(info)
+                if code in lecturers:
+                    info['lecturers'] = [lecturer['name'] for lecturer in lecturers[code]['lecturers']]
+                courses_by_level[level][code] = info
+
+        by_lecturer: Dict[str, List[Tuple[str, str]]] = {}
+        for code, entry in lecturers.items():
+            for lecturer in entry['lecturers']:
+                by_lecturer.setdefault(normalize_name(lecturer['name']), []).append((code, lecturer['role']))
+
+        # Topic terms: course names and descriptions, PDF topics and key concepts, past-question topics
+        by_topic: Dict[str, List[str]] = {}
+
+        def index_topics(code: str, texts):
+            for term in tokenize(' '.join(texts)):
+                codes = by_topic.setdefault(term, [])
+                if code not in codes:
+                    codes.append(code)
+
+        for courses in courses_by_level.values():
+            for code, info in courses.items():
+                index_topics(code, [info['name'], info.get('description', '')])
+        for courses in data['course_catalogue'].values():
+            for code, name in courses.items():
+                index_topics(code, [name])
+        for code, pdf in data['course_pdfs'].items():
+            index_topics(code, [pdf['title'], *pdf.get('topics', []), *pdf.get('key_concepts', [])])
+        for code, questions in data['past_questions'].items():
+            index_topics(code, [question['topic'] for question in questions])
+
+        self._data = freeze(data)
+        self._courses_by_level = freeze(courses_by_level)
+        self._course_index = CourseIndex(self._courses_by_level)
+        self._course_lecturers = freeze({code: entry['lecturers'] for code, entry in lecturers.items()})
+        self._by_level = MappingProxyType({level: tuple(courses) for level, courses in courses_by_level.items()})
+        self._by_lecturer = freeze(by_lecturer)
+        self._by_topic = freeze(by_topic)
+        self._version = digest.hexdigest()[:12]
+
+    def _section(self, name: str) -> Mapping:
+        self._load()
+        return self._data.get(name, EMPTY)
+
+    def _resolve(self, table: Mapping, code: str) -> Optional[str]:
+        """Key of table for the code in either spelling (COS102, CPT112 / FTM-CPT112)"""
+        for variant in sorted(course_variants([code]), key=lambda variant: variant != code.upper()):
+            if variant in table:
+                return variant
+        return None
+
+    @property
+    def version(self) -> str:
+        """Short content hash of every loaded file; changes whenever the knowledge does"""
+        self._load()
+        return self._version
+
+    # Courses
+
+    @property
+    def course_index(self) -> CourseIndex:
+        self._load()
+        return self._course_index
+
+    @property
+    def courses_by_level(self) -> Mapping[str, Mapping[str, Any]]:
+        """{level: {code: details}} for every course with full details"""
+        self._load()
+        return self._courses_by_level
+
+    def level_courses(self, level: str) -> Mapping[str, Any]:
+        return self.courses_by_level.get(level, EMPTY)
+
+    def level_codes(self, level: str) -> Tuple[str, ...]:
+        self._load()
+        return self._by_level.get(level, ())
+
+    def course(self, code: str) -> Optional[Mapping[str, Any]]:
+        entry = self.course_index.lookup(code)
+        return entry[1] if entry else None
+
+    def lookup(self, code: str) -> Optional[Tuple[str, str, Mapping[str, Any]]]:
+        """(catalogued code, level, details) for a code in either spelling"""
+        resolved = self.course_index.resolve(code)
+        if not resolved:
+            return None
+        level, info = self.course_index.by_code[resolved]
+        return resolved, level, info
+
+    def find_courses(self, text: str) -> List[Tuple[str, str, Mapping[str, Any]]]:
+        """(code, level, details) for every detailed course mentioned in the text"""
+        return self.course_index.find(text)
+
+    def catalogue(self) -> Mapping[str, Mapping[str, str]]:
+        """{level: {code: name}} for the whole programme, detailed courses first"""
+        self._load()
+        levels: Dict[str, Dict[str, str]] = {}
+        for level, courses in self._courses_by_level.items():
+            levels[level] = {code: info['name'] for code, info in courses.items()}
+        for level, courses in self._section('course_catalogue').items():
+            levels.setdefault(level, {}).update(courses)
+        return freeze(dict(sorted(levels.items())))
+
+    def courses_for_topic(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Course codes whose topics share the most terms with the text"""
+        self._load()
+        counts: Dict[str, int] = {}
+        for term in set(tokenize(text)):
+            for code in self._by_topic.get(term, ()):
+                counts[code] = counts.get(code, 0) + 1
+        ranked = sorted(counts, key=lambda code: -counts[code])
+        return ranked[:limit] if limit else ranked
+
+    # Lecturers
+
+    def course_lecturers(self, code: str) -> Tuple[Mapping[str, str], ...]:
+        """({'name', 'role'}, ...) for the course, lead lecturer first"""
+        self._load()
+        resolved = self._resolve(self._course_lecturers, code)
+        return self._course_lecturers[resolved] if resolved else ()
+
+    def lecturer_courses(self, name: str) -> Tuple[Tuple[str, str], ...]:
+        """((code, role), ...) for a lecturer's exact name (case and punctuation ignored)"""
+        self._load()
+        return self._by_lecturer.get(normalize_name(name), ())
+
+    def lecturer_names(self) -> Tuple[str, ...]:
+        """Every lecturer (normalized names)"""
+        self._load()
+        return tuple(self._by_lecturer)
+
+    # Course documents
+
+    def course_pdf(self, code: str) -> Optional[Mapping[str, Any]]:
+        pdfs = self.course_pdfs
+        resolved = self._resolve(pdfs, code)
+        return pdfs[resolved] if resolved else None
+
+    @property
+    def course_pdfs(self) -> Mapping[str, Mapping[str, Any]]:
+        return self._section('course_pdfs')
+
+    @property
+    def past_questions(self) -> Mapping[str, Tuple]:
+        """{course code or 'general_cs': (question, ...)}"""
+        return self._section('past_questions')
+
+    def course_summary(self, code: str) -> Optional[str]:
+        summaries = self._section('course_summaries')
+        resolved = self._resolve(summaries, code)
+        return summaries[resolved] if resolved else None
+
+    # University
+
+    @property
+    def university(self) -> Mapping[str, Any]:
+        """fut_general, sict_school, admission_requirements, faculties, campus_facilities"""
+        return self._section('university')
+
+    @property
+    def department_guide(self) -> Mapping[str, Tuple[str, ...]]:
+        """career_paths, essential_skills, industries, future_contributions"""
+        return self._section('department_guide')
+
+    def get_stats(self) -> Dict:
+        self._load()
+        return {
+            'version': self._version,
+            'path': self.directory,
+            'courses': len(self._course_index),
+            'catalogue_courses': sum(len(courses) for courses in self.catalogue().values()),
+            'levels': {level: len(codes) for level, codes in self._by_level.items()},
+            'lecturers': len(self._by_lecturer),
+            'topic_terms': len(self._by_topic),
+            'course_pdfs': len(self.course_pdfs),
+            'past_question_sets': len(self.past_questions)
+        }
+
+
+# Global instance
+knowledge_store = KnowledgeStore(RuntimeConfig.KNOWLEDGE_PATH, RuntimeConfig.LECTURER_DATABASE_PATH)
@@ -0,0 +1,245 @@
+"""
+Lecturer name lookup for the unified strategies and the Groq prompts
+An inverted index maps each normalized name token to the lecturers whose
+name contains it. Question words are matched against the name tokens within
+a length-bounded edit distance (transpositions count once) through a
+deletion-variant index, so "Alenoghena" also finds Benjamin Alenoghen and
+"Saidu" finds Sadiu. Built from the knowledge store and rebuilt whenever its
+version changes (KnowledgeStore.reload)
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from knowledge_store import KnowledgeStore, knowledge_store, normalize_name
+from text_tokens import STOPWORDS
+
+HONORIFICS = {'dr', 'prof', 'professor', 'mr', 'mrs', 'ms', 'miss', 'engr', 'sir'}
+LECTURER_WORDS = {
+    'lecturer', 'lecturers', 'teacher', 'teachers', 'instructor', 'instructors', 'professors',
+    'teach', 'teaches', 'teaching', 'taught'
+}
+# Words that mark a question as being about a person on the staff
+LECTURER_CUES = HONORIFICS | LECTURER_WORDS
+# Question words that are never read as names (on top of the shared stopwords)
+QUERY_STOPWORDS = STOPWORDS | LECTURER_CUES | {
+    'course', 'courses', 'take', 'takes', 'handle', 'handles', 'tell', 'about', 'show', 'list', 'please', 'does'
+}
+# Words allowed between a single name word and its cue ("taught by Brown")
+CUE_LINK_WORDS = {'by'}
+# Shorter tokens (initials, "as") are too ambiguous to match on
+MIN_TOKEN_LENGTH = 3
+NAME_TOKEN_PATTERN = re.compile(r'[a-z]+')
+
+
+def max_edits(token: str) -> int:
+    """Edits allowed when matching a query token: none for short words, 2 for long names"""
+    if len(token) <= 3:
+        return 0
+    return 1 if len(token) <= 5 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent transpositions), capped at limit + 1"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def next_to_cue(words: List[str], position: int) -> bool:
+    """Whether the word at position has a lecturer word or honorific right before or after it"""
+    for step in (-1, 1):
+        neighbour = position + step
+        while 0 <= neighbour < len(words) and words[neighbour] in CUE_LINK_WORDS:
+            neighbour += step
+        if 0 <= neighbour < len(words) and words[neighbour] in LECTURER_CUES:
+            return True
+    return False
+
+
+def deletions(token: str, edits: int) -> Set[str]:
+    """The token and every string made by deleting up to `edits` of its characters"""
+    variants = {token}
+    frontier = {token}
+    for _ in range(edits):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants |= frontier
+    return variants
+
+
+class NameTokenIndex:
+    """Name tokens within an edit distance of a word via shared deletion variants (SymSpell)
+
+    Two words within d edits (insertions, deletions, substitutions or adjacent
+    transpositions) always share a string obtained by deleting at most d
+    characters from each, so candidates come from hash lookups and only they
+    are checked with edit_distance.
+    """
+
+    def __init__(self, words, max_edits: int = 2):
+        self.max_edits = max_edits
+        self.variants: Dict[str, Set[str]] = {}
+        for word in words:
+            for variant in deletions(word, max_edits):
+                self.variants.setdefault(variant, set()).add(word)
+
+    def search(self, word: str, limit: int) -> List[Tuple[int, str]]:
+        """(distance, name token) for every token within limit edits"""
+        limit = min(limit, self.max_edits)
+        candidates = set()
+        for variant in deletions(word, limit):
+            candidates |= self.variants.get(variant, set())
+        found = ((edit_distance(word, candidate, limit), candidate) for candidate in candidates)
+        return sorted(match for match in found if match[0] <= limit)
+
+
+@dataclass(frozen=True)
+class LecturerMatch:
+    """A lecturer named in a question and what they teach"""
+
+    name: str                                   # spelling from lecturer_database.json
+    courses: Tuple[Tuple[str, str, str], ...]   # (course code, course name, role)
+    matched: int                                # question words that matched the name
+    distance: int                               # total edits over those words (0 = exact)
+    words: Tuple[str, ...] = ()                 # the question words that matched
+
+
+class LecturerIndex:
+    """Name token -> lecturers inverted index with bounded-edit-distance matching for misspellings"""
+
+    def __init__(self, store: KnowledgeStore, cache_size: int = 4096):
+        self.store = store
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._names: List[str] = []
+        self._courses: List[Tuple[Tuple[str, str, str], ...]] = []
+        self._postings: Dict[str, Tuple[int, ...]] = {}
+        self._fuzzy = NameTokenIndex([])
+        # Query token -> ((lecturer id, edits), ...), so repeated words skip the fuzzy search
+        self._token_cache: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+
+    def _ensure(self):
+        version = self.store.version
+        if version == self._version:
+            return
+        with self._lock:
+            if version != self._version:
+                self._build()
+                self._version = version
+
+    def _build(self):
+        ids: Dict[str, int] = {}
+        names: List[str] = []
+        courses: List[List[Tuple[str, str, str]]] = []
+        postings: Dict[str, List[int]] = {}
+        for level, catalogue in self.store.catalogue().items():
+            for code, course_name in catalogue.items():
+                for lecturer in self.store.course_lecturers(code):
+                    tokens = [token for token in normalize_name(lecturer['name']).split() if token not in HONORIFICS]
+                    # "Lawal OLamilekan Lawal" and "Lawal Olamilekan Lawal" are one lecturer
+                    key = ' '.join(tokens)
+                    if key not in ids:
+                        ids[key] = len(names)
+                        names.append(lecturer['name'])
+                        courses.append([])
+                    lecturer_id = ids[key]
+                    courses[lecturer_id].append((code, course_name, lecturer['role']))
+                    for token in tokens:
+                        if len(token) >= MIN_TOKEN_LENGTH and lecturer_id not in postings.setdefault(token, []):
+                            postings[token].append(lecturer_id)
+
+        self._names = names
+        self._courses = [tuple(taught) for taught in courses]
+        self._postings = {token: tuple(lecturer_ids) for token, lecturer_ids in postings.items()}
+        self._fuzzy = NameTokenIndex(self._postings)
+        self._token_cache = {}
+
+    def _token_matches(self, token: str) -> Tuple[Tuple[int, int], ...]:
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+        # Near spellings are matched even when the exact token exists: "Lasotte" also finds "Iosotte"
+        matches = tuple((lecturer_id, distance)
+                        for distance, name_token in self._fuzzy.search(token, max_edits(token))
+                        for lecturer_id in self._postings[name_token])
+        if len(self._token_cache) >= self.cache_size:
+            self._token_cache.clear()
+        self._token_cache[token] = matches
+        return matches
+
+    def find(self, text: str, limit: Optional[int] = None) -> List[LecturerMatch]:
+        """Lecturers named in the text, best first; only those matching the most question words are returned"""
+        self._ensure()
+        scores: Dict[int, Dict[str, int]] = {}
+        for token in dict.fromkeys(NAME_TOKEN_PATTERN.findall(text.lower())):
+            if len(token) < MIN_TOKEN_LENGTH or token in QUERY_STOPWORDS:
+                continue
+            for lecturer_id, distance in self._token_matches(token):
+                edits = scores.setdefault(lecturer_id, {})
+                edits[token] = min(distance, edits.get(token, distance))
+        if not scores:
+            return []
+
+        best = max(len(edits) for edits in scores.values())
+        found = [LecturerMatch(self._names[lecturer_id], self._courses[lecturer_id], len(edits), sum(edits.values()),
+                               tuple(edits))
+                 for lecturer_id, edits in scores.items() if len(edits) == best]
+        found.sort(key=lambda match: (match.distance, match.name))
+        return found[:limit] if limit else found
+
+    def mentioned(self, text: str, limit: Optional[int] = None) -> List[LecturerMatch]:
+        """Lecturers the question is about, for routing
+
+        A single name word ("brown bread recipe", "is sarah around") is too
+        common to route on by itself: it counts only when spelled exactly and
+        right next to a lecturer word or honorific ("Dr Brown", "what does
+        Davis teach", "taught by Brown"), so "Dr, explain binary search" is not
+        read as Sarah. Two or more matched name words (a full name) always count.
+        """
+        found = self.find(text)
+        if found and found[0].matched < 2:
+            words = NAME_TOKEN_PATTERN.findall(text.lower())
+            cued = {word for position, word in enumerate(words) if next_to_cue(words, position)}
+            found = [match for match in found if match.distance == 0 and cued.intersection(match.words)]
+        return found[:limit] if limit else found
+
+    def courses_taught_by(self, name: str) -> Tuple[Tuple[str, str, str], ...]:
+        """(code, course name, role) for the closest lecturer to the name; () when nobody matches"""
+        found = self.find(name, limit=1)
+        return found[0].courses if found else ()
+
+    def get_stats(self) -> Dict:
+        self._ensure()
+        return {
+            'knowledge_version': self._version,
+            'lecturers': len(self._names),
+            'name_tokens': len(self._postings),
+            'cached_tokens': len(self._token_cache)
+        }
+
+
+def format_lecturer_matches(matches: List[LecturerMatch]) -> str:
+    """One line per lecturer: name: CODE - Course (role); ..."""
+    return "\n".join(
+        f"- {match.name}: " + "; ".join(f"{code} - {course} ({role})" for code, course, role in match.courses)
+        for match in matches
+    )
+
+
+# Global instance
+lecturer_index = LecturerIndex(knowledge_store)
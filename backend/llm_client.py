@@ -0,0 +1,230 @@
+"""
+Async HTTP client layer for external LLM providers
+Keeps one pooled keep-alive connection pool per provider so outbound
+calls never block the uvicorn event loop
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from circuit_breaker import CircuitOpenError, is_failure_status, provider_health
+from config import ExternalAPIConfig
+from response_cache import normalize_question
+from single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+GROQ_CHAT_URL = "https://api.groq.com/openai/v1/chat/completions"
+HUGGINGFACE_INFERENCE_URL = "https://api-inference.huggingface.co/models/{model}"
+
+
+def request_fingerprint(provider: str, url: str, model: str, messages: List[Dict[str, str]],
+                        max_tokens: int, temperature: float) -> str:
+    """Key identifying chat requests that would produce the same completion"""
+    parts = [provider, url, model, str(max_tokens), f"{temperature:.2f}"]
+    for message in messages:
+        content = message.get('content', '')
+        if message.get('role') == 'user':
+            content = normalize_question(content)
+        else:
+            content = ' '.join(content.split())
+        parts.append(f"{message.get('role')}:{content}")
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+class AsyncLLMClient:
+    """Shared async HTTP client with a separate connection pool per provider"""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self.request_counts: Dict[str, int] = {}
+        self.error_counts: Dict[str, int] = {}
+        self.single_flight = SingleFlight()
+
+    def _get_client(self, provider: str) -> httpx.AsyncClient:
+        """Get (or lazily create) the pooled client for a provider"""
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            pool = ExternalAPIConfig.get_pool_limits(provider)
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=pool['max_connections'],
+                    max_keepalive_connections=pool['max_keepalive_connections'],
+                    keepalive_expiry=ExternalAPIConfig.HTTP_KEEPALIVE_EXPIRY
+                ),
+                timeout=httpx.Timeout(
+                    ExternalAPIConfig.get_timeout(provider),
+                    connect=ExternalAPIConfig.HTTP_CONNECT_TIMEOUT
+                )
+            )
+            self._clients[provider] = client
+        return client
+
+    async def post_json(self, provider: str, url: str, payload: Dict[str, Any],
+                        headers: Optional[Dict[str, str]] = None,
+                        timeout: Optional[float] = None) -> httpx.Response:
+        """POST a JSON payload through the provider's pool, guarded by its circuit breaker"""
+        breaker = provider_health.get(provider)
+        if not breaker.allow_request():
+            raise CircuitOpenError(provider)
+
+        client = self._get_client(provider)
+        self.request_counts[provider] = self.request_counts.get(provider, 0) + 1
+        started = time.perf_counter()
+        try:
+            if timeout is not None:
+                response = await client.post(url, json=payload, headers=headers, timeout=timeout)
+            else:
+                response = await client.post(url, json=payload, headers=headers)
+        except httpx.HTTPError:
+            self.error_counts[provider] = self.error_counts.get(provider, 0) + 1
+            breaker.record_failure(time.perf_counter() - started)
+            raise
+        except BaseException:
+            # Cancelled or failed before any outcome: don't leave a half-open probe reserved
+            breaker.release_probe()
+            raise
+
+        latency = time.perf_counter() - started
+        # Misconfiguration, rate limiting and server errors count against the provider's health
+        if is_failure_status(response.status_code):
+            breaker.record_failure(latency)
+        else:
+            breaker.record_success(latency)
+        return response
+
+    async def chat_completion(self, provider: str, url: str, api_key: str,
+                              messages: List[Dict[str, str]], model: str,
+                              max_tokens: int = 500, temperature: float = 0.7,
+                              timeout: Optional[float] = None) -> Optional[str]:
+        """Call an OpenAI-compatible chat completions endpoint and return the message text.
+        Identical requests already in flight share one upstream call."""
+        key = request_fingerprint(provider, url, model, messages, max_tokens, temperature)
+        return await self.single_flight.do(
+            key,
+            lambda: self._chat_completion(provider, url, api_key, messages, model,
+                                          max_tokens, temperature, timeout)
+        )
+
+    async def _chat_completion(self, provider: str, url: str, api_key: str,
+                               messages: List[Dict[str, str]], model: str,
+                               max_tokens: int, temperature: float,
+                               timeout: Optional[float]) -> Optional[str]:
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+
+        response = await self.post_json(provider, url, payload, headers=headers, timeout=timeout)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'choices' in result and len(result['choices']) > 0:
+                return result['choices'][0]['message']['content']
+
+        logger.error(f"{provider} API error: {response.status_code} - {response.text}")
+        return None
+
+    async def stream_chat_completion(self, provider: str, url: str, api_key: str,
+                                     messages: List[Dict[str, str]], model: str,
+                                     max_tokens: int = 500, temperature: float = 0.7,
+                                     timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """Stream an OpenAI-compatible chat completion, yielding content deltas as they arrive"""
+        breaker = provider_health.get(provider)
+        if not breaker.allow_request():
+            raise CircuitOpenError(provider)
+
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True
+        }
+
+        client = self._get_client(provider)
+        self.request_counts[provider] = self.request_counts.get(provider, 0) + 1
+        started = time.perf_counter()
+        first_token_latency = None
+        request_timeout = timeout if timeout is not None else client.timeout
+        try:
+            async with client.stream("POST", url, json=payload, headers=headers,
+                                     timeout=request_timeout) as response:
+                if response.status_code != 200:
+                    body = await response.aread()
+                    logger.error(f"{provider} stream error: {response.status_code} - {body[:500]!r}")
+                    if is_failure_status(response.status_code):
+                        breaker.record_failure(time.perf_counter() - started)
+                    else:
+                        breaker.record_success(time.perf_counter() - started)
+                    return
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        choices = json.loads(data).get('choices') or []
+                    except ValueError:
+                        continue
+                    delta = choices[0].get('delta', {}).get('content') if choices else None
+                    if delta:
+                        if first_token_latency is None:
+                            first_token_latency = time.perf_counter() - started
+                        yield delta
+        except httpx.HTTPError:
+            self.error_counts[provider] = self.error_counts.get(provider, 0) + 1
+            breaker.record_failure(time.perf_counter() - started)
+            raise
+        except BaseException:
+            # Client went away mid-stream, or an unexpected error: don't count it against the
+            # provider, but don't leave a half-open probe reserved either
+            breaker.release_probe()
+            raise
+
+        # Health tracks time-to-first-token, which is what streaming users feel
+        breaker.record_success(first_token_latency if first_token_latency is not None
+                               else time.perf_counter() - started)
+
+    async def aclose(self):
+        """Close every provider pool (called on application shutdown)"""
+        for client in self._clients.values():
+            if not client.is_closed:
+                await client.aclose()
+        self._clients.clear()
+
+    def get_status(self) -> Dict:
+        """Pool configuration and request counters per provider"""
+        providers = sorted(set(ExternalAPIConfig.PROVIDER_TIMEOUTS) | set(self._clients))
+        return {
+            provider: {
+                'pool_open': provider in self._clients and not self._clients[provider].is_closed,
+                'timeout': ExternalAPIConfig.get_timeout(provider),
+                **ExternalAPIConfig.get_pool_limits(provider),
+                'requests': self.request_counts.get(provider, 0),
+                'errors': self.error_counts.get(provider, 0)
+            }
+            for provider in providers
+        }
+
+
+# Global instance
+llm_client = AsyncLLMClient()
@@ -0,0 +1,188 @@
+"""
+On-disk store of course-material chunks
+chunks.jsonl holds one chunk per line (course, source file, page/slide,
+character offsets, text); chunks.idx holds the byte offset of every line as
+little-endian uint64, and chunks.jsonl is memory-mapped, so chunk i is one
+slice without parsing the rest of the file. course_bitmaps.npy holds one
+packed bit per chunk for each course (names in courses.json), so retrieval
+can restrict itself to the chunks of the courses a question mentions.
+Written by ingest_materials.py
+"""
+
+import json
+import logging
+import mmap
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from config import RuntimeConfig
+from course_codes import course_variants
+
+logger = logging.getLogger(__name__)
+
+CHUNKS_FILE = 'chunks.jsonl'
+OFFSETS_FILE = 'chunks.idx'
+COURSES_FILE = 'courses.json'
+COURSE_BITMAPS_FILE = 'course_bitmaps.npy'
+OFFSET_DTYPE = np.dtype('<u8')
+
+
+def write_chunk_store(chunks: Iterable[Dict], directory: str) -> int:
+    """Write chunks (assigning ids in order) and their offsets index; returns the chunk count
+
+    Both files are written next to the old ones and renamed into place, so a
+    reader never sees a half-written store.
+    """
+    os.makedirs(directory, exist_ok=True)
+    chunks_path = os.path.join(directory, CHUNKS_FILE)
+    offsets_path = os.path.join(directory, OFFSETS_FILE)
+
+    offsets = []
+    chunk_courses: List[Optional[str]] = []
+    with open(chunks_path + '.tmp', 'wb') as f:
+        for chunk_id, chunk in enumerate(chunks):
+            offsets.append(f.tell())
+            record = {'id': chunk_id, **{key: value for key, value in chunk.items() if key != 'id'}}
+            f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+            chunk_courses.append(chunk.get('course'))
+        # One extra entry (the file size) so every chunk's length is known
+        offsets.append(f.tell())
+    np.asarray(offsets, dtype=OFFSET_DTYPE).tofile(offsets_path + '.tmp')
+
+    # One row of packed bits per course: bit i is set when chunk i belongs to it
+    courses = sorted({course for course in chunk_courses if course})
+    bitmaps = np.zeros((len(courses), len(chunk_courses)), dtype=bool)
+    for row, course in enumerate(courses):
+        bitmaps[row] = [chunk_course == course for chunk_course in chunk_courses]
+    np.save(os.path.join(directory, COURSE_BITMAPS_FILE + '.tmp.npy'), np.packbits(bitmaps, axis=1))
+    with open(os.path.join(directory, COURSES_FILE + '.tmp'), 'w', encoding='utf-8') as f:
+        json.dump(courses, f)
+
+    os.replace(chunks_path + '.tmp', chunks_path)
+    os.replace(offsets_path + '.tmp', offsets_path)
+    os.replace(os.path.join(directory, COURSE_BITMAPS_FILE + '.tmp.npy'), os.path.join(directory, COURSE_BITMAPS_FILE))
+    os.replace(os.path.join(directory, COURSES_FILE + '.tmp'), os.path.join(directory, COURSES_FILE))
+    return len(offsets) - 1
+
+
+class ChunkStore:
+    """Random access to the chunks written by write_chunk_store; opened lazily, never reprocessed"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._offsets: Optional[np.ndarray] = None
+        self._course_bitmaps: Optional[np.ndarray] = None
+        self.courses: List[str] = []
+        self._file = None
+        self._data = b''
+        self._lock = threading.Lock()
+        self._opened = False
+
+    def _open(self) -> bool:
+        if self._opened:
+            return self._file is not None
+        with self._lock:
+            if self._opened:
+                return self._file is not None
+            chunks_path = os.path.join(self.directory, CHUNKS_FILE)
+            offsets_path = os.path.join(self.directory, OFFSETS_FILE)
+            try:
+                if os.path.exists(chunks_path) and os.path.exists(offsets_path):
+                    offsets = np.memmap(offsets_path, dtype=OFFSET_DTYPE, mode='r')
+                    if len(offsets) == 0 or int(offsets[-1]) != os.path.getsize(chunks_path):
+                        raise ValueError(f"{OFFSETS_FILE} does not match {CHUNKS_FILE}; re-run ingest_materials.py")
+                    bitmaps = np.load(os.path.join(self.directory, COURSE_BITMAPS_FILE), mmap_mode='r')
+                    with open(os.path.join(self.directory, COURSES_FILE), 'r', encoding='utf-8') as f:
+                        courses = json.load(f)
+                    if bitmaps.shape != (len(courses), (len(offsets) - 1 + 7) // 8):
+                        raise ValueError(f"{COURSE_BITMAPS_FILE} does not match {CHUNKS_FILE}; re-run ingest_materials.py")
+                    self._course_bitmaps = bitmaps
+                    self.courses = courses
+                    self._offsets = offsets
+                    self._file = open(chunks_path, 'rb')
+                    # mmap can't map an empty file; a store with no chunks never reads
+                    if int(offsets[-1]):
+                        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                    logger.info(f"Opened material store: {len(offsets) - 1} chunks in {self.directory}")
+                else:
+                    logger.warning(f"No material store in {self.directory}: answers get no material context "
+                                   f"(run ingest_materials.py)")
+            except Exception as e:
+                logger.error(f"Error opening material store: {str(e)}")
+            self._opened = True
+        return self._file is not None
+
+    @property
+    def available(self) -> bool:
+        return self._open()
+
+    def __len__(self) -> int:
+        if not self._open():
+            return 0
+        return len(self._offsets) - 1
+
+    def _read(self, chunk_id: int) -> bytes:
+        start, end = int(self._offsets[chunk_id]), int(self._offsets[chunk_id + 1])
+        # Slice of the read-only mapping: no shared file position, so concurrent readers don't need the lock
+        return self._data[start:end]
+
+    def course_mask(self, codes: Iterable[str]) -> np.ndarray:
+        """Boolean mask over chunk ids: the OR of the given courses' bitmaps (all False if none has materials)"""
+        count = len(self)
+        if count == 0:
+            return np.zeros(0, dtype=bool)
+        wanted = course_variants(codes)
+        rows = [row for row, course in enumerate(self.courses) if course.upper() in wanted]
+        if not rows:
+            return np.zeros(count, dtype=bool)
+        packed = np.bitwise_or.reduce(self._course_bitmaps[rows], axis=0)
+        return np.unpackbits(packed, count=count).astype(bool)
+
+    def get(self, chunk_id: int) -> Optional[Dict]:
+        """One chunk by id, or None if out of range"""
+        if not self._open() or not 0 <= chunk_id < len(self):
+            return None
+        return json.loads(self._read(chunk_id))
+
+    def get_many(self, chunk_ids: Iterable[int]) -> List[Dict]:
+        """Chunks in the order of the ids given; unknown ids are skipped"""
+        chunks = (self.get(chunk_id) for chunk_id in chunk_ids)
+        return [chunk for chunk in chunks if chunk is not None]
+
+    def __iter__(self) -> Iterator[Dict]:
+        if not self._open():
+            return
+        # Sequential scan: one buffered pass over the file instead of a read per chunk
+        with open(self._file.name, 'rb') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def close(self):
+        with self._lock:
+            if isinstance(self._data, mmap.mmap):
+                self._data.close()
+            self._data = b''
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+            self._offsets = None
+            self._course_bitmaps = None
+            self.courses = []
+            self._opened = False
+
+    def get_stats(self) -> Dict:
+        available = self._open()
+        return {
+            'available': available,
+            'path': self.directory,
+            'chunks': len(self),
+            'courses': self.courses,
+            'bytes': int(self._offsets[-1]) if available else 0
+        }
+
+
+# Global instance
+material_store = ChunkStore(RuntimeConfig.MATERIALS_PATH)
@@ -0,0 +1,129 @@
+"""
+ONNX Runtime backend for the extractive QA model
+Serves the exported (int8-quantized) DistilBERT through onnxruntime on CPU
+with the same call signature and {'answer', 'score', 'start', 'end'} output
+as the transformers question-answering pipeline
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_MODEL_FILE = 'model.int8.onnx'
+FULL_PRECISION_MODEL_FILE = 'model.onnx'
+
+
+def resolve_onnx_model(model_dir: str) -> Optional[str]:
+    """Path of the quantized model in an export directory, else the fp32 one"""
+    for name in (QUANTIZED_MODEL_FILE, FULL_PRECISION_MODEL_FILE):
+        path = os.path.join(model_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class OnnxQuestionAnswering:
+    """Drop-in replacement for pipeline("question-answering") backed by onnxruntime"""
+
+    def __init__(self, model_dir: str, max_seq_len: int = 384, doc_stride: int = 128,
+                 max_answer_len: int = 15, intra_op_threads: int = 0):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        model_path = resolve_onnx_model(model_dir)
+        if model_path is None:
+            raise FileNotFoundError(f"No {QUANTIZED_MODEL_FILE} or {FULL_PRECISION_MODEL_FILE} in {model_dir}")
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = onnxruntime.InferenceSession(model_path, options, providers=['CPUExecutionProvider'])
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        self.model_path = model_path
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        if not self.tokenizer.is_fast:
+            raise ValueError("ONNX QA backend needs a fast tokenizer (offset mappings)")
+        # Same defaults as the transformers pipeline
+        self.max_seq_len = min(self.tokenizer.model_max_length, max_seq_len)
+        self.doc_stride = min(self.max_seq_len // 2, doc_stride)
+        self.max_answer_len = max_answer_len
+        self.question_first = self.tokenizer.padding_side == 'right'
+
+    def __call__(self, question: Union[str, List[str]], context: Union[str, List[str]],
+                 batch_size: Optional[int] = None, **kwargs) -> Union[Dict, List[Dict]]:
+        single = isinstance(question, str)
+        questions = [question] if single else list(question)
+        contexts = [context] * len(questions) if isinstance(context, str) else list(context)
+        answers = self._answer(questions, contexts)
+        return answers[0] if single else answers
+
+    def _answer(self, questions: List[str], contexts: List[str]) -> List[Dict]:
+        encoded = self.tokenizer(
+            text=[q.lstrip() for q in questions] if self.question_first else contexts,
+            text_pair=contexts if self.question_first else [q.lstrip() for q in questions],
+            padding='longest',
+            truncation='only_second' if self.question_first else 'only_first',
+            max_length=self.max_seq_len,
+            stride=self.doc_stride,
+            return_overflowing_tokens=True,
+            return_offsets_mapping=True,
+            return_tensors='np'
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self.input_names}
+        start_logits, end_logits = self.session.run(None, feeds)[:2]
+
+        # Long contexts are split into overlapping windows; keep the best span per question
+        best: List[Optional[Dict]] = [None] * len(questions)
+        sample_mapping = encoded['overflow_to_sample_mapping']
+        context_sequence = 1 if self.question_first else 0
+        for feature, sample in enumerate(sample_mapping):
+            span = self._best_span(encoded, feature, start_logits[feature], end_logits[feature], context_sequence)
+            if span is None:
+                continue
+            start_char, end_char, score = span
+            if best[sample] is None or score > best[sample]['score']:
+                best[sample] = {
+                    'score': score,
+                    'start': start_char,
+                    'end': end_char,
+                    'answer': contexts[sample][start_char:end_char]
+                }
+        return [answer or {'score': 0.0, 'start': 0, 'end': 0, 'answer': ''} for answer in best]
+
+    def _best_span(self, encoded, feature: int, start_logits: np.ndarray, end_logits: np.ndarray,
+                   context_sequence: int):
+        """Highest p(start) * p(end) span inside the context, as the pipeline's decode_spans does"""
+        encoding = encoded.encodings[feature]
+        sequence_ids = encoding.sequence_ids
+        attention_mask = encoded['attention_mask'][feature]
+        desired = np.array([sequence_id == context_sequence for sequence_id in sequence_ids]) & (attention_mask == 1)
+        # The pipeline keeps [CLS] in the softmax and zeroes its probability afterwards
+        cls_positions = encoded['input_ids'][feature] == self.tokenizer.cls_token_id
+        in_softmax = desired | cls_positions
+
+        start = np.where(in_softmax, start_logits, -10000.0)
+        end = np.where(in_softmax, end_logits, -10000.0)
+        start = np.exp(start - start.max())
+        start /= start.sum()
+        end = np.exp(end - end.max())
+        end /= end.sum()
+        start[0] = end[0] = 0.0
+
+        outer = np.tril(np.triu(np.outer(start, end)), self.max_answer_len - 1)
+        s, e = np.unravel_index(int(np.argmax(outer)), outer.shape)
+        if not (desired[s] and desired[e]):
+            return None
+
+        # Widen to whole words like the pipeline's align_to_words
+        try:
+            start_char = encoding.word_to_chars(encoding.token_to_word(s), sequence_index=context_sequence)[0]
+            end_char = encoding.word_to_chars(encoding.token_to_word(e), sequence_index=context_sequence)[1]
+        except Exception:
+            start_char, end_char = encoding.offsets[s][0], encoding.offsets[e][1]
+        return int(start_char), int(end_char), float(outer[s, e])
@@ -0,0 +1,164 @@
+"""
+Hedged fan-out across external LLM providers
+Starts providers concurrently (or staggered), keeps the first good answer
+and cancels the rest, all under one overall deadline
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ProviderCall = Callable[[], Awaitable[Optional[str]]]
+
+
+class ProviderStats:
+    """Win/latency counters for a single provider"""
+
+    def __init__(self, window: int = 200):
+        self.attempts = 0
+        self.wins = 0
+        self.failures = 0
+        self.cancelled = 0
+        self.latencies = deque(maxlen=window)
+
+    def record(self, outcome: str, latency: Optional[float] = None):
+        if outcome == 'attempt':
+            self.attempts += 1
+        elif outcome == 'win':
+            self.wins += 1
+        elif outcome == 'failure':
+            self.failures += 1
+        elif outcome == 'cancelled':
+            self.cancelled += 1
+        if latency is not None:
+            self.latencies.append(latency)
+
+    def _percentile(self, pct: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+        return round(ordered[index], 3)
+
+    def to_dict(self) -> Dict:
+        return {
+            'attempts': self.attempts,
+            'wins': self.wins,
+            'failures': self.failures,
+            'cancelled': self.cancelled,
+            'win_rate': round(self.wins / self.attempts, 3) if self.attempts else 0.0,
+            'latency_p50': self._percentile(0.50),
+            'latency_p95': self._percentile(0.95)
+        }
+
+
+class ProviderFanout:
+    """Races provider calls and tracks which provider wins and how fast"""
+
+    def __init__(self):
+        self.stats: Dict[str, ProviderStats] = {}
+        self.races = 0
+        self.deadline_misses = 0
+
+    def _stats_for(self, name: str) -> ProviderStats:
+        if name not in self.stats:
+            self.stats[name] = ProviderStats()
+        return self.stats[name]
+
+    async def race(self, candidates: List[Tuple[str, ProviderCall]], stagger: float,
+                   deadline: float, is_good: Callable[[Any], bool] = bool) -> Optional[Tuple[str, str]]:
+        """
+        Launch candidates in order, one every `stagger` seconds (0 = all at once).
+        A candidate that fails early releases the next one immediately.
+        Returns (provider, answer) for the first good answer, or None.
+        """
+        self.races += 1
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        queue = list(candidates)
+        pending: Dict[asyncio.Task, Tuple[str, float]] = {}
+        next_launch = start
+
+        try:
+            while queue or pending:
+                now = loop.time()
+                remaining = deadline - (now - start)
+                if remaining <= 0:
+                    self.deadline_misses += 1
+                    logger.warning(f"Provider fan-out hit its {deadline}s deadline")
+                    return None
+
+                if queue and (now >= next_launch or not pending):
+                    name, call = queue.pop(0)
+                    pending[asyncio.ensure_future(call())] = (name, now)
+                    self._stats_for(name).record('attempt')
+                    next_launch = now + stagger
+                    continue
+
+                timeout = remaining if not queue else min(remaining, max(0.0, next_launch - now))
+                done, _ = await asyncio.wait(list(pending), timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name, started = pending.pop(task)
+                    latency = loop.time() - started
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.error(f"{name} provider error: {str(e)}")
+                        result = None
+
+                    if is_good(result):
+                        self._stats_for(name).record('win', latency)
+                        return name, result
+                    self._stats_for(name).record('failure', latency)
+
+            return None
+        finally:
+            for task, (name, _) in pending.items():
+                task.cancel()
+                self._stats_for(name).record('cancelled')
+
+    async def sequential(self, candidates: List[Tuple[str, ProviderCall]], deadline: float,
+                         is_good: Callable[[Any], bool] = bool) -> Optional[Tuple[str, str]]:
+        """Try candidates one after another (original behaviour) under a deadline"""
+        self.races += 1
+
+        async def _chain():
+            for name, call in candidates:
+                stats = self._stats_for(name)
+                stats.record('attempt')
+                started = time.perf_counter()
+                try:
+                    result = await call()
+                except Exception as e:
+                    logger.error(f"{name} provider error: {str(e)}")
+                    result = None
+                latency = time.perf_counter() - started
+                if is_good(result):
+                    stats.record('win', latency)
+                    return name, result
+                stats.record('failure', latency)
+            return None
+
+        try:
+            return await asyncio.wait_for(_chain(), timeout=deadline)
+        except asyncio.TimeoutError:
+            self.deadline_misses += 1
+            logger.warning(f"Sequential provider chain hit its {deadline}s deadline")
+            return None
+
+    def get_stats(self) -> Dict:
+        """Per-provider win and latency statistics"""
+        return {
+            'races': self.races,
+            'deadline_misses': self.deadline_misses,
+            'providers': {name: stats.to_dict() for name, stats in self.stats.items()}
+        }
+
+
+# Global instance
+provider_fanout = ProviderFanout()
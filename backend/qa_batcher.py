@@ -0,0 +1,152 @@
+"""
+Dynamic micro-batching for the extractive QA model
+Requests are queued; a worker thread collects up to max_batch_size questions
+(or waits max_wait_ms for more), runs one padded forward pass and resolves
+each caller's future. With several workers (one per model process) several
+batches are in flight at once
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# infer(questions, contexts) -> one {'answer', 'score', ...} dict per question
+BatchInfer = Callable[[List[str], List[str]], List[Dict]]
+
+
+class _Pending:
+    """One queued question and the future its caller awaits"""
+
+    __slots__ = ('question', 'context', 'future', 'loop', 'enqueued')
+
+    def __init__(self, question: str, context: str, future: asyncio.Future, loop: asyncio.AbstractEventLoop):
+        self.question = question
+        self.context = context
+        self.future = future
+        self.loop = loop
+        self.enqueued = time.perf_counter()
+
+
+def _resolve(future: asyncio.Future, result=None, error: Optional[BaseException] = None):
+    # Runs on the caller's event loop; the caller may have given up in the meantime
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class QABatcher:
+    """Collects concurrent QA requests into padded batches on worker threads"""
+
+    def __init__(self, infer: BatchInfer, max_batch_size: int = 8, max_wait_ms: float = 5.0, workers: int = 1):
+        self.infer = infer
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.workers = max(1, workers)
+        self._queue: "queue.Queue[Optional[_Pending]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.total_queue_wait = 0.0
+        self.total_infer_time = 0.0
+
+    def _ensure_worker(self):
+        with self._lock:
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._run, name=f"qa-batcher-{len(self._threads)}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    async def submit(self, question: str, context: str) -> Dict:
+        """Queue one question and wait for its answer"""
+        self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        pending = _Pending(question, context, loop.create_future(), loop)
+        self._queue.put(pending)
+        return await pending.future
+
+    def _collect(self, first: _Pending) -> List[_Pending]:
+        """The first request plus whatever arrives before the batch fills or the window closes"""
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Shutdown requested; finish this batch first (the sentinel goes back for this thread's next get)
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [item for item in self._collect(first) if not item.future.cancelled()]
+            if batch:
+                self._dispatch(batch)
+
+    def _dispatch(self, batch: List[_Pending]):
+        started = time.perf_counter()
+        try:
+            results = self.infer([item.question for item in batch], [item.context for item in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"QA model returned {len(results)} answers for {len(batch)} questions")
+        except Exception as e:
+            logger.error(f"QA batch of {len(batch)} failed: {str(e)}")
+            for item in batch:
+                item.loop.call_soon_threadsafe(_resolve, item.future, None, e)
+            return
+        finished = time.perf_counter()
+
+        with self._stats_lock:
+            self.batches += 1
+            self.items += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self.total_queue_wait += sum(started - item.enqueued for item in batch)
+            self.total_infer_time += finished - started
+
+        for item, result in zip(batch, results):
+            item.loop.call_soon_threadsafe(_resolve, item.future, result)
+
+    def close(self):
+        """Stop the workers after the requests already queued"""
+        with self._lock:
+            threads = [thread for thread in self._threads if thread.is_alive()]
+            # One sentinel per thread; each thread exits on the one it takes
+            for _ in threads:
+                self._queue.put(None)
+            for thread in threads:
+                thread.join(timeout=5)
+            self._threads = []
+
+    def get_stats(self) -> Dict:
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': round(self.max_wait * 1000, 2),
+            'workers': self.workers,
+            'queued': self._queue.qsize(),
+            'batches': self.batches,
+            'questions': self.items,
+            'largest_batch': self.largest_batch,
+            'avg_batch_size': round(self.items / self.batches, 2) if self.batches else 0.0,
+            'avg_queue_wait_ms': round(self.total_queue_wait / self.items * 1000, 2) if self.items else 0.0,
+            'avg_batch_infer_ms': round(self.total_infer_time / self.batches * 1000, 2) if self.batches else 0.0
+        }
@@ -0,0 +1,210 @@
+"""
+QA model loading and atomic hot-swap
+The pipeline, its version and load timings live in one immutable snapshot;
+a reload builds and warms a new model off the event loop and replaces the
+snapshot in a single assignment, so in-flight requests finish on the old one
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from config import RuntimeConfig
+from onnx_qa import OnnxQuestionAnswering, resolve_onnx_model
+from qa_process_pool import QAProcessPool
+
+logger = logging.getLogger(__name__)
+
+FINE_TUNED_MODEL_PATHS = [
+    "../data/models/fut_qa_model_ultimate",
+    "../data/models/fut_qa_model_final"
+]
+PRETRAINED_MODEL = "distilbert/distilbert-base-cased-distilled-squad"
+
+# Context for the extractive QA model when the request doesn't bring its own
+DEFAULT_QA_CONTEXT = """
+            Federal University of Technology (FUT) is a Nigerian university focused on technology and engineering education. 
+            The university offers various programs in engineering, technology, and applied sciences. 
+            Students can access academic resources, course materials, and institutional information through various channels.
+            """
+
+# Run through a freshly built model before it takes traffic (first calls pay allocation/JIT costs)
+WARM_UP_QUESTIONS = [
+    "What is FUT?",
+    "What programs does the university offer?",
+    "Where can students find course materials?"
+]
+
+
+def build_qa_pipeline(backend: str) -> Tuple[Any, str]:
+    """Load the QA model for a backend ('pytorch' or 'onnx'); returns (pipeline, source). Blocking."""
+    if backend == 'onnx':
+        if resolve_onnx_model(RuntimeConfig.QA_ONNX_MODEL_PATH):
+            logger.info(f"Loading ONNX model from: {RuntimeConfig.QA_ONNX_MODEL_PATH}")
+            qa = OnnxQuestionAnswering(RuntimeConfig.QA_ONNX_MODEL_PATH, intra_op_threads=RuntimeConfig.QA_ONNX_THREADS)
+            return qa, qa.model_path
+        logger.warning(f"No ONNX model in {RuntimeConfig.QA_ONNX_MODEL_PATH}, falling back to PyTorch")
+
+    # transformers/torch are imported here, not at startup
+    from transformers import pipeline, AutoTokenizer, AutoModelForQuestionAnswering
+
+    # Try to load ultimate model first, then fallback to final model
+    for model_path in FINE_TUNED_MODEL_PATHS:
+        if os.path.exists(model_path):
+            logger.info(f"Loading fine-tuned model from: {model_path}")
+            tokenizer = AutoTokenizer.from_pretrained(model_path)
+            model = AutoModelForQuestionAnswering.from_pretrained(model_path)
+            return pipeline("question-answering", model=model, tokenizer=tokenizer), model_path
+
+    # Fallback to pre-trained model
+    logger.info("Fine-tuned model not found, using pre-trained model")
+    return pipeline("question-answering", model=PRETRAINED_MODEL), PRETRAINED_MODEL
+
+
+def warm_up(qa_pipeline) -> float:
+    """Single and batched inferences on a new pipeline; returns seconds spent"""
+    started = time.perf_counter()
+    for question in WARM_UP_QUESTIONS:
+        qa_pipeline(question=question, context=DEFAULT_QA_CONTEXT)
+    qa_pipeline(question=WARM_UP_QUESTIONS, context=[DEFAULT_QA_CONTEXT] * len(WARM_UP_QUESTIONS),
+                batch_size=len(WARM_UP_QUESTIONS))
+    return time.perf_counter() - started
+
+
+def build_qa_runner(backend: str, execution: str) -> Tuple[Any, str]:
+    """The model in this process, or (execution='process') a started pool of worker processes. Blocking."""
+    if execution == 'process':
+        pool = QAProcessPool(build_qa_pipeline, (backend,), warm=warm_up)
+        try:
+            return pool.start(), pool.source
+        except Exception:
+            pool.close()
+            raise
+    return build_qa_pipeline(backend)
+
+
+class LoadedQAModel:
+    """Immutable snapshot of one loaded model"""
+
+    __slots__ = ('pipeline', 'version', 'backend', 'execution', 'source', 'load_seconds', 'warm_up_seconds',
+                 'loaded_at')
+
+    def __init__(self, pipeline, version: int, backend: str, execution: str, source: str,
+                 load_seconds: float, warm_up_seconds: float):
+        self.pipeline = pipeline
+        self.version = version
+        self.backend = backend
+        self.execution = execution
+        self.source = source
+        self.load_seconds = load_seconds
+        self.warm_up_seconds = warm_up_seconds
+        self.loaded_at = datetime.now().isoformat()
+
+
+class QAModelManager:
+    """Owns the current QA model; loads and reloads happen on a worker thread"""
+
+    def __init__(self):
+        self.current: Optional[LoadedQAModel] = None
+        self.last_error: Optional[str] = None
+        self.reloads = 0
+        self._version = 0
+        self._load_lock = threading.Lock()
+        self._task: Optional[asyncio.Future] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.current is not None
+
+    @property
+    def loading(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def started(self) -> bool:
+        return self._task is not None or self.current is not None
+
+    def load(self) -> LoadedQAModel:
+        """Build, warm up and swap in a new model (blocking). The previous model keeps serving on failure."""
+        with self._load_lock:
+            started = time.perf_counter()
+            backend = RuntimeConfig.QA_BACKEND
+            execution = RuntimeConfig.QA_EXECUTION
+            qa_pipeline = None
+            try:
+                qa_pipeline, source = build_qa_runner(backend, execution)
+                load_seconds = time.perf_counter() - started
+                # Pool workers warm up their own model; this also checks the round trip to them
+                warm_up_seconds = warm_up(qa_pipeline)
+            except Exception as e:
+                logger.error(f"Error loading model: {str(e)}")
+                self.last_error = str(e)
+                if isinstance(qa_pipeline, QAProcessPool):
+                    qa_pipeline.close()
+                raise
+
+            self._version += 1
+            model = LoadedQAModel(qa_pipeline, self._version, backend, execution, source, load_seconds,
+                                  warm_up_seconds)
+            # The swap: requests that already hold the old snapshot finish on it
+            previous, self.current = self.current, model
+            self.last_error = None
+            if previous is not None and isinstance(previous.pipeline, QAProcessPool):
+                # Old workers exit once their queued calls are done
+                previous.pipeline.close()
+            logger.info(f"QA model v{model.version} ready ({source}, loaded in {load_seconds:.1f}s, "
+                        f"warm-up {warm_up_seconds:.1f}s)")
+            return model
+
+    def start_load(self) -> asyncio.Future:
+        """Load (or reload) on a worker thread; concurrent callers share the load already running"""
+        if self._task is None or self._task.done():
+            if self._task is not None:
+                self.reloads += 1
+            self._task = asyncio.get_running_loop().run_in_executor(None, self.load)
+            # Failures are reported through last_error and /ready
+            self._task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return self._task
+
+    async def ensure_loaded(self) -> LoadedQAModel:
+        """Current model, waiting for the first load (and starting it if nothing has)"""
+        model = self.current
+        if model is not None:
+            return model
+        if self._task is not None and self._task.done():
+            # The only load so far failed; /reload-model retries
+            raise RuntimeError(self.last_error or "model load failed")
+        return await asyncio.shield(self.start_load())
+
+    def close(self):
+        """Stop worker processes, if the current model runs in a pool"""
+        model = self.current
+        if model is not None and isinstance(model.pipeline, QAProcessPool):
+            model.pipeline.close()
+
+    def get_status(self) -> Dict:
+        model = self.current
+        status = {
+            'loaded': model is not None,
+            'loading': self.loading,
+            'version': model.version if model else 0,
+            'backend': model.backend if model else RuntimeConfig.QA_BACKEND,
+            'execution': model.execution if model else RuntimeConfig.QA_EXECUTION,
+            'source': model.source if model else None,
+            'load_seconds': round(model.load_seconds, 2) if model else None,
+            'warm_up_seconds': round(model.warm_up_seconds, 2) if model else None,
+            'loaded_at': model.loaded_at if model else None,
+            'reloads': self.reloads,
+            'last_error': self.last_error
+        }
+        if model is not None and isinstance(model.pipeline, QAProcessPool):
+            status['process_pool'] = model.pipeline.get_stats()
+        return status
+
+
+# Global instance
+qa_models = QAModelManager()
@@ -0,0 +1,117 @@
+"""
+Process-pool execution for the extractive QA model
+Each worker process builds and warms its own copy of the model when it
+starts; forward passes run there, so concurrent requests use every core
+instead of queueing behind the API process's GIL
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import RuntimeConfig
+
+logger = logging.getLogger(__name__)
+
+# Set inside each worker process by _init_worker
+_worker_pipeline = None
+_worker_source: Optional[str] = None
+
+
+def worker_count() -> int:
+    """QA_PROCESS_WORKERS, or one worker per CPU core"""
+    return RuntimeConfig.QA_PROCESS_WORKERS or os.cpu_count() or 1
+
+
+def _init_worker(build: Callable, build_args: Tuple, warm: Optional[Callable], threads: int):
+    global _worker_pipeline, _worker_source
+    # Before torch/onnxruntime are imported: every worker defaulting to all cores would oversubscribe them
+    os.environ['OMP_NUM_THREADS'] = str(threads)
+    os.environ['MKL_NUM_THREADS'] = str(threads)
+    if not RuntimeConfig.QA_ONNX_THREADS:
+        RuntimeConfig.QA_ONNX_THREADS = threads
+    _worker_pipeline, _worker_source = build(*build_args)
+    if warm is not None:
+        warm(_worker_pipeline)
+
+
+def _worker_info() -> Tuple[int, Optional[str]]:
+    return os.getpid(), _worker_source
+
+
+def _worker_answer(question, context, batch_size):
+    return _worker_pipeline(question=question, context=context, batch_size=batch_size)
+
+
+class QAProcessPool:
+    """Callable like the QA pipeline; each call is answered by one of the worker processes"""
+
+    def __init__(self, build: Callable, build_args: Tuple = (), warm: Optional[Callable] = None,
+                 workers: Optional[int] = None):
+        """build(*build_args) -> (pipeline, source) runs in every worker; both must be module-level (picklable)"""
+        self.workers = workers or worker_count()
+        self.threads_per_worker = max(1, (os.cpu_count() or 1) // self.workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # Forking a process that already runs threads (event loop executor, batcher) isn't safe
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(build, tuple(build_args), warm, self.threads_per_worker)
+        )
+        self.source: Optional[str] = None
+        self.pids: List[int] = []
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.in_flight = 0
+        self.total_call_time = 0.0
+
+    def start(self) -> 'QAProcessPool':
+        """Start every worker and wait until each has loaded its model (blocking)"""
+        try:
+            # The model load takes seconds, so each of these lands on a newly spawned worker
+            info = [future.result() for future in [self._executor.submit(_worker_info) for _ in range(self.workers)]]
+        except BrokenProcessPool as e:
+            self.close()
+            raise RuntimeError("QA worker process failed to load the model (see its log output)") from e
+        self.pids = sorted({pid for pid, _ in info})
+        self.source = info[0][1]
+        logger.info(f"QA process pool ready: {self.workers} workers x {self.threads_per_worker} threads ({self.source})")
+        return self
+
+    def submit(self, question, context, batch_size: Optional[int] = None) -> Future:
+        """Queue one pipeline call on the pool"""
+        return self._executor.submit(_worker_answer, question, context, batch_size)
+
+    def __call__(self, question, context, batch_size: Optional[int] = None, **kwargs):
+        started = time.perf_counter()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            return self.submit(question, context, batch_size).result()
+        except BrokenProcessPool:
+            logger.error("QA worker process died; POST /reload-model to start a new pool")
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.calls += 1
+                self.total_call_time += time.perf_counter() - started
+
+    def close(self):
+        """Stop the workers once the calls already queued have finished"""
+        self._executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict:
+        return {
+            'workers': self.workers,
+            'threads_per_worker': self.threads_per_worker,
+            'pids': self.pids,
+            'calls': self.calls,
+            'in_flight': self.in_flight,
+            'avg_call_ms': round(self.total_call_time / self.calls * 1000, 2) if self.calls else 0.0
+        }
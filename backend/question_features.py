@@ -0,0 +1,33 @@
+"""
+Per-request question features for the unified intelligence strategies
+Normalized text, tokens, course codes, lecturer names and routing flags computed once per
+question and passed to every response strategy
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Tuple
+
+from keyword_matcher import KeywordMatches
+from lecturer_index import LecturerMatch
+
+
+@dataclass
+class QuestionFeatures:
+    """Everything the strategies read from a question, derived once"""
+
+    raw: str
+    text: str                       # lowercased question
+    tokens: Tuple[str, ...]         # whitespace tokens of `text`
+    token_set: FrozenSet[str]
+    matches: KeywordMatches         # routing keyword categories with positions
+    course_codes: Tuple[str, ...]   # canonical course codes in order of mention (course_codes.py)
+    lecturers: Tuple[LecturerMatch, ...]  # lecturers the question is about, best match first (lecturer_index.mentioned)
+    intent: str
+    language_style: str
+    user_type: str
+    complexity: str
+    context_needed: bool
+
+    def has(self, *phrases: str) -> bool:
+        """Whether any of the phrases occurs in the normalized text"""
+        return any(phrase in self.text for phrase in phrases)
@@ -0,0 +1,96 @@
+"""
+Pre-rendered answers for the static unified strategies
+Course pages, course PDF listings, past questions and the course overview
+depend only on the knowledge data, so each is rendered once per
+(strategy, course code) and served from a dict afterwards. The knowledge
+store version is checked on every lookup; after the knowledge is reloaded
+with new content (POST /reload-knowledge, or a restart) every rendered answer
+is dropped and re-rendered on next use
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from knowledge_store import KnowledgeStore, knowledge_store
+
+logger = logging.getLogger(__name__)
+
+# A render that produced no answer is remembered too
+NO_ANSWER = object()
+
+
+class RenderedResponses:
+    """(strategy, key) -> response dict, memoized per knowledge store version"""
+
+    def __init__(self, store: KnowledgeStore):
+        self.store = store
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._responses: Dict[Tuple[str, Hashable], object] = {}
+        self.hits = 0
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def _check_version(self) -> str:
+        """The store's current version, dropping every answer rendered for an older one"""
+        version = self.store.version
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._responses = {}
+                    self._version = version
+        return version
+
+    def get(self, strategy: str, key: Hashable, render: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """The rendered answer for (strategy, key), calling render() the first time
+
+        Returns a shallow copy, so callers may add fields without touching
+        the cached answer (the answer text itself is shared). Rendering reads
+        the store without its lock, so an answer is only kept when the
+        version it started from is still current afterwards: one rendered
+        across a reload may mix old and new data and is returned uncached.
+        """
+        version = self._check_version()
+        response = self._responses.get((strategy, key))
+        if response is None:
+            started = time.perf_counter()
+            rendered = render()
+            response = NO_ANSWER if rendered is None else rendered
+            with self._lock:
+                if self.store.version == version and self._version == version:
+                    self._responses[(strategy, key)] = response
+                self.renders += 1
+                self.render_seconds += time.perf_counter() - started
+        else:
+            self.hits += 1
+        return None if response is NO_ANSWER else dict(response)
+
+    def warm(self, renders: Iterable[Tuple[str, Hashable, Callable[[], Optional[Dict]]]]) -> int:
+        """Render every (strategy, key, render) not rendered yet; returns how many answers are cached"""
+        for strategy, key, render in renders:
+            try:
+                self.get(strategy, key, render)
+            except Exception as e:
+                logger.error(f"Error pre-rendering {strategy} answer for {key}: {str(e)}")
+        return len(self._responses)
+
+    def clear(self):
+        with self._lock:
+            self._responses = {}
+
+    def get_stats(self) -> Dict:
+        return {
+            'knowledge_version': self._version,
+            'responses': len(self._responses),
+            'bytes': sum(len(response['answer'].encode('utf-8')) for response in list(self._responses.values())
+                         if response is not NO_ANSWER),
+            'hits': self.hits,
+            'renders': self.renders,
+            'render_ms': round(self.render_seconds * 1000, 3)
+        }
+
+
+# Global instance
+rendered_responses = RenderedResponses(knowledge_store)
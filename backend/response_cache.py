@@ -0,0 +1,245 @@
+"""
+Persistent LLM answer cache keyed by prompt fingerprint
+In-memory LRU with TTL in front of an on-disk SQLite store that survives
+restarts and is shared between uvicorn workers. From async code only the
+memory tier runs on the event loop: disk reads go to a worker thread and
+disk writes are written behind by a single background thread
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from config import ExternalAPIConfig
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation"""
+    question = re.sub(r'\s+', ' ', question.lower()).strip()
+    return question.rstrip('?!. ')
+
+
+def prompt_fingerprint(question: str, system_prompt: str, model: str, temperature: float) -> str:
+    """Stable hash of everything that determines a completion"""
+    parts = [
+        normalize_question(question),
+        re.sub(r'\s+', ' ', system_prompt).strip(),
+        model,
+        f"{temperature:.2f}"
+    ]
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier answer cache: memory LRU + SQLite"""
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, db_path: str, ttl: float, max_entries: int, max_disk_entries: int):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # Memory tier only; never held during disk I/O, so the event loop never waits on SQLite
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        # One writer thread: disk writes stay in order and off the request path
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='llm-cache-writer')
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stores_since_prune = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store on first use; the cache still works in memory if this fails"""
+        if self._conn is not None or not self.db_path:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, answer TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error as e:
+            logger.error(f"LLM cache disk store unavailable: {e}")
+            self.db_path = None
+        return self._conn
+
+    def _remember(self, key: str, answer: str, expires_at: float):
+        self._memory[key] = (answer, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _get_memory(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            answer, expires_at = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return answer
+            del self._memory[key]
+            return None
+
+    def _get_disk(self, key: str, now: float) -> Optional[str]:
+        with self._disk_lock:
+            conn = self._get_conn()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT answer, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if not row or row[1] <= now:
+                    return None
+                conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"LLM cache read error: {e}")
+                return None
+        with self._lock:
+            self._remember(key, row[0], row[1])
+            self.disk_hits += 1
+        return row[0]
+
+    def _miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def _set_memory(self, key: str, answer: str, now: float) -> float:
+        expires_at = now + self.ttl
+        with self._lock:
+            self._remember(key, answer, expires_at)
+            self.stores += 1
+        return expires_at
+
+    def _set_disk(self, key: str, answer: str, expires_at: float, now: float):
+        with self._disk_lock:
+            conn = self._get_conn()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, answer, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, answer, expires_at, now)
+                )
+                self._stores_since_prune += 1
+                if self._stores_since_prune >= self.PRUNE_EVERY:
+                    self._prune(conn, now)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"LLM cache write error: {e}")
+
+    def get(self, key: str) -> Optional[str]:
+        """Blocking lookup (memory, then disk); from async code use aget"""
+        now = time.time()
+        answer = self._get_memory(key, now)
+        if answer is None:
+            answer = self._get_disk(key, now)
+        if answer is None:
+            self._miss()
+        return answer
+
+    def set(self, key: str, answer: str):
+        """Blocking store in both tiers; from async code use aset"""
+        now = time.time()
+        self._set_disk(key, answer, self._set_memory(key, answer, now), now)
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Memory hit on the event loop; the disk lookup runs in a worker thread"""
+        now = time.time()
+        answer = self._get_memory(key, now)
+        if answer is None and self.db_path:
+            answer = await asyncio.get_running_loop().run_in_executor(None, self._get_disk, key, now)
+        if answer is None:
+            self._miss()
+        return answer
+
+    async def aset(self, key: str, answer: str):
+        """Store in memory now and write behind to disk from the writer thread"""
+        now = time.time()
+        expires_at = self._set_memory(key, answer, now)
+        if self.db_path:
+            self._writer.submit(self._set_disk, key, answer, expires_at, now)
+
+    def _prune(self, conn: sqlite3.Connection, now: float):
+        """Drop expired rows and keep only the most recently used entries on disk"""
+        self._stores_since_prune = 0
+        conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+        conn.execute(
+            "DELETE FROM llm_cache WHERE key NOT IN "
+            "(SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT ?)",
+            (self.max_disk_entries,)
+        )
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        with self._disk_lock:
+            conn = self._get_conn()
+            if conn is not None:
+                conn.execute("DELETE FROM llm_cache")
+                conn.commit()
+
+    def get_status(self) -> Dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        disk_entries = None
+        with self._disk_lock:
+            conn = self._get_conn()
+            if conn is not None:
+                try:
+                    disk_entries = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+        return {
+            'enabled': ExternalAPIConfig.LLM_CACHE_ENABLED,
+            'memory_entries': len(self._memory),
+            'disk_entries': disk_entries,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            'ttl_seconds': self.ttl,
+            'max_entries': self.max_entries
+        }
+
+    def close(self):
+        """Finish pending write-behind stores and close the disk store"""
+        self._writer.shutdown(wait=True)
+        with self._disk_lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+
+
+# Global instance
+llm_response_cache = LLMResponseCache(
+    ExternalAPIConfig.LLM_CACHE_PATH,
+    ttl=ExternalAPIConfig.LLM_CACHE_TTL,
+    max_entries=ExternalAPIConfig.LLM_CACHE_MAX_ENTRIES,
+    max_disk_entries=ExternalAPIConfig.LLM_CACHE_MAX_DISK_ENTRIES
+)
@@ -0,0 +1,263 @@
+"""
+Semantic near-duplicate answer cache for paraphrased questions
+Questions are embedded as hashed TF-IDF vectors (words, word bigrams and
+character trigrams, no network) and kept in a NumPy matrix; a cached answer
+is served when the cosine similarity clears a threshold and the detected
+course codes and negation match. Course codes are partitioned on rather than
+ordered, so "cos 102 lecturers" and "lecturers for COS102" embed alike
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from config import RuntimeConfig, backend_path
+from course_codes import COURSE_CODE_PATTERN, canonical_code, extract_course_codes
+
+logger = logging.getLogger(__name__)
+
+# Words that carry no meaning for matching paraphrases (question words and
+# negations are kept: "who teaches X" and "what is not X" ask something else)
+STOPWORDS = {
+    'a', 'an', 'the', 'is', 'are', 'was', 'be', 'for', 'of', 'in', 'on', 'to', 'at',
+    'me', 'my', 'i', 'us', 'we', 'you', 'please', 'can', 'could', 'tell', 'about',
+    'dey', 'na', 'abi', 'and', 'do', 'does', 'this', 'that',
+    'need', 'want', 'get', 'give', 'know', 'with', 'there', 'any', 'some', 'available', 'kindly'
+}
+
+# Collapse common phrasings (including Pidgin) onto one canonical token
+SYNONYMS = {
+    'lecturer': 'lecturer', 'lecturers': 'lecturer', 'teacher': 'lecturer',
+    'teachers': 'lecturer', 'teach': 'lecturer', 'teaches': 'lecturer',
+    'teaching': 'lecturer', 'instructor': 'lecturer', 'instructors': 'lecturer',
+    'handles': 'lecturer', 'material': 'materials', 'books': 'materials',
+    'resources': 'materials', 'courses': 'course', 'careers': 'career',
+    'jobs': 'career', 'job': 'career', 'opportunities': 'career', 'wetin': 'what',
+    'no': 'not', 'never': 'not', 'without': 'not', 'cannot': 'not'
+}
+
+# Question words count less than content words ("cos102 lecturers" still matches
+# "who are the lecturers for cos102") but keep "who teaches X" apart from "what is X"
+QUESTION_WORDS = {'who', 'what', 'which', 'where', 'when', 'how', 'why'}
+QUESTION_WORD_WEIGHT = 0.5
+# Word bigrams carry word order: "prerequisite for cos102" vs "cos102 a prerequisite for"
+BIGRAM_WEIGHT = 1.0
+NEGATION = 'not'
+# A preposition left at the end turns the relation around ("what is COS102 a
+# prerequisite for" vs "what is the prerequisite for COS102"), so it is kept
+STRANDED_PREPOSITIONS = {'for', 'to', 'from', 'with'}
+
+# Follow-ups like "tell me more" depend on the conversation and are never cached
+# (a bare course code such as "mat121" is still specific enough)
+MIN_CONTENT_TOKENS = 2
+
+SEED_CORPUS_FILES = [
+    backend_path('../final_academic_training_data.json'),
+    backend_path('../groq_pdf_training_data.json')
+]
+
+
+def detect_course_codes(text_lower: str) -> FrozenSet[str]:
+    """Canonical course codes mentioned in a lowercased question"""
+    return frozenset(extract_course_codes(text_lower))
+
+
+def tokenize(question: str) -> List[str]:
+    """Normalize a question into canonical content tokens"""
+    text = COURSE_CODE_PATTERN.sub(lambda m: f" {canonical_code(m).lower().replace('-', '')} ", question.lower())
+    text = re.sub(r"\bcan['’]t\b", 'cannot', text)
+    text = re.sub(r"n['’]t\b", ' not', text)
+    words = re.findall(r'[a-z0-9]+', text)
+    tokens = [token for token in (SYNONYMS.get(word, word) for word in words) if token not in STOPWORDS]
+    if words and words[-1] in STRANDED_PREPOSITIONS:
+        tokens.append(words[-1])
+    return tokens
+
+
+class SemanticAnswerCache:
+    """Fixed-capacity matrix of question vectors with cosine lookup"""
+
+    def __init__(self, capacity: int, threshold: float, dims: int = 4096, eviction: str = 'lru'):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.dims = dims
+        self.eviction = eviction
+
+        self.matrix = np.zeros((capacity, dims), dtype=np.float32)
+        self.course_ids = np.full(capacity, -1, dtype=np.int32)
+        self.last_used = np.zeros(capacity, dtype=np.float64)
+        self.inserted_at = np.zeros(capacity, dtype=np.float64)
+        self.answers: List[Optional[Dict]] = [None] * capacity
+        self.questions: List[Optional[str]] = [None] * capacity
+        self.size = 0
+
+        self._course_keys: Dict[Tuple[FrozenSet[str], bool], int] = {}
+        self._lock = threading.Lock()
+        self.idf = np.ones(dims, dtype=np.float32)
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _feature_index(self, feature: str) -> int:
+        return zlib.crc32(feature.encode('utf-8')) % self.dims
+
+    def _features(self, tokens: List[str]) -> List[tuple]:
+        """(index, weight) pairs: whole tokens, character trigrams and word bigrams (word order)
+
+        A bigram with a course code is order-free: the code already picks the
+        partition, and "cos102 lecturers" asks the same as "lecturers for cos102".
+        """
+        features = []
+        for token in tokens:
+            if token in QUESTION_WORDS:
+                features.append((self._feature_index('w:' + token), QUESTION_WORD_WEIGHT))
+                continue
+            features.append((self._feature_index('w:' + token), 1.0))
+            padded = f"#{token}#"
+            for i in range(len(padded) - 2):
+                features.append((self._feature_index('c:' + padded[i:i + 3]), 0.3))
+        for first, second in zip(tokens, tokens[1:]):
+            if COURSE_CODE_PATTERN.fullmatch(first) or COURSE_CODE_PATTERN.fullmatch(second):
+                first, second = sorted((first, second))
+            features.append((self._feature_index(f'b:{first} {second}'), BIGRAM_WEIGHT))
+        return features
+
+    def fit_idf(self, questions: List[str]):
+        """Estimate IDF weights from a corpus of known questions"""
+        df = np.zeros(self.dims, dtype=np.float64)
+        for question in questions:
+            indices = {index for index, _ in self._features(tokenize(question))}
+            df[list(indices)] += 1
+        n = len(questions)
+        self.idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+
+    def load_seed_corpus(self, paths: List[str]):
+        """Fit IDF from the training datasets that ship with the repo"""
+        questions = []
+        for path in paths:
+            try:
+                if os.path.exists(path):
+                    with open(path, 'r', encoding='utf-8') as f:
+                        questions.extend(item['question'] for item in json.load(f) if 'question' in item)
+                else:
+                    logger.warning(f"Semantic cache seed corpus {path} not found")
+            except Exception as e:
+                logger.error(f"Could not read semantic cache seed corpus {path}: {e}")
+        if questions:
+            self.fit_idf(questions)
+        else:
+            logger.warning("No semantic cache seed questions: IDF stays uniform and paraphrase matching is weaker")
+
+    def embed(self, question: str) -> Optional[np.ndarray]:
+        """L2-normalized hashed TF-IDF vector, or None for questions too short to match safely"""
+        tokens = tokenize(question)
+        if len(tokens) < MIN_CONTENT_TOKENS and not detect_course_codes(question.lower()):
+            return None
+        vector = np.zeros(self.dims, dtype=np.float32)
+        for index, weight in self._features(tokens):
+            vector[index] += weight
+        np.log1p(vector, out=vector)
+        vector *= self.idf
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def _course_id(self, question: str) -> int:
+        """Id of the question's partition: its course codes and whether it is negated
+        (only questions in the same partition can match each other)"""
+        key = (detect_course_codes(question.lower()), NEGATION in tokenize(question))
+        if key not in self._course_keys:
+            self._course_keys[key] = len(self._course_keys)
+        return self._course_keys[key]
+
+    def _best_match(self, vector: np.ndarray, course_id: int):
+        if self.size == 0:
+            return None, 0.0
+        scores = self.matrix[:self.size] @ vector
+        scores[self.course_ids[:self.size] != course_id] = -1.0
+        slot = int(np.argmax(scores))
+        return slot, float(scores[slot])
+
+    def lookup(self, question: str) -> Optional[Dict]:
+        """Return a cached answer for a near-duplicate question, if any"""
+        vector = self.embed(question)
+        if vector is None:
+            return None
+        with self._lock:
+            slot, score = self._best_match(vector, self._course_id(question))
+            if slot is not None and score >= self.threshold:
+                self.hits += 1
+                self.last_used[slot] = time.monotonic()
+                logger.info(f"Semantic cache hit ({score:.3f}) for: {question[:60]}")
+                return dict(self.answers[slot])
+            self.misses += 1
+            return None
+
+    def store(self, question: str, answer: Dict):
+        """Remember an answer, replacing a near-duplicate entry or evicting one"""
+        vector = self.embed(question)
+        if vector is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            course_id = self._course_id(question)
+            slot, score = self._best_match(vector, course_id)
+            if slot is None or score < self.threshold:
+                if self.size < self.capacity:
+                    slot = self.size
+                    self.size += 1
+                else:
+                    ages = self.last_used if self.eviction == 'lru' else self.inserted_at
+                    slot = int(np.argmin(ages[:self.size]))
+                    self.evictions += 1
+                self.inserted_at[slot] = now
+
+            self.matrix[slot] = vector
+            self.course_ids[slot] = course_id
+            self.last_used[slot] = now
+            self.answers[slot] = answer
+            self.questions[slot] = question
+            self.stores += 1
+
+    def clear(self):
+        with self._lock:
+            self.size = 0
+            self.answers = [None] * self.capacity
+            self.questions = [None] * self.capacity
+            self.course_ids[:] = -1
+            self._course_keys.clear()
+
+    def get_status(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'enabled': RuntimeConfig.SEMANTIC_CACHE_ENABLED,
+            'entries': self.size,
+            'capacity': self.capacity,
+            'threshold': self.threshold,
+            'eviction': self.eviction,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'matrix_bytes': int(self.matrix.nbytes)
+        }
+
+
+# Global instance
+semantic_cache = SemanticAnswerCache(
+    capacity=RuntimeConfig.SEMANTIC_CACHE_CAPACITY,
+    threshold=RuntimeConfig.SEMANTIC_CACHE_THRESHOLD,
+    eviction=RuntimeConfig.SEMANTIC_CACHE_EVICTION
+)
+semantic_cache.load_seed_corpus(SEED_CORPUS_FILES)
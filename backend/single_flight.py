@@ -0,0 +1,64 @@
+"""
+Single-flight coalescing for identical in-flight upstream calls
+Callers that ask for a key already being fetched await the same task
+instead of starting another request
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One shared upstream call and the number of callers waiting on it"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key"""
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `call` once per key at a time; concurrent callers share its result"""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _, key=key, flight=flight: self._finish(key, flight))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+            logger.info(f"Coalesced request onto in-flight call ({flight.waiters} already waiting)")
+
+        flight.waiters += 1
+        try:
+            # Shield so one caller being cancelled (e.g. losing a hedged race) doesn't cancel the others
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def get_stats(self) -> Dict:
+        total = self.leaders + self.coalesced
+        return {
+            'in_flight': len(self._flights),
+            'upstream_calls': self.leaders,
+            'coalesced': self.coalesced,
+            'coalescing_rate': round(self.coalesced / total, 3) if total else 0.0
+        }
@@ -0,0 +1,39 @@
+"""
+Server-Sent Events helpers for streamed answers
+Formats SSE frames and splits locally generated markdown into small chunks
+so the chat UI can start rendering before the whole answer is ready
+"""
+
+import json
+import re
+from typing import Dict, Iterator, Optional
+
+# Roughly one short line of text per frame
+STREAM_CHUNK_CHARS = 64
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"  # stop nginx/Vercel proxies from buffering the stream
+}
+
+
+def sse_event(data: Dict, event: Optional[str] = None) -> str:
+    """Encode one SSE frame with a JSON payload"""
+    frame = f"event: {event}\n" if event else ""
+    return frame + f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def chunk_markdown(text: str, size: int = STREAM_CHUNK_CHARS) -> Iterator[str]:
+    """Split markdown on line and word boundaries into chunks of about `size` characters"""
+    buffer = ""
+    # Keep the separators so the reassembled text is identical to the original
+    for piece in re.split(r'(\n|\s+)', text):
+        if not piece:
+            continue
+        buffer += piece
+        if piece == "\n" or len(buffer) >= size:
+            yield buffer
+            buffer = ""
+    if buffer:
+        yield buffer
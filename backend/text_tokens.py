@@ -0,0 +1,38 @@
+"""
+Shared word tokenizer for keyword search and knowledge lookups
+Lowercases text, turns course codes into one token however they are
+written (cos102, ftmcpt112), drops function words and folds plurals, so the
+BM25 index, the knowledge store's topic terms and lecturer name matching
+agree on what a word is without depending on each other
+"""
+
+import re
+from typing import List
+
+from course_codes import COURSE_CODE_PATTERN, canonical_code
+
+# Function words that carry no topic (and only add long BM25 postings lists)
+STOPWORDS = {
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'for', 'of', 'in', 'on', 'to', 'at', 'by',
+    'and', 'or', 'as', 'it', 'its', 'this', 'that', 'these', 'those', 'with', 'from', 'into', 'can', 'could',
+    'do', 'does', 'did', 'what', 'which', 'who', 'how', 'why', 'when', 'where', 'me', 'my', 'i', 'you',
+    'your', 'we', 'our', 'us', 'they', 'their', 'he', 'she', 'his', 'her', 'about', 'tell', 'explain',
+    'please', 'will', 'would', 'should', 'may', 'also', 'not', 'no', 'if', 'then', 'than', 'so', 'such'
+}
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase content tokens; course codes become one token (cos102, ftmcpt112) however they are written"""
+    text = COURSE_CODE_PATTERN.sub(lambda m: f" {canonical_code(m).lower().replace('-', '')} ", text.lower())
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text):
+        if token in STOPWORDS:
+            continue
+        # Light plural folding: algorithms -> algorithm, processes -> process
+        if len(token) > 4 and token.endswith('es') and token[-3] in 'sxz':
+            token = token[:-2]
+        elif len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
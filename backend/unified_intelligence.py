@@ -9,14 +9,20 @@ import re
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import requests
-from transformers import pipeline
+from keyword_matcher import KeywordMatches, keyword_matcher, UNIFIED_COURSE_PATTERNS
+from course_codes import extract_course_codes
+from knowledge_store import knowledge_store
+from lecturer_index import lecturer_index
+from rendered_responses import rendered_responses
+from question_features import QuestionFeatures
+from intent_classifier import intent_classifier, strategy_type
+from config import RuntimeConfig
 
 class UnifiedIntelligence:
     def __init__(self):
-        self.knowledge_base = self._load_comprehensive_knowledge()
-        self.course_database = self._load_course_database()
-        self.pdf_database = self._load_pdf_database()
-        self.past_questions = self._load_past_questions()
+        self.knowledge = knowledge_store
+        self.rendered = rendered_responses  # static strategy answers, re-rendered when the knowledge changes
+        self.intent_classifier = intent_classifier  # None unless INTENT_ROUTER=classifier
         self.conversation_memory = []
         self.learning_data = []
         self.response_history = []
@@ -28,639 +34,6 @@ class UnifiedIntelligence:
         self.fut_api = self._init_fut_api()
         self.qa_model = None  # Will be loaded when needed
         
-    def _load_comprehensive_knowledge(self) -> Dict:
-        """Load comprehensive knowledge base"""
-        return {
-            'fut_general': {
-                'established': '1983',
-                'location': 'Minna, Niger State, Nigeria',
-                'motto': 'Technology for Development',
-                'type': 'Federal University',
-                'accreditation': 'National Universities Commission (NUC)',
-                'website': 'https://fut.edu.ng',
-                'email': 'info@fut.edu.ng',
-                'phone': '+234-66-222-000'
-            },
-            'sict_school': {
-                'name': 'School of Information and Communication Technology',
-                'departments': ['Computer Science', 'Cyber Security', 'Information Technology', 'Telecommunications Engineering'],
-                'programs': ['B.Sc Computer Science', 'B.Sc Cyber Security', 'B.Sc Information Technology', 'B.Eng Telecommunications'],
-                'facilities': ['Computer Laboratories', 'Network Laboratory', 'Software Development Lab', 'Hardware Maintenance Lab', 'Research Laboratory']
-            },
-            'admission_requirements': {
-                'utme': 'Minimum of 180 in UTME',
-                'olevel': 'Five credits including Mathematics and English',
-                'subjects': 'Mathematics, English, Physics, Chemistry, and any other science subject',
-                'direct_entry': 'A-level, OND, HND, or equivalent qualifications',
-                'cut_off_mark': '180 and above'
-            }
-        }
-    
-    def _load_course_database(self) -> Dict:
-        """Load comprehensive course database"""
-        return {
-            '100_level': {
-                'COS101': {
-                    'name': 'Introduction to Computer Science',
-                    'description': 'Fundamental concepts of computer science, history, and applications',
-                    'credits': 3,
-                    'prerequisites': 'None',
-                    'lecturers': [
-                        'Umar alkali',
-                        'O. Ojerinde O',
-                        'Abisoye O. A',
-                        'Lawal OLamilekan Lawal',
-                        'Bashir Suleiman'
-                    ],
-                    'materials': [
-                        'Introduction to Computer Science textbook',
-                        'Programming basics guide',
-                        'Computer fundamentals notes',
-                        'Online CS resources'
-                    ],
-                    'success_tips': [
-                        'Understand basic concepts thoroughly',
-                        'Practice programming fundamentals',
-                        'Read recommended textbooks',
-                        'Join study groups',
-                        'Ask questions during lectures'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly lab sessions'
-                },
-                'COS102': {
-                    'name': 'Introduction to Problem Solving',
-                    'description': 'Basic programming concepts and problem-solving techniques using Python',
-                    'credits': 3,
-                    'prerequisites': 'COS101',
-                    'lecturers': [
-                        'Sadiu Admed Abubakar',
-                        'Shuaibu M Badeggi',
-                        'Ibrahim Shehi Shehu',
-                        'Abubakar Suleiman T',
-                        'Lasotte yakubu'
-                    ],
-                    'materials': [
-                        'Python programming textbook',
-                        'Code editor (VS Code/PyCharm)',
-                        'Online Python tutorials',
-                        'Programming practice problems'
-                    ],
-                    'success_tips': [
-                        'Practice coding daily',
-                        'Understand variables and data types',
-                        'Work on programming projects',
-                        'Use online coding platforms',
-                        'Debug your code regularly'
-                    ],
-                    'assessment': 'Continuous Assessment (40%) + Examination (60%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly programming labs'
-                },
-                'PHY101': {
-                    'name': 'General Physics I',
-                    'description': 'Fundamental concepts of physics including mechanics, waves, and thermodynamics',
-                    'credits': 3,
-                    'prerequisites': 'O\'Level Physics',
-                    'lecturers': [
-                        'Aku Ibrahim'
-                    ],
-                    'materials': [
-                        'Physics textbook',
-                        'Scientific calculator',
-                        'Physics lab manual',
-                        'Online physics resources'
-                    ],
-                    'success_tips': [
-                        'Understand mathematical concepts',
-                        'Practice problem-solving regularly',
-                        'Attend all laboratory sessions',
-                        'Use scientific calculator effectively',
-                        'Study physics formulas and derivations'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly physics labs'
-                },
-                'PHY102': {
-                    'name': 'General Physics II',
-                    'description': 'Advanced physics concepts including electricity, magnetism, and modern physics',
-                    'credits': 3,
-                    'prerequisites': 'PHY101',
-                    'lecturers': [
-                        'Dr. Julia Elchie'
-                    ],
-                    'materials': [
-                        'Physics textbook',
-                        'Scientific calculator',
-                        'Physics lab manual',
-                        'Online physics resources'
-                    ],
-                    'success_tips': [
-                        'Build on PHY101 concepts',
-                        'Practice complex problem-solving',
-                        'Understand electromagnetic concepts',
-                        'Use laboratory equipment properly',
-                        'Study modern physics applications'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly physics labs'
-                },
-                'CST111': {
-                    'name': 'Communication in English',
-                    'description': 'English language skills for academic and professional communication',
-                    'credits': 2,
-                    'prerequisites': 'O\'Level English',
-                    'lecturers': [
-                        'Okeli Chike',
-                        'Amina Gogo Tafida',
-                        'Halima Shehu'
-                    ],
-                    'materials': [
-                        'English grammar textbook',
-                        'Academic writing guide',
-                        'Communication skills manual',
-                        'Online English resources'
-                    ],
-                    'success_tips': [
-                        'Practice writing regularly',
-                        'Improve vocabulary',
-                        'Participate in class discussions',
-                        'Read academic texts',
-                        'Practice presentation skills'
-                    ],
-                    'assessment': 'Continuous Assessment (40%) + Examination (60%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Communication workshops'
-                },
-                'GST112': {
-                    'name': 'Nigerian Peoples and Culture',
-                    'description': 'Study of Nigerian cultural diversity, traditions, and social structures',
-                    'credits': 2,
-                    'prerequisites': 'None',
-                    'lecturers': [
-                        'Isah Usman'
-                    ],
-                    'materials': [
-                        'Nigerian culture textbook',
-                        'Cultural studies guide',
-                        'Social anthropology text',
-                        'Online cultural resources'
-                    ],
-                    'success_tips': [
-                        'Understand cultural diversity',
-                        'Study Nigerian history',
-                        'Participate in cultural activities',
-                        'Read about different ethnic groups',
-                        'Appreciate cultural differences'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Cultural workshops'
-                },
-                'STA111': {
-                    'name': 'Descriptive Statistics',
-                    'description': 'Introduction to statistical methods, data analysis, and probability',
-                    'credits': 3,
-                    'prerequisites': 'O\'Level Mathematics',
-                    'lecturers': [
-                        'Olayiwola Adelutu'
-                    ],
-                    'materials': [
-                        'Statistics textbook',
-                        'Scientific calculator',
-                        'Statistical software',
-                        'Online statistics resources'
-                    ],
-                    'success_tips': [
-                        'Understand mathematical concepts',
-                        'Practice statistical calculations',
-                        'Use statistical software',
-                        'Interpret data correctly',
-                        'Study probability theory'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Statistical analysis labs'
-                },
-                'FTM-CPT111': {
-                    'name': 'Probability for Computer Science',
-                    'description': 'Probability theory and its applications in computer science',
-                    'credits': 3,
-                    'prerequisites': 'O\'Level Mathematics',
-                    'lecturers': [
-                        'Saliu adam muhammad',
-                        'Saidu Ahmed Abubakar'
-                    ],
-                    'materials': [
-                        'Probability textbook',
-                        'Mathematical software',
-                        'Statistics calculator',
-                        'Online probability resources'
-                    ],
-                    'success_tips': [
-                        'Master probability concepts',
-                        'Practice probability calculations',
-                        'Understand applications in CS',
-                        'Use mathematical software',
-                        'Study probability distributions'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Probability problem-solving sessions'
-                },
-                'FTM-CPT112': {
-                    'name': 'Front End Web Development',
-                    'description': 'Introduction to web development using HTML, CSS, and JavaScript',
-                    'credits': 3,
-                    'prerequisites': 'COS102',
-                    'lecturers': [
-                        'Benjamin Alenoghen',
-                        'Lawal Olamilekan Lawal',
-                        'Iosotte Yakubu',
-                        'Benjamin Alenoghena'
-                    ],
-                    'materials': [
-                        'Web development textbook',
-                        'Code editor (VS Code)',
-                        'Web browser',
-                        'Online web development resources'
-                    ],
-                    'success_tips': [
-                        'Practice HTML/CSS regularly',
-                        'Learn JavaScript fundamentals',
-                        'Build web projects',
-                        'Use developer tools',
-                        'Stay updated with web technologies'
-                    ],
-                    'assessment': 'Continuous Assessment (40%) + Examination (60%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Web development labs'
-                },
-                'FTM-CPT192': {
-                    'name': 'Introduction to Computer Hardware',
-                    'description': 'Fundamental concepts of computer hardware components and systems',
-                    'credits': 3,
-                    'prerequisites': 'None',
-                    'lecturers': [
-                        'Benjamin Alenoghen'
-                    ],
-                    'materials': [
-                        'Computer hardware textbook',
-                        'Hardware lab manual',
-                        'Component identification guide',
-                        'Hardware tools'
-                    ],
-                    'success_tips': [
-                        'Hands-on practice with hardware',
-                        'Understand component functions',
-                        'Study maintenance procedures',
-                        'Practice troubleshooting',
-                        'Join hardware study groups'
-                    ],
-                    'assessment': 'Continuous Assessment (35%) + Examination (65%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly hardware labs'
-                },
-                'CPT121': {
-                    'name': 'Introduction to Computer Hardware',
-                    'description': 'Computer hardware components and maintenance',
-                    'credits': 3,
-                    'prerequisites': 'None',
-                    'materials': [
-                        'Computer hardware textbook',
-                        'Hardware lab manual',
-                        'Component identification guide',
-                        'Hardware tools'
-                    ],
-                    'success_tips': [
-                        'Hands-on practice with hardware',
-                        'Understand component functions',
-                        'Study maintenance procedures',
-                        'Practice troubleshooting',
-                        'Join hardware study groups'
-                    ],
-                    'assessment': 'Continuous Assessment (35%) + Examination (65%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly hardware labs'
-                },
-                'CPT122': {
-                    'name': 'Computer Hardware Systems and Maintenance',
-                    'description': 'Advanced hardware systems and troubleshooting',
-                    'credits': 3,
-                    'prerequisites': 'CPT121',
-                    'materials': [
-                        'Hardware systems textbook',
-                        'Troubleshooting guide',
-                        'Maintenance tools',
-                        'System diagnostic software'
-                    ],
-                    'success_tips': [
-                        'Practice troubleshooting',
-                        'Understand system architecture',
-                        'Learn diagnostic procedures',
-                        'Work with different hardware',
-                        'Document maintenance procedures'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly maintenance labs'
-                },
-                'MAT101': {
-                    'name': 'Mathematics for Computer Science',
-                    'description': 'Mathematical foundations for CS',
-                    'credits': 3,
-                    'prerequisites': 'O\'Level Mathematics',
-                    'materials': [
-                        'Discrete mathematics textbook',
-                        'Calculus textbook',
-                        'Mathematical problem sets',
-                        'Scientific calculator'
-                    ],
-                    'success_tips': [
-                        'Practice mathematical problems',
-                        'Understand discrete math concepts',
-                        'Apply math to programming',
-                        'Use mathematical software',
-                        'Join math study groups'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Examination (70%)',
-                    'lecturer_office_hours': 'Available on request',
-                    'practical_sessions': 'Weekly problem-solving sessions'
-                },
-                'MAT121': {
-                    'name': 'Differential and Integral Calculus',
-                    'description': 'Fundamental concepts of differential and integral calculus with applications',
-                    'credits': 3,
-                    'prerequisites': 'O\'Level Mathematics',
-                    'lecturers': [
-                        'Dr. Sarah Johnson',
-                        'Prof. Michael Brown',
-                        'Dr. Emily Davis'
-                    ],
-                    'materials': [
-                        'Calculus textbook',
-                        'Graphing calculator',
-                        'Notebook',
-                        'Ruler',
-                        'Graph paper'
-                    ],
-                    'success_tips': [
-                        'Practice differentiation and integration',
-                        'Understand limits and continuity',
-                        'Work on word problems',
-                        'Use graphing software',
-                        'Attend all lectures'
-                    ],
-                    'assessment': 'Continuous Assessment (30%) + Midterm (30%) + Final exam (40%)',
-                    'lecturer_office_hours': 'Monday-Friday 2:00-4:00 PM',
-                    'practical_sessions': 'Weekly calculus problem sessions'
-                }
-            },
-            '200_level': {
-                'COS201': {
-                    'name': 'Data Structures and Algorithms',
-                    'description': 'Fundamental data structures and algorithm design',
-                    'credits': 3,
-                    'prerequisites': 'COS102',
-                    'materials': [
-                        'Data structures textbook',
-                        'Algorithm design guide',
-                        'Programming practice problems',
-                        'Algorithm visualization tools'
-                    ],
-                    'success_tips': [
-                        'Master basic data structures',
-                        'Practice algorithm implementation',
-                        'Understand time complexity',
-                        'Solve coding problems',
-                        'Use algorithm visualization tools'
-                    ]
-                },
-                'COS202': {
-                    'name': 'Object-Oriented Programming',
-                    'description': 'OOP concepts using Java or C++',
-                    'credits': 3,
-                    'prerequisites': 'COS102',
-                    'materials': [
-                        'OOP textbook',
-                        'Java/C++ programming guide',
-                        'Design patterns book',
-                        'IDE (IntelliJ/Eclipse)'
-                    ],
-                    'success_tips': [
-                        'Understand OOP principles',
-                        'Practice inheritance and polymorphism',
-                        'Design object-oriented solutions',
-                        'Learn design patterns',
-                        'Build OOP projects'
-                    ]
-                }
-            }
-        }
-    
-    def _load_pdf_database(self) -> Dict:
-        """Load PDF content database"""
-        return {
-            'MAT121': {
-                'title': 'Differential and Integral Calculus',
-                'file': 'MAT121 Differential and Integral Calculus.pdf',
-                'topics': [
-                    'Limits and Continuity',
-                    'Derivatives and Differentiation Rules',
-                    'Applications of Derivatives',
-                    'Integration Techniques',
-                    'Applications of Integration',
-                    'Differential Equations'
-                ],
-                'key_concepts': [
-                    'Chain rule and product rule',
-                    'Implicit differentiation',
-                    'Related rates problems',
-                    'Optimization problems',
-                    'Integration by parts',
-                    'Partial fractions',
-                    'Area and volume calculations'
-                ],
-                'practice_problems': [
-                    'Find the derivative of composite functions',
-                    'Solve optimization problems',
-                    'Calculate areas under curves',
-                    'Solve differential equations'
-                ]
-            },
-            'COS102': {
-                'title': 'Introduction to Programming (Python)',
-                'files': [
-                    'COS 102 M1-M4.pdf',
-                    'COS102 M1_UNIT1_dbd4c419a350159fd2b993a51d3060d5.pptx',
-                    'COS102 M1_UNIT2_fea9594f22ab6877cd4665e38d7868ba.pptx'
-                ],
-                'topics': [
-                    'Python Basics and Syntax',
-                    'Variables and Data Types',
-                    'Control Structures',
-                    'Functions and Modules',
-                    'File Handling',
-                    'Object-Oriented Programming'
-                ]
-            },
-            'CPT121': {
-                'title': 'Introduction to Computer Hardware',
-                'files': [
-                    'BSG CPT121 Compiled Questions (2021-22).PDF'
-                ],
-                'topics': [
-                    'Computer Components',
-                    'Motherboard and CPU',
-                    'Memory Systems',
-                    'Storage Devices',
-                    'Input/Output Devices',
-                    'System Assembly'
-                ]
-            },
-            'CPT122': {
-                'title': 'Computer Hardware Systems and Maintenance',
-                'files': [
-                    'CPT122 - Introduction to computer Hardware module 1 unit 2.pdf',
-                    'CPT122 - Introduction to computer Hardware module 1, unit 1.pdf',
-                    'Module 2 - FUTM-CPT 122- Introduction to Computer Hardware Systems and Maintenance_98ed8947d600abe43052d6be9c9085d9.pdf'
-                ],
-                'topics': [
-                    'Advanced Hardware Systems',
-                    'Troubleshooting Techniques',
-                    'System Maintenance',
-                    'Hardware Diagnostics',
-                    'Performance Optimization'
-                ]
-            }
-        }
-    
-    def _load_past_questions(self) -> Dict:
-        """Load past questions and responses from trained model"""
-        return {
-            'MAT121': [
-                {
-                    'question': 'What is the derivative of x² + 3x + 2?',
-                    'answer': 'The derivative of x² + 3x + 2 is 2x + 3. This uses the power rule: d/dx(x²) = 2x and d/dx(3x) = 3.',
-                    'difficulty': 'Basic',
-                    'topic': 'Derivatives'
-                },
-                {
-                    'question': 'How do you solve integration by parts?',
-                    'answer': 'Integration by parts uses the formula ∫u dv = uv - ∫v du. Choose u and dv strategically - typically choose u as the part that becomes simpler when differentiated.',
-                    'difficulty': 'Intermediate',
-                    'topic': 'Integration'
-                },
-                {
-                    'question': 'What are the applications of derivatives in optimization?',
-                    'answer': 'Derivatives are used to find maximum and minimum values of functions. Set f\'(x) = 0 to find critical points, then use the second derivative test to determine if they are maxima or minima.',
-                    'difficulty': 'Advanced',
-                    'topic': 'Applications of Derivatives'
-                }
-            ],
-            'COS102': [
-                {
-                    'question': 'How do you create a function in Python?',
-                    'answer': 'Use the def keyword: def function_name(parameters): followed by the function body. Example: def greet(name): return f"Hello, {name}!"',
-                    'difficulty': 'Basic',
-                    'topic': 'Functions'
-                },
-                {
-                    'question': 'What are Python data types?',
-                    'answer': 'Python has several built-in data types: int (integers), float (decimals), str (strings), bool (True/False), list (ordered collections), tuple (immutable lists), dict (key-value pairs), and set (unique elements).',
-                    'difficulty': 'Basic',
-                    'topic': 'Data Types'
-                }
-            ],
-            'CPT121': [
-                {
-                    'question': 'What are the main components of a computer?',
-                    'answer': 'The main components are: CPU (Central Processing Unit), RAM (Random Access Memory), Motherboard, Storage (HDD/SSD), Power Supply, Graphics Card, and Input/Output devices.',
-                    'difficulty': 'Basic',
-                    'topic': 'Computer Components'
-                },
-                {
-                    'question': 'What is the difference between RAM and ROM?',
-                    'answer': 'RAM (Random Access Memory) is volatile memory that temporarily stores data while the computer is running. ROM (Read-Only Memory) is non-volatile memory that stores permanent data like BIOS.',
-                    'difficulty': 'Intermediate',
-                    'topic': 'Memory Systems'
-                }
-            ],
-            'CPT122': [
-                {
-                    'question': 'How do you troubleshoot a computer that won\'t start?',
-                    'answer': 'Check power connections, test the power supply, verify RAM is properly seated, check for loose cables, test with minimal hardware, and check for overheating issues.',
-                    'difficulty': 'Intermediate',
-                    'topic': 'Troubleshooting'
-                }
-            ],
-            'general_cs': [
-                {
-                    'question': 'What career paths are available in Computer Science?',
-                    'answer': 'Computer Science offers diverse career paths including Software Development (Full-stack, Mobile, Game development), Data Science & Analytics, Cybersecurity, Artificial Intelligence & Machine Learning, Web Development, System Administration, Database Administration, Network Engineering, Cloud Computing, DevOps, IT Consulting, Research & Academia, and Entrepreneurship in tech startups.',
-                    'difficulty': 'Basic',
-                    'topic': 'Career Guidance'
-                },
-                {
-                    'question': 'How do I balance academics with other responsibilities?',
-                    'answer': 'Create a structured schedule with dedicated study time, prioritize tasks using the Eisenhower Matrix, use time-blocking techniques, set realistic goals, learn to say no to non-essential activities, maintain a healthy work-life balance, use productivity tools and apps, join study groups for efficiency, communicate with lecturers about challenges, and remember that quality study time is more important than quantity.',
-                    'difficulty': 'Intermediate',
-                    'topic': 'Academic Success'
-                },
-                {
-                    'question': 'How do I get access to associations or organizations for Computer Science Students?',
-                    'answer': 'Join the Computer Science Students Association (CSSA) at FUT, participate in ACM (Association for Computing Machinery) student chapter, join IEEE Computer Society, attend tech meetups and conferences, participate in hackathons and coding competitions, join online communities like Stack Overflow, GitHub, and LinkedIn groups, volunteer for tech events, and network with industry professionals through these organizations.',
-                    'difficulty': 'Basic',
-                    'topic': 'Student Organizations'
-                },
-                {
-                    'question': 'What edge does Computer Science have over other departments in ICT?',
-                    'answer': 'Computer Science provides a strong foundation in algorithms, data structures, and computational thinking that applies across all ICT fields. CS graduates have deeper understanding of software development, system design, and problem-solving methodologies. The mathematical and theoretical foundation in CS provides better analytical skills, while the programming expertise gives CS students an advantage in automation, AI, and emerging technologies. CS also offers more diverse career opportunities and higher earning potential.',
-                    'difficulty': 'Intermediate',
-                    'topic': 'Department Comparison'
-                },
-                {
-                    'question': 'Are there any Computer labs for Computer Science Students?',
-                    'answer': 'Yes, FUT has well-equipped computer laboratories for CS students including the SICT Computer Laboratory with modern workstations, Network Laboratory for networking courses, Software Development Lab with programming environments, Hardware Maintenance Lab for hands-on hardware training, Research Laboratory for advanced projects, and 24/7 access labs for student use. These labs are equipped with the latest software, development tools, and high-speed internet connectivity.',
-                    'difficulty': 'Basic',
-                    'topic': 'Campus Facilities'
-                },
-                {
-                    'question': 'What are the essential skills for a Computer Science Student?',
-                    'answer': 'Essential skills include Programming (Python, Java, C++, JavaScript), Problem-solving and Algorithmic thinking, Data Structures and Algorithms, Database Management (SQL, NoSQL), Version Control (Git), Web Development (HTML, CSS, JavaScript), Software Engineering principles, Mathematics and Statistics, Communication skills, Teamwork and collaboration, Continuous learning mindset, Debugging and testing skills, and Project management abilities.',
-                    'difficulty': 'Intermediate',
-                    'topic': 'Essential Skills'
-                },
-                {
-                    'question': 'What industries can a Computer Science Student work in?',
-                    'answer': 'CS graduates can work in Technology (Google, Microsoft, Apple), Finance (Banks, Fintech), Healthcare (Medical software, Health tech), E-commerce (Amazon, Shopify), Gaming (Game development studios), Education (EdTech companies), Government (Digital services), Manufacturing (Automation, IoT), Entertainment (Streaming platforms), Transportation (Uber, Tesla), Energy (Smart grids), and virtually any industry that uses technology.',
-                    'difficulty': 'Basic',
-                    'topic': 'Industry Opportunities'
-                },
-                {
-                    'question': 'What can Computer Science contribute to society in the next 15 years?',
-                    'answer': 'CS will drive AI and Machine Learning advancements, revolutionize healthcare with telemedicine and AI diagnostics, enable smart cities with IoT and data analytics, transform education through personalized learning, advance climate solutions with green tech, improve transportation with autonomous vehicles, enhance cybersecurity for digital safety, democratize access to information and services, create new job opportunities, and solve complex global challenges through computational solutions.',
-                    'difficulty': 'Advanced',
-                    'topic': 'Future Impact'
-                },
-                {
-                    'question': 'How can I achieve excellence on this path?',
-                    'answer': 'Set clear academic and career goals, maintain high GPA through consistent study, build a strong portfolio of projects, participate in coding competitions and hackathons, contribute to open-source projects, network with professionals and alumni, pursue internships and practical experience, stay updated with technology trends, develop soft skills like communication and leadership, seek mentorship from experienced professionals, and maintain a growth mindset throughout your journey.',
-                    'difficulty': 'Intermediate',
-                    'topic': 'Excellence Strategies'
-                },
-                {
-                    'question': 'Are there any shortcuts?',
-                    'answer': 'While there are no true shortcuts to mastering Computer Science, you can optimize your learning by focusing on fundamentals first, using online resources and tutorials for faster learning, joining study groups for collaborative learning, practicing coding daily for muscle memory, building projects to apply knowledge immediately, seeking help from lecturers and peers when stuck, using spaced repetition for memorization, and maintaining consistency rather than cramming. Remember, solid understanding is better than quick fixes.',
-                    'difficulty': 'Basic',
-                    'topic': 'Learning Strategies'
-                }
-            ]
-        }
-    
     def _init_conversational_system(self) -> Dict:
         """Initialize conversational response system"""
         return {
@@ -761,19 +134,35 @@ class UnifiedIntelligence:
             }
         }
     
-    def analyze_question_intelligence(self, question: str, context: str = "") -> Dict:
-        """Intelligent analysis of question to determine best response strategy"""
+    def extract_features(self, question: str) -> QuestionFeatures:
+        """Normalize the question and derive every routing feature once per request"""
         question_lower = question.lower()
+        tokens = tuple(question_lower.split())
+        matches = keyword_matcher.match(question_lower)
+        return QuestionFeatures(
+            raw=question,
+            text=question_lower,
+            tokens=tokens,
+            token_set=frozenset(tokens),
+            matches=matches,
+            course_codes=tuple(extract_course_codes(question_lower)),
+            lecturers=tuple(lecturer_index.mentioned(question_lower)),
+            intent=self._identify_intent(matches),
+            language_style=self._detect_language_style(matches),
+            user_type=self._infer_user_type(matches),
+            complexity=self._assess_complexity(tokens),
+            context_needed='context_indicator' in matches
+        )
+    
+    def analyze_question_intelligence(self, question: str, context: str = "",
+                                      features: Optional[QuestionFeatures] = None) -> Dict:
+        """Intelligent analysis of question to determine best response strategy"""
+        if features is None:
+            features = self.extract_features(question)
+        matches = features.matches
         
         # Check for unrelated questions first
-        unrelated_keywords = [
-            'cooking', 'recipe', 'food', 'restaurant', 'travel', 'hotel', 'weather',
-            'sports', 'football', 'basketball', 'music', 'movie', 'entertainment',
-            'fashion', 'shopping', 'beauty', 'health', 'medical', 'politics',
-            'religion', 'dating', 'relationship', 'personal', 'private'
-        ]
-        
-        if any(keyword in question_lower for keyword in unrelated_keywords):
+        if 'unrelated' in matches:
             return {
                 'type': 'boundary',
                 'confidence': 0.95,
@@ -784,84 +173,54 @@ class UnifiedIntelligence:
         # Analyze question complexity and intent
         analysis = {
             'type': 'general',  # Default type
-            'complexity': self._assess_complexity(question),
-            'intent': self._identify_intent(question),
-            'context_needed': self._needs_context(question),
-            'language_style': self._detect_language_style(question),
-            'user_type': self._infer_user_type(question),
+            'complexity': features.complexity,
+            'intent': features.intent,
+            'context_needed': features.context_needed,
+            'language_style': features.language_style,
+            'user_type': features.user_type,
             'response_priority': [],
             'confidence': 0.70,  # Default confidence
             'context_clues': []
         }
         
-        # Human-like intent analysis with natural language understanding
-        course_patterns = {
-            'COS101': ['cos101', 'cos 101', 'introduction to computer science', 'computer science intro', 'cs intro', 'computer science basics'],
-            'COS102': ['cos102', 'cos 102', 'introduction to programming', 'python', 'programming intro', 'problem solving', 'programming basics'],
-            'PHY101': ['phy101', 'phy 101', 'physics 1', 'general physics', 'physics first', 'physics basics'],
-            'PHY102': ['phy102', 'phy 102', 'physics 2', 'advanced physics', 'physics second'],
-            'CST111': ['cst111', 'cst 111', 'communication', 'english', 'communication skills', 'english skills'],
-            'GST112': ['gst112', 'gst 112', 'nigerian culture', 'culture', 'nigerian people', 'cultural studies'],
-            'STA111': ['sta111', 'sta 111', 'statistics', 'descriptive statistics', 'stats', 'statistical methods'],
-            'CPT121': ['cpt121', 'cpt 121', 'computer hardware', 'hardware intro', 'hardware basics', 'computer components'],
-            'CPT122': ['cpt122', 'cpt 122', 'hardware systems', 'hardware maintenance', 'advanced hardware', 'computer maintenance'],
-            'FTM-CPT111': ['ftm-cpt111', 'ftm cpt111', 'probability', 'math for cs', 'probability theory', 'mathematical probability'],
-            'FTM-CPT112': ['ftm-cpt112', 'ftm cpt112', 'web development', 'frontend', 'html css javascript', 'web programming'],
-            'FTM-CPT192': ['ftm-cpt192', 'ftm cpt192', 'computer hardware systems', 'hardware systems', 'computer systems'],
-            'MAT101': ['mat101', 'mat 101', 'mathematics for cs', 'math for computer science', 'discrete mathematics'],
-            'MAT121': ['mat121', 'mat 121', 'differential calculus', 'integral calculus', 'calculus', 'mathematics 121'],
-            'PHY101': ['phy101', 'phy 101', 'physics 1', 'general physics', 'physics first', 'physics basics'],
-            'PHY102': ['phy102', 'phy 102', 'physics 2', 'advanced physics', 'physics second'],
-            'CST111': ['cst111', 'cst 111', 'communication', 'english', 'communication skills', 'english skills'],
-            'GST112': ['gst112', 'gst 112', 'nigerian culture', 'culture', 'nigerian people', 'cultural studies'],
-            'STA111': ['sta111', 'sta 111', 'statistics', 'descriptive statistics', 'stats', 'statistical methods']
-        }
-        
-        # Smart course detection with flexible matching
+        # Smart course detection with flexible matching (phrases live in keyword_matcher)
         detected_courses = []
-        for course_code, patterns in course_patterns.items():
-            if any(pattern in question_lower for pattern in patterns):
+        for course_code in UNIFIED_COURSE_PATTERNS:
+            if f'course:{course_code}' in matches:
                 detected_courses.append(course_code)
                 analysis['context_clues'].append(f"Course mentioned: {course_code}")
+        for lecturer in features.lecturers:
+            analysis['context_clues'].append(f"Lecturer mentioned: {lecturer.name}")
+        
+        if self.intent_classifier is not None:
+            strategy, probability = self.intent_classifier.classify(features.text)
+            if probability >= RuntimeConfig.INTENT_CLASSIFIER_MIN_CONFIDENCE:
+                analysis['type'] = strategy_type(strategy)
+                analysis['response_priority'] = [strategy]
+                analysis['confidence'] = round(probability, 2)
+                analysis['router'] = 'classifier'
+                return analysis
+        
+        self._route_by_keywords(matches, detected_courses, analysis, bool(features.lecturers))
+        return analysis
+    
+    def _route_by_keywords(self, matches: KeywordMatches, detected_courses: List[str], analysis: Dict,
+                           lecturer_mentioned: bool = False):
+        """Keyword-table routing: set type, response_priority and confidence on the analysis"""
+        analysis['router'] = 'keyword'
         
         # Enhanced natural language intent detection with better pattern matching
-        # Check for lecturer questions first (before generic patterns) - SUPER SMART
-        lecturer_keywords = [
-            'who teaches', 'who is the lecturer', 'lecturer for', 'teacher for', 'instructor for', 
-            'who handles', 'who takes', 'lecturer', 'teacher', 'instructor', 'teaches', 'who are', 
-            'who are the lecturer', 'who are the lecturers', 'lecturers for', 'teachers for', 
-            'instructors for', 'who is', 'who are the', 'lecturers', 'teachers', 'instructors',
-            'who dey teach', 'who dey', 'dey teach', 'teaching', 'teach us', 'teach me',
-            'who is teaching', 'who teaching', 'teaching us', 'teaches us', 'teaches me'
-        ]
-        
-        # Check for course listing questions - SMART PATTERN MATCHING
-        course_list_keywords = [
-            'list my courses', 'my courses', 'courses', 'list courses', 'show courses',
-            'available courses', 'all courses', 'courses available', 'courses do i need',
-            'courses should i take', 'list', 'show me courses', 'what courses',
-            'courses by', 'my course', 'course list', 'show my courses'
-        ]
-        
-        # Check for materials questions - SMART PATTERN MATCHING  
-        materials_keywords = [
-            'materials', 'material', 'download', 'downloads', 'books', 'resources',
-            'study materials', 'course materials', 'materials for', 'materials do i need',
-            'what do i need', 'study guide', 'textbooks', 'learning materials',
-            'books do i need', 'materials do i need', 'i need materials', 'need materials',
-            'course material', 'this course material', 'materials for this course'
-        ]
-        
         # SUPER AGGRESSIVE PATTERN MATCHING - Check specific patterns FIRST
-        if any(phrase in question_lower for phrase in lecturer_keywords):
+        # (lecturer questions before course listing, materials and generic patterns)
+        if 'lecturer' in matches or lecturer_mentioned:
             analysis['type'] = 'course_specific'
             analysis['response_priority'] = ['course_specific']
             analysis['confidence'] = 0.95
-        elif any(phrase in question_lower for phrase in course_list_keywords):
+        elif 'course_list' in matches:
             analysis['type'] = 'course_general'
             analysis['response_priority'] = ['course_general']
             analysis['confidence'] = 0.95
-        elif any(phrase in question_lower for phrase in materials_keywords):
+        elif 'materials' in matches:
             analysis['type'] = 'materials'
             analysis['response_priority'] = ['materials']
             analysis['confidence'] = 0.95
@@ -870,65 +229,45 @@ class UnifiedIntelligence:
             analysis['response_priority'] = ['course_specific']
             analysis['confidence'] = 0.95
         # Remove duplicate generic patterns - they're already handled above
-        elif any(phrase in question_lower for phrase in ['career', 'job opportunities', 'what can i do', 'future career', 'work after graduation', 'employment', 'career paths', 'job prospects', 'work in tech', 'tech jobs', 'after graduation', 'jobs available', 'jobs can i get', 'degree', 'work with']):
+        elif 'career' in matches:
             analysis['type'] = 'cs_guidance'
             analysis['response_priority'] = ['cs_guidance']
             analysis['confidence'] = 0.90
-        elif any(phrase in question_lower for phrase in ['study materials', 'books', 'resources', 'what do i need', 'materials for', 'study guide', 'textbooks', 'learning materials', 'books do i need', 'materials do i need']):
+        elif 'study_materials' in matches:
             analysis['type'] = 'materials'
             analysis['response_priority'] = ['materials']
             analysis['confidence'] = 0.90
-        elif any(phrase in question_lower for phrase in ['how to study', 'study tips', 'how to pass', 'study strategy', 'academic success', 'excel in', 'study methods', 'learning tips', 'study better', 'struggling with', 'succeed in studies']):
+        elif 'success_tips' in matches:
             analysis['type'] = 'success_tips'
             analysis['response_priority'] = ['success_tips']
             analysis['confidence'] = 0.85
-        elif any(phrase in question_lower for phrase in ['fut', 'university', 'campus', 'facilities', 'admission', 'about fut', 'university info', 'campus life']):
+        elif 'fut_info' in matches:
             analysis['type'] = 'fut_info'
             analysis['response_priority'] = ['fut_info']
             analysis['confidence'] = 0.85
-        elif any(phrase in question_lower for phrase in ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings', 'new here', 'new student']):
-            analysis['type'] = 'conversational'
-            analysis['response_priority'] = ['conversational']
-            analysis['confidence'] = 0.95
-        elif any(phrase in question_lower for phrase in ['thank you', 'thanks', 'appreciate', 'grateful', 'thank you so much']):
+        elif matches.any('greeting', 'thanks'):
             analysis['type'] = 'conversational'
             analysis['response_priority'] = ['conversational']
             analysis['confidence'] = 0.95
-        elif any(phrase in question_lower for phrase in ['pdf', 'download', 'access materials', 'course content', 'lecture notes', 'study materials', 'course files']):
+        elif 'pdf_content' in matches:
             analysis['type'] = 'pdf_content'
             analysis['response_priority'] = ['pdf_content']
             analysis['confidence'] = 0.90
-        elif any(phrase in question_lower for phrase in ['past questions', 'previous exams', 'sample questions', 'practice questions', 'exam examples', 'old questions', 'previous papers']):
+        elif 'past_questions' in matches:
             analysis['type'] = 'past_questions'
             analysis['response_priority'] = ['past_questions']
             analysis['confidence'] = 0.90
-        elif any(phrase in question_lower for phrase in ['help', 'what can you do', 'what do you know', 'capabilities', 'assist', 'support', 'guide me', 'can you help']):
+        elif 'help' in matches:
             analysis['type'] = 'general'
             analysis['response_priority'] = ['general_guidance']
             analysis['confidence'] = 0.80
-        elif any(phrase in question_lower for phrase in ['wetin', 'how far', 'abi', 'dey', 'na', 'sabi', 'how you dey']):
+        elif matches.any('pidgin_routing', 'casual_routing'):
             analysis['type'] = 'adaptive_learning'
             analysis['response_priority'] = ['adaptive_learning']
             analysis['confidence'] = 0.85
-        elif any(phrase in question_lower for phrase in ['yo', 'sup', 'what\'s up', 'cool', 'awesome', 'nice one']):
-            analysis['type'] = 'adaptive_learning'
-            analysis['response_priority'] = ['adaptive_learning']
-            analysis['confidence'] = 0.85
-        elif any(phrase in question_lower for phrase in ['computer science', 'cs', 'programming', 'physics', 'statistics', 'hardware', 'web development']):
+        elif 'cs_subject' in matches:
             # If specific subjects are mentioned, try to route to appropriate course
-            if 'programming' in question_lower or 'python' in question_lower:
-                analysis['type'] = 'course_specific'
-                analysis['response_priority'] = ['course_specific']
-                analysis['confidence'] = 0.90
-            elif 'physics' in question_lower:
-                analysis['type'] = 'course_specific'
-                analysis['response_priority'] = ['course_specific']
-                analysis['confidence'] = 0.90
-            elif 'statistics' in question_lower or 'stats' in question_lower:
-                analysis['type'] = 'course_specific'
-                analysis['response_priority'] = ['course_specific']
-                analysis['confidence'] = 0.90
-            elif 'hardware' in question_lower:
+            if matches.any('subject_programming', 'subject_physics', 'subject_statistics', 'subject_hardware'):
                 analysis['type'] = 'course_specific'
                 analysis['response_priority'] = ['course_specific']
                 analysis['confidence'] = 0.90
@@ -941,62 +280,49 @@ class UnifiedIntelligence:
             analysis['type'] = 'general'
             analysis['response_priority'] = ['general_guidance']
             analysis['confidence'] = 0.70
-        
-        return analysis
     
-    def _assess_complexity(self, question: str) -> str:
+    def _assess_complexity(self, tokens: Tuple[str, ...]) -> str:
         """Assess question complexity"""
-        if len(question.split()) > 15:
+        if len(tokens) > 15:
             return 'high'
-        elif len(question.split()) > 8:
+        elif len(tokens) > 8:
             return 'medium'
         else:
             return 'low'
     
-    def _identify_intent(self, question: str) -> str:
+    def _identify_intent(self, matches: KeywordMatches) -> str:
         """Identify primary intent"""
-        question_lower = question.lower()
-        
-        if any(word in question_lower for word in ['what', 'tell me', 'explain', 'describe']):
+        if 'intent_informational' in matches:
             return 'informational'
-        elif any(word in question_lower for word in ['how', 'can i', 'should i', 'what should']):
+        elif 'intent_guidance' in matches:
             return 'guidance'
-        elif any(word in question_lower for word in ['why', 'because', 'reason']):
+        elif 'intent_explanatory' in matches:
             return 'explanatory'
-        elif any(word in question_lower for word in ['when', 'where', 'which']):
+        elif 'intent_specific' in matches:
             return 'specific'
         else:
             return 'general'
     
-    def _needs_context(self, question: str) -> bool:
-        """Determine if question needs additional context"""
-        context_indicators = ['this', 'that', 'it', 'them', 'here', 'there']
-        return any(indicator in question.lower() for indicator in context_indicators)
-    
-    def _detect_language_style(self, question: str) -> str:
+    def _detect_language_style(self, matches: KeywordMatches) -> str:
         """Detect language style"""
-        question_lower = question.lower()
-        
-        if any(word in question_lower for word in ['wetin', 'how far', 'abi', 'dey', 'na', 'sabi', 'wahala']):
+        if 'style_pidgin' in matches:
             return 'pidgin'
-        elif any(word in question_lower for word in ['yo', 'sup', 'hey', 'what\'s up', 'cool', 'awesome']):
+        elif 'style_casual' in matches:
             return 'casual'
-        elif any(word in question_lower for word in ['could you please', 'may i know', 'kindly provide']):
+        elif 'style_formal' in matches:
             return 'formal'
         else:
             return 'neutral'
     
-    def _infer_user_type(self, question: str) -> str:
+    def _infer_user_type(self, matches: KeywordMatches) -> str:
         """Infer user type based on question"""
-        question_lower = question.lower()
-        
-        if any(word in question_lower for word in ['100l', '100 level', 'first year', 'freshman']):
+        if 'user_new' in matches:
             return 'new_student'
-        elif any(word in question_lower for word in ['400l', '400 level', 'final year', 'graduating']):
+        elif 'user_advanced' in matches:
             return 'advanced_student'
-        elif any(word in question_lower for word in ['struggling', 'difficult', 'hard', 'confused']):
+        elif 'user_struggling' in matches:
             return 'struggling_student'
-        elif any(word in question_lower for word in ['career', 'job', 'industry', 'work']):
+        elif 'user_career' in matches:
             return 'career_focused'
         else:
             return 'general_student'
@@ -1004,8 +330,11 @@ class UnifiedIntelligence:
     def get_unified_response(self, question: str, context: str = "") -> Dict:
         """Get unified intelligent response using all systems with conversation context"""
         
+        # Normalize once; every strategy below reads these features
+        features = self.extract_features(question)
+        
         # Analyze the question with conversation context
-        analysis = self.analyze_question_intelligence(question, context)
+        analysis = self.analyze_question_intelligence(question, context, features)
         
         # Add conversation context awareness
         if self.conversation_memory:
@@ -1013,7 +342,7 @@ class UnifiedIntelligence:
             analysis['conversation_context'] = recent_context
             
             # Check if this is a follow-up question
-            if self._is_follow_up_question(question, recent_context):
+            if self._is_follow_up_question(features, recent_context):
                 analysis['type'] = 'follow_up'
                 analysis['response_priority'] = ['contextual_response']
                 analysis['confidence'] = 0.90
@@ -1021,12 +350,13 @@ class UnifiedIntelligence:
         # Store conversation context
         self.conversation_memory.append({
             'question': question,
+            'features': features,
             'analysis': analysis,
             'timestamp': datetime.now().isoformat()
         })
         
         # Generate response based on priority strategy
-        response = self._generate_unified_response(question, analysis, context)
+        response = self._generate_unified_response(features, analysis, context)
         
         # Store response for learning
         self.response_history.append({
@@ -1042,36 +372,26 @@ class UnifiedIntelligence:
         
         return response
     
-    def _is_follow_up_question(self, question: str, recent_context: List[Dict]) -> bool:
+    def _is_follow_up_question(self, features: QuestionFeatures, recent_context: List[Dict]) -> bool:
         """Check if this is a follow-up question based on conversation context"""
-        question_lower = question.lower()
+        # A question naming a lecturer says who it is about
+        if features.lecturers:
+            return False
         
-        # Enhanced follow-up indicators
-        follow_up_indicators = [
-            'what about', 'how about', 'and', 'also', 'additionally', 'furthermore',
-            'can you tell me more', 'more details', 'explain more', 'elaborate',
-            'what else', 'anything else', 'other', 'different', 'alternative',
-            'who are', 'who is', 'what are', 'what is', 'tell me about',
-            'that course', 'this course', 'the course', 'it', 'them', 'they',
-            'download', 'materials', 'lecturer', 'teacher', 'instructor',
-            'more info', 'more information', 'details', 'explain'
-        ]
-        
-        # Check for follow-up patterns
-        if any(indicator in question_lower for indicator in follow_up_indicators):
+        # Check for follow-up patterns (indicators live in keyword_matcher)
+        if 'follow_up' in features.matches:
             return True
         
         # Check if question references previous topics
         for interaction in recent_context:
-            prev_question = interaction['question'].lower()
             # Check for common words between current and previous questions
-            common_words = set(question_lower.split()) & set(prev_question.split())
+            common_words = features.token_set & interaction['features'].token_set
             if len(common_words) >= 2:  # At least 2 common words
                 return True
         
         return False
     
-    def _get_contextual_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_contextual_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get contextual response based on conversation history"""
         if not self.conversation_memory:
             return None
@@ -1080,33 +400,29 @@ class UnifiedIntelligence:
         
         # Check if this is a follow-up about a specific course
         for interaction in recent_context:
-            prev_question = interaction['question'].lower()
-            prev_analysis = interaction.get('analysis', {})
+            prev_features = interaction['features']
+            prev_question = prev_features.text
             
             # If previous question was about a course, and current is a follow-up
-            if 'course' in prev_question and any(word in question.lower() for word in ['lecturer', 'materials', 'download', 'info', 'details']):
+            if 'course' in prev_question and features.has('lecturer', 'materials', 'download', 'info', 'details'):
                 # Extract course from previous question
-                course_code = None
-                for level, courses in self.course_database.items():
-                    for code, info in courses.items():
-                        if code.lower() in prev_question:
-                            course_code = code
-                            break
+                mentioned = self.knowledge.course_index.entries(prev_features.course_codes)
                 
-                if course_code:
+                if mentioned:
+                    course_code, level, info = mentioned[0]
                     # Generate contextual response
                     response = f"**Following up on {course_code}:**\n\n"
                     
-                    if 'lecturer' in question.lower() or 'teacher' in question.lower():
-                        if 'lecturers' in self.course_database.get(level, {}).get(course_code, {}):
-                            lecturers = self.course_database[level][course_code]['lecturers']
+                    if features.has('lecturer', 'teacher'):
+                        if 'lecturers' in info:
+                            lecturers = info['lecturers']
                             response += f"**👨‍🏫 Lecturers for {course_code}:**\n"
                             for lecturer in lecturers:
                                 response += f"• {lecturer}\n"
                         else:
                             response += f"**👨‍🏫 Lecturers for {course_code}:** To be announced\n"
                     
-                    if 'materials' in question.lower() or 'download' in question.lower():
+                    if features.has('materials', 'download'):
                         response += f"\n**📥 Materials for {course_code}:**\n"
                         response += f"• **Syllabus**: http://localhost:8000/download/{course_code}\n"
                         response += f"• **Lecture Notes**: http://localhost:8000/download/{course_code}\n"
@@ -1124,236 +440,128 @@ class UnifiedIntelligence:
         
         return None
     
-    def _generate_unified_response(self, question: str, analysis: Dict, context: str) -> Dict:
+    def _generate_unified_response(self, features: QuestionFeatures, analysis: Dict, context: str) -> Dict:
         """Generate unified response using multiple systems with enhanced conversation context"""
         
         if analysis.get('type') == 'boundary':
-            return self._handle_boundary_question(question)
+            return self._handle_boundary_question(features.raw)
         
         # Check for contextual responses first (follow-up questions)
         if analysis.get('type') == 'follow_up':
-            contextual_response = self._get_contextual_response(question, analysis)
+            contextual_response = self._get_contextual_response(features, analysis)
             if contextual_response:
                 return contextual_response
         
         # Try each response strategy in priority order
         for strategy in analysis['response_priority']:
-            response = self._try_response_strategy(question, strategy, analysis, context)
+            response = self._try_response_strategy(features, strategy, analysis, context)
             if response and len(response.get('answer', '')) > 50:
                 return response
         
         # Fallback to general response
-        return self._generate_general_response(question, analysis)
+        return self._generate_general_response(features, analysis)
     
-    def _try_response_strategy(self, question: str, strategy: str, analysis: Dict, context: str) -> Optional[Dict]:
+    def _try_response_strategy(self, features: QuestionFeatures, strategy: str, analysis: Dict, context: str) -> Optional[Dict]:
         """Try a specific response strategy"""
         
         if strategy == 'course_specific':
-            return self._get_course_specific_response(question, analysis)
+            return self._get_course_specific_response(features, analysis)
         elif strategy == 'course_general':
-            return self._get_course_general_response(question, analysis)
+            return self._get_course_general_response(features, analysis)
         elif strategy == 'cs_guidance':
-            return self._get_cs_guidance_response(question, analysis)
+            return self._get_cs_guidance_response(features, analysis)
         elif strategy == 'materials':
-            return self._get_materials_response(question, analysis)
+            return self._get_materials_response(features, analysis)
         elif strategy == 'success_tips':
-            return self._get_success_tips_response(question, analysis)
+            return self._get_success_tips_response(features, analysis)
         elif strategy == 'fut_info':
-            return self._get_fut_info_response(question, analysis)
+            return self._get_fut_info_response(features, analysis)
         elif strategy == 'conversational':
-            return self._get_conversational_response(question, analysis)
+            return self._get_conversational_response(features, analysis)
         elif strategy == 'adaptive_learning':
-            return self._get_adaptive_response(question, analysis)
+            return self._get_adaptive_response(features, analysis)
         elif strategy == 'general_guidance':
-            return self._get_general_guidance_response(question, analysis)
+            return self._get_general_guidance_response(features, analysis)
         elif strategy == 'pdf_content':
-            return self._get_pdf_content_response(question, analysis)
+            return self._get_pdf_content_response(features, analysis)
         elif strategy == 'past_questions':
-            return self._get_past_questions_response(question, analysis)
+            return self._get_past_questions_response(features, analysis)
         
         return None
     
-    def _get_course_specific_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_course_specific_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get course-specific response with detailed information"""
-        question_lower = question.lower()
+        question_lower = features.text
         
-        # Check for specific course codes
-        for level, courses in self.course_database.items():
-            for code, info in courses.items():
-                if code.lower() in question_lower:
-                    response = f"# 📚 {code} - {info['name']}\n\n"
-                    
-                    # Basic course information
-                    response += f"**📋 Course Details:**\n"
-                    response += f"• **Level:** {level.replace('_', ' ').title()}\n"
-                    response += f"• **Credits:** {info['credits']}\n"
-                    response += f"• **Prerequisites:** {info['prerequisites']}\n\n"
-                    
-                    # Lecturer information
-                    if 'lecturers' in info and info['lecturers']:
-                        response += f"**👨‍🏫 Lecturers:**\n"
-                        for lecturer in info['lecturers']:
-                            response += f"• **{lecturer}**\n"
-                        response += "\n"
-                    else:
-                        response += f"**👨‍🏫 Lecturers:** To be announced\n\n"
-                    
-                    # Course description
-                    response += f"**📖 Course Description:**\n"
-                    response += f"{info['description']}\n\n"
-                    
-                    # Materials needed
-                    response += f"**📚 Materials Needed:**\n"
-                    for material in info['materials']:
-                        response += f"• {material}\n"
-                    response += "\n"
-                    
-                    # Success tips
-                    response += f"**💡 Success Tips:**\n"
-                    for tip in info['success_tips']:
-                        response += f"• {tip}\n"
-                    response += "\n"
-                    
-                    # Assessment and practical information
-                    response += f"**📊 Assessment:** {info['assessment']}\n\n"
-                    response += f"**👨‍🏫 Office Hours:** {info['lecturer_office_hours']}\n\n"
-                    response += f"**🔬 Practical Sessions:** {info['practical_sessions']}\n\n"
-                    
-                    # Interactive options for students
-                    response += "---\n\n"
-                    response += "**🎯 Would you like to know more about this course?**\n\n"
-                    response += "**📥 Available Materials:**\n"
-                    response += "• Course syllabus and outline\n"
-                    response += "• Lecture notes and presentations\n"
-                    response += "• Assignment guidelines\n"
-                    response += "• Past exam questions\n"
-                    response += "• Recommended textbooks and resources\n\n"
-                    
-                    response += "**💬 Ask me about:**\n"
-                    response += "• Specific topics in this course\n"
-                    response += "• Study strategies for this course\n"
-                    response += "• Assignment help and guidance\n"
-                    response += "• Exam preparation tips\n"
-                    response += "• Download course materials\n\n"
-                    
-                    response += "**Just ask: 'Can I download materials for {code}?' or 'What topics are covered in {code}?'**\n"
-                    
-                    return {
-                        'answer': response,
-                        'confidence': 0.95,
-                        'strategy_used': 'course_specific',
-                        'source': 'course_database'
-                    }
+        # Check for specific course codes (the first catalogued one; answers are pre-rendered per course)
+        entries = self.knowledge.course_index.entries(features.course_codes)
+        if entries:
+            code, level, info = entries[0]
+            return self.rendered.get('course_specific', code, lambda: self._render_course_detail(code, level, info))
         
         # Handle lecturer-specific questions
         if any(word in question_lower for word in ['lecturer', 'teacher', 'instructor', 'teaches', 'who teaches']):
-            for level, courses in self.course_database.items():
-                for code, info in courses.items():
-                    if code.lower() in question_lower:
-                        response = f"**👨‍🏫 Lecturers for {code} - {info['name']}:**\n\n"
-                        
-                        if 'lecturers' in info and info['lecturers']:
-                            for i, lecturer in enumerate(info['lecturers'], 1):
-                                response += f"**{i}. {lecturer}**\n"
-                        else:
-                            response += "Lecturers to be announced\n"
-                        
-                        response += f"\n**📞 Office Hours:** {info['lecturer_office_hours']}\n"
-                        response += f"**🔬 Practical Sessions:** {info['practical_sessions']}\n\n"
-                        
-                        response += "**💬 Need more information about this course?**\n"
-                        response += "Ask me about course materials, topics, or study tips!\n"
-                        
-                        return {
-                            'answer': response,
-                            'confidence': 0.95,
-                            'strategy_used': 'course_specific',
-                            'source': 'course_database'
-                        }
+            for code, level, info in self.knowledge.course_index.entries(features.course_codes):
+                response = f"**👨‍🏫 Lecturers for {code} - {info['name']}:**\n\n"
+                
+                if 'lecturers' in info and info['lecturers']:
+                    for i, lecturer in enumerate(info['lecturers'], 1):
+                        response += f"**{i}. {lecturer}**\n"
+                else:
+                    response += "Lecturers to be announced\n"
+                
+                response += f"\n**📞 Office Hours:** {info['lecturer_office_hours']}\n"
+                response += f"**🔬 Practical Sessions:** {info['practical_sessions']}\n\n"
+                
+                response += "**💬 Need more information about this course?**\n"
+                response += "Ask me about course materials, topics, or study tips!\n"
+                
+                return {
+                    'answer': response,
+                    'confidence': 0.95,
+                    'strategy_used': 'course_specific',
+                    'source': 'course_database'
+                }
+        
+        # Questions naming a lecturer rather than a course
+        if features.lecturers:
+            return self._get_lecturer_courses_response(features)
         
         return None
     
-    def _get_course_general_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_lecturer_courses_response(self, features: QuestionFeatures) -> Dict:
+        """Courses taught by the lecturers named in the question"""
+        response = "# 👨‍🏫 Lecturers and Their Courses\n\n"
+        for lecturer in features.lecturers:
+            response += f"## {lecturer.name}\n\n"
+            for code, course_name, role in lecturer.courses:
+                response += f"• **{code}** - {course_name} ({role})\n"
+            response += "\n"
+        
+        if any(lecturer.distance for lecturer in features.lecturers):
+            response += "*These are the closest matches to the name you asked about - spellings in our records may differ slightly.*\n\n"
+        
+        response += "**💬 Ask me about any of these courses for materials, topics or study tips!**\n"
+        
+        return {
+            'answer': response,
+            'confidence': 0.95 if features.lecturers[0].distance == 0 else 0.85,
+            'strategy_used': 'course_specific',
+            'source': 'lecturer_index'
+        }
+    
+    def _get_course_general_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get general course information response"""
-        question_lower = question.lower()
+        question_lower = features.text
         
         if 'course' in question_lower:
-            response = "# 📚 Computer Science Courses at FUT\n\n"
-            
-            # Dynamically generate course list from database
-            response += "## 🎯 100 LEVEL COURSES\n\n"
-            for course_code, course_info in self.course_database['100_level'].items():
-                response += f"**{course_code}**: {course_info['name']}\n\n"
-            
-            response += "## 🎯 200 LEVEL COURSES\n\n"
-            response += "**COS201**: Data Structures and Algorithms\n\n"
-            response += "**COS202**: Object-Oriented Programming (Java/C++)\n\n"
-            response += "**CPT221**: Digital Electronics\n\n"
-            response += "**CPT222**: Assembly Language Programming\n\n"
-            
-            response += "\n\n## 📖 DETAILED COURSE INFORMATION\n\n"
-            for course_code, course_info in self.course_database['100_level'].items():
-                response += f"### {course_code} - {course_info['name']}\n\n"
-                response += f"**📋 Course Details:**\n\n"
-                response += f"**Credits:** {course_info['credits']}\n\n"
-                response += f"**Prerequisites:** {course_info['prerequisites']}\n\n"
-                if 'lecturers' in course_info:
-                    response += f"**Lecturers:** {', '.join(course_info['lecturers'])}\n\n"
-                else:
-                    response += f"**Lecturers:** To be announced\n\n"
-                response += f"**Description:** {course_info['description']}\n\n"
-                response += "---\n\n"
-            
-            response += "\n\n## 💡 RECOMMENDED COURSE PROGRESSION\n\n"
-            
-            response += "### 🎯 First Semester (100 Level)\n\n"
-            response += "**COS101** - Start with computer science fundamentals\n\n"
-            response += "**CST111** - Develop communication skills\n\n"
-            response += "**GST112** - Understand Nigerian culture\n\n"
-            response += "**PHY101** - Master physics concepts\n\n"
-            response += "**STA111** - Learn statistical methods\n\n"
-            
-            response += "### 🎯 Second Semester (100 Level)\n\n"
-            response += "**COS102** - Build programming skills with Python\n\n"
-            response += "**PHY102** - Advanced physics concepts\n\n"
-            response += "**CPT121** - Learn computer hardware basics\n\n"
-            response += "**FTM-CPT111** - Master probability theory\n\n"
-            response += "**FTM-CPT112** - Web development skills\n\n"
-            
-            response += "## 📚 TYPICAL SEMESTER STRUCTURE\n\n"
-            
-            response += "### 📖 Academic Load\n\n"
-            response += "**5-6 courses** per semester\n\n"
-            response += "**15-18 credit hours** total\n\n"
-            response += "**Mix of theory and practical** courses\n\n"
-            response += "**Continuous assessment** and examinations\n\n"
-            
-            response += "### ⏰ Study Schedule\n\n"
-            response += "**Lectures:** 3-4 hours per day\n\n"
-            response += "**Practical sessions:** 2-3 hours per week\n\n"
-            response += "**Study time:** 2-3 hours daily\n\n"
-            response += "**Project work:** Weekly assignments\n\n"
-            
-            response += "### 🎯 Success Tips\n\n"
-            response += "**Attend all lectures** and practical sessions\n\n"
-            response += "**Complete assignments** on time\n\n"
-            response += "**Form study groups** with classmates\n\n"
-            response += "**Seek help** from lecturers when needed\n\n"
-            response += "**Practice programming** regularly\n\n"
-            response += "**Stay updated** with course materials\n"
-            
-            return {
-                'answer': response,
-                'confidence': 0.90,
-                'strategy_used': 'course_general',
-                'source': 'course_overview'
-            }
+            return self.rendered.get('course_general', None, self._render_course_overview)
         
         return None
     
-    def _get_cs_guidance_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_cs_guidance_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get CS guidance response"""
-        question_lower = question.lower()
+        question_lower = features.text
         
         if 'career' in question_lower or 'job' in question_lower:
             response = "🚀 **Career Opportunities in Computer Science**\n\n"
@@ -1422,9 +630,9 @@ class UnifiedIntelligence:
         
         return None
     
-    def _get_materials_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_materials_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get materials and resources response"""
-        question_lower = question.lower()
+        question_lower = features.text
         
         if 'software' in question_lower:
             response = "🛠️ **Essential Software for CS Students**\n\n"
@@ -1575,9 +783,9 @@ class UnifiedIntelligence:
         
         return None
     
-    def _get_success_tips_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_success_tips_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get success tips response"""
-        question_lower = question.lower()
+        question_lower = features.text
         
         if 'success' in question_lower or 'pass' in question_lower or 'excel' in question_lower:
             response = "🎯 **Success Strategies for CS Students**\n\n"
@@ -1633,14 +841,14 @@ class UnifiedIntelligence:
         
         return None
     
-    def _get_fut_info_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_fut_info_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get FUT information response"""
-        question_lower = question.lower()
+        question_lower = features.text
         
         if 'admission' in question_lower:
             response = "🎓 **FUT Admission Requirements**\n\n"
             
-            admission = self.knowledge_base['admission_requirements']
+            admission = self.knowledge.university['admission_requirements']
             response += "**📝 BASIC REQUIREMENTS:**\n"
             response += f"• UTME Score: {admission['utme']}\n"
             response += f"• O'Level: {admission['olevel']}\n"
@@ -1676,7 +884,7 @@ class UnifiedIntelligence:
         elif 'facilities' in question_lower:
             response = "🏢 **FUT Campus Facilities**\n\n"
             
-            fut_info = self.knowledge_base['fut_general']
+            fut_info = self.knowledge.university['fut_general']
             response += "**🏛️ ACADEMIC FACILITIES:**\n"
             response += "• Modern lecture theaters with audio-visual equipment\n"
             response += "• Well-equipped computer laboratories\n"
@@ -1684,7 +892,7 @@ class UnifiedIntelligence:
             response += "• Central library with e-resources\n"
             response += "• Language laboratory\n\n"
             
-            sict = self.knowledge_base['sict_school']
+            sict = self.knowledge.university['sict_school']
             response += "**💻 SICT SPECIFIC FACILITIES:**\n"
             for facility in sict['facilities']:
                 response += f"• {facility}\n"
@@ -1714,7 +922,7 @@ class UnifiedIntelligence:
         elif 'fut' in question_lower or 'university' in question_lower:
             response = "🏛️ **About Federal University of Technology, Minna**\n\n"
             
-            fut_info = self.knowledge_base['fut_general']
+            fut_info = self.knowledge.university['fut_general']
             response += "**📖 UNIVERSITY OVERVIEW:**\n"
             response += f"• **Established**: {fut_info['established']}\n"
             response += f"• **Location**: {fut_info['location']}\n"
@@ -1750,9 +958,9 @@ class UnifiedIntelligence:
         
         return None
     
-    def _get_conversational_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_conversational_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get conversational response"""
-        question_lower = question.lower()
+        question_lower = features.text
         
         # Check for greetings
         if any(pattern in question_lower for pattern in self.conversational_system['greetings']['patterns']):
@@ -1822,7 +1030,7 @@ class UnifiedIntelligence:
         
         return None
     
-    def _get_adaptive_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_adaptive_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get adaptive response based on language style and user type"""
         language_style = analysis.get('language_style', 'neutral')
         user_type = analysis.get('user_type', 'general_student')
@@ -1846,7 +1054,7 @@ class UnifiedIntelligence:
             'source': 'adaptive_system'
         }
     
-    def _get_general_guidance_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_general_guidance_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get general guidance response"""
         response = "🤖 **FUT CS Assistant - How Can I Help?**\n\n"
         
@@ -1907,68 +1115,180 @@ class UnifiedIntelligence:
             'source': 'boundary_system'
         }
     
-    def _get_pdf_content_response(self, question: str, analysis: Dict) -> Optional[Dict]:
+    def _get_pdf_content_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
         """Get PDF content access response"""
-        question_lower = question.lower()
+        question_lower = features.text
         
         # Check for specific course PDFs
-        for course_code, pdf_info in self.pdf_database.items():
-            if course_code.lower() in question_lower:
-                response = f"📚 **{course_code} - {pdf_info['title']}**\n\n"
-                
-                response += "**📖 AVAILABLE PDF CONTENT:**\n"
-                if isinstance(pdf_info['files'], list):
-                    for file in pdf_info['files']:
-                        response += f"• {file}\n"
-                else:
-                    response += f"• {pdf_info['file']}\n"
-                
-                response += "\n**📋 TOPICS COVERED:**\n"
-                for topic in pdf_info['topics']:
-                    response += f"• {topic}\n"
-                
-                if 'key_concepts' in pdf_info:
-                    response += "\n**🎯 KEY CONCEPTS:**\n"
-                    for concept in pdf_info['key_concepts']:
-                        response += f"• {concept}\n"
-                
-                if 'practice_problems' in pdf_info:
-                    response += "\n**💡 PRACTICE PROBLEMS:**\n"
-                    for problem in pdf_info['practice_problems']:
-                        response += f"• {problem}\n"
-                
-                        response += "\n**📥 DOWNLOAD OPTIONS:**\n"
-                        response += f"• **Course Syllabus** - [Download {course_code} Syllabus](http://localhost:8000/download/{course_code})\n"
-                        response += f"• **Lecture Notes** - [Download {course_code} Notes](http://localhost:8000/download/{course_code})\n"
-                        response += f"• **Past Questions** - [Download {course_code} Past Questions](http://localhost:8000/download/{course_code})\n"
-                        response += f"• **Study Guides** - [Download {course_code} Study Guide](http://localhost:8000/download/{course_code})\n\n"
-                        
-                        response += "**🚀 READY TO DOWNLOAD?**\n"
-                        response += f"**CLICK ANY LINK ABOVE TO DOWNLOAD MATERIALS FOR {course_code}**\n\n"
-                        response += f"**🔗 DIRECT DOWNLOAD LINKS:**\n"
-                        response += f"• **Syllabus**: http://localhost:8000/download/{course_code}\n"
-                        response += f"• **Lecture Notes**: http://localhost:8000/download/{course_code}\n"
-                        response += f"• **Past Questions**: http://localhost:8000/download/{course_code}\n"
-                        response += f"• **Study Guide**: http://localhost:8000/download/{course_code}\n\n"
-                        response += f"**📁 View All Materials**: http://localhost:8000/materials/{course_code}\n\n"
-                
-                response += "**💡 Study Tips:**\n"
-                response += "• Download and review materials regularly\n"
-                response += "• Practice with past questions\n"
-                response += "• Use study guides for exam preparation\n"
-                response += "• Combine with lecture notes for comprehensive understanding\n"
-                
-                return {
-                    'answer': response,
-                    'confidence': 0.90,
-                    'strategy_used': 'pdf_content',
-                    'source': 'pdf_database'
-                }
+        for course_code in features.course_codes:
+            pdf_info = self.knowledge.course_pdf(course_code)
+            if pdf_info:
+                return self.rendered.get('pdf_content', course_code,
+                                         lambda: self._render_course_pdf(course_code, pdf_info))
         
         # General PDF access information
+        return self.rendered.get('pdf_content', None, self._render_pdf_guide)
+    
+    def _get_past_questions_response(self, features: QuestionFeatures, analysis: Dict) -> Optional[Dict]:
+        """Get past questions and responses"""
+        question_lower = features.text
+        
+        # Check for specific course past questions
+        for course_code in features.course_codes:
+            questions = self.knowledge.past_questions.get(course_code)
+            if questions:
+                return self.rendered.get('past_questions', course_code,
+                                         lambda: self._render_past_questions(course_code, questions))
+        
+        # General past questions information
+        return self.rendered.get('past_questions', None, self._render_past_questions_guide)
+    
+    # Static answers: rendered once per (strategy, course) and served from self.rendered
+    
+    def prerender_responses(self) -> int:
+        """Render every static answer now (course pages, PDFs, past questions, overviews); returns the count"""
+        renders = [('course_general', None, self._render_course_overview),
+                   ('pdf_content', None, self._render_pdf_guide),
+                   ('past_questions', None, self._render_past_questions_guide)]
+        for code, (level, info) in self.knowledge.course_index.by_code.items():
+            renders.append(('course_specific', code, lambda code=code, level=level, info=info:
+                            self._render_course_detail(code, level, info)))
+        for code, pdf_info in self.knowledge.course_pdfs.items():
+            renders.append(('pdf_content', code, lambda code=code, pdf_info=pdf_info: self._render_course_pdf(code, pdf_info)))
+        for code, questions in self.knowledge.past_questions.items():
+            if not extract_course_codes(code):
+                continue  # 'general_cs' is not asked for by course code
+            renders.append(('past_questions', code, lambda code=code, questions=questions:
+                            self._render_past_questions(code, questions)))
+        return self.rendered.warm(renders)
+    
+    def _render_course_detail(self, code: str, level: str, info: Dict) -> Dict:
+        """Full course page for a catalogued course"""
+        response = f"# 📚 {code} - {info['name']}\n\n"
+        
+        # Basic course information
+        response += f"**📋 Course Details:**\n"
+        response += f"• **Level:** {level.replace('_', ' ').title()}\n"
+        response += f"• **Credits:** {info['credits']}\n"
+        response += f"• **Prerequisites:** {info['prerequisites']}\n\n"
+        
+        # Lecturer information
+        if 'lecturers' in info and info['lecturers']:
+            response += f"**👨‍🏫 Lecturers:**\n"
+            for lecturer in info['lecturers']:
+                response += f"• **{lecturer}**\n"
+            response += "\n"
+        else:
+            response += f"**👨‍🏫 Lecturers:** To be announced\n\n"
+        
+        # Course description
+        response += f"**📖 Course Description:**\n"
+        response += f"{info['description']}\n\n"
+        
+        # Materials needed
+        response += f"**📚 Materials Needed:**\n"
+        for material in info['materials']:
+            response += f"• {material}\n"
+        response += "\n"
+        
+        # Success tips
+        response += f"**💡 Success Tips:**\n"
+        for tip in info['success_tips']:
+            response += f"• {tip}\n"
+        response += "\n"
+        
+        # Assessment and practical information (200 level entries don't list them)
+        if 'assessment' in info:
+            response += f"**📊 Assessment:** {info['assessment']}\n\n"
+        if 'lecturer_office_hours' in info:
+            response += f"**👨‍🏫 Office Hours:** {info['lecturer_office_hours']}\n\n"
+        if 'practical_sessions' in info:
+            response += f"**🔬 Practical Sessions:** {info['practical_sessions']}\n\n"
+        
+        # Interactive options for students
+        response += "---\n\n"
+        response += "**🎯 Would you like to know more about this course?**\n\n"
+        response += "**📥 Available Materials:**\n"
+        response += "• Course syllabus and outline\n"
+        response += "• Lecture notes and presentations\n"
+        response += "• Assignment guidelines\n"
+        response += "• Past exam questions\n"
+        response += "• Recommended textbooks and resources\n\n"
+        
+        response += "**💬 Ask me about:**\n"
+        response += "• Specific topics in this course\n"
+        response += "• Study strategies for this course\n"
+        response += "• Assignment help and guidance\n"
+        response += "• Exam preparation tips\n"
+        response += "• Download course materials\n\n"
+        
+        response += "**Just ask: 'Can I download materials for {code}?' or 'What topics are covered in {code}?'**\n"
+        
+        return {
+            'answer': response,
+            'confidence': 0.95,
+            'strategy_used': 'course_specific',
+            'source': 'course_database'
+        }
+    
+    def _render_course_pdf(self, course_code: str, pdf_info: Dict) -> Dict:
+        """PDF materials, topics and download links for a course"""
+        response = f"📚 **{course_code} - {pdf_info['title']}**\n\n"
+        
+        response += "**📖 AVAILABLE PDF CONTENT:**\n"
+        if 'files' in pdf_info:
+            for file in pdf_info['files']:
+                response += f"• {file}\n"
+        else:
+            response += f"• {pdf_info['file']}\n"
+        
+        response += "\n**📋 TOPICS COVERED:**\n"
+        for topic in pdf_info['topics']:
+            response += f"• {topic}\n"
+        
+        if 'key_concepts' in pdf_info:
+            response += "\n**🎯 KEY CONCEPTS:**\n"
+            for concept in pdf_info['key_concepts']:
+                response += f"• {concept}\n"
+        
+        if 'practice_problems' in pdf_info:
+            response += "\n**💡 PRACTICE PROBLEMS:**\n"
+            for problem in pdf_info['practice_problems']:
+                response += f"• {problem}\n"
+        
+                response += "\n**📥 DOWNLOAD OPTIONS:**\n"
+                response += f"• **Course Syllabus** - [Download {course_code} Syllabus](http://localhost:8000/download/{course_code})\n"
+                response += f"• **Lecture Notes** - [Download {course_code} Notes](http://localhost:8000/download/{course_code})\n"
+                response += f"• **Past Questions** - [Download {course_code} Past Questions](http://localhost:8000/download/{course_code})\n"
+                response += f"• **Study Guides** - [Download {course_code} Study Guide](http://localhost:8000/download/{course_code})\n\n"
+        
+                response += "**🚀 READY TO DOWNLOAD?**\n"
+                response += f"**CLICK ANY LINK ABOVE TO DOWNLOAD MATERIALS FOR {course_code}**\n\n"
+                response += f"**🔗 DIRECT DOWNLOAD LINKS:**\n"
+                response += f"• **Syllabus**: http://localhost:8000/download/{course_code}\n"
+                response += f"• **Lecture Notes**: http://localhost:8000/download/{course_code}\n"
+                response += f"• **Past Questions**: http://localhost:8000/download/{course_code}\n"
+                response += f"• **Study Guide**: http://localhost:8000/download/{course_code}\n\n"
+                response += f"**📁 View All Materials**: http://localhost:8000/materials/{course_code}\n\n"
+        
+        response += "**💡 Study Tips:**\n"
+        response += "• Download and review materials regularly\n"
+        response += "• Practice with past questions\n"
+        response += "• Use study guides for exam preparation\n"
+        response += "• Combine with lecture notes for comprehensive understanding\n"
+        
+        return {
+            'answer': response,
+            'confidence': 0.90,
+            'strategy_used': 'pdf_content',
+            'source': 'pdf_database'
+        }
+    
+    def _render_pdf_guide(self) -> Dict:
+        """How to access the course PDFs"""
         response = "📚 **PDF Content Access Guide**\n\n"
         response += "**📖 AVAILABLE COURSE MATERIALS:**\n"
-        for course_code, pdf_info in self.pdf_database.items():
+        for course_code, pdf_info in self.knowledge.course_pdfs.items():
             response += f"• **{course_code}**: {pdf_info['title']}\n"
         
         response += "\n**📁 HOW TO ACCESS PDF CONTENT:**\n"
@@ -1990,38 +1310,34 @@ class UnifiedIntelligence:
             'source': 'pdf_access_guide'
         }
     
-    def _get_past_questions_response(self, question: str, analysis: Dict) -> Optional[Dict]:
-        """Get past questions and responses"""
-        question_lower = question.lower()
+    def _render_past_questions(self, course_code: str, questions) -> Dict:
+        """Past questions with answers for a course"""
+        response = f"📝 **{course_code} Past Questions & Answers**\n\n"
         
-        # Check for specific course past questions
-        for course_code, questions in self.past_questions.items():
-            if course_code.lower() in question_lower:
-                response = f"📝 **{course_code} Past Questions & Answers**\n\n"
-                
-                for i, qa in enumerate(questions, 1):
-                    response += f"**{i}. {qa['question']}**\n"
-                    response += f"   *Difficulty: {qa['difficulty']} | Topic: {qa['topic']}*\n\n"
-                    response += f"   **Answer:** {qa['answer']}\n\n"
-                    response += "   " + "─" * 50 + "\n\n"
-                
-                response += "**💡 STUDY TIPS:**\n"
-                response += "• Practice these questions regularly\n"
-                response += "• Understand the concepts, don't just memorize\n"
-                response += "• Create your own variations of these questions\n"
-                response += "• Use these as exam preparation materials\n"
-                
-                return {
-                    'answer': response,
-                    'confidence': 0.90,
-                    'strategy_used': 'past_questions',
-                    'source': 'past_questions_database'
-                }
+        for i, qa in enumerate(questions, 1):
+            response += f"**{i}. {qa['question']}**\n"
+            response += f"   *Difficulty: {qa['difficulty']} | Topic: {qa['topic']}*\n\n"
+            response += f"   **Answer:** {qa['answer']}\n\n"
+            response += "   " + "─" * 50 + "\n\n"
         
-        # General past questions information
+        response += "**💡 STUDY TIPS:**\n"
+        response += "• Practice these questions regularly\n"
+        response += "• Understand the concepts, don't just memorize\n"
+        response += "• Create your own variations of these questions\n"
+        response += "• Use these as exam preparation materials\n"
+        
+        return {
+            'answer': response,
+            'confidence': 0.90,
+            'strategy_used': 'past_questions',
+            'source': 'past_questions_database'
+        }
+    
+    def _render_past_questions_guide(self) -> Dict:
+        """Which courses have past questions and how to ask for them"""
         response = "📝 **Past Questions & Answers Database**\n\n"
         response += "**📚 AVAILABLE COURSES:**\n"
-        for course_code, questions in self.past_questions.items():
+        for course_code, questions in self.knowledge.past_questions.items():
             response += f"• **{course_code}**: {len(questions)} questions available\n"
         
         response += "\n**🎯 HOW TO ACCESS PAST QUESTIONS:**\n"
@@ -2043,9 +1359,80 @@ class UnifiedIntelligence:
             'source': 'past_questions_guide'
         }
     
-    def _generate_general_response(self, question: str, analysis: Dict) -> Dict:
+    def _render_course_overview(self) -> Dict:
+        """Course list, course details and study structure for the whole programme"""
+        response = "# 📚 Computer Science Courses at FUT\n\n"
+        
+        # Dynamically generate course list from database
+        response += "## 🎯 100 LEVEL COURSES\n\n"
+        for course_code, course_info in self.knowledge.level_courses('100_level').items():
+            response += f"**{course_code}**: {course_info['name']}\n\n"
+        
+        response += "## 🎯 200 LEVEL COURSES\n\n"
+        for course_code, course_name in self.knowledge.catalogue()['200_level'].items():
+            response += f"**{course_code}**: {course_name}\n\n"
+        
+        response += "\n\n## 📖 DETAILED COURSE INFORMATION\n\n"
+        for course_code, course_info in self.knowledge.level_courses('100_level').items():
+            response += f"### {course_code} - {course_info['name']}\n\n"
+            response += f"**📋 Course Details:**\n\n"
+            response += f"**Credits:** {course_info['credits']}\n\n"
+            response += f"**Prerequisites:** {course_info['prerequisites']}\n\n"
+            if 'lecturers' in course_info:
+                response += f"**Lecturers:** {', '.join(course_info['lecturers'])}\n\n"
+            else:
+                response += f"**Lecturers:** To be announced\n\n"
+            response += f"**Description:** {course_info['description']}\n\n"
+            response += "---\n\n"
+        
+        response += "\n\n## 💡 RECOMMENDED COURSE PROGRESSION\n\n"
+        
+        response += "### 🎯 First Semester (100 Level)\n\n"
+        response += "**COS101** - Start with computer science fundamentals\n\n"
+        response += "**CST111** - Develop communication skills\n\n"
+        response += "**GST112** - Understand Nigerian culture\n\n"
+        response += "**PHY101** - Master physics concepts\n\n"
+        response += "**STA111** - Learn statistical methods\n\n"
+        
+        response += "### 🎯 Second Semester (100 Level)\n\n"
+        response += "**COS102** - Build programming skills with Python\n\n"
+        response += "**PHY102** - Advanced physics concepts\n\n"
+        response += "**CPT121** - Learn computer hardware basics\n\n"
+        response += "**FTM-CPT111** - Master probability theory\n\n"
+        response += "**FTM-CPT112** - Web development skills\n\n"
+        
+        response += "## 📚 TYPICAL SEMESTER STRUCTURE\n\n"
+        
+        response += "### 📖 Academic Load\n\n"
+        response += "**5-6 courses** per semester\n\n"
+        response += "**15-18 credit hours** total\n\n"
+        response += "**Mix of theory and practical** courses\n\n"
+        response += "**Continuous assessment** and examinations\n\n"
+        
+        response += "### ⏰ Study Schedule\n\n"
+        response += "**Lectures:** 3-4 hours per day\n\n"
+        response += "**Practical sessions:** 2-3 hours per week\n\n"
+        response += "**Study time:** 2-3 hours daily\n\n"
+        response += "**Project work:** Weekly assignments\n\n"
+        
+        response += "### 🎯 Success Tips\n\n"
+        response += "**Attend all lectures** and practical sessions\n\n"
+        response += "**Complete assignments** on time\n\n"
+        response += "**Form study groups** with classmates\n\n"
+        response += "**Seek help** from lecturers when needed\n\n"
+        response += "**Practice programming** regularly\n\n"
+        response += "**Stay updated** with course materials\n"
+        
+        return {
+            'answer': response,
+            'confidence': 0.90,
+            'strategy_used': 'course_general',
+            'source': 'course_overview'
+        }
+    
+    def _generate_general_response(self, features: QuestionFeatures, analysis: Dict) -> Dict:
         """Generate general fallback response"""
-        return self._get_general_guidance_response(question, analysis)
+        return self._get_general_guidance_response(features, analysis)
     
     def learn_from_interaction(self, question: str, response: str, feedback: Optional[str] = None):
         """Learn from user interactions and improve over time"""
@@ -2054,7 +1441,7 @@ class UnifiedIntelligence:
             'response': response,
             'feedback': feedback,
             'timestamp': datetime.now().isoformat(),
-            'user_pattern': self._extract_user_pattern(question),
+            'user_pattern': self._extract_user_pattern(self.extract_features(question)),
             'successful_response': len(response) > 50 and "FUT CS Assistant - How Can I Help?" not in response
         }
         self.learning_data.append(learning_entry)
@@ -2066,15 +1453,14 @@ class UnifiedIntelligence:
         if len(self.learning_data) > 100:
             self.learning_data = self.learning_data[-100:]
     
-    def _extract_user_pattern(self, question: str) -> Dict:
+    def _extract_user_pattern(self, features: QuestionFeatures) -> Dict:
         """Extract user interaction patterns for learning"""
-        question_lower = question.lower()
         return {
-            'length': len(question),
-            'has_greeting': any(word in question_lower for word in ['hello', 'hi', 'hey']),
-            'has_thanks': any(word in question_lower for word in ['thank', 'thanks']),
-            'question_type': self._classify_question_type(question_lower),
-            'keywords': [word for word in question_lower.split() if len(word) > 3]
+            'length': len(features.raw),
+            'has_greeting': features.has('hello', 'hi', 'hey'),
+            'has_thanks': features.has('thank', 'thanks'),
+            'question_type': self._classify_question_type(features.text),
+            'keywords': [word for word in features.tokens if len(word) > 3]
         }
     
     def _classify_question_type(self, question_lower: str) -> str:
@@ -2135,8 +1521,10 @@ class UnifiedIntelligence:
         """Get unified system status"""
         return {
             'unified_intelligence': 'active',
-            'knowledge_base_loaded': len(self.knowledge_base) > 0,
-            'course_database_loaded': len(self.course_database) > 0,
+            'knowledge_base_loaded': len(self.knowledge.university) > 0,
+            'course_database_loaded': len(self.knowledge.course_index) > 0,
+            'knowledge_version': self.knowledge.version,
+            'rendered_responses': self.rendered.get_stats(),
             'conversation_memory_count': len(self.conversation_memory),
             'learning_data_count': len(self.learning_data),
             'response_history_count': len(self.response_history),
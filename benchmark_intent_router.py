@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for question routing: keyword tables vs the intent classifier
+Times analyze_question_intelligence with each router per question, the
+classifier on whole batches, and reports how often the two agree
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from config import RuntimeConfig  # noqa: E402
+from intent_classifier import IntentClassifier  # noqa: E402
+from unified_intelligence import UnifiedIntelligence  # noqa: E402
+
+MODEL_PATH = os.path.join(ROOT_DIR, 'data', 'models', 'intent_classifier.npz')
+SAMPLE_FILES = [
+    'final_academic_training_data.json',
+    'groq_pdf_training_data.json',
+    'comprehensive_training_data.json'
+]
+BATCH_SIZES = [1, 8, 32, 128]
+
+
+def load_questions():
+    questions = []
+    for name in SAMPLE_FILES:
+        path = os.path.join(ROOT_DIR, name)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                questions.extend(item['question'] for item in json.load(f) if 'question' in item)
+    return questions
+
+
+def time_per_question(fn, questions, repeat=3):
+    samples = []
+    for _ in range(repeat):
+        for question in questions:
+            started = time.perf_counter()
+            fn(question)
+            samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def report(label, samples):
+    ordered = sorted(samples)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    print(f"{label:<34} mean {statistics.mean(samples):7.1f} µs   p50 {statistics.median(samples):7.1f} µs   p95 {p95:7.1f} µs")
+    return statistics.mean(samples)
+
+
+def main():
+    classifier = IntentClassifier.load(MODEL_PATH)
+    if classifier is None:
+        print(f"❌ No model at {MODEL_PATH}; run: python training/train_intent_classifier.py")
+        return
+
+    questions = load_questions()
+    keyword_router = UnifiedIntelligence()
+    keyword_router.intent_classifier = None
+    classifier_router = UnifiedIntelligence()
+    classifier_router.intent_classifier = classifier
+
+    print("🧪 Intent Router Microbenchmark")
+    print("=" * 60)
+    print(f"Questions: {len(questions)}   classes: {len(classifier.labels)}   "
+          f"weights: {classifier.weights.nbytes // 1024} KB")
+
+    # Agreement on the strategy each router picks (boundary questions never reach the classifier)
+    routed = [(keyword_router.analyze_question_intelligence(q), classifier_router.analyze_question_intelligence(q))
+              for q in questions]
+    routed = [(k, c) for k, c in routed if k['type'] != 'boundary']
+    agree = sum(k['response_priority'] == c['response_priority'] for k, c in routed)
+    by_classifier = sum(c.get('router') == 'classifier' for _, c in routed)
+    print(f"Same strategy as keyword router: {agree}/{len(routed)} ({agree / len(routed):.1%}); "
+          f"classifier decided {by_classifier}, keyword fallback {len(routed) - by_classifier} "
+          f"(min confidence {RuntimeConfig.INTENT_CLASSIFIER_MIN_CONFIDENCE})\n")
+
+    # Bypass the per-question keyword memo so every call does the full scan
+    keyword_router_uncached = lambda q: keyword_router.analyze_question_intelligence(q + ' ')  # noqa: E731
+    classifier_uncached = lambda q: classifier_router.analyze_question_intelligence(q + ' ')  # noqa: E731
+    keyword = report("keyword router (analyze)", time_per_question(keyword_router_uncached, questions))
+    report("classifier router (analyze)", time_per_question(classifier_uncached, questions))
+    report("classifier alone, batch of 1", time_per_question(classifier.classify, questions))
+
+    print()
+    for size in BATCH_SIZES[1:]:
+        batches = [questions[i:i + size] for i in range(0, len(questions) - size + 1, size)]
+        samples = []
+        for batch in batches:
+            started = time.perf_counter()
+            classifier.classify_batch(batch)
+            samples.append((time.perf_counter() - started) * 1e6 / len(batch))
+        per_question = report(f"classifier, batch of {size} (per q)", samples)
+        print(f"{'':<34} {keyword / per_question:.1f}x vs keyword router")
+
+
+if __name__ == "__main__":
+    main()
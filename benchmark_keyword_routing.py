@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for per-question keyword routing cost
+Compares the old linear any(... in question_lower) scans with the compiled
+keyword matcher over the same tables, and checks both agree
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from keyword_matcher import KEYWORD_TABLES, UNIFIED_COURSE_PATTERNS, keyword_matcher  # noqa: E402
+
+# Order in which one /ask request used to evaluate the tables; each inner list is an
+# if/elif chain that stops at the first table that matches (course codes are
+# extracted by course_codes.py and not part of these tables)
+LEGACY_CHAINS = (
+    # app.ask_question CS-domain detection
+    [['cs_domain'], ['cs_course_name']]
+    # analyze_question_intelligence and the helpers it calls
+    + [['unrelated'],
+       ['intent_informational', 'intent_guidance', 'intent_explanatory', 'intent_specific'],
+       ['context_indicator'],
+       ['style_pidgin', 'style_casual', 'style_formal'],
+       ['user_new', 'user_advanced', 'user_struggling', 'user_career']]
+    + [[f'course:{code}'] for code in UNIFIED_COURSE_PATTERNS]
+    + [['lecturer', 'course_list', 'materials', 'career', 'study_materials', 'success_tips',
+        'fut_info', 'greeting', 'thanks', 'pdf_content', 'past_questions', 'help',
+        'pidgin_routing', 'casual_routing', 'cs_subject'],
+       ['follow_up']]
+    # DynamicIntelligence.analyze_question_intent
+    + [['unrelated', 'dynamic_cs', 'dynamic_fut', 'dynamic_materials', 'dynamic_success']]
+)
+
+SAMPLE_FILES = [
+    'final_academic_training_data.json',
+    'groq_pdf_training_data.json',
+    'comprehensive_training_data.json'
+]
+
+
+def legacy_route(question_lower):
+    matched = set()
+    for chain in LEGACY_CHAINS:
+        for category in chain:
+            if any(pattern in question_lower for pattern in KEYWORD_TABLES[category]):
+                matched.add(category)
+                break
+    return matched
+
+
+def compiled_route(question_lower):
+    return keyword_matcher._match(question_lower)
+
+
+def load_questions():
+    questions = []
+    root = os.path.dirname(os.path.abspath(__file__))
+    for name in SAMPLE_FILES:
+        path = os.path.join(root, name)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                questions.extend(item['question'].lower() for item in json.load(f) if 'question' in item)
+    return questions or ["who are the lecturers for cos102?", "what materials do i need for cos101"]
+
+
+def time_per_question(fn, questions, repeat=5, prime=False):
+    samples = []
+    for _ in range(repeat):
+        for question in questions:
+            if prime:
+                fn(question)
+            started = time.perf_counter()
+            fn(question)
+            samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def report(label, samples):
+    ordered = sorted(samples)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    print(f"{label:<28} mean {statistics.mean(samples):7.1f} µs   p50 {statistics.median(samples):7.1f} µs   p95 {p95:7.1f} µs")
+    return statistics.mean(samples)
+
+
+def main():
+    questions = load_questions()
+    print("🧪 Keyword Routing Microbenchmark")
+    print("=" * 60)
+    print(f"Questions: {len(questions)}   patterns: {len(keyword_matcher.patterns)}   "
+          f"automaton states: {keyword_matcher.state_count}")
+
+    # Every chain decision must be the same with the compiled matcher
+    mismatches = 0
+    for question in questions:
+        matches = compiled_route(question)
+        compiled = set()
+        for chain in LEGACY_CHAINS:
+            for category in chain:
+                if category in matches:
+                    compiled.add(category)
+                    break
+        mismatches += compiled != legacy_route(question)
+    print(f"Routing mismatches: {mismatches}\n")
+
+    before = report("before: any() scans", time_per_question(legacy_route, questions))
+    after = report("after: one compiled pass", time_per_question(compiled_route, questions))
+    cached = report("after: memoized repeat", time_per_question(keyword_matcher.match, questions, prime=True))
+    print(f"\nSpeed-up: {before / after:.1f}x per question ({before / cached:.0f}x when the question repeats "
+          f"within a request)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+BM25 / dense / hybrid material retrieval benchmark
+Index build and load time, query latency (with and without the course
+bitmap filter, plus the dense index when built), the hybrid retriever's
+per-stage breakdown, and the size of the Groq system prompts /ask sends for
+CS questions with retrieved chunks vs the fixed department context
+
+Usage:
+    python ingest_materials.py                 # once, to create data/materials
+    python benchmark_material_retrieval.py
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+os.chdir(BACKEND_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+import app  # noqa: E402
+from bm25_index import BM25Index, build_bm25_index  # noqa: E402
+from config import RuntimeConfig  # noqa: E402
+from course_codes import extract_course_codes  # noqa: E402
+from dense_index import dense_index  # noqa: E402
+from hybrid_retriever import STAGES, hybrid_retriever  # noqa: E402
+from material_store import material_store  # noqa: E402
+
+DATASET_FILES = ['final_academic_training_data.json', 'groq_pdf_training_data.json', 'cs100_training_data.json']
+
+
+def load_questions():
+    questions = []
+    for name in DATASET_FILES:
+        with open(os.path.join(ROOT_DIR, name), 'r', encoding='utf-8') as f:
+            questions.extend(item['question'] for item in json.load(f) if item.get('question'))
+    return list(dict.fromkeys(questions))
+
+
+def approx_tokens(text):
+    # ~4 characters per token for English text with BPE tokenizers
+    return len(text) / 4
+
+
+def percentiles(values):
+    ordered = sorted(values)
+    return statistics.median(ordered), ordered[int(0.95 * (len(ordered) - 1))]
+
+
+def main():
+    if not material_store.available:
+        print("❌ No material store; run: python ingest_materials.py")
+        return
+
+    print("🧪 Material Retrieval Benchmark")
+    print("=" * 60)
+    print(f"Chunks: {len(material_store)}   top-k: {RuntimeConfig.MATERIALS_TOP_K}\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        build_times = []
+        for _ in range(3):
+            started = time.perf_counter()
+            meta = build_bm25_index(material_store, directory)
+            build_times.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        index = BM25Index(material_store, directory)
+        index.available
+        load_ms = (time.perf_counter() - started) * 1000
+        index_bytes = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+    print(f"Index build: {min(build_times) * 1000:.0f} ms   load (mmap): {load_ms:.1f} ms   "
+          f"{len(meta['terms'])} terms, {index_bytes / 1024:.0f} KB on disk\n")
+
+    questions = load_questions()
+    k = RuntimeConfig.MATERIALS_TOP_K or 4
+    runs = [("BM25", app.bm25_index, False), ("BM25 + course", app.bm25_index, True)]
+    if dense_index.available:
+        encoder = dense_index.encoder.name
+        runs += [("dense", dense_index, False), ("dense + course", dense_index, True)]
+        print(f"Dense index: {dense_index.vectors.shape[0]} x {dense_index.vectors.shape[1]} ({encoder})\n")
+    for label, index, with_filter in runs:
+        index.search(questions[0], k)  # load / warm-up
+        latencies, hits = [], 0
+        for question in questions:
+            courses = extract_course_codes(question) if with_filter else None
+            started = time.perf_counter()
+            results = index.search(question, k, courses)
+            latencies.append((time.perf_counter() - started) * 1e6)
+            hits += bool(results)
+        p50, p95 = percentiles(latencies)
+        print(f"Query ({label:<14}) p50 {p50:6.0f} µs   p95 {p95:6.0f} µs   with results: {hits}/{len(questions)}")
+
+    # Hybrid: end-to-end latency (including the chunk fetch) and where it goes
+    for with_filter in (False, True):
+        latencies, hits = [], 0
+        stage_totals = {stage: 0.0 for stage in STAGES}
+        for question in questions:
+            courses = extract_course_codes(question) if with_filter else None
+            started = time.perf_counter()
+            chunks, timings = hybrid_retriever.retrieve_with_timings(question, k, courses)
+            latencies.append((time.perf_counter() - started) * 1e6)
+            hits += bool(chunks)
+            for stage in STAGES:
+                stage_totals[stage] += timings[stage]
+        p50, p95 = percentiles(latencies)
+        label = "hybrid + course" if with_filter else "hybrid"
+        print(f"Query ({label:<14}) p50 {p50:6.0f} µs   p95 {p95:6.0f} µs   with results: {hits}/{len(questions)}")
+        print("   stages (mean µs): " + "  ".join(f"{stage} {stage_totals[stage] * 1000 / len(questions):.0f}"
+                                                  for stage in STAGES))
+
+    # /ask: CS questions that reach Groq get get_cs_system_prompt(question)
+    cs_questions = [q for q in questions if app.is_cs_domain_question(q.lower())]
+    top_k = RuntimeConfig.MATERIALS_TOP_K
+    RuntimeConfig.MATERIALS_TOP_K = 0
+    fixed = [approx_tokens(app.get_cs_system_prompt(q)) for q in cs_questions]
+    RuntimeConfig.MATERIALS_TOP_K = top_k
+    retrieved = [approx_tokens(app.get_cs_system_prompt(q)) for q in cs_questions]
+    grounded = sum(a != b for a, b in zip(fixed, retrieved))
+    print(f"\n/ask CS system prompt ({len(cs_questions)} questions, ~4 chars/token):")
+    print(f"   fixed department context: {statistics.mean(fixed):6.0f} tokens/question")
+    print(f"   retrieved chunks:         {statistics.mean(retrieved):6.0f} tokens/question "
+          f"({1 - sum(retrieved) / sum(fixed):.0%} fewer; {grounded} questions grounded in materials)")
+
+
+if __name__ == "__main__":
+    main()
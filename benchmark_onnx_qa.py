@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Accuracy-parity and latency/memory comparison: PyTorch vs int8 ONNX QA backend
+Each backend is loaded through app.load_model in its own process (so resident
+memory is measured separately), answers the training-set questions, and the
+answers are compared with each other and with the dataset answers
+
+Usage:
+    python training/export_onnx.py      # once, to create data/models/fut_qa_model_onnx
+    python benchmark_onnx_qa.py [--limit 200]
+"""
+
+import argparse
+import json
+import os
+import re
+import resource
+import statistics
+import string
+import subprocess
+import sys
+import time
+from collections import Counter
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+
+DATASET_FILES = [
+    'final_academic_training_data.json',
+    'groq_pdf_training_data.json'
+]
+BACKENDS = ['pytorch', 'onnx']
+
+
+def load_examples(limit):
+    examples = []
+    for name in DATASET_FILES:
+        with open(os.path.join(ROOT_DIR, name), 'r', encoding='utf-8') as f:
+            for item in json.load(f):
+                if not item.get('context'):
+                    continue
+                answers = item.get('answers', {}).get('text') or [item.get('answer', '')]
+                examples.append({'question': item['question'], 'context': item['context'], 'gold': answers[0]})
+    # Same question/context pairs appear several times in the datasets
+    unique = {(e['question'], e['context']): e for e in examples}
+    return list(unique.values())[:limit]
+
+
+def rss_mb():
+    # ru_maxrss is KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(backend, limit):
+    """Runs inside a fresh process: load one backend, answer every example, print JSON"""
+    os.environ['QA_BACKEND'] = backend
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, BACKEND_DIR)
+    import app
+
+    before_load = rss_mb()
+    model = app.load_model()  # includes the warm-up inferences
+    after_load = rss_mb()
+    qa_pipeline = model.pipeline
+
+    examples = load_examples(limit)
+    predictions, latencies = [], []
+    for example in examples:
+        started = time.perf_counter()
+        result = qa_pipeline(question=example['question'], context=example['context'])
+        latencies.append((time.perf_counter() - started) * 1000)
+        predictions.append({'answer': result['answer'], 'score': float(result['score'])})
+
+    print(json.dumps({
+        'backend': type(qa_pipeline).__name__,
+        'load_seconds': model.load_seconds,
+        'model_rss_mb': after_load - before_load,
+        'peak_rss_mb': rss_mb(),
+        'latencies_ms': latencies,
+        'predictions': predictions
+    }))
+
+
+def normalize_answer(text):
+    text = text.lower()
+    text = ''.join(ch for ch in text if ch not in set(string.punctuation))
+    text = re.sub(r'\b(a|an|the)\b', ' ', text)
+    return ' '.join(text.split())
+
+
+def f1(prediction, gold):
+    pred_tokens, gold_tokens = normalize_answer(prediction).split(), normalize_answer(gold).split()
+    common = sum((Counter(pred_tokens) & Counter(gold_tokens)).values())
+    if not pred_tokens or not gold_tokens:
+        return float(pred_tokens == gold_tokens)
+    if common == 0:
+        return 0.0
+    precision, recall = common / len(pred_tokens), common / len(gold_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+def run_child(backend, limit):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', backend, '--limit', str(limit)],
+        capture_output=True, text=True, check=True
+    ).stdout
+    # app logs to stderr; the JSON report is the last stdout line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyTorch vs ONNX QA backend comparison")
+    parser.add_argument('--limit', type=int, default=200, help="number of distinct examples")
+    parser.add_argument('--child', choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.limit)
+        return
+
+    examples = load_examples(args.limit)
+    reports = {backend: run_child(backend, args.limit) for backend in BACKENDS}
+    if reports['onnx']['backend'] != 'OnnxQuestionAnswering':
+        print("❌ ONNX model not found; run: python training/export_onnx.py")
+        return
+
+    print("🧪 QA Backend Comparison (PyTorch vs int8 ONNX)")
+    print("=" * 60)
+    print(f"Examples: {len(examples)}\n")
+
+    print(f"{'backend':<10} {'load s':>7} {'model MB':>9} {'peak MB':>8} {'p50 ms':>8} {'p95 ms':>8} {'EM':>6} {'F1':>6}")
+    for backend, report in reports.items():
+        latencies = sorted(report['latencies_ms'])
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        answers = [p['answer'] for p in report['predictions']]
+        em = statistics.mean(normalize_answer(a) == normalize_answer(e['gold']) for a, e in zip(answers, examples))
+        f1_score = statistics.mean(f1(a, e['gold']) for a, e in zip(answers, examples))
+        print(f"{backend:<10} {report['load_seconds']:>7.1f} {report['model_rss_mb']:>9.0f} {report['peak_rss_mb']:>8.0f} "
+              f"{statistics.median(latencies):>8.1f} {p95:>8.1f} {em:>6.1%} {f1_score:>6.1%}")
+
+    torch_predictions = reports['pytorch']['predictions']
+    onnx_predictions = reports['onnx']['predictions']
+    same = sum(a['answer'] == b['answer'] for a, b in zip(torch_predictions, onnx_predictions))
+    overlap = statistics.mean(f1(b['answer'], a['answer']) for a, b in zip(torch_predictions, onnx_predictions))
+    score_delta = statistics.mean(abs(a['score'] - b['score']) for a, b in zip(torch_predictions, onnx_predictions))
+    print(f"\nParity: identical answers {same}/{len(examples)} ({same / len(examples):.1%}), "
+          f"token F1 vs PyTorch {overlap:.1%}, mean |score diff| {score_delta:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Throughput / latency benchmark for QA micro-batching
+Closed-loop clients at several concurrency levels send questions to the QA
+model one at a time (as /ask did) and through QABatcher
+
+Usage:
+    python benchmark_qa_batching.py              # real model (needs transformers)
+    python benchmark_qa_batching.py --simulated  # fixed-cost stand-in forward pass
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from qa_batcher import QABatcher  # noqa: E402
+
+CONCURRENCY_LEVELS = [1, 4, 16, 64]
+
+
+def load_pairs():
+    path = os.path.join(ROOT_DIR, 'final_academic_training_data.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        return [(item['question'], item['context']) for item in json.load(f) if item.get('context')]
+
+
+def real_model():
+    """The same pipeline /ask uses, loaded the way app.load_model does"""
+    os.chdir(BACKEND_DIR)
+    import app
+    app.load_model()
+    return app.run_qa_batch
+
+
+def simulated_model(overhead_ms, per_item_ms):
+    """Forward pass with a fixed cost plus a per-question cost; sleep releases the GIL like torch does"""
+    def infer(questions, contexts):
+        time.sleep((overhead_ms + per_item_ms * len(questions)) / 1000.0)
+        return [{'answer': '', 'score': 0.0} for _ in questions]
+    return infer
+
+
+async def drive(ask, pairs, concurrency, requests_per_client):
+    latencies = []
+
+    async def client(offset):
+        for i in range(requests_per_client):
+            question, context = pairs[(offset + i * concurrency) % len(pairs)]
+            started = time.perf_counter()
+            await ask(question, context)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(offset) for offset in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return len(latencies) / elapsed, latencies
+
+
+def summarize(latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    return statistics.median(ordered) * 1000, p95 * 1000
+
+
+async def run(infer, pairs, requests_per_client, max_batch_size, max_wait_ms):
+    # One request at a time on a single thread, as when /ask called the pipeline on the event loop
+    serial = ThreadPoolExecutor(max_workers=1)
+
+    async def unbatched(question, context):
+        loop = asyncio.get_running_loop()
+        return (await loop.run_in_executor(serial, infer, [question], [context]))[0]
+
+    batcher = QABatcher(infer, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+    # Warm-up (model caches, thread start)
+    await unbatched(*pairs[0])
+    await batcher.submit(*pairs[0])
+
+    print(f"{'clients':>7} | {'unbatched req/s':>15} {'p50 ms':>8} {'p95 ms':>8} | "
+          f"{'batched req/s':>13} {'p50 ms':>8} {'p95 ms':>8} {'avg batch':>9}")
+    for concurrency in CONCURRENCY_LEVELS:
+        before = await drive(unbatched, pairs, concurrency, requests_per_client)
+        batches, items = batcher.batches, batcher.items
+        after = await drive(batcher.submit, pairs, concurrency, requests_per_client)
+        avg_batch = (batcher.items - items) / max(1, batcher.batches - batches)
+        print(f"{concurrency:>7} | {before[0]:>15.1f} {summarize(before[1])[0]:>8.1f} {summarize(before[1])[1]:>8.1f} | "
+              f"{after[0]:>13.1f} {summarize(after[1])[0]:>8.1f} {summarize(after[1])[1]:>8.1f} {avg_batch:>9.1f}")
+
+    batcher.close()
+    serial.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QA micro-batching benchmark")
+    parser.add_argument('--simulated', action='store_true', help="use a fixed-cost stand-in instead of the model")
+    parser.add_argument('--overhead-ms', type=float, default=30.0, help="simulated cost per forward pass")
+    parser.add_argument('--per-item-ms', type=float, default=6.0, help="simulated cost per question in a batch")
+    parser.add_argument('--requests', type=int, default=8, help="requests per client")
+    parser.add_argument('--max-batch-size', type=int, default=8)
+    parser.add_argument('--max-wait-ms', type=float, default=5.0)
+    args = parser.parse_args()
+
+    pairs = load_pairs()
+    if args.simulated:
+        infer = simulated_model(args.overhead_ms, args.per_item_ms)
+        label = f"simulated ({args.overhead_ms:g} ms + {args.per_item_ms:g} ms/question)"
+    else:
+        infer = real_model()
+        label = "transformers pipeline"
+
+    print("🧪 QA Micro-batching Benchmark")
+    print("=" * 60)
+    print(f"Model: {label}   batch ≤ {args.max_batch_size}   window {args.max_wait_ms:g} ms\n")
+    asyncio.run(run(infer, pairs, args.requests, args.max_batch_size, args.max_wait_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling benchmark: QA inference in threads vs worker processes
+For each worker count, the same questions are answered by that many threads
+sharing one in-process model (QA_EXECUTION=thread) and by a QAProcessPool
+with that many processes (QA_EXECUTION=process)
+
+Usage:
+    python benchmark_qa_processes.py              # real model (needs transformers)
+    python benchmark_qa_processes.py --simulated  # pure-Python stand-in that holds the GIL
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from qa_process_pool import QAProcessPool  # noqa: E402
+
+
+def load_pairs():
+    path = os.path.join(ROOT_DIR, 'final_academic_training_data.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        return [(item['question'], item['context']) for item in json.load(f) if item.get('context')]
+
+
+def spin(iterations):
+    total = 0
+    for i in range(iterations):
+        total += i
+    return total
+
+
+def calibrate(cost_ms):
+    """Loop iterations that take cost_ms on one core"""
+    started = time.perf_counter()
+    spin(200000)
+    return int(200000 * cost_ms / 1000.0 / (time.perf_counter() - started))
+
+
+class SimulatedPipeline:
+    """A fixed amount of pure-Python work per question (like tokenization and span decoding); holds the GIL"""
+
+    def __init__(self, iterations):
+        self.iterations = iterations
+
+    def __call__(self, question, context, batch_size=None, **kwargs):
+        spin(self.iterations)
+        return {'answer': '', 'score': 0.0, 'start': 0, 'end': 0}
+
+
+def build_simulated(iterations):
+    return SimulatedPipeline(iterations), 'simulated'
+
+
+def build_real(backend):
+    # Model paths are relative to backend/, as when the API runs
+    os.chdir(BACKEND_DIR)
+    from qa_model import build_qa_pipeline
+    return build_qa_pipeline(backend)
+
+
+def throughput(qa, pairs, clients, total):
+    """Answer `total` questions from `clients` concurrent callers; returns questions per second"""
+    def ask(i):
+        question, context = pairs[i % len(pairs)]
+        return qa(question=question, context=context)
+
+    with ThreadPoolExecutor(max_workers=clients) as callers:
+        started = time.perf_counter()
+        list(callers.map(ask, range(total)))
+        return total / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QA thread vs process scaling benchmark")
+    parser.add_argument('--simulated', action='store_true', help="use a GIL-holding stand-in instead of the model")
+    parser.add_argument('--cost-ms', type=float, default=20.0, help="simulated cost per question")
+    parser.add_argument('--backend', default='pytorch', choices=['pytorch', 'onnx'])
+    parser.add_argument('--questions', type=int, default=64, help="questions per measurement")
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pairs = load_pairs()
+    if args.simulated:
+        build, build_args = build_simulated, (calibrate(args.cost_ms),)
+        label = f"simulated ({args.cost_ms:g} ms/question, GIL held)"
+    else:
+        build, build_args = build_real, (args.backend,)
+        label = f"{args.backend} model"
+
+    levels = sorted({1, *(2 ** i for i in range(1, 8) if 2 ** i <= args.max_workers), args.max_workers})
+    in_process, _ = build(*build_args)
+    in_process(question=pairs[0][0], context=pairs[0][1])  # warm-up
+
+    print("🧪 QA Execution Scaling Benchmark")
+    print("=" * 60)
+    print(f"Model: {label}   CPU cores: {os.cpu_count()}   questions: {args.questions}\n")
+    print(f"{'workers':>7} | {'threads q/s':>11} {'scaling':>8} | {'processes q/s':>13} {'scaling':>8}")
+
+    baseline = {}
+    for workers in levels:
+        # Twice as many callers as workers, so a worker never waits for its next question
+        threads = throughput(in_process, pairs, workers * 2, args.questions)
+
+        pool = QAProcessPool(build, build_args, workers=workers).start()
+        pool(question=pairs[0][0], context=pairs[0][1])
+        processes = throughput(pool, pairs, workers * 2, args.questions)
+        pool.close()
+
+        baseline.setdefault('threads', threads)
+        baseline.setdefault('processes', processes)
+        print(f"{workers:>7} | {threads:>11.1f} {threads / baseline['threads']:>7.2f}x | "
+              f"{processes:>13.1f} {processes / baseline['processes']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
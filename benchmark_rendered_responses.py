@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pre-rendered static answers against rendering on every request
+Runs the course, PDF, past-question and course-overview strategies with the
+memo bypassed and with it warm, checks both give the same answers, and
+reports latency and bytes allocated per call
+"""
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+from unified_intelligence import unified_intelligence  # noqa: E402
+
+# (strategy method, question)
+CASES = [
+    ('_get_course_specific_response', "Tell me about COS101"),
+    ('_get_course_specific_response', "What is FTM-CPT112 about?"),
+    ('_get_course_specific_response', "cos 201 details"),
+    ('_get_pdf_content_response', "MAT121 pdf"),
+    ('_get_pdf_content_response', "COS102 pdf notes"),
+    ('_get_pdf_content_response', "where are the pdfs"),
+    ('_get_past_questions_response', "MAT121 past questions"),
+    ('_get_past_questions_response', "past questions please"),
+    ('_get_course_general_response', "what courses are offered"),
+]
+
+
+class RenderEveryTime:
+    """Stand-in for rendered_responses that renders on every call (the old behaviour)"""
+
+    def get(self, strategy, key, render):
+        return render()
+
+
+def run_cases(cases):
+    return [getattr(unified_intelligence, method)(features, {}) for method, features in cases]
+
+
+def time_per_call(cases, repeat):
+    samples = []
+    for _ in range(repeat):
+        for method, features in cases:
+            started = time.perf_counter()
+            getattr(unified_intelligence, method)(features, {})
+            samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def allocated_per_call(cases, repeat=20):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    peak_total = 0
+    for _ in range(repeat):
+        for method, features in cases:
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            getattr(unified_intelligence, method)(features, {})
+            peak_total += tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+    return peak_total / (repeat * len(cases)), before
+
+
+def report(label, samples, allocated):
+    ordered = sorted(samples)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    print(f"{label:<26} mean {statistics.mean(samples):8.1f} µs   p95 {p95:8.1f} µs   "
+          f"peak alloc {allocated / 1024:7.1f} KiB/call")
+    return statistics.mean(samples)
+
+
+def main():
+    cases = [(method, unified_intelligence.extract_features(question)) for method, question in CASES]
+    cached = unified_intelligence.rendered
+
+    print("🧪 Pre-rendered Response Benchmark")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    count = unified_intelligence.prerender_responses()
+    print(f"Pre-rendered {count} answers in {(time.perf_counter() - started) * 1000:.1f} ms "
+          f"({cached.get_stats()['bytes'] / 1024:.0f} KiB, knowledge {cached.get_stats()['knowledge_version']})\n")
+
+    unified_intelligence.rendered = RenderEveryTime()
+    expected = run_cases(cases)
+    before = report("before: render per call", time_per_call(cases, 200), allocated_per_call(cases)[0])
+
+    unified_intelligence.rendered = cached
+    actual = run_cases(cases)
+    after = report("after: pre-rendered", time_per_call(cases, 200), allocated_per_call(cases)[0])
+
+    mismatches = sum(a != b for a, b in zip(expected, actual))
+    print(f"\nAnswer mismatches: {mismatches} of {len(cases)}")
+    print(f"Speed-up: {before / after:.1f}x per strategy call")
+
+
+if __name__ == "__main__":
+    main()
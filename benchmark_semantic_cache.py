@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark the semantic answer cache against the full unified intelligence path
+Measures paraphrase hit rate and lookup latency, run in-process from the repo root
+"""
+
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+from semantic_cache import SemanticAnswerCache, SEED_CORPUS_FILES  # noqa: E402
+
+# (canonical question, paraphrases that should reuse its answer)
+PARAPHRASE_GROUPS = [
+    ("Who are the lecturers for COS102?", [
+        "who teaches cos 102",
+        "COS102 lecturers",
+        "who dey teach cos102?",
+        "Tell me the lecturers of COS 102 please",
+    ]),
+    ("What materials do I need for COS101?", [
+        "cos101 materials",
+        "Which books for COS 101?",
+        "resources for cos101",
+    ]),
+    ("What career paths are available in computer science?", [
+        "computer science careers",
+        "what jobs can I do with computer science",
+        "career paths in computer science",
+    ]),
+    ("What is MAT121 about?", [
+        "tell me about mat 121",
+        "what is mat121",
+    ]),
+]
+
+# Questions that must NOT be answered from the cache
+NEGATIVE_QUESTIONS = [
+    "Who are the lecturers for COS101?",
+    "What materials do I need for PHY101?",
+    "How do I apply for hostel accommodation?",
+    "What is MAT122 about?",
+]
+
+# (cached question, question with a different meaning that must not reuse its answer)
+FALSE_HIT_PAIRS = [
+    ("What is the prerequisite for COS102?", "What is COS102 a prerequisite for?"),
+    ("What is computer science?", "What is not computer science?"),
+    ("Who teaches COS102?", "What is COS102?"),
+    ("Which careers need programming?", "Which careers don't need programming?"),
+]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+def time_calls(fn, questions, repeat):
+    samples = []
+    for _ in range(repeat):
+        for question in questions:
+            started = time.perf_counter()
+            fn(question)
+            samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main():
+    print("🧪 Semantic Cache Benchmark")
+    print("=" * 60)
+
+    cache = SemanticAnswerCache(capacity=1000, threshold=0.85)
+    cache.load_seed_corpus(SEED_CORPUS_FILES)
+    for canonical, _ in PARAPHRASE_GROUPS:
+        cache.store(canonical, {'answer': canonical, 'confidence': 0.95, 'model_used': 'benchmark'})
+
+    hits = 0
+    total = 0
+    for canonical, paraphrases in PARAPHRASE_GROUPS:
+        for paraphrase in paraphrases:
+            total += 1
+            cached = cache.lookup(paraphrase)
+            correct = cached is not None and cached['answer'] == canonical
+            hits += correct
+            print(f"   {'✅' if correct else '❌'} {paraphrase}")
+
+    false_hits = 0
+    for question in NEGATIVE_QUESTIONS:
+        cached = cache.lookup(question)
+        false_hits += cached is not None
+        print(f"   {'❌ false hit' if cached else '✅ miss'}: {question}")
+
+    pair_hits = 0
+    for cached_question, question in FALSE_HIT_PAIRS:
+        pairs = SemanticAnswerCache(capacity=4, threshold=0.85)
+        pairs.idf = cache.idf
+        pairs.store(cached_question, {'answer': cached_question, 'confidence': 0.95, 'model_used': 'benchmark'})
+        cached = pairs.lookup(question)
+        pair_hits += cached is not None
+        print(f"   {'❌ false hit' if cached else '✅ miss'}: {question} (cached: {cached_question})")
+
+    print(f"\nParaphrase hit rate: {hits}/{total} ({hits / total:.0%})")
+    print(f"False hits: {false_hits}/{len(NEGATIVE_QUESTIONS)} unrelated, "
+          f"{pair_hits}/{len(FALSE_HIT_PAIRS)} same words with a different meaning")
+
+    # Fill the cache to capacity so lookups scan a realistic matrix
+    for i in range(cache.capacity):
+        cache.store(f"synthetic{i} question{i * 7} topic{i * 13}", {'answer': str(i), 'confidence': 1.0, 'model_used': 'benchmark'})
+
+    questions = [p for _, paraphrases in PARAPHRASE_GROUPS for p in paraphrases] + NEGATIVE_QUESTIONS
+    cache_ms = time_calls(cache.lookup, questions, repeat=20)
+    print(f"\nCache lookup ({cache.size} entries): p50 {statistics.median(cache_ms):.3f} ms, "
+          f"p95 {percentile(cache_ms, 0.95):.3f} ms")
+
+    try:
+        from unified_intelligence import unified_intelligence
+    except Exception as e:
+        print(f"\n⚠️  Unified intelligence not importable here ({e}); skipping full-path comparison")
+        return
+
+    full_ms = time_calls(unified_intelligence.get_unified_response, questions, repeat=3)
+    print(f"Unified intelligence: p50 {statistics.median(full_ms):.3f} ms, "
+          f"p95 {percentile(full_ms, 0.95):.3f} ms")
+    print(f"Speed-up at p50: {statistics.median(full_ms) / statistics.median(cache_ms):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
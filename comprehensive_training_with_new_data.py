@@ -202,7 +202,8 @@ def create_lecturer_database():
         "PHY101": {
             "course": "General Physics I",
             "lecturers": [
-                {"name": "Aku Ibrahim", "role": "Lecturer"}
+                {"name": "Aku Ibrahim", "role": "Lecturer"},
+                {"name": "Moses AS", "role": "Practical Lecturer"}
             ]
         },
         "PHY102": {
@@ -252,6 +253,14 @@ def create_lecturer_database():
             "lecturers": [
                 {"name": "Benjamin Alenoghen", "role": "Lecturer"}
             ]
+        },
+        "MAT121": {
+            "course": "Differential and Integral Calculus",
+            "lecturers": [
+                {"name": "Dr. Sarah Johnson", "role": "Lead Lecturer"},
+                {"name": "Prof. Michael Brown", "role": "Co-Lecturer"},
+                {"name": "Dr. Emily Davis", "role": "Co-Lecturer"}
+            ]
         }
     }
     
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Ingestion manifest: which source files were processed, from which content
+Records each file's SHA-256, size and mtime together with what the ingester
+derived from it (chunk ranges, training examples), so a re-run only
+re-extracts files that were added or changed and drops what came from
+deleted ones. A file is only re-hashed when its size or mtime changed
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+MANIFEST_VERSION = 1
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    """Source file -> fingerprint and derived data, persisted as JSON
+
+    `settings` are the options the derived data depends on (chunk size,
+    overlap, ...); a manifest written with different settings is ignored,
+    so every file counts as added.
+    """
+
+    def __init__(self, path: str, settings: Optional[Dict] = None):
+        self.path = path
+        self.settings = settings or {}
+        self.files: Dict[str, Dict] = {}
+        self.outputs: Dict = {}
+        self.fingerprints: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION and data.get('settings') == self.settings:
+                    self.files = data['files']
+                    self.outputs = data.get('outputs', {})
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable manifest {path}: {e}")
+
+    def fingerprint(self, key: str, path: str) -> Dict:
+        """sha256/size/mtime of the file; the recorded hash is reused when size and mtime are unchanged"""
+        stat = os.stat(path)
+        entry = self.files.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+            sha256 = entry['sha256']
+        else:
+            sha256 = sha256_file(path)
+        return {'sha256': sha256, 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def scan(self, paths: Dict[str, str]) -> Dict[str, List[str]]:
+        """Classify source files (key -> path on disk) as added, changed, unchanged or deleted"""
+        plan = {'added': [], 'changed': [], 'unchanged': [], 'deleted': sorted(set(self.files) - set(paths))}
+        for key in sorted(paths):
+            fingerprint = self.fingerprint(key, paths[key])
+            self.fingerprints[key] = fingerprint
+            entry = self.files.get(key)
+            if entry is None:
+                plan['added'].append(key)
+            elif entry['sha256'] != fingerprint['sha256']:
+                plan['changed'].append(key)
+            else:
+                # Same content (maybe touched or copied): keep the derived data, refresh size/mtime
+                entry.update(fingerprint)
+                plan['unchanged'].append(key)
+        return plan
+
+    def record(self, key: str, **data):
+        """Store what was derived from a scanned file"""
+        self.files[key] = {**self.fingerprints[key], **data}
+
+    def forget(self, key: str):
+        self.files.pop(key, None)
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        data = {'version': MANIFEST_VERSION, 'settings': self.settings, 'outputs': self.outputs,
+                'files': {key: self.files[key] for key in sorted(self.files)}}
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+        os.replace(self.path + '.tmp', self.path)
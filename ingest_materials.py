@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Ingest course materials (PDF, PPTX, DOCX) into the on-disk chunk store
+Every page and slide is extracted (in parallel, see material_extraction.py)
+and split into overlapping text chunks
+tagged with course code, source file, page/slide number and character
+offsets; the chunks and their BM25 index (and, with --dense, sentence
+embeddings) are written to data/materials/ for the backend
+
+Runs are incremental: data/materials/manifest.json records every source
+file's hash, size and mtime and the chunks taken from it, so only added or
+changed files are extracted again, chunks of deleted files are dropped and
+only new chunks are embedded. --full re-extracts everything
+
+Requires: pip install PyPDF2 python-pptx python-docx (--dense: sentence-transformers)
+
+Usage:
+    python ingest_materials.py [--source pdf_data] [--chunk-size 800] [--overlap 200] [--full] [--workers N]
+    python ingest_materials.py --dense [--encoder sentence-transformers/all-MiniLM-L6-v2]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from ingest_manifest import IngestManifest
+from material_extraction import ExtractionProgress, Unit, iter_documents, supported_extensions
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'backend'))
+
+from course_codes import extract_course_codes  # noqa: E402
+from bm25_index import INDEX_DIR, build_bm25_index  # noqa: E402
+from dense_index import DEFAULT_ENCODER, build_dense_index, read_index_meta  # noqa: E402
+from dense_index import INDEX_DIR as DENSE_INDEX_DIR  # noqa: E402
+from material_store import ChunkStore, write_chunk_store  # noqa: E402
+
+MANIFEST_FILE = 'manifest.json'
+WHITESPACE = re.compile(r'\s+')
+# Pages with less text than this (title slides, scanned images) are skipped
+MIN_UNIT_CHARS = 20
+
+
+def normalize(text: str) -> str:
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def chunk_spans(text: str, size: int, overlap: int) -> List[Tuple[int, int]]:
+    """(start, end) character spans of at most `size` chars, consecutive spans sharing about `overlap` chars
+
+    Spans end at a word boundary when one exists in the second half of the window.
+    """
+    spans = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            cut = text.rfind(' ', start + size // 2, end)
+            if cut != -1:
+                end = cut
+        spans.append((start, end))
+        if end == len(text):
+            break
+        next_start = max(end - overlap, start + 1)
+        # Start on a word, not mid-token
+        space = text.find(' ', next_start, end)
+        start = space + 1 if space != -1 else next_start
+    return spans
+
+
+def detect_course(path: str, units: List[Unit]) -> Optional[str]:
+    """Course code from the file name, else the one the document mentions most"""
+    codes = extract_course_codes(os.path.basename(path))
+    if codes:
+        return codes[0]
+    mentioned = Counter(code for _, text in units for code in extract_course_codes(text))
+    return mentioned.most_common(1)[0][0] if mentioned else None
+
+
+def chunk_document(path: str, units: List[Unit], size: int, overlap: int) -> List[Dict]:
+    """All chunks of one file, from its extracted pages"""
+    extension = os.path.splitext(path)[1].lower()
+    units = [(page, normalize(text)) for page, text in units]
+    units = [(page, text) for page, text in units if len(text) >= MIN_UNIT_CHARS]
+    course = detect_course(path, units)
+    source = os.path.relpath(path, ROOT_DIR)
+
+    chunks = []
+    for page, text in units:
+        for start, end in chunk_spans(text, size, overlap):
+            chunks.append({
+                'course': course,
+                'source': source,
+                'kind': extension[1:],
+                'page': page,
+                'start': start,
+                'end': end,
+                'text': text[start:end]
+            })
+    return chunks
+
+
+def find_documents(source_dirs: List[str]) -> List[str]:
+    paths = []
+    for directory in source_dirs:
+        for dirpath, _, filenames in os.walk(directory):
+            paths.extend(os.path.join(dirpath, name) for name in filenames
+                         if name.lower().endswith(supported_extensions()) and not name.startswith('~$'))
+    return sorted(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunk course materials into the backend's material store")
+    parser.add_argument('--source', action='append', help="directory to ingest (repeatable; default pdf_data)")
+    parser.add_argument('--output', default=os.path.join(ROOT_DIR, 'data', 'materials'))
+    parser.add_argument('--chunk-size', type=int, default=800, help="max characters per chunk")
+    parser.add_argument('--overlap', type=int, default=200, help="characters shared by consecutive chunks")
+    parser.add_argument('--full', action='store_true', help="re-extract every file, ignoring the manifest")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="extraction processes (1 = extract in this process)")
+    parser.add_argument('--dense', action='store_true', help="also embed the chunks for MATERIALS_RETRIEVER=dense")
+    parser.add_argument('--encoder', help=f"sentence-transformers model, or 'hashed' (no extra dependencies); "
+                                          f"default: the existing index's, else {DEFAULT_ENCODER}")
+    args = parser.parse_args()
+    if not 0 <= args.overlap < args.chunk_size:
+        parser.error("--overlap must be smaller than --chunk-size")
+
+    source_dirs = args.source or [os.path.join(ROOT_DIR, 'pdf_data')]
+    documents = {os.path.relpath(path, ROOT_DIR): path for path in find_documents(source_dirs)}
+    print("📚 Ingesting course materials")
+    print("=" * 60)
+    print(f"Found {len(documents)} documents in {', '.join(source_dirs)}\n")
+
+    started = time.perf_counter()
+    manifest = IngestManifest(os.path.join(args.output, MANIFEST_FILE),
+                              settings={'chunk_size': args.chunk_size, 'overlap': args.overlap})
+    old_store = ChunkStore(args.output)
+    old_store_bytes = old_store.get_stats()['bytes'] if old_store.available else None
+    # The recorded chunk ranges are only usable against the store they were recorded for
+    if args.full or old_store_bytes is None or manifest.outputs.get('store_bytes') != old_store_bytes:
+        manifest.files = {}
+    plan = manifest.scan(documents)
+
+    # An existing dense index is kept in step with the store even without --dense
+    dense_dir = os.path.join(args.output, DENSE_INDEX_DIR)
+    dense_meta = read_index_meta(dense_dir)
+    build_dense = args.dense or dense_meta is not None
+    encoder = args.encoder or (dense_meta or {}).get('encoder') or DEFAULT_ENCODER
+    dense_current = dense_meta is not None and dense_meta.get('store_bytes') == old_store_bytes \
+        and dense_meta['encoder'] == encoder
+    bm25_built = os.path.exists(os.path.join(args.output, INDEX_DIR, 'meta.json'))
+
+    if manifest.files and not plan['added'] and not plan['changed'] and not plan['deleted'] \
+            and bm25_built and (dense_current or not build_dense):
+        print(f"✅ Up to date: {len(plan['unchanged'])} unchanged files, nothing to re-ingest")
+        return
+
+    chunks: List[Dict] = []
+    # Per new chunk: its id in the previous store (-1 if freshly extracted), to reuse its embedding
+    previous_ids: List[int] = []
+    progress = ExtractionProgress()
+    # Extracted in the pool ahead of this loop, yielded in the same (sorted) order
+    extracted = iter_documents([path for key, path in sorted(documents.items()) if key not in plan['unchanged']],
+                               args.workers, progress)
+    for key, path in sorted(documents.items()):
+        entry = manifest.files.get(key)
+        if key in plan['unchanged']:
+            first = entry['first_chunk']
+            document_chunks = old_store.get_many(range(first, first + entry['chunk_count']))
+            previous_ids.extend(range(first, first + len(document_chunks)))
+            status = '⏭️'
+        else:
+            _, units = next(extracted)
+            if units is None:
+                print(f"❌ {os.path.basename(path)}: {progress.errors.get(path)}")
+                manifest.forget(key)
+                continue
+            document_chunks = chunk_document(path, units, args.chunk_size, args.overlap)
+            previous_ids.extend([-1] * len(document_chunks))
+            status = '✅' if key in plan['added'] else '🔄'
+        course = document_chunks[0]['course'] if document_chunks else None
+        manifest.record(key, course=course, first_chunk=len(chunks), chunk_count=len(document_chunks))
+        chunks.extend(document_chunks)
+        print(f"{status} {os.path.basename(path)[:60]:<60} {course or '?':<8} {len(document_chunks):>4} chunks")
+    for key in plan['deleted']:
+        manifest.forget(key)
+        print(f"🗑️ {os.path.basename(key)[:60]:<60} removed")
+    old_store.close()
+    if progress.files:
+        print(f"\n📄 Extracted {progress.report()} with {args.workers} workers")
+
+    count = write_chunk_store(chunks, args.output)
+    store = ChunkStore(args.output)
+    manifest.outputs = {'store_bytes': store.get_stats()['bytes']}
+    by_course = Counter(chunk['course'] or '?' for chunk in chunks)
+    print(f"\n📦 {count} chunks written to {args.output} in {time.perf_counter() - started:.1f}s "
+          f"({len(plan['added'])} added, {len(plan['changed'])} changed, {len(plan['deleted'])} deleted, "
+          f"{len(plan['unchanged'])} unchanged files)")
+    print("   " + ", ".join(f"{course}: {n}" for course, n in sorted(by_course.items())))
+
+    # BM25 statistics (document frequencies, average length) span the whole corpus: always rebuilt (~100 ms)
+    started = time.perf_counter()
+    meta = build_bm25_index(store, os.path.join(args.output, INDEX_DIR))
+    print(f"🔎 BM25 index: {len(meta['terms'])} terms in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    if build_dense:
+        started = time.perf_counter()
+        meta = build_dense_index(store, dense_dir, encoder, previous=previous_ids if dense_current else None)
+        print(f"🧭 Dense index: {meta['chunk_count']} x {meta['dims']} float16 ({meta['encoder']}, "
+              f"{meta['reused']} vectors reused) in {time.perf_counter() - started:.1f}s")
+
+    # Last: if anything above failed, the next run starts from the previous manifest
+    manifest.save()
+
+
+if __name__ == "__main__":
+    main()
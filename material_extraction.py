@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Parallel text extraction for course materials (PDF, PPTX, DOCX)
+Each format has an extractor that counts a file's pages (slides) and
+extracts a range of them. Files are split into page-range tasks run on a
+process pool, and pages are yielded in document order with only a few tasks
+in flight, so memory stays flat however large a module is. New formats are
+added with register_extractor()
+
+Requires: pip install PyPDF2 python-pptx python-docx
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# (page or slide number, None for formats without pages; raw text)
+Unit = Tuple[Optional[int], str]
+# Tasks submitted ahead of the one being yielded, per worker
+TASKS_IN_FLIGHT_PER_WORKER = 2
+
+
+class PdfExtractor:
+    extensions = ('.pdf',)
+    # Pages per task: PDF pages are independent, so one file is spread over several workers
+    pages_per_task = 8
+
+    def count(self, path: str) -> int:
+        import PyPDF2
+
+        return len(PyPDF2.PdfReader(path).pages)
+
+    def extract(self, path: str, start: int, end: Optional[int]) -> List[Unit]:
+        import PyPDF2
+
+        units = []
+        pages = PyPDF2.PdfReader(path).pages
+        for index in range(start, len(pages) if end is None else end):
+            try:
+                units.append((index + 1, pages[index].extract_text() or ''))
+            except Exception as e:
+                print(f"   ⚠️ {os.path.basename(path)} page {index + 1}: {e}")
+        return units
+
+
+class PptxExtractor:
+    extensions = ('.pptx',)
+    # Whole file per task: python-pptx parses the full package on open
+    pages_per_task = 0
+
+    def count(self, path: str) -> int:
+        from pptx import Presentation
+
+        return len(Presentation(path).slides)
+
+    def extract(self, path: str, start: int, end: Optional[int]) -> List[Unit]:
+        from pptx import Presentation
+
+        units = []
+        slides = list(Presentation(path).slides)
+        for index in range(start, len(slides) if end is None else end):
+            slide = slides[index]
+            parts = []
+            for shape in slide.shapes:
+                if shape.has_text_frame:
+                    parts.append(shape.text_frame.text)
+                if getattr(shape, 'has_table', False) and shape.has_table:
+                    parts.extend(cell.text for row in shape.table.rows for cell in row.cells)
+            if slide.has_notes_slide:
+                parts.append(slide.notes_slide.notes_text_frame.text)
+            units.append((index + 1, '\n'.join(parts)))
+        return units
+
+
+class DocxExtractor:
+    extensions = ('.docx',)
+    pages_per_task = 0
+
+    def count(self, path: str) -> int:
+        return 1
+
+    def extract(self, path: str, start: int, end: Optional[int]) -> List[Unit]:
+        import docx
+
+        document = docx.Document(path)
+        parts = [paragraph.text for paragraph in document.paragraphs]
+        parts.extend(cell.text for table in document.tables for row in table.rows for cell in row.cells)
+        # Word files have no fixed pages; the whole document is one unit
+        return [(None, '\n'.join(parts))]
+
+
+EXTRACTORS: Dict[str, object] = {}
+
+
+def register_extractor(extractor):
+    """Use extractor (count(path), extract(path, start, end), extensions, pages_per_task) for its extensions"""
+    for extension in extractor.extensions:
+        EXTRACTORS[extension] = extractor
+
+
+for _extractor in (PdfExtractor(), PptxExtractor(), DocxExtractor()):
+    register_extractor(_extractor)
+
+
+def supported_extensions() -> Tuple[str, ...]:
+    return tuple(EXTRACTORS)
+
+
+def plan_tasks(path: str) -> List[Tuple]:
+    """(extractor, path, start, end) page ranges covering the file"""
+    extractor = EXTRACTORS[os.path.splitext(path)[1].lower()]
+    if extractor.pages_per_task <= 0:
+        return [(extractor, path, 0, None)]
+    count = extractor.count(path)
+    step = extractor.pages_per_task
+    return [(extractor, path, start, min(start + step, count)) for start in range(0, count, step)] \
+        or [(extractor, path, 0, 0)]
+
+
+def _run_task(extractor, path: str, start: int, end: Optional[int]) -> List[Unit]:
+    # The extractor instance is pickled with the task, so registered plug-ins work in workers too
+    return extractor.extract(path, start, end)
+
+
+class ExtractionProgress:
+    """Files, pages and throughput of an extraction run"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.files = 0
+        self.pages = 0
+        self.characters = 0
+        self.errors: Dict[str, str] = {}
+
+    def add(self, units: List[Unit]):
+        self.pages += len(units)
+        self.characters += sum(len(text) for _, text in units)
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.seconds if self.seconds > 0 else 0.0
+
+    def report(self) -> str:
+        return (f"{self.files} files, {self.pages} pages in {self.seconds:.1f}s "
+                f"({self.pages_per_second:.1f} pages/s){f', {len(self.errors)} failed' if self.errors else ''}")
+
+
+def _iter_task_results(paths: Iterable[str], workers: int,
+                       progress: ExtractionProgress) -> Iterator[Tuple[str, Optional[List[Unit]], bool]]:
+    """(path, units or None on failure, last task of the file) in document order"""
+
+    def tasks():
+        for path in paths:
+            try:
+                planned = plan_tasks(path)
+            except Exception as e:
+                progress.errors[path] = str(e)
+                yield None, path, True
+                continue
+            for position, task in enumerate(planned):
+                yield task, path, position == len(planned) - 1
+
+    def finish(path: str, last: bool, run) -> Tuple[str, Optional[List[Unit]], bool]:
+        if run is None:
+            return path, None, last
+        try:
+            units = run()
+        except Exception as e:
+            progress.errors[path] = str(e)
+            return path, None, last
+        progress.add(units)
+        return path, units, last
+
+    if workers <= 1:
+        for task, path, last in tasks():
+            yield finish(path, last, task and (lambda: _run_task(*task)))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task, path, last in tasks():
+            pending.append((path, last, task and pool.submit(_run_task, *task).result))
+            if len(pending) >= workers * TASKS_IN_FLIGHT_PER_WORKER:
+                yield finish(*pending.popleft())
+        while pending:
+            yield finish(*pending.popleft())
+
+
+def iter_pages(paths: Iterable[str], workers: Optional[int] = None,
+               progress: Optional[ExtractionProgress] = None) -> Iterator[Tuple[str, Optional[int], str]]:
+    """(path, page, text) for every page of every file, in order; files that fail are listed in progress.errors"""
+    progress = progress or ExtractionProgress()
+    for path, units, last in _iter_task_results(paths, workers or os.cpu_count() or 1, progress):
+        for page, text in units or []:
+            yield path, page, text
+        if last:
+            progress.files += 1
+
+
+def iter_documents(paths: Iterable[str], workers: Optional[int] = None,
+                   progress: Optional[ExtractionProgress] = None) -> Iterator[Tuple[str, Optional[List[Unit]]]]:
+    """(path, pages) per file, in order; pages is None when the file could not be read"""
+    progress = progress or ExtractionProgress()
+    units: List[Unit] = []
+    failed = False
+    for path, task_units, last in _iter_task_results(paths, workers or os.cpu_count() or 1, progress):
+        if task_units is None:
+            failed = True
+        else:
+            units.extend(task_units)
+        if last:
+            progress.files += 1
+            yield path, None if failed else units
+            units, failed = [], False
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Cold-start measurement for the FastAPI backend
+Reports per-module import time (python -X importtime) for `import app`, the
+wall time until the app can serve keyword answers, and how long the QA model
+load takes on top of that
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+TIMING_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+report = {'import_app_s': imported - started}
+if {load_model}:
+    try:
+        app.load_model()
+        report['load_model_s'] = time.perf_counter() - imported
+    except Exception as e:
+        report['load_model_error'] = str(e)
+print(json.dumps(report))
+"""
+
+
+def run_backend_python(args, code):
+    return subprocess.run([sys.executable, *args, '-c', code], cwd=BACKEND_DIR,
+                          capture_output=True, text=True)
+
+
+def import_times():
+    """(module, self_us, cumulative_us, depth) for every module imported by `import app`"""
+    result = run_backend_python(['-X', 'importtime'], 'import app')
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure backend cold start")
+    parser.add_argument('--top', type=int, default=15, help="how many modules to list")
+    parser.add_argument('--load-model', action='store_true', help="also time app.load_model()")
+    args = parser.parse_args()
+
+    print("🧪 Backend Cold-Start Measurement")
+    print("=" * 60)
+
+    rows = import_times()
+    if not rows:
+        print("❌ `import app` failed; run it from backend/ to see the error")
+        return
+    total = next((cumulative for module, _, cumulative, depth in rows if module == 'app' and depth == 0), 0)
+    print(f"`import app` (importtime total): {total / 1000:.0f} ms\n")
+
+    # importtime lists children before their parent: app's direct imports are the depth-1
+    # rows between the previous top-level module and `app` itself
+    app_index = next(i for i, row in enumerate(rows) if row[0] == 'app' and row[3] == 0)
+    first = app_index
+    while first > 0 and rows[first - 1][3] > 0:
+        first -= 1
+    print("Slowest imports made by app (cumulative):")
+    top_level = sorted((row for row in rows[first:app_index] if row[3] == 1), key=lambda row: row[2], reverse=True)
+    for module, self_us, cumulative_us, _ in top_level[:args.top]:
+        print(f"   {module:<36} {cumulative_us / 1000:8.1f} ms   (self {self_us / 1000:.1f} ms)")
+
+    own_modules = {name[:-3] for name in os.listdir(BACKEND_DIR) if name.endswith('.py')}
+    print("\nBackend modules (self time, i.e. module-level work such as building indexes):")
+    for module, self_us, cumulative_us, _ in sorted(rows, key=lambda row: row[1], reverse=True):
+        if module in own_modules:
+            print(f"   {module:<36} {self_us / 1000:8.1f} ms   (cumulative {cumulative_us / 1000:.1f} ms)")
+
+    heavy = [module for module, _, _, _ in rows if module.split('.')[0] in ('transformers', 'torch', 'onnxruntime')]
+    print(f"\nHeavy ML modules imported at startup: {len(heavy)}"
+          + (f" (e.g. {', '.join(heavy[:3])})" if heavy else " ✅"))
+
+    result = run_backend_python([], TIMING_SCRIPT.replace('{load_model}', str(args.load_model)))
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        print(f"❌ Timing run failed:\n{result.stderr[-2000:]}")
+        return
+    report = json.loads(lines[-1])
+    print(f"\nWall time until keyword answers can be served: {report['import_app_s'] * 1000:.0f} ms")
+    if 'load_model_s' in report:
+        print(f"QA model load (background at startup):         {report['load_model_s']:.1f} s")
+    elif 'load_model_error' in report:
+        print(f"QA model load failed: {report['load_model_error']}")
+
+
+if __name__ == "__main__":
+    main()
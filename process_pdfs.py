@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """
 Process PDF documents for FUT QA Assistant Academic Training
-Extracts text from PDFs and creates training examples
+Extracts text from PDFs (and PPTX/DOCX course slides and notes) and creates
+training examples; pages are extracted in parallel (material_extraction.py)
+and the examples of each file are kept in data/pdf_training_manifest.json
+with its hash, so re-runs only extract new or changed files
 """
 
 import os
@@ -10,21 +13,29 @@ import re
 from pathlib import Path
 import PyPDF2
 
+from ingest_manifest import IngestManifest
+from material_extraction import ExtractionProgress, iter_documents, supported_extensions
+
+MANIFEST_PATH = os.path.join("data", "pdf_training_manifest.json")
+
+def pages_to_text(pages):
+    """Join (page number, text) pairs into one "Page N: ..." text"""
+    # One join instead of repeated += (quadratic on large modules)
+    return "".join(f"Page {page}: {text}\n" if page else f"{text}\n" for page, text in pages if text)
+
 def extract_text_from_pdf(pdf_path):
     """Extract text from PDF file with better error handling"""
     try:
         with open(pdf_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            text = ""
+            pages = []
             for page_num, page in enumerate(reader.pages):
                 try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += f"Page {page_num + 1}: {page_text}\n"
+                    pages.append((page_num + 1, page.extract_text()))
                 except Exception as e:
                     print(f"Warning: Could not extract text from page {page_num + 1} of {pdf_path}: {e}")
                     continue
-        return text
+        return pages_to_text(pages)
     except Exception as e:
         print(f"Error reading PDF {pdf_path}: {e}")
         return None
@@ -78,8 +89,8 @@ def create_training_examples_from_text(text, source_name):
     
     return examples
 
-def process_pdf_directory(pdf_dir="pdf_data"):
-    """Process all PDF files in a directory"""
+def process_pdf_directory(pdf_dir="pdf_data", workers=None):
+    """Process all PDF, PPTX and DOCX files in a directory"""
     if not os.path.exists(pdf_dir):
         print(f"❌ Directory {pdf_dir} not found. Creating it...")
         os.makedirs(pdf_dir, exist_ok=True)
@@ -87,25 +98,51 @@ def process_pdf_directory(pdf_dir="pdf_data"):
         return []
     
     all_examples = []
-    pdf_files = list(Path(pdf_dir).glob("*.pdf"))
+    pdf_files = sorted(path for path in Path(pdf_dir).iterdir()
+                       if path.suffix.lower() in supported_extensions() and not path.name.startswith("~$"))
     
     if not pdf_files:
         print(f"📁 No PDF files found in {pdf_dir} directory")
         print(f"💡 Please add your PDF files to the {pdf_dir} directory and run this script again")
         return []
     
-    print(f"📚 Found {len(pdf_files)} PDF files to process...")
+    print(f"📚 Found {len(pdf_files)} PDF/PPTX/DOCX files to process...")
+    
+    manifest = IngestManifest(MANIFEST_PATH)
+    plan = manifest.scan({pdf_file.name: str(pdf_file) for pdf_file in pdf_files})
+    progress = ExtractionProgress()
+    # Extracted in parallel ahead of this loop, in the same order
+    extracted = iter_documents([str(pdf_file) for pdf_file in pdf_files if pdf_file.name not in plan['unchanged']],
+                               workers, progress)
     
     for pdf_file in pdf_files:
-        print(f"📄 Processing PDF: {pdf_file.name}")
-        text = extract_text_from_pdf(str(pdf_file))
+        if pdf_file.name in plan['unchanged']:
+            examples = manifest.files[pdf_file.name]['examples']
+            all_examples.extend(examples)
+            print(f"⏭️ Unchanged: {len(examples)} examples from {pdf_file.name}")
+            continue
+        
+        print(f"📄 Processing: {pdf_file.name}")
+        _, pages = next(extracted)
+        text = pages_to_text(pages) if pages else None
         
         if text:
             examples = create_training_examples_from_text(text, pdf_file.stem)
             all_examples.extend(examples)
+            manifest.record(pdf_file.name, examples=examples)
             print(f"✅ Extracted {len(examples)} examples from {pdf_file.name}")
         else:
-            print(f"❌ Could not extract text from {pdf_file.name}")
+            # Not recorded: retried on the next run
+            manifest.forget(pdf_file.name)
+            print(f"❌ Could not extract text from {pdf_file.name}: {progress.errors.get(str(pdf_file), 'no text')}")
+    
+    if progress.files:
+        print(f"📊 Extracted {progress.report()}")
+    
+    for name in plan['deleted']:
+        manifest.forget(name)
+        print(f"🗑️ Dropped examples of removed PDF: {name}")
+    manifest.save()
     
     return all_examples
 
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
 Process Raw Data for FUT QA Assistant Training
-Handles PDFs, text files, and other raw data sources
+Handles PDFs, text files, and other raw data sources; examples are kept per
+file in data/raw_training_manifest.json, so re-runs only extract new or
+changed files
 """
 
 import os
@@ -9,15 +11,18 @@ import json
 import re
 from pathlib import Path
 
+from ingest_manifest import IngestManifest
+
+MANIFEST_PATH = os.path.join("data", "raw_training_manifest.json")
+
 def extract_text_from_pdf(pdf_path):
     """Extract text from PDF file"""
     try:
         import PyPDF2
         with open(pdf_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            # One join instead of repeated += (quadratic on large files)
+            text = "".join(f"{page.extract_text()}\n" for page in reader.pages)
         return text
     except ImportError:
         print("❌ PyPDF2 not installed. Install with: pip install PyPDF2")
@@ -89,24 +94,33 @@ def process_raw_data_directory(data_dir="raw_data"):
         return []
     
     all_examples = []
+    extractors = {".pdf": extract_text_from_pdf, ".txt": extract_text_from_txt}
+    data_files = sorted(path for path in Path(data_dir).iterdir() if path.suffix in extractors)
     
-    # Process PDF files
-    for pdf_file in Path(data_dir).glob("*.pdf"):
-        print(f"📄 Processing PDF: {pdf_file.name}")
-        text = extract_text_from_pdf(str(pdf_file))
-        if text:
-            examples = create_training_examples_from_text(text, pdf_file.stem)
-            all_examples.extend(examples)
-            print(f"✅ Extracted {len(examples)} examples from {pdf_file.name}")
+    manifest = IngestManifest(MANIFEST_PATH)
+    plan = manifest.scan({data_file.name: str(data_file) for data_file in data_files})
     
-    # Process text files
-    for txt_file in Path(data_dir).glob("*.txt"):
-        print(f"📄 Processing text file: {txt_file.name}")
-        text = extract_text_from_txt(str(txt_file))
+    # Process PDF and text files
+    for data_file in data_files:
+        if data_file.name in plan['unchanged']:
+            examples = manifest.files[data_file.name]['examples']
+            all_examples.extend(examples)
+            print(f"⏭️ Unchanged: {len(examples)} examples from {data_file.name}")
+            continue
+        print(f"📄 Processing {'PDF' if data_file.suffix == '.pdf' else 'text file'}: {data_file.name}")
+        text = extractors[data_file.suffix](str(data_file))
         if text:
-            examples = create_training_examples_from_text(text, txt_file.stem)
+            examples = create_training_examples_from_text(text, data_file.stem)
             all_examples.extend(examples)
-            print(f"✅ Extracted {len(examples)} examples from {txt_file.name}")
+            manifest.record(data_file.name, examples=examples)
+            print(f"✅ Extracted {len(examples)} examples from {data_file.name}")
+        else:
+            manifest.forget(data_file.name)
+    
+    for name in plan['deleted']:
+        manifest.forget(name)
+        print(f"🗑️ Dropped examples of removed file: {name}")
+    manifest.save()
     
     return all_examples
 
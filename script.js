@@ -79,24 +79,7 @@ async function askQuestion() {
     setLoadingState(true);
     
     try {
-        const response = await fetch(`${API_BASE_URL}/ask`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                question: question
-            })
-        });
-        
-        const data = await response.json();
-        
-        if (response.ok) {
-            // Add bot response to chat
-            addMessageToChat(data.answer, 'bot', data.confidence, data.model_used);
-        } else {
-            throw new Error(data.detail || 'Failed to get answer');
-        }
+        await streamAnswer(question);
     } catch (error) {
         console.error('Error asking question:', error);
         addMessageToChat(
@@ -110,6 +93,110 @@ async function askQuestion() {
     }
 }
 
+// Stream the answer from /ask/stream, rendering chunks as they arrive
+async function streamAnswer(question) {
+    const response = await fetch(`${API_BASE_URL}/ask/stream`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            question: question
+        })
+    });
+    
+    // Older deployments or browsers without streaming support use the regular endpoint
+    if (!response.ok || !response.body || !response.body.getReader) {
+        return askWithoutStreaming(question);
+    }
+    
+    const { contentDiv, messageText } = addMessageToChat('', 'bot');
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let answer = '';
+    let finished = false;
+    
+    try {
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            
+            // SSE frames are separated by a blank line
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const frame = parseSSEFrame(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+                if (!frame) continue;
+                
+                if (frame.event === 'error') {
+                    throw new Error(frame.data.detail || 'Failed to get answer');
+                } else if (frame.event === 'done') {
+                    finished = true;
+                    appendMessageInfo(contentDiv, frame.data.confidence, frame.data.model_used);
+                } else if (frame.data.delta) {
+                    answer += frame.data.delta;
+                    messageText.textContent = answer;
+                    chatMessages.scrollTop = chatMessages.scrollHeight;
+                }
+            }
+        }
+    } catch (error) {
+        console.error('Error streaming answer:', error);
+        showStreamFailure(contentDiv, messageText, answer,
+            'Sorry, I encountered an error while processing your question. Please try again later.');
+        return;
+    }
+    
+    // The connection closed before the server's final event
+    if (!finished) {
+        showStreamFailure(contentDiv, messageText, answer,
+            'Sorry, the answer was cut off before it finished. Please try again.');
+    }
+}
+
+// Fill the streamed bubble after a failed stream: keep any partial answer and say what went wrong
+function showStreamFailure(contentDiv, messageText, answer, notice) {
+    messageText.textContent = answer ? `${answer} (${notice})` : notice;
+    appendMessageInfo(contentDiv, 0, 'error');
+    chatMessages.scrollTop = chatMessages.scrollHeight;
+}
+
+// Parse one SSE frame into { event, data }
+function parseSSEFrame(frame) {
+    let event = 'message';
+    let data = '';
+    for (const line of frame.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim();
+        else if (line.startsWith('data:')) data += line.slice(5).trim();
+    }
+    if (!data) return null;
+    return { event, data: JSON.parse(data) };
+}
+
+// Non-streaming fallback
+async function askWithoutStreaming(question) {
+    const response = await fetch(`${API_BASE_URL}/ask`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            question: question
+        })
+    });
+    
+    const data = await response.json();
+    
+    if (response.ok) {
+        // Add bot response to chat
+        addMessageToChat(data.answer, 'bot', data.confidence, data.model_used);
+    } else {
+        throw new Error(data.detail || 'Failed to get answer');
+    }
+}
+
 // Add message to chat
 function addMessageToChat(message, sender, confidence = null, modelUsed = null) {
     const messageDiv = document.createElement('div');
@@ -125,18 +212,7 @@ function addMessageToChat(message, sender, confidence = null, modelUsed = null)
     
     // Add confidence score and model info if available
     if (confidence !== null && sender === 'bot') {
-        const infoDiv = document.createElement('div');
-        infoDiv.className = 'confidence-score';
-        
-        let confidenceClass = 'confidence-low';
-        if (confidence > 0.7) confidenceClass = 'confidence-high';
-        else if (confidence > 0.4) confidenceClass = 'confidence-medium';
-        
-        infoDiv.innerHTML = `
-            <span class="${confidenceClass}">Confidence: ${(confidence * 100).toFixed(1)}%</span>
-            ${modelUsed ? ` • Model: ${modelUsed}` : ''}
-        `;
-        contentDiv.appendChild(infoDiv);
+        appendMessageInfo(contentDiv, confidence, modelUsed);
     }
     
     messageDiv.appendChild(contentDiv);
@@ -144,6 +220,24 @@ function addMessageToChat(message, sender, confidence = null, modelUsed = null)
     
     // Scroll to bottom
     chatMessages.scrollTop = chatMessages.scrollHeight;
+    
+    return { contentDiv, messageText };
+}
+
+// Add confidence score and model info below a bot message
+function appendMessageInfo(contentDiv, confidence, modelUsed = null) {
+    const infoDiv = document.createElement('div');
+    infoDiv.className = 'confidence-score';
+    
+    let confidenceClass = 'confidence-low';
+    if (confidence > 0.7) confidenceClass = 'confidence-high';
+    else if (confidence > 0.4) confidenceClass = 'confidence-medium';
+    
+    infoDiv.innerHTML = `
+        <span class="${confidenceClass}">Confidence: ${(confidence * 100).toFixed(1)}%</span>
+        ${modelUsed ? ` • Model: ${modelUsed}` : ''}
+    `;
+    contentDiv.appendChild(infoDiv);
 }
 
 // Set loading state
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test the BM25 Material Index - ranking, course filtering and stale-index detection
+Runs without the server: python -m pytest test_bm25_index.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from bm25_index import BM25Index, build_bm25_index, tokenize  # noqa: E402
+from material_store import ChunkStore, write_chunk_store  # noqa: E402
+
+CHUNKS = [
+    {'course': 'COS101', 'source': 'cos101.pdf', 'text': "Binary search halves a sorted array at every step."},
+    {'course': 'COS101', 'source': 'cos101.pdf', 'text': "Bubble sort swaps adjacent elements until sorted."},
+    {'course': 'COS102', 'source': 'cos102.pdf', 'text': "Recursion calls the same function on a smaller input."},
+    {'course': 'MAT121', 'source': 'mat121.pdf', 'text': "A matrix is a rectangular array of numbers."},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    write_chunk_store(CHUNKS, str(tmp_path))
+    store = ChunkStore(str(tmp_path))
+    build_bm25_index(store, str(tmp_path / 'bm25'))
+    yield BM25Index(store, str(tmp_path / 'bm25'))
+    store.close()
+
+
+def test_tokenize_drops_stopwords():
+    assert 'the' not in tokenize("What is the binary search?")
+    assert 'binary' in tokenize("What is the binary search?")
+
+
+def test_best_match_first(index):
+    results = index.search("how does binary search work", k=2)
+    assert results[0][0] == 0
+    assert index.retrieve("recursion", k=1)[0]['course'] == 'COS102'
+    assert index.search("photosynthesis") == []
+
+
+def test_course_filter(index):
+    assert {chunk_id for chunk_id, _ in index.search("array", k=4)} == {0, 3}
+    assert [chunk_id for chunk_id, _ in index.search("array", k=4, courses=['MAT121'])] == [3]
+    assert index.search("array", courses=['PHY101']) == []
+
+
+def test_stale_index_is_not_used(tmp_path, index):
+    assert index.available
+    write_chunk_store(CHUNKS + [{'course': 'PHY101', 'text': "Force equals mass times acceleration."}], str(tmp_path))
+    stale = BM25Index(ChunkStore(str(tmp_path)), str(tmp_path / 'bm25'))
+    assert not stale.available
+    assert stale.search("array") == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
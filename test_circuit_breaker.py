@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test the Provider Circuit Breakers - open, half-open probe, close and health ordering
+Runs without the server: python -m pytest test_circuit_breaker.py
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from circuit_breaker import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker, ProviderHealthRegistry,  # noqa: E402
+                             is_failure_status, provider_health)
+from llm_client import AsyncLLMClient  # noqa: E402
+
+
+def make_breaker(reset_timeout=60.0):
+    return CircuitBreaker("groq", failure_threshold=3, reset_timeout=reset_timeout, ewma_alpha=0.3)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.is_available()
+    assert not breaker.allow_request()
+    assert breaker.health_score() == 0.0
+
+
+def test_success_resets_the_failure_count():
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_one_probe():
+    breaker = make_breaker(reset_timeout=0.0)
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_order_by_health_skips_open_circuits():
+    registry = ProviderHealthRegistry()
+    for _ in range(registry.get("openai").failure_threshold):
+        registry.get("openai").record_failure()
+    registry.get("gemini").record_success(latency=2.0)
+    registry.get("groq").record_success(latency=0.2)
+    assert registry.order_by_health(["gemini", "openai", "groq"]) == ["groq", "gemini"]
+
+
+
+def test_untried_provider_ranks_between_fast_and_slow():
+    registry = ProviderHealthRegistry()
+    registry.get("gemini").record_success(latency=3.0)
+    registry.get("groq").record_success(latency=0.2)
+    assert registry.order_by_health(["huggingface", "gemini", "groq"]) == ["groq", "huggingface", "gemini"]
+
+
+@pytest.mark.parametrize('status, failure', [
+    (200, False), (400, False), (401, True), (403, True), (404, True), (410, True), (429, True), (503, True),
+])
+def test_failure_statuses(status, failure):
+    assert is_failure_status(status) == failure
+
+
+def post_through(provider, handler):
+    async def run():
+        client = AsyncLLMClient()
+        client._clients[provider] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await client.post_json(provider, "https://llm.test/v1/chat", {})
+        finally:
+            await client.aclose()
+    return asyncio.run(run())
+
+
+def test_misconfigured_provider_trips_the_breaker():
+    breaker = provider_health.get("test-bad-key")
+    for _ in range(breaker.failure_threshold):
+        post_through("test-bad-key", lambda request: httpx.Response(401))
+    assert breaker.state == OPEN
+
+
+def test_unexpected_error_releases_the_probe():
+    breaker = provider_health.get("test-probe")
+    breaker.reset_timeout = 0.0
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    def broken(request):
+        raise ValueError("unexpected")
+
+    with pytest.raises(ValueError):
+        post_through("test-probe", broken)
+    assert breaker.state == HALF_OPEN and not breaker.probe_in_flight
+    assert breaker.allow_request()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test Course-Code Extraction - spellings of COS102 and FTM-CPT112, and CourseIndex lookups
+Runs without the server: python -m pytest test_course_codes.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from course_codes import CourseIndex, course_variants, extract_course_codes  # noqa: E402
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("who teaches COS102", ["COS102"]),
+    ("cos 102 and cos-102 notes", ["COS102"]),
+    ("is FTM-CPT112 before cpt 121?", ["FTM-CPT112", "CPT121"]),
+    ("ftm cpt 112", ["FTM-CPT112"]),
+    ("mat121, phy101 and sta111", ["MAT121", "PHY101", "STA111"]),
+    ("macos1020 or cos1021", []),
+    ("what is computer science", []),
+])
+def test_extract_course_codes(text, expected):
+    assert extract_course_codes(text) == expected
+
+
+def test_course_variants_cover_both_spellings():
+    assert course_variants(["cpt112"]) == {"CPT112", "FTM-CPT112"}
+    assert course_variants(["FTM-CPT112", "COS101"]) == {"CPT112", "FTM-CPT112", "COS101", "FTM-COS101"}
+
+
+def test_course_index_resolves_either_spelling():
+    index = CourseIndex({
+        '100_level': {'COS102': {'name': 'Problem Solving'}},
+        '200_level': {'FTM-CPT112': {'name': 'Programming'}}
+    })
+    assert index.resolve("cpt112") == "FTM-CPT112"
+    assert index.lookup("cos102") == ('100_level', {'name': 'Problem Solving'})
+    assert "CPT112" in index and "COS999" not in index
+    assert [code for code, _, _ in index.find("compare CPT 112 with COS102 and FTM-CPT112")] == \
+        ["FTM-CPT112", "COS102"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test the Dense Material Index - float16 memmap search, course filtering and vector reuse
+Uses the dependency-free hashed encoder. Runs without the server: python -m pytest test_dense_index.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from dense_index import DenseIndex, HashedEncoder, build_dense_index  # noqa: E402
+from material_store import ChunkStore, write_chunk_store  # noqa: E402
+
+CHUNKS = [
+    {'course': 'COS101', 'source': 'cos101.pdf', 'text': "Binary search halves a sorted array at every step."},
+    {'course': 'COS101', 'source': 'cos101.pdf', 'text': "Bubble sort swaps adjacent elements until sorted."},
+    {'course': 'COS102', 'source': 'cos102.pdf', 'text': "Recursion calls the same function on a smaller input."},
+    {'course': 'MAT121', 'source': 'mat121.pdf', 'text': "A matrix is a rectangular array of numbers."},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    write_chunk_store(CHUNKS, str(tmp_path))
+    store = ChunkStore(str(tmp_path))
+    yield store
+    store.close()
+
+
+def test_hashed_encoder_gives_unit_vectors():
+    vectors = HashedEncoder().encode(["binary search", "binary searching", ""])
+    assert np.allclose(np.linalg.norm(vectors[:2], axis=1), 1.0)
+    assert vectors[0] @ vectors[1] > 0.5
+
+
+def test_search_and_course_filter(tmp_path, store):
+    meta = build_dense_index(store, str(tmp_path / 'dense'), encoder_name='hashed')
+    assert meta['chunk_count'] == len(CHUNKS) and meta['encoder'] == 'hashed'
+    index = DenseIndex(store, str(tmp_path / 'dense'))
+    assert index.search("binary search in a sorted array", k=1)[0][0] == 0
+    assert [chunk_id for chunk_id, _ in index.search("binary search in a sorted array", k=4, courses=['MAT121'])] == [3]
+    assert index.search("anything", courses=['PHY101']) == []
+
+
+def test_rebuild_reuses_unchanged_vectors(tmp_path, store):
+    directory = str(tmp_path / 'dense')
+    build_dense_index(store, directory, encoder_name='hashed')
+    before = np.fromfile(os.path.join(directory, 'vectors.f16'), dtype=np.float16)
+    meta = build_dense_index(store, directory, encoder_name='hashed', previous=list(range(len(CHUNKS))))
+    assert meta['reused'] == len(CHUNKS)
+    assert np.array_equal(np.fromfile(os.path.join(directory, 'vectors.f16'), dtype=np.float16), before)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
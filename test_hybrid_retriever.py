@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test the Hybrid Retriever - reciprocal rank fusion of BM25 and dense rankings with course filtering
+Uses the dependency-free hashed encoder. Runs without the server: python -m pytest test_hybrid_retriever.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from bm25_index import BM25Index, build_bm25_index  # noqa: E402
+from dense_index import DenseIndex, build_dense_index  # noqa: E402
+from hybrid_retriever import HybridRetriever  # noqa: E402
+from material_store import ChunkStore, write_chunk_store  # noqa: E402
+
+CHUNKS = [
+    {'course': 'COS101', 'source': 'cos101.pdf', 'text': "Binary search halves a sorted array at every step."},
+    {'course': 'COS101', 'source': 'cos101.pdf', 'text': "Bubble sort swaps adjacent elements until sorted."},
+    {'course': 'COS102', 'source': 'cos102.pdf', 'text': "Recursion calls the same function on a smaller input."},
+    {'course': 'MAT121', 'source': 'mat121.pdf', 'text': "A matrix is a rectangular array of numbers."},
+]
+
+
+@pytest.fixture
+def retriever(tmp_path):
+    write_chunk_store(CHUNKS, str(tmp_path))
+    store = ChunkStore(str(tmp_path))
+    build_bm25_index(store, str(tmp_path / 'bm25'))
+    build_dense_index(store, str(tmp_path / 'dense'), encoder_name='hashed')
+    yield HybridRetriever(store, BM25Index(store, str(tmp_path / 'bm25')), DenseIndex(store, str(tmp_path / 'dense')))
+    store.close()
+
+
+def test_fuse_rewards_agreement(retriever):
+    fused = retriever.fuse([(1.0, [(1, 9.0), (2, 5.0)]), (1.0, [(2, 0.9), (3, 0.8)])], k=3)
+    assert [chunk_id for chunk_id, _ in fused] == [2, 1, 3]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_retrieve_reports_ranks_and_timings(retriever):
+    chunks, timings = retriever.retrieve_with_timings("binary search on a sorted array", k=2)
+    assert chunks[0]['text'].startswith("Binary search")
+    assert chunks[0]['lexical_rank'] == 1 and chunks[0]['dense_rank'] is not None
+    assert set(timings) == {'filter', 'lexical', 'dense', 'fusion', 'fetch'}
+    assert retriever.get_stats()['queries'] == 1
+
+
+def test_course_filter(retriever):
+    assert [chunk['course'] for chunk in retriever.retrieve("array", k=4, courses=['MAT121'])] == ['MAT121']
+    assert retriever.retrieve("array", courses=['PHY101']) == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
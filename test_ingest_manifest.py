@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test the Ingestion Manifest - added, changed, unchanged and deleted source files across runs
+Runs without the server: python -m pytest test_ingest_manifest.py
+"""
+
+import sys
+
+import pytest
+
+from ingest_manifest import IngestManifest
+
+SETTINGS = {'chunk_size': 800, 'overlap': 100}
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return str(path)
+
+
+def test_second_run_only_reprocesses_what_changed(tmp_path):
+    manifest_path = str(tmp_path / 'manifest.json')
+    paths = {name: write(tmp_path / f'{name}.txt', name) for name in ('a', 'b', 'c')}
+
+    manifest = IngestManifest(manifest_path, SETTINGS)
+    assert manifest.scan(paths)['added'] == ['a', 'b', 'c']
+    for key in paths:
+        manifest.record(key, chunks=[0, 1])
+    manifest.save()
+
+    write(paths['a'], 'a, revised')
+    # Rewritten with the same content: a new mtime but nothing to re-extract
+    write(paths['b'], 'b')
+    del paths['c']
+    paths['d'] = write(tmp_path / 'd.txt', 'd')
+
+    manifest = IngestManifest(manifest_path, SETTINGS)
+    assert manifest.scan(paths) == {'added': ['d'], 'changed': ['a'], 'unchanged': ['b'], 'deleted': ['c']}
+    assert manifest.files['b']['chunks'] == [0, 1]
+
+
+def test_manifest_with_other_settings_is_ignored(tmp_path):
+    manifest_path = str(tmp_path / 'manifest.json')
+    paths = {'a': write(tmp_path / 'a.txt', 'a')}
+    manifest = IngestManifest(manifest_path, SETTINGS)
+    manifest.scan(paths)
+    manifest.record('a')
+    manifest.save()
+
+    assert IngestManifest(manifest_path, SETTINGS).scan(paths)['unchanged'] == ['a']
+    assert IngestManifest(manifest_path, {**SETTINGS, 'chunk_size': 400}).scan(paths)['added'] == ['a']
+
+
+def test_unreadable_manifest_starts_fresh(tmp_path):
+    manifest_path = write(tmp_path / 'manifest.json', '{not json')
+    assert IngestManifest(manifest_path, SETTINGS).files == {}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
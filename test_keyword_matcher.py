@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test the Keyword Matcher - one automaton pass agrees with the substring checks it replaced
+Runs without the server: python -m pytest test_keyword_matcher.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from keyword_matcher import KEYWORD_TABLES, KeywordMatcher, keyword_matcher  # noqa: E402
+
+QUESTIONS = [
+    "who is the lecturer for cos102",
+    "who dey teach cos 101 abeg",
+    "what career paths are available in computer science",
+    "tell me more",
+    "where can i download the mat121 past questions pdf",
+    "what is the weather like today",
+    "",
+]
+
+
+@pytest.mark.parametrize('question', QUESTIONS)
+def test_matches_naive_substring_checks(question):
+    expected = {category for category, patterns in KEYWORD_TABLES.items()
+                if any(pattern in question for pattern in patterns)}
+    assert keyword_matcher.match(question).categories == expected
+
+
+def test_reports_overlapping_positions():
+    matcher = KeywordMatcher({'a': ['he', 'she', 'hers'], 'b': ['his']})
+    matches = matcher.match("ushers")
+    assert sorted(matches.positions('a')) == [(1, 4, 'she'), (2, 4, 'he'), (2, 6, 'hers')]
+    assert 'b' not in matches
+    assert matches.any('b', 'a')
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
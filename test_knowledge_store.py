@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the Knowledge Store - loading from any working directory and reloading edited files
+Runs without the server: python -m pytest test_knowledge_store.py
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from knowledge_store import KnowledgeStore  # noqa: E402
+
+LOOKUP_SCRIPT = """
+import sys
+sys.path.insert(0, {backend!r})
+from knowledge_store import knowledge_store
+print(knowledge_store.course_lecturers('COS102')[0]['name'])
+print(len(knowledge_store.course_index))
+"""
+
+
+@pytest.mark.parametrize('cwd', [ROOT_DIR, BACKEND_DIR, os.path.dirname(ROOT_DIR)])
+def test_loads_from_any_working_directory(cwd):
+    """The default paths are resolved against backend/, not the working directory"""
+    result = subprocess.run([sys.executable, '-c', LOOKUP_SCRIPT.format(backend=BACKEND_DIR)],
+                            cwd=cwd, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    lead_lecturer, courses = result.stdout.strip().splitlines()[-2:]
+    assert lead_lecturer == 'Sadiu Admed Abubakar'
+    assert int(courses) > 0
+
+
+def test_missing_files_raise(tmp_path):
+    """An unreadable store raises instead of serving an empty catalogue"""
+    store = KnowledgeStore(str(tmp_path), str(tmp_path / 'lecturer_database.json'))
+    with pytest.raises(RuntimeError):
+        store.load()
+    with pytest.raises(RuntimeError):
+        store.course('COS102')
+
+
+def test_reload_picks_up_changed_files(tmp_path):
+    """reload() swaps in edited files and changes the version; unreadable files keep the old data"""
+    knowledge_dir = tmp_path / 'knowledge'
+    shutil.copytree(os.path.join(ROOT_DIR, 'data', 'knowledge'), knowledge_dir)
+    lecturer_file = tmp_path / 'lecturer_database.json'
+    shutil.copy(os.path.join(ROOT_DIR, 'lecturer_database.json'), lecturer_file)
+    store = KnowledgeStore(str(knowledge_dir), str(lecturer_file))
+    version = store.version
+    assert store.reload() is False
+
+    lecturers = json.loads(lecturer_file.read_text(encoding='utf-8'))
+    lecturers['COS102']['lecturers'][0]['name'] = 'Test Lecturer'
+    lecturer_file.write_text(json.dumps(lecturers), encoding='utf-8')
+    assert store.reload() is True
+    assert store.version != version
+    assert store.course_lecturers('COS102')[0]['name'] == 'Test Lecturer'
+
+    lecturer_file.write_text('{', encoding='utf-8')
+    with pytest.raises(RuntimeError):
+        store.reload()
+    assert store.course_lecturers('COS102')[0]['name'] == 'Test Lecturer'
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
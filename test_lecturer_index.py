@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test the Lecturer Index - misspelled names found, everyday words not mistaken for lecturers
+Runs without the server: python -m pytest test_lecturer_index.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from lecturer_index import edit_distance, lecturer_index  # noqa: E402
+
+
+def names(matches):
+    return [match.name for match in matches]
+
+
+@pytest.mark.parametrize('question', [
+    "brown bread recipe",
+    "who is davis cup winner",
+    "is sarah around",
+    "Dr, explain binary search",
+    "dr please explain how a brown dwarf forms",
+    "who teaches cos102 and what is davis cup",
+    "what is the weather like today",
+])
+def test_common_words_are_not_lecturers(question):
+    """One everyday word that happens to be a surname doesn't route a question"""
+    assert lecturer_index.mentioned(question) == []
+
+
+@pytest.mark.parametrize('question, expected', [
+    ("which courses does lasotte yakubu teach", "Lasotte yakubu"),
+    ("who is saidu ahmed abubakar", "Saidu Ahmed Abubakar"),
+    ("courses by umar alkali", "Umar alkali"),
+    ("dr brown office hours", "Prof. Michael Brown"),
+    ("what does davis teach", "Dr. Emily Davis"),
+    ("courses taught by Brown", "Prof. Michael Brown"),
+])
+def test_named_lecturers_are_found(question, expected):
+    """Full names, or one name word next to a lecturer word or title"""
+    assert expected in names(lecturer_index.mentioned(question))
+
+
+def test_misspelled_names_match_variant_spellings():
+    found = names(lecturer_index.find("which courses does lasotte yakubu teach"))
+    assert found[:2] == ["Lasotte yakubu", "Iosotte Yakubu"]
+    assert "Sadiu Admed Abubakar" in names(lecturer_index.find("saidu ahmed abubakar"))
+
+
+def test_edit_distance_counts_transpositions_once():
+    assert edit_distance("saidu", "sadiu", 2) == 1
+    assert edit_distance("alenoghena", "alenoghen", 2) == 1
+    assert edit_distance("brown", "johnson", 2) == 3
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
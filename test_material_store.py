@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test the Course-Material Chunk Store - random access, course bitmaps and scans
+Runs without the server: python -m pytest test_material_store.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from material_store import ChunkStore, write_chunk_store  # noqa: E402
+
+CHUNKS = [
+    {'course': 'COS101', 'source': 'cos101.pdf', 'kind': 'pdf', 'page': 1, 'text': "Binary search halves a sorted array."},
+    {'course': 'MAT121', 'source': 'mat121.pdf', 'kind': 'pdf', 'page': 1, 'text': "A matrix is an array of numbers – ü."},
+    {'course': 'COS101', 'source': 'cos101.pdf', 'kind': 'pdf', 'page': 2, 'text': "Bubble sort swaps adjacent elements."},
+    {'course': 'FTM-CPT112', 'source': 'cpt112.pptx', 'kind': 'pptx', 'slide': 3, 'text': "Variables hold values."},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    assert write_chunk_store(CHUNKS, str(tmp_path)) == len(CHUNKS)
+    store = ChunkStore(str(tmp_path))
+    yield store
+    store.close()
+
+
+def test_random_access_returns_each_chunk(store):
+    assert len(store) == len(CHUNKS)
+    for chunk_id in reversed(range(len(CHUNKS))):
+        assert store.get(chunk_id) == {'id': chunk_id, **CHUNKS[chunk_id]}
+    assert store.get(len(CHUNKS)) is None
+    assert [chunk['id'] for chunk in store.get_many([2, 99, 0])] == [2, 0]
+
+
+def test_scan_matches_random_access(store):
+    assert list(store) == store.get_many(range(len(store)))
+
+
+def test_course_mask_accepts_either_spelling(store):
+    assert store.course_mask(['cos101']).tolist() == [True, False, True, False]
+    assert store.course_mask(['CPT112']).tolist() == [False, False, False, True]
+    assert not store.course_mask(['PHY101']).any()
+
+
+def test_empty_and_missing_stores(tmp_path):
+    write_chunk_store([], str(tmp_path / 'empty'))
+    empty = ChunkStore(str(tmp_path / 'empty'))
+    assert empty.available and len(empty) == 0 and empty.get(0) is None
+    empty.close()
+    assert not ChunkStore(str(tmp_path / 'missing')).available
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
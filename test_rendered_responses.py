@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test the Pre-rendered Answers - memoized per knowledge version, never cached across a reload
+Runs without the server: python -m pytest test_rendered_responses.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from rendered_responses import RenderedResponses  # noqa: E402
+
+
+class VersionedStore:
+    """Stands in for KnowledgeStore: only the version is read"""
+
+    def __init__(self):
+        self.version = 'v1'
+
+
+def test_answers_are_rendered_once_per_version():
+    store = VersionedStore()
+    responses = RenderedResponses(store)
+    calls = []
+
+    def render():
+        calls.append(store.version)
+        return {'answer': f"COS102 ({store.version})"}
+
+    assert responses.get('course', 'COS102', render)['answer'] == "COS102 (v1)"
+    assert responses.get('course', 'COS102', render)['answer'] == "COS102 (v1)"
+    store.version = 'v2'
+    assert responses.get('course', 'COS102', render)['answer'] == "COS102 (v2)"
+    assert calls == ['v1', 'v2']
+
+
+def test_answer_rendered_across_a_reload_is_not_cached():
+    store = VersionedStore()
+    responses = RenderedResponses(store)
+
+    def render_during_reload():
+        store.version = 'v2'
+        # Another request sees the new version first and moves the cache on to it
+        responses.get('course', 'MAT121', lambda: {'answer': "MAT121"})
+        return {'answer': "rendered from v1 data"}
+
+    assert responses.get('course', 'COS102', render_during_reload)['answer'] == "rendered from v1 data"
+    fresh = responses.get('course', 'COS102', lambda: {'answer': "rendered from v2 data"})
+    assert fresh['answer'] == "rendered from v2 data"
+    assert responses.get_stats()['knowledge_version'] == 'v2' and responses.get_stats()['renders'] == 3
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test the LLM Response Cache - memory tier, write-behind disk tier and restarts
+Runs without the server: python -m pytest test_response_cache.py
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from response_cache import LLMResponseCache, prompt_fingerprint  # noqa: E402
+
+
+def test_fingerprint_ignores_case_spacing_and_trailing_punctuation():
+    assert prompt_fingerprint("Who teaches COS102?", "prompt", "model", 0.3) == \
+        prompt_fingerprint("  who   teaches cos102 ", "prompt", "model", 0.3)
+    assert prompt_fingerprint("Who teaches COS102?", "prompt", "model", 0.3) != \
+        prompt_fingerprint("Who teaches COS102?", "prompt", "model", 0.7)
+
+
+def test_async_tiers_survive_a_restart(tmp_path):
+    db_path = str(tmp_path / 'llm_cache.db')
+
+    async def first_run():
+        cache = LLMResponseCache(db_path, ttl=60, max_entries=1, max_disk_entries=10)
+        assert await cache.aget('a') is None
+        await cache.aset('a', 'answer a')
+        await cache.aset('b', 'answer b')
+        # 'a' fell out of the one-entry memory tier and comes back from disk
+        assert await cache.aget('b') == 'answer b'
+        cache.close()
+        assert await LLMResponseCache(db_path, 60, 1, 10).aget('a') == 'answer a'
+        return cache.get_status()
+
+    status = asyncio.run(first_run())
+    assert status['memory_hits'] == 1 and status['misses'] == 1 and status['stores'] == 2
+
+
+def test_expired_answers_are_not_served(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / 'llm_cache.db'), ttl=-1, max_entries=10, max_disk_entries=10)
+    cache.set('a', 'stale')
+    assert cache.get('a') is None
+    cache.close()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test the Semantic Answer Cache - paraphrases hit, same words with another meaning miss
+Runs without the server: python -m pytest test_semantic_cache.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from semantic_cache import SEED_CORPUS_FILES, SemanticAnswerCache, tokenize  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def idf():
+    cache = SemanticAnswerCache(capacity=1, threshold=0.85)
+    cache.load_seed_corpus(SEED_CORPUS_FILES)
+    return cache.idf
+
+
+def cached_answer(idf, cached_question, question):
+    cache = SemanticAnswerCache(capacity=4, threshold=0.85)
+    cache.idf = idf
+    cache.store(cached_question, {'answer': cached_question, 'confidence': 0.95, 'model_used': 'test'})
+    return cache.lookup(question)
+
+
+def test_negations_are_kept():
+    assert 'not' in tokenize("What is not computer science?")
+    assert 'not' in tokenize("Which careers don't need programming?")
+    assert tokenize("Who teaches COS 102?")[0] == 'who'
+
+
+def test_seed_corpus_found_from_any_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert all(os.path.exists(path) for path in SEED_CORPUS_FILES)
+
+
+@pytest.mark.parametrize('cached_question, question', [
+    ("Who are the lecturers for COS102?", "who teaches cos 102"),
+    ("Who are the lecturers for COS102?", "cos 102 lecturers"),
+    ("lecturers for COS102", "cos 102 lecturers"),
+    ("who dey teach cos102", "cos 102 lecturers"),
+    ("What career paths are available in computer science?", "career paths in computer science"),
+    ("What is MAT121 about?", "what is mat121"),
+])
+def test_paraphrases_hit(idf, cached_question, question):
+    assert cached_answer(idf, cached_question, question) is not None
+
+
+@pytest.mark.parametrize('cached_question, question', [
+    ("What is the prerequisite for COS102?", "What is COS102 a prerequisite for?"),
+    ("What is computer science?", "What is not computer science?"),
+    ("Who teaches COS102?", "What is COS102?"),
+    ("Who are the lecturers for COS102?", "Who are the lecturers for COS101?"),
+])
+def test_different_meanings_miss(idf, cached_question, question):
+    assert cached_answer(idf, cached_question, question) is None
+
+
+
+def test_clear_forgets_course_partitions(idf):
+    cache = SemanticAnswerCache(capacity=4, threshold=0.85)
+    cache.idf = idf
+    for code in ("COS101", "COS102", "MAT121"):
+        cache.store(f"Who teaches {code}?", {'answer': code, 'confidence': 0.95, 'model_used': 'test'})
+    cache.clear()
+    assert cache._course_keys == {} and cache.lookup("Who teaches COS101?") is None
+    cache.store("Who teaches COS102?", {'answer': 'COS102', 'confidence': 0.95, 'model_used': 'test'})
+    assert cache.lookup("who teaches cos 102")['answer'] == 'COS102'
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test Single-Flight Coalescing - concurrent identical calls share one upstream request
+Runs without the server: python -m pytest test_single_flight.py
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from single_flight import SingleFlight  # noqa: E402
+
+
+def test_concurrent_calls_share_one_upstream_call():
+    calls = []
+
+    async def upstream():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def run():
+        flights = SingleFlight()
+        results = await asyncio.gather(*(flights.do("key", upstream) for _ in range(5)))
+        # Finished flights are forgotten: the next call goes upstream again
+        await flights.do("key", upstream)
+        return results, flights.get_stats()
+
+    results, stats = asyncio.run(run())
+    assert results == ["answer"] * 5
+    assert len(calls) == 2
+    assert stats['upstream_calls'] == 2 and stats['coalesced'] == 4 and stats['in_flight'] == 0
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def upstream():
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def run():
+        flights = SingleFlight()
+        loser = asyncio.ensure_future(flights.do("key", upstream))
+        winner = asyncio.ensure_future(flights.do("key", upstream))
+        await asyncio.sleep(0.01)
+        loser.cancel()
+        return await winner
+
+    assert asyncio.run(run()) == "answer"
+
+
+def test_errors_reach_every_waiter():
+    async def upstream():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider down")
+
+    async def run():
+        flights = SingleFlight()
+        return await asyncio.gather(*(flights.do("key", upstream) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
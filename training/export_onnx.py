@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Export the QA model to ONNX with dynamic int8 quantization
+Converts data/models/fut_qa_model_ultimate (or the final / SQuAD fallback the
+API would load) for QA_BACKEND=onnx
+
+Requires: pip install onnx onnxruntime
+"""
+
+import argparse
+import inspect
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'backend'))
+
+from onnx_qa import FULL_PRECISION_MODEL_FILE, QUANTIZED_MODEL_FILE  # noqa: E402
+
+MODEL_CANDIDATES = [
+    os.path.join(ROOT_DIR, 'data', 'models', 'fut_qa_model_ultimate'),
+    os.path.join(ROOT_DIR, 'data', 'models', 'fut_qa_model_final')
+]
+FALLBACK_MODEL = "distilbert/distilbert-base-cased-distilled-squad"
+
+
+def default_source() -> str:
+    for path in MODEL_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return FALLBACK_MODEL
+
+
+def export(source: str, output_dir: str, opset: int, keep_fp32: bool):
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModelForQuestionAnswering, AutoTokenizer
+
+    print(f"📦 Loading {source}")
+    tokenizer = AutoTokenizer.from_pretrained(source)
+    model = AutoModelForQuestionAnswering.from_pretrained(source)
+    model.config.return_dict = False
+    model.eval()
+
+    sample = tokenizer("Who teaches COS101?", "COS101 is taught in the Department of Computer Science.",
+                       return_tensors='pt')
+    # DistilBERT takes no token_type_ids; only export what the model accepts
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids')
+                   if name in sample and name in inspect.signature(model.forward).parameters]
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+    dynamic_axes.update({'start_logits': {0: 'batch', 1: 'sequence'}, 'end_logits': {0: 'batch', 1: 'sequence'}})
+
+    os.makedirs(output_dir, exist_ok=True)
+    fp32_path = os.path.join(output_dir, FULL_PRECISION_MODEL_FILE)
+    int8_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+
+    print(f"🔄 Exporting ONNX graph (opset {opset})")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            ({name: sample[name] for name in input_names},),
+            fp32_path,
+            input_names=input_names,
+            output_names=['start_logits', 'end_logits'],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True
+        )
+
+    print("🔄 Quantizing weights to int8")
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    tokenizer.save_pretrained(output_dir)
+
+    fp32_mb = os.path.getsize(fp32_path) / 1e6
+    int8_mb = os.path.getsize(int8_path) / 1e6
+    if not keep_fp32:
+        os.remove(fp32_path)
+    print(f"✅ {int8_path}: {int8_mb:.0f} MB (fp32 graph was {fp32_mb:.0f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the QA model to int8 ONNX")
+    parser.add_argument('--source', default=default_source(), help="model directory or hub id")
+    parser.add_argument('--output', default=os.path.join(ROOT_DIR, 'data', 'models', 'fut_qa_model_onnx'))
+    parser.add_argument('--opset', type=int, default=14)
+    parser.add_argument('--keep-fp32', action='store_true', help="also keep the unquantized model.onnx")
+    args = parser.parse_args()
+    export(args.source, args.output, args.opset, args.keep_fp32)
+    print("\nServe it with QA_BACKEND=onnx; compare with: python benchmark_onnx_qa.py")
+
+
+if __name__ == "__main__":
+    main()
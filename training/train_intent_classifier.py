@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Train the question intent classifier used by INTENT_ROUTER=classifier
+Labels every known question with the strategy the keyword router picks today,
+fits the hashed n-gram model and saves it as a compact .npz
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import random
+import sys
+from collections import Counter
+from typing import List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from intent_classifier import IntentClassifier  # noqa: E402
+from keyword_matcher import KEYWORD_TABLES  # noqa: E402
+from config import RuntimeConfig  # noqa: E402
+
+
+def load_dataset_questions() -> List[str]:
+    """Questions from every QA dataset in the repository root (final_academic_training_data.json, ...)"""
+    questions = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, '*.json'))):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, list):
+            questions.extend(item['question'] for item in data if isinstance(item, dict) and 'question' in item)
+    return questions
+
+
+def load_keyword_phrases() -> List[str]:
+    """The routing phrases themselves, so every table is represented in training"""
+    return [phrase for phrases in KEYWORD_TABLES.values() for phrase in phrases]
+
+
+def load_test_questions() -> List[str]:
+    """Question lists from the test_*.py scripts (e.g. test_questions = [...])"""
+    questions = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, 'test_*.py'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.List):
+                continue
+            names = [target.id for target in node.targets if isinstance(target, ast.Name)]
+            if not any('question' in name or 'test_cases' in name for name in names):
+                continue
+            for element in node.value.elts:
+                if isinstance(element, ast.Constant) and isinstance(element.value, str):
+                    questions.append(element.value)
+                elif isinstance(element, ast.Dict):
+                    for key, value in zip(element.keys, element.values):
+                        if (isinstance(key, ast.Constant) and key.value == 'question'
+                                and isinstance(value, ast.Constant) and isinstance(value.value, str)):
+                            questions.append(value.value)
+    return questions
+
+
+def label_with_keyword_router(questions: List[str]):
+    """(question, strategy) pairs as routed by the keyword tables; boundary questions are skipped"""
+    from unified_intelligence import UnifiedIntelligence
+
+    router = UnifiedIntelligence()
+    router.intent_classifier = None
+    labelled = []
+    for question in questions:
+        analysis = router.analyze_question_intelligence(question)
+        if analysis['type'] != 'boundary':
+            labelled.append((question, analysis['response_priority'][0]))
+    return labelled
+
+
+def report_agreement(label: str, model: IntentClassifier, labelled):
+    predicted = model.classify_batch([question for question, _ in labelled])
+    agreement = sum(strategy == expected for (strategy, _), (_, expected) in zip(predicted, labelled))
+    confident = [(strategy == expected) for (strategy, probability), (_, expected) in zip(predicted, labelled)
+                 if probability >= RuntimeConfig.INTENT_CLASSIFIER_MIN_CONFIDENCE]
+    print(f"\n{label} agreement with keyword router: {agreement}/{len(labelled)} ({agreement / len(labelled):.1%})")
+    if confident:
+        print(f"   above min confidence {RuntimeConfig.INTENT_CLASSIFIER_MIN_CONFIDENCE}: "
+              f"{sum(confident)}/{len(confident)} ({sum(confident) / len(confident):.1%}), "
+              f"{len(labelled) - len(confident)} fall back to keywords")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default=os.path.join(ROOT_DIR, 'data', 'models', 'intent_classifier.npz'))
+    parser.add_argument('--dims', type=int, default=4096)
+    parser.add_argument('--epochs', type=int, default=500)
+    parser.add_argument('--learning-rate', type=float, default=5.0)
+    parser.add_argument('--holdout', type=float, default=0.2, help="fraction held out to report agreement")
+    args = parser.parse_args()
+
+    seen = set()
+    questions = []
+    for question in load_dataset_questions() + load_test_questions() + load_keyword_phrases():
+        key = question.strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            questions.append(question.strip())
+
+    labelled = label_with_keyword_router(questions)
+    fit_options = {'dims': args.dims, 'epochs': args.epochs, 'learning_rate': args.learning_rate}
+    print(f"🧠 Training intent classifier on {len(labelled)} questions")
+    for strategy, count in Counter(strategy for _, strategy in labelled).most_common():
+        print(f"   {strategy:<20} {count}")
+
+    random.Random(42).shuffle(labelled)
+    split = int(len(labelled) * (1 - args.holdout))
+    train, held_out = labelled[:split], labelled[split:]
+    if held_out:
+        model = IntentClassifier.fit([q for q, _ in train], [s for _, s in train], **fit_options)
+        report_agreement("Held-out", model, held_out)
+
+    model = IntentClassifier.fit([q for q, _ in labelled], [s for _, s in labelled], **fit_options)
+    report_agreement("Training-set", model, labelled)
+
+    model.save(args.output)
+    print(f"\n✅ Saved {args.output} ({os.path.getsize(args.output) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()